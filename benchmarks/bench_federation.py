@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Federation RPC Load Test
+========================
+
+Starts N federation engines on localhost ports in one event loop. Node 0
+then plays leader and drives Raft heartbeats (empty ``raft_append``) and
+appends (``raft_append`` carrying log entries) at every follower, to measure
+what pooled, multiplexed connections (``NetworkManager`` with
+``enable_rpc_pool``) buy over one TCP connection per RPC.
+
+Run: python benchmarks/bench_federation.py [--compare] [--json out.json]
+
+  --nodes N        engines, leader included            (default 8)
+  --concurrency N  in-flight RPCs per follower         (default 16)
+  --entries N      log entries per append RPC          (default 8)
+  --duration S     seconds of load per run             (default 5)
+  --no-pool        one connection per RPC (the pre-pool transport)
+  --compare        run without and then with the pool
+
+Only the network layers are started (no discovery, election or sync loops),
+so the numbers are transport + dispatch cost. Each run reports RPCs/s,
+p50/p95/p99 latency per RPC kind, and the TCP connections the leader opened.
+"""
+
+import asyncio
+import json
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_nucleus import stats  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _run(nodes: int, concurrency: int, entries: int, duration: float, pool: bool) -> dict:
+    from mcp_server_nucleus.runtime.federation import FederationConfig, FederationEngine
+
+    tmp = Path(tempfile.mkdtemp(prefix="bench_fed_"))
+    engines = []
+    for i in range(nodes):
+        config = FederationConfig(
+            brain_id=f"brain-{i}",
+            address=f"127.0.0.1:{_free_port()}",
+            brain_path=tmp / f"brain-{i}",
+            enable_consensus=False,
+            enable_auto_sync=False,
+            enable_rpc_pool=pool,
+        )
+        engine = FederationEngine(config)
+        await engine.network.start()
+        engines.append(engine)
+
+    leader = engines[0].network
+    command = {"op": "set", "key": "bench", "value": "x" * 200}
+    log = [{"term": 1, "index": i + 1, "command": command,
+            "timestamp": "2026-01-01T00:00:00+00:00"} for i in range(entries)]
+    samples = {"heartbeat": [], "append": []}
+    errors = {"heartbeat": 0, "append": 0}
+    deadline = time.perf_counter() + duration
+
+    async def client(address: str, idx: int) -> None:
+        kind = "append" if idx % 2 else "heartbeat"
+        while time.perf_counter() < deadline:
+            request = {
+                "type": "raft_append", "term": 1, "leader_id": "brain-0",
+                "prev_log_index": 0, "prev_log_term": 0,
+                "entries": log if kind == "append" else [], "leader_commit": 0,
+            }
+            t0 = time.perf_counter()
+            resp = await leader.send_message(address, request)
+            if resp and resp.get("success"):
+                samples[kind].append((time.perf_counter() - t0) * 1000)
+            else:
+                errors[kind] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(e.config.address, i) for e in engines[1:] for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    opened = leader.connections_opened
+    for engine in engines:
+        await engine.network.stop()
+
+    total = sum(len(v) for v in samples.values())
+    result = {
+        "pool": pool,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(total / elapsed, 1),
+        "connections_opened": opened,
+    }
+    for kind, times in samples.items():
+        result[kind] = dict(stats(times), errors=errors[kind])
+    return result
+
+
+def print_result(r: dict) -> None:
+    label = "pooled" if r["pool"] else "one connection per RPC"
+    print(f"  {label}: {r['throughput_rps']} RPC/s over {r['elapsed_s']}s, "
+          f"{r['connections_opened']} connections opened")
+    for kind in ("heartbeat", "append"):
+        s = r[kind]
+        if not s.get("n"):
+            print(f"    {kind:<9s} no successful RPCs  errors={s['errors']}")
+            continue
+        print(
+            f"    {kind:<9s} n={s['n']:>7d}  p50={s['p50_ms']:>7.2f}ms  "
+            f"p95={s['p95_ms']:>7.2f}ms  p99={s['p99_ms']:>7.2f}ms  errors={s['errors']}"
+        )
+
+
+def _arg(name: str, default):
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            return type(default)(sys.argv[idx + 1])
+    return default
+
+
+def main():
+    params = dict(
+        nodes=_arg("--nodes", 8),
+        concurrency=_arg("--concurrency", 16),
+        entries=_arg("--entries", 8),
+        duration=_arg("--duration", 5.0),
+    )
+    if "--compare" in sys.argv:
+        modes = [False, True]
+    else:
+        modes = [False] if "--no-pool" in sys.argv else [True]
+
+    print("Federation RPC Load Test")
+    print(f"  {params}")
+    results = []
+    for pool in modes:
+        results.append(asyncio.run(_run(pool=pool, **params)))
+        print_result(results[-1])
+
+    output_file = _arg("--json", "")
+    if output_file:
+        Path(output_file).write_text(json.dumps({"params": params, "runs": results}, indent=2))
+        print(f"Results saved to {output_file}")
+
+
+if __name__ == "__main__":
+    main()
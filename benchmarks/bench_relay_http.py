@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Relay HTTP Load Test
+====================
+
+Concurrent posters and readers against the relay routes
+(``http_transport/relay_route.py``) served by a local uvicorn, to measure
+what moving relay_ops work off the event loop buys.
+
+Run: python benchmarks/bench_relay_http.py [--compare] [--json out.json]
+
+  --workers N     NUCLEUS_RELAY_WORKERS for the server (default 8; 0 runs
+                  relay_ops inline on the event loop, the pre-pool baseline)
+  --compare       run once with --workers 0 and once with the given value
+  --posters N     concurrent POST /relay/{r} clients   (default 16)
+  --readers N     concurrent GET  /relay/{r} clients   (default 16)
+  --recipients N  buckets the clients spread over      (default 4)
+  --duration S    seconds of load per run              (default 10)
+  --seed N        messages pre-loaded per bucket       (default 500)
+
+Each run gets a fresh brain in a temp dir and a fresh server process.
+Reports p50/p95/p99 latency per request kind and overall throughput.
+Requires uvicorn and starlette (the http_transport extras).
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_nucleus import stats  # noqa: E402
+
+TOKEN = "bench-relay-token"
+SENDER = "bench_sender"
+
+
+# ── Server ───────────────────────────────────────────────────────
+
+def serve(port: int) -> None:
+    """Child process: serve only the relay routes on 127.0.0.1:port."""
+    import uvicorn
+    from starlette.applications import Starlette
+
+    from mcp_server_nucleus.http_transport.relay_route import (
+        relay_ack_route,
+        relay_get_route,
+        relay_route,
+        relay_status_route,
+    )
+
+    app = Starlette(routes=[relay_route, relay_get_route, relay_ack_route, relay_status_route])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(brain: Path, workers: int) -> tuple:
+    port = _free_port()
+    env = dict(os.environ)
+    env.update({
+        "NUCLEUS_BRAIN_PATH": str(brain),
+        "NUCLEUS_RELAY_TOKEN_MAP": json.dumps({TOKEN: SENDER}),
+        "NUCLEUS_RELAY_WORKERS": str(workers),
+        # The limiter is not what is being measured.
+        "NUCLEUS_RELAY_RATE_PER_MIN": "100000000",
+        "NUCLEUS_RELAY_RATE_BURST": "100000000",
+        "NUCLEUS_RELAY_RATE_PER_RECIPIENT": "100000000",
+        "PYTHONPATH": str(Path(__file__).parent.parent / "src"),
+    })
+    env.pop("NUCLEUS_RELAY_URL", None)
+    proc = subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(port)],
+        env=env, cwd=str(Path(__file__).parent),
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return proc, port
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError("relay server exited during startup")
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("relay server did not start within 30s")
+
+
+# ── Clients ──────────────────────────────────────────────────────
+
+def _request(port: int, method: str, path: str, body=None) -> int:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(
+        f"http://127.0.0.1:{port}{path}",
+        data=data,
+        method=method,
+        headers={"Authorization": f"Bearer {TOKEN}", "Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            resp.read()
+            return resp.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def _post(port: int, recipient: str, n: int) -> int:
+    return _request(port, "POST", f"/relay/{recipient}", {
+        "subject": f"bench {n}",
+        "body": "x" * 512,
+        "sender": SENDER,
+        "priority": "normal",
+    })
+
+
+def _read(port: int, recipient: str) -> int:
+    return _request(port, "GET", f"/relay/{recipient}?unread_only=true&limit=50")
+
+
+def run(workers: int, posters: int, readers: int, recipients: int,
+        duration: float, seed: int) -> dict:
+    names = [f"bench_r{i}" for i in range(recipients)]
+    with tempfile.TemporaryDirectory() as tmp:
+        brain = Path(tmp) / ".brain"
+        brain.mkdir()
+        proc, port = _start_server(brain, workers)
+        try:
+            with ThreadPoolExecutor(max_workers=32) as pool:
+                list(pool.map(lambda i: _post(port, names[i % recipients], i),
+                              range(seed * recipients)))
+
+            samples = {"post": [], "get": []}
+            errors = {"post": 0, "get": 0}
+            lock = threading.Lock()
+            stop = time.monotonic() + duration
+
+            def client(kind: str, idx: int) -> None:
+                recipient = names[idx % recipients]
+                n = 0
+                while time.monotonic() < stop:
+                    start = time.perf_counter()
+                    status = _post(port, recipient, n) if kind == "post" else _read(port, recipient)
+                    elapsed = (time.perf_counter() - start) * 1000
+                    n += 1
+                    with lock:
+                        samples[kind].append(elapsed)
+                        if status >= 400:
+                            errors[kind] += 1
+
+            threads = [threading.Thread(target=client, args=("post", i)) for i in range(posters)]
+            threads += [threading.Thread(target=client, args=("get", i)) for i in range(readers)]
+            started = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - started
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    result = {"workers": workers, "elapsed_s": round(elapsed, 2)}
+    for kind in ("post", "get"):
+        result[kind] = dict(stats(samples[kind]), errors=errors[kind])
+    total = len(samples["post"]) + len(samples["get"])
+    result["throughput_rps"] = round(total / elapsed, 1) if elapsed else 0.0
+    return result
+
+
+def print_result(r: dict) -> None:
+    label = "inline (event loop)" if r["workers"] <= 0 else f"pool ({r['workers']} workers)"
+    print(f"  {label}: {r['throughput_rps']} req/s over {r['elapsed_s']}s")
+    for kind in ("post", "get"):
+        s = r[kind]
+        if not s.get("n"):
+            continue
+        print(
+            f"    {kind:<5s} n={s['n']:>6d}  p50={s['p50_ms']:>8.2f}ms  "
+            f"p95={s['p95_ms']:>8.2f}ms  p99={s['p99_ms']:>8.2f}ms  errors={s['errors']}"
+        )
+
+
+def _arg(name: str, default):
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            return type(default)(sys.argv[idx + 1])
+    return default
+
+
+def main():
+    if "--serve" in sys.argv:
+        serve(int(sys.argv[sys.argv.index("--serve") + 1]))
+        return
+
+    workers = _arg("--workers", 8)
+    params = dict(
+        posters=_arg("--posters", 16),
+        readers=_arg("--readers", 16),
+        recipients=_arg("--recipients", 4),
+        duration=_arg("--duration", 10.0),
+        seed=_arg("--seed", 500),
+    )
+    modes = [0, workers] if "--compare" in sys.argv else [workers]
+
+    print("Relay HTTP Load Test")
+    print(f"  {params}")
+    results = []
+    for w in modes:
+        print(f"  Running with NUCLEUS_RELAY_WORKERS={w}...", flush=True)
+        results.append(run(w, **params))
+        print_result(results[-1])
+
+    output_file = _arg("--json", "")
+    if output_file:
+        Path(output_file).write_text(json.dumps({"params": params, "runs": results}, indent=2))
+        print(f"Results saved to {output_file}")
+
+
+if __name__ == "__main__":
+    main()
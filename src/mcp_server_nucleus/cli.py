@@ -3335,6 +3335,16 @@ def _run_chat(tier_name: str = "local_free", model_override: str = None, system_
                         print(f"   Tokens: {_used:,}/{_limit:,} ({_pct}%) — /compact to free space")
                 except Exception:
                     pass
+                # LLM response cache (opt-in: NUCLEUS_LLM_CACHE=1)
+                try:
+                    from mcp_server_nucleus.runtime.llm_cache import get_llm_cache
+                    _cache = get_llm_cache()
+                    if _cache is not None:
+                        _cs = _cache.stats()
+                        print(f"   Cache: {_cs['hits']} hits / {_cs['misses']} misses, "
+                              f"~{_cs['tokens_saved']:,} tokens ({_cs['bytes_saved']:,} bytes) saved")
+                except Exception:
+                    pass
                 _k = os.environ.get(_auth_env_map.get(_provider, ""), "")
                 print(f"   Auth: ...{_k[-6:]}" if _k else "   Auth: ⚠️ no key")
                 # Training flywheel status
@@ -4948,6 +4958,14 @@ def main():
     _p.add_argument('key', help='Engram key to quarantine')
     _p.add_argument('--undo', action='store_true', help='Remove quarantine')
 
+    _p = _add_agent_flags(engram_subs.add_parser('compact', help='Compact the append-only engram ledger (drop superseded versions/tombstones)',
+        epilog='Examples:\n  nucleus engram compact --stats\n  nucleus engram compact\n  nucleus engram compact --force',
+        formatter_class=argparse.RawDescriptionHelpFormatter))
+    _p.add_argument('--force', action='store_true', help='Compact even below the dead-record threshold')
+    _p.add_argument('--threshold', type=float, default=None,
+                    help='Dead-record ratio that triggers compaction (default: $NUCLEUS_LEDGER_COMPACT_RATIO or 0.5)')
+    _p.add_argument('--stats', action='store_true', help='Only report record/dead counts, do not rewrite')
+
     # --- DISPATCH COMMAND (cross-vendor CLI one-shot + capture; flag-gated) ---
     dispatch_parser = subparsers.add_parser(
         'dispatch',
@@ -5165,6 +5183,8 @@ def main():
     _p.add_argument('--ack', action='store_true', help='Mark listed messages as read after showing them')
     _p.add_argument('--limit', type=int, default=20, help='Max messages to show (default: 20)')
 
+    relay_subs.add_parser('reindex', help='Rebuild the relay mailbox index from the message files')
+
     # --- FLEET COMMANDS (multi-agent fleet setup — g4_fleet_init_command) ---
     fleet_parser = subparsers.add_parser('fleet',
         help='🚀 Multi-agent fleet setup: init a coordinated .brain for Claude Code, Gemini CLI, Devin')
@@ -5191,6 +5211,8 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter))
     _p.add_argument('--status', default=None, help='Filter by status (e.g., READY, IN_PROGRESS)')
     _p.add_argument('--priority', type=int, default=None, help='Filter by priority')
+    _p.add_argument('--limit', type=int, default=None, help='Show at most N tasks (by priority)')
+    _p.add_argument('--offset', type=int, default=0, help='Skip the first N tasks (with --limit: paging)')
 
     _p = _add_agent_flags(task_subs.add_parser('add', help='Create a new task',
         epilog='Examples:\n  nucleus task add "Ship v1.4.1" --priority 1\n  nucleus task add "Review PR" --format json | jq .task_id',
@@ -6438,42 +6460,52 @@ def handle_engram_command(args) -> int:
 
     elif action == 'quarantine':
         from .runtime.common import get_brain_path
-        import json
         brain = get_brain_path()
         ledger = brain / "engrams" / "ledger.jsonl"
         if not ledger.exists():
             print("No engram ledger found.", file=sys.stderr)
             return 1
+        from .runtime.engram_ledger import append_records, load_live_engrams
         undo = getattr(args, 'undo', False)
-        lines = []
-        found = False
-        with open(ledger, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        e = json.loads(line)
-                        if e.get("key") == args.key and not e.get("deleted", False):
-                            found = True
-                            if undo:
-                                e.pop("quarantined", None)
-                            else:
-                                e["quarantined"] = True
-                        lines.append(json.dumps(e, ensure_ascii=False) + "\n")
-                    except json.JSONDecodeError:
-                        lines.append(line)
-                else:
-                    lines.append(line)
-        if not found:
+        current = next((e for e in load_live_engrams(ledger) if e.get("key") == args.key), None)
+        if current is None:
             print(f"Engram '{args.key}' not found.", file=sys.stderr)
             return 3
-        with open(ledger, "w", encoding="utf-8") as f:
-            f.writelines(lines)
+        # Append a new version instead of rewriting the ledger in place.
+        e = dict(current)
+        if undo:
+            e.pop("quarantined", None)
+        else:
+            e["quarantined"] = True
+        e["version"] = current.get("version", 1) + 1
+        e["timestamp"] = datetime.now().isoformat()
+        try:
+            append_records(brain, [e])
+        except TimeoutError as err:
+            print(f"Error: {err}", file=sys.stderr)
+            return 1
         verb = "unquarantined" if undo else "quarantined"
         print(f"Engram '{args.key}' {verb}. It will be {'included in' if undo else 'excluded from'} morning-brief and search.")
         return 0
 
+    elif action == 'compact':
+        from .runtime.common import get_brain_path
+        from .runtime.engram_ledger import compact_ledger, ledger_stats
+        brain = get_brain_path()
+        ledger = brain / "engrams" / "ledger.jsonl"
+        if not ledger.exists():
+            print("No engram ledger found.", file=sys.stderr)
+            return 1
+        if getattr(args, 'stats', False):
+            return output(ledger_stats(ledger), fmt)
+        try:
+            result = compact_ledger(brain, min_dead_ratio=args.threshold, force=args.force)
+        except TimeoutError as e:
+            return output(None, fmt, error=str(e))
+        return output(result, fmt)
+
     else:
-        print("Usage: nucleus engram <search|write|query|quarantine>", file=sys.stderr)
+        print("Usage: nucleus engram <search|write|query|quarantine|compact>", file=sys.stderr)
         return 1
 
 
@@ -7647,10 +7679,22 @@ def handle_relay_command(args) -> int:
             print(f"✓ acked {acked} message(s)")
         return 0
 
+    elif action == 'reindex':
+        from .runtime.relay.index import rebuild_relay_index
+        try:
+            result = rebuild_relay_index()
+        except Exception as e:
+            print(f"❌ relay reindex failed: {e}", file=sys.stderr)
+            return 1
+        print(f"✓ indexed {result['messages']} message(s) in {result['buckets']} bucket(s)"
+              f" ({result['unparseable']} unparseable) → {result['index']}")
+        return 0
+
     else:
-        print("Usage: nucleus relay <send|inbox>", file=sys.stderr)
+        print("Usage: nucleus relay <send|inbox|reindex>", file=sys.stderr)
         print("  nucleus relay send <to> --subject S --body B", file=sys.stderr)
         print("  nucleus relay inbox [--unread] [--ack]", file=sys.stderr)
+        print("  nucleus relay reindex", file=sys.stderr)
         return 1
 
 
@@ -7740,6 +7784,8 @@ def handle_task_command(args) -> int:
         data = _list_tasks(
             status=getattr(args, 'status', None),
             priority=getattr(args, 'priority', None),
+            limit=getattr(args, 'limit', None),
+            offset=getattr(args, 'offset', 0) or 0,
         )
         tasks = data.get("tasks", []) if isinstance(data, dict) else data
         return output(tasks, fmt, columns=["task_id", "description", "status", "priority"])
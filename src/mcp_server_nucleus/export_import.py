@@ -58,6 +58,9 @@ _ALWAYS_EXCLUDED_SUFFIXES = {".pyc", ".pyo", ".log", ".lock"}
 # Directories that contain secrets and are excluded unless --include-secrets.
 _SECRET_DIRS = {"secrets"}
 
+# The ADUN engram ledger; importing it also backfills the SoR (when enabled).
+_LEDGER_RELPATH = "engrams/ledger.jsonl"
+
 # Files that may contain secrets and are redacted by default.
 _SECRET_FILE_PATTERNS = {
     "config/nucleus.yaml",   # may contain API keys
@@ -242,6 +245,8 @@ def import_brain(
         A dict with import results:
             {"imported": N, "skipped": N, "overwritten": N, "errors": [...],
              "manifest": {...}}
+        plus ``"sor_backfill"`` stats when ``NUCLEUS_MEMORY_SOR`` is on and
+        the archive carried an engram ledger.
 
     Raises:
         FileNotFoundError: if archive doesn't exist.
@@ -285,6 +290,7 @@ def import_brain(
     }
 
     ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    imported_ledger: Optional[Path] = None
 
     with tempfile.TemporaryDirectory() as tmpdir:
         with tarfile.open(archive_path, "r:*") as tar:
@@ -335,10 +341,35 @@ def import_brain(
 
             shutil.copy2(str(src), str(dst))
             result["imported"] += 1
+            if relpath == _LEDGER_RELPATH:
+                imported_ledger = dst
+
+    if imported_ledger is not None:
+        _backfill_sor(imported_ledger, target_brain, result)
 
     return result
 
 
+def _backfill_sor(ledger_path: Path, target_brain: Path, result: dict) -> None:
+    """Bulk-load the imported ledger's live engrams into the SoR.
+
+    Only when ``NUCLEUS_MEMORY_SOR`` is on; keys already in the target's SoR
+    are skipped, so merging into a brain that shares engrams adds no
+    duplicates. Failures are reported in ``result["errors"]`` — the file
+    import itself has already succeeded.
+    """
+    from .memory.facade import sor_flag_enabled
+
+    if not sor_flag_enabled():
+        return
+    try:
+        from .memory.backfill import backfill_sor_from_ledger
+
+        result["sor_backfill"] = backfill_sor_from_ledger(ledger_path, brain_path=target_brain)
+    except Exception as exc:  # noqa: BLE001 — SoR is derived from the imported ledger
+        result["errors"].append(f"SoR backfill failed: {exc}")
+
+
 # ---------------------------------------------------------------------------
 # Verify
 # ---------------------------------------------------------------------------
@@ -13,6 +13,11 @@ Auth: Bearer token via NucleusTenantMiddleware (same as relay routes).
 Tenant isolation: per-tenant brain path resolved by middleware; each
 tenant's engrams live in <brain_root>/<tenant_id>/.brain/engrams/ledger.jsonl.
 
+Deletes travel as tombstones: the hosted ledger records a DELETE as an
+append-only tombstone (see runtime/engram_ledger), a live engram only
+overrides a tombstone if its timestamp is later than the delete, and keys
+are resolved with ``engram_ledger.resolve_latest`` rather than by rank.
+
 Engram record shape (append-only JSONL):
     {
         "key": str,           # dedup key
@@ -34,6 +39,7 @@ Request:
     {
         "since_timestamp": "2026-06-15T10:00:00Z" | null,
         "local_engrams": [<engram_record>, ...],
+        "deleted_keys": [{"key": ..., "deleted_at": "..."}, ...],  # local tombstones
         "local_sync_state": {"last_sync_timestamp": "...", "sync_count": N}
     }
 
@@ -42,6 +48,7 @@ Response:
         "synced": <count of local engrams applied to hosted>,
         "conflicts": [{"key": ..., "local_version": N, "remote_version": M, "resolution": "remote_wins"|"local_wins"|"noop"}],
         "remote_engrams": [<engram_record>, ...],  # engrams local should apply
+        "deleted_keys": [{"key": ..., "deleted_at": "..."}, ...],  # local should delete
         "next_sync_timestamp": "2026-06-15T10:45:00Z",
         "hosted_sync_state": {"engram_count": N, "last_modified": "..."}
     }
@@ -111,33 +118,60 @@ def _validate_engram(engram: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
-def _read_hosted_engrams(ledger_path) -> Dict[str, Dict[str, Any]]:
-    """Read all engrams from hosted ledger, keyed by engram key.
+def _resolve_hosted(ledger_path) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Resolve the hosted ledger into (live engrams by key, tombstoned key → deleted_at).
 
-    Returns the LATEST version of each key (highest version, then latest timestamp).
+    Keys resolve through ``engram_ledger.resolve_latest`` (a tombstone
+    supersedes earlier records; live-vs-live uses ``_engram_rank``), so a
+    tombstone is never ranked against, or served as, a live engram.
     """
-    engrams_by_key: Dict[str, Dict[str, Any]] = {}
+    from mcp_server_nucleus.runtime.engram_ledger import is_tombstone, iter_records, resolve_latest
+
     if not ledger_path.exists():
-        return engrams_by_key
+        return {}, {}
+
+    def _winner(existing: Dict[str, Any], candidate: Dict[str, Any]) -> Dict[str, Any]:
+        return candidate if _engram_rank(candidate) > _engram_rank(existing) else existing
+
     try:
-        with open(ledger_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    engram = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                key = engram.get("key")
-                if not key:
-                    continue
-                existing = engrams_by_key.get(key)
-                if existing is None or _engram_rank(engram) > _engram_rank(existing):
-                    engrams_by_key[key] = engram
+        resolved = resolve_latest(iter_records(ledger_path), _winner)
     except Exception as e:
         logger.warning("Failed to read hosted ledger %s: %s", ledger_path, e)
-    return engrams_by_key
+        return {}, {}
+    live: Dict[str, Dict[str, Any]] = {}
+    tombstones: Dict[str, str] = {}
+    for key, rec in resolved["by_key"].items():
+        if is_tombstone(rec):
+            tombstones[key] = rec.get("deleted_at") or rec.get("timestamp", "")
+        else:
+            live[key] = rec
+    return live, tombstones
+
+
+def _read_hosted_engrams(ledger_path) -> Dict[str, Dict[str, Any]]:
+    """Read all live engrams from hosted ledger, keyed by engram key.
+
+    Returns the LATEST version of each key (highest version, then latest timestamp).
+    """
+    return _resolve_hosted(ledger_path)[0]
+
+
+def _newer_than(timestamp: str, other: str) -> bool:
+    """True if ``timestamp`` is strictly later than ``other`` (unparseable = not newer)."""
+    ts, ref = _parse_timestamp(timestamp), _parse_timestamp(other)
+    if ts is None or ref is None:
+        return False
+    return ts > ref
+
+
+def _tombstone(key: str, deleted_at: str) -> Dict[str, Any]:
+    return {
+        "key": key,
+        "op_type": "DELETE",
+        "timestamp": deleted_at,
+        "deleted": True,
+        "deleted_at": deleted_at,
+    }
 
 
 def _engram_rank(engram: Dict[str, Any]) -> Tuple[int, float, int]:
@@ -161,9 +195,13 @@ def _apply_engram_to_hosted(engram: Dict[str, Any], ledger_path, brain_path) ->
     if not key:
         return "skipped"
 
-    hosted = _read_hosted_engrams(ledger_path)
+    hosted, tombstones = _resolve_hosted(ledger_path)
     existing = hosted.get(key)
 
+    if key in tombstones and not _newer_than(engram.get("timestamp", ""), tombstones[key]):
+        # Deleted on hosted after this version was written.
+        return "noop"
+
     if existing is None:
         # ADD — engram doesn't exist on hosted
         _append_to_ledger(engram, ledger_path, brain_path)
@@ -264,8 +302,22 @@ async def engram_sync_route_handler(request: Request) -> JSONResponse:
     local_engrams = payload.get("local_engrams", [])
     local_sync_state = payload.get("local_sync_state", {})
 
+    deleted_keys = payload.get("deleted_keys", [])
+
     if not isinstance(local_engrams, list):
         return _err(400, "schema_violation", "local_engrams must be a list")
+    if not isinstance(deleted_keys, list) or not all(
+        isinstance(d, dict) and isinstance(d.get("key"), str) and d["key"]
+        and isinstance(d.get("deleted_at"), str)
+        for d in deleted_keys
+    ):
+        return _err(400, "schema_violation", "deleted_keys must be a list of {key, deleted_at}")
+    if len(deleted_keys) > MAX_ENGRAMS_PER_SYNC:
+        return _err(
+            413,
+            "too_many_engrams",
+            f"deleted_keys has {len(deleted_keys)} entries; max is {MAX_ENGRAMS_PER_SYNC}",
+        )
 
     if len(local_engrams) > MAX_ENGRAMS_PER_SYNC:
         return _err(
@@ -288,7 +340,21 @@ async def engram_sync_route_handler(request: Request) -> JSONResponse:
         return _err(400, "schema_violation", "; ".join(validation_errors[:5]))
 
     # Read hosted engrams (current state)
-    hosted_engrams = _read_hosted_engrams(ledger_path)
+    hosted_engrams, hosted_tombstones = _resolve_hosted(ledger_path)
+
+    # Phase 0: Apply local deletes to hosted (unless hosted holds a later write)
+    deleted_count = 0
+    for d in deleted_keys:
+        key, deleted_at = d["key"], d["deleted_at"]
+        existing = hosted_engrams.get(key)
+        if existing is not None and _newer_than(existing.get("timestamp", ""), deleted_at):
+            continue
+        if existing is None and key in hosted_tombstones:
+            continue
+        _append_to_ledger(_tombstone(key, deleted_at), ledger_path, brain_path)
+        hosted_engrams.pop(key, None)
+        hosted_tombstones[key] = deleted_at
+        deleted_count += 1
 
     # Phase 1: Apply local engrams to hosted
     synced_count = 0
@@ -298,10 +364,23 @@ async def engram_sync_route_handler(request: Request) -> JSONResponse:
         key = local_engram["key"]
         existing = hosted_engrams.get(key)
 
+        if key in hosted_tombstones and not _newer_than(
+            local_engram.get("timestamp", ""), hosted_tombstones[key]
+        ):
+            # Deleted on hosted after this version was written.
+            conflicts.append({
+                "key": key,
+                "local_version": local_engram.get("version"),
+                "remote_version": None,
+                "resolution": "remote_deleted",
+            })
+            continue
+
         if existing is None:
             # ADD
             _append_to_ledger(local_engram, ledger_path, brain_path)
             hosted_engrams[key] = local_engram
+            hosted_tombstones.pop(key, None)
             synced_count += 1
         else:
             local_rank = _engram_rank(local_engram)
@@ -354,6 +433,12 @@ async def engram_sync_route_handler(request: Request) -> JSONResponse:
     # Filter by since_timestamp if provided (incremental sync)
     remote_to_send = _filter_engrams_since(remote_to_send, since_timestamp)
 
+    # Hosted deletes of keys local still holds live
+    deletes_to_send = [
+        {"key": key, "deleted_at": hosted_tombstones[key]}
+        for key in sorted(local_keys & hosted_tombstones.keys())
+    ]
+
     # Build sync state
     next_sync_timestamp = _utc_now_iso()
     hosted_sync_state = {
@@ -366,10 +451,11 @@ async def engram_sync_route_handler(request: Request) -> JSONResponse:
     }
 
     logger.info(
-        "engram_sync tenant=%s local_in=%d synced=%d conflicts=%d remote_out=%d",
+        "engram_sync tenant=%s local_in=%d synced=%d deleted=%d conflicts=%d remote_out=%d",
         tenant_id,
         len(valid_local),
         synced_count,
+        deleted_count,
         len(conflicts),
         len(remote_to_send),
     )
@@ -381,6 +467,8 @@ async def engram_sync_route_handler(request: Request) -> JSONResponse:
         "conflict_count": len(conflicts),
         "remote_engrams": remote_to_send,
         "remote_count": len(remote_to_send),
+        "deleted_count": deleted_count,
+        "deleted_keys": deletes_to_send,
         "next_sync_timestamp": next_sync_timestamp,
         "hosted_sync_state": hosted_sync_state,
         "validation_errors": validation_errors,
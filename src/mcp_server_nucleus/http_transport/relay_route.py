@@ -13,13 +13,18 @@ exists. Filed via [DEVIATION] relay before merge.
 """
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
 import hashlib
 import json
 import logging
 import os
 import time
 import uuid
+import weakref
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 from starlette.requests import Request
@@ -37,6 +42,16 @@ RATE_PER_MIN = int(os.environ.get("NUCLEUS_RELAY_RATE_PER_MIN", "60"))
 RATE_BURST = int(os.environ.get("NUCLEUS_RELAY_RATE_BURST", "10"))
 RATE_PER_RECIPIENT = int(os.environ.get("NUCLEUS_RELAY_RATE_PER_RECIPIENT", "30"))
 IDEMPOTENCY_TTL_S = 24 * 3600
+# GET /relay/{recipient}?wait_s= long-poll ceiling; each held poll occupies
+# one worker thread, so keep it below client/proxy idle timeouts.
+MAX_LONG_POLL_S = float(os.environ.get("NUCLEUS_RELAY_LONG_POLL_MAX_S", "30"))
+# A held long-poll re-stats the inbox buckets this often. The HTTP app runs
+# no relay watcher, so writes by other processes only show up this way.
+LONG_POLL_RESCAN_S = float(os.environ.get("NUCLEUS_RELAY_LONG_POLL_RESCAN_S", "1"))
+# Worker threads for the blocking relay_ops calls (0 = run them inline on
+# the event loop, the pre-pool behaviour; benchmarks/bench_relay_http.py
+# uses it as the baseline).
+RELAY_WORKERS = int(os.environ.get("NUCLEUS_RELAY_WORKERS", "8"))
 VALID_PRIORITIES = {"low", "normal", "high", "urgent", "critical"}
 REQUIRED_FIELDS = ("subject", "body", "sender")
 
@@ -175,6 +190,92 @@ def _reset_rate_bucket_persistence() -> None:
     _last_bucket_snapshot = 0.0
 
 
+# ── Blocking-work offload ─────────────────────────────────────────────
+#
+# relay_ops is synchronous (bucket scans, JSON parse, atomic writes, index
+# transactions). Handlers hand it to a bounded worker pool so one slow inbox
+# no longer stalls every other request on the loop. Writes to one recipient
+# (post, ack) are serialized with a per-recipient asyncio.Lock, taken before
+# a worker is claimed, so a burst at one bucket queues on the loop instead of
+# pinning every worker; reads run concurrently. Long-polls stay off this
+# pool (asyncio.to_thread) so held connections cannot starve posts.
+
+_relay_executor: Optional[ThreadPoolExecutor] = None
+# loop -> {recipient: Lock}; asyncio locks are bound to the loop that uses them.
+_recipient_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_relay_executor() -> ThreadPoolExecutor:
+    global _relay_executor
+    if _relay_executor is None:
+        _relay_executor = ThreadPoolExecutor(
+            max_workers=max(RELAY_WORKERS, 1), thread_name_prefix="nucleus-relay"
+        )
+    return _relay_executor
+
+
+def _recipient_lock(recipient: str) -> asyncio.Lock:
+    locks = _recipient_locks.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.get(recipient)
+    if lock is None:
+        lock = locks[recipient] = asyncio.Lock()
+    return lock
+
+
+async def _run_blocking(route: str, fn, *args, serialize_on: Optional[str] = None, **kwargs):
+    """Run ``fn(*args, **kwargs)`` on the relay worker pool.
+
+    ``serialize_on`` names a recipient whose writes must not interleave.
+    Time spent waiting for the lock and a free worker is recorded as
+    ``relay_route.<route>.queue_wait``.
+    """
+    from mcp_server_nucleus.runtime.prometheus import observe_latency
+
+    if RELAY_WORKERS <= 0:
+        return fn(*args, **kwargs)
+    queued = time.perf_counter()
+
+    def call():
+        observe_latency(f"relay_route.{route}.queue_wait", time.perf_counter() - queued)
+        return fn(*args, **kwargs)
+
+    # Carry the request's ContextVars (tenant brain path, project) into the
+    # worker, as asyncio.to_thread does.
+    ctx = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    if serialize_on is None:
+        return await loop.run_in_executor(_get_relay_executor(), ctx.run, call)
+    async with _recipient_lock(serialize_on):
+        return await loop.run_in_executor(_get_relay_executor(), ctx.run, call)
+
+
+def _timed(route: str):
+    """Record request latency and a per-status count for a relay handler.
+
+    Exported through runtime.prometheus as
+    ``nucleus_tool_latency_seconds{tool="relay_route.<route>"}`` and
+    ``nucleus_tool_calls_total{route=...,status=...}``.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(request: Request) -> JSONResponse:
+            from mcp_server_nucleus.runtime.prometheus import inc_counter, observe_latency
+
+            start = time.perf_counter()
+            status = 500
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return response
+            finally:
+                observe_latency(f"relay_route.{route}", time.perf_counter() - start)
+                inc_counter("relay_route_requests", {"route": route, "status": str(status)})
+        return wrapper
+    return decorator
+
+
 def _load_token_map() -> Dict[str, str]:
     """Parse NUCLEUS_RELAY_TOKEN_MAP env var. Returns {token: owner_sender}."""
     raw = os.environ.get("NUCLEUS_RELAY_TOKEN_MAP", "")
@@ -486,6 +587,7 @@ def _err(http_status: int, code: str, reason: str, retry_after_s: Optional[int]
     return JSONResponse(body, status_code=http_status, headers=headers)
 
 
+@_timed("post")
 async def post_relay(request: Request) -> JSONResponse:
     """POST /relay/{recipient} — envelope contract per a2a_envelope_alignment.md."""
     now = time.time()
@@ -636,7 +738,10 @@ async def post_relay(request: Request) -> JSONResponse:
     # force_fs=True: the server is the FS authority; without it a server
     # process running with NUCLEUS_RELAY_URL set self-recurses over HTTP.
     try:
-        result = relay_ops.relay_post(
+        result = await _run_blocking(
+            "post",
+            relay_ops.relay_post,
+            serialize_on=recipient,
             to=recipient,
             subject=subject,
             body=body_field,
@@ -705,6 +810,7 @@ async def post_relay(request: Request) -> JSONResponse:
     return JSONResponse(response, status_code=202, headers=rate_headers)
 
 
+@_timed("get")
 async def get_relay(request: Request) -> JSONResponse:
     """GET /relay/{recipient} — fetch inbox for recipient."""
     now = time.time()
@@ -736,27 +842,96 @@ async def get_relay(request: Request) -> JSONResponse:
     except (ValueError, TypeError):
         limit = 50
     unread_only = request.query_params.get("unread_only", "false").lower() in ("1", "true", "yes")
+    try:
+        wait_s = float(request.query_params.get("wait_s", "0"))
+        wait_s = max(0.0, min(wait_s, MAX_LONG_POLL_S))
+    except (ValueError, TypeError):
+        wait_s = 0.0
+    cursor = request.query_params.get("cursor") or None
 
     try:
-        # force_fs=True: server-side self-recursion guard (see post handler).
-        result = relay_ops.relay_inbox(
-            recipient=recipient,
-            limit=limit,
-            unread_only=unread_only,
-            force_fs=True,
-        )
+        if wait_s > 0:
+            result, cursor = await asyncio.to_thread(
+                _long_poll_inbox, recipient, limit, unread_only, wait_s, cursor
+            )
+        else:
+            # force_fs=True: server-side self-recursion guard (see post handler).
+            result = await _run_blocking(
+                "get",
+                relay_ops.relay_inbox,
+                recipient=recipient,
+                limit=limit,
+                unread_only=unread_only,
+                force_fs=True,
+            )
+            cursor = _inbox_cursor(recipient)
     except Exception as e:
         return _err(503, "inbox_unavailable", f"Failed to read inbox: {e}", rate_headers=rate_headers)
 
     messages = result.get("messages", [])
     has_more = len(messages) >= limit
     return JSONResponse(
-        {"messages": messages, "count": len(messages), "has_more": has_more},
+        {"messages": messages, "count": len(messages), "has_more": has_more, "cursor": cursor},
         status_code=200,
         headers=rate_headers,
     )
 
 
+def _inbox_cursor(recipient: str, gens: Optional[Tuple[int, ...]] = None) -> str:
+    """Opaque change cursor for ``recipient``'s inbox (hub generations)."""
+    if gens is None:
+        from mcp_server_nucleus.runtime.relay.hub import bucket_generations, rescan_buckets
+        dirs = relay_ops._iter_inbox_dirs(recipient)
+        # Record the bucket mtimes this cursor covers, so a later long-poll
+        # holding it notices files other processes add after this response.
+        rescan_buckets(dirs)
+        gens = bucket_generations(dirs)
+    return ".".join(str(g) for g in gens)
+
+
+def _long_poll_inbox(
+    recipient: str,
+    limit: int,
+    unread_only: bool,
+    wait_s: float,
+    cursor: Optional[str],
+) -> Tuple[Dict[str, Any], str]:
+    """Hold GET /relay/{recipient} open for up to ``wait_s`` seconds.
+
+    Without ``cursor`` the poll returns as soon as the inbox listing is
+    non-empty. With the ``cursor`` of a previous response it returns as soon
+    as a message lands in the inbox after that response — so a client that
+    already holds the current listing (e.g. relay_wait scanning for a reply)
+    does not spin on it. Either way it returns the listing on timeout.
+    Runs in a worker thread; wakes on the relay hub for in-process posts and
+    re-stats the buckets every ``LONG_POLL_RESCAN_S`` for foreign writers.
+    """
+    from mcp_server_nucleus.runtime.relay.hub import (
+        bucket_generations, rescan_buckets, wait_for_change,
+    )
+
+    dirs = relay_ops._iter_inbox_dirs(recipient)
+    deadline = time.monotonic() + wait_s
+    rescan_buckets(dirs)
+    while True:
+        gens = bucket_generations(dirs)
+        current = _inbox_cursor(recipient, gens)
+        remaining = deadline - time.monotonic()
+        if cursor != current or remaining <= 0:
+            # force_fs=True: server-side self-recursion guard (see post handler).
+            result = relay_ops.relay_inbox(
+                recipient=recipient,
+                limit=limit,
+                unread_only=unread_only,
+                force_fs=True,
+            )
+            if result.get("messages") or cursor is not None or remaining <= 0:
+                return result, current
+        if not wait_for_change(dirs, gens, min(remaining, LONG_POLL_RESCAN_S)):
+            rescan_buckets(dirs)
+
+
+@_timed("ack")
 async def ack_relay(request: Request) -> JSONResponse:
     """POST /relay/{recipient}/ack — acknowledge message_ids."""
     now = time.time()
@@ -798,6 +973,14 @@ async def ack_relay(request: Request) -> JSONResponse:
     if session_id is not None and not isinstance(session_id, str):
         return _err(400, "schema_violation", "session_id must be a string", rate_headers=rate_headers)
 
+    acked, failed = await _run_blocking(
+        "ack", _ack_messages, recipient, message_ids, session_id, serialize_on=recipient
+    )
+    return JSONResponse({"acked": acked, "failed": failed}, status_code=200, headers=rate_headers)
+
+
+def _ack_messages(recipient: str, message_ids: List[Any], session_id: Optional[str]) -> Tuple[int, int]:
+    """Ack each id for ``recipient``; returns ``(acked, failed)``."""
     acked = 0
     failed = 0
     for mid in message_ids:
@@ -812,10 +995,10 @@ async def ack_relay(request: Request) -> JSONResponse:
                 failed += 1
         except Exception:
             failed += 1
-
-    return JSONResponse({"acked": acked, "failed": failed}, status_code=200, headers=rate_headers)
+    return acked, failed
 
 
+@_timed("status")
 async def get_relay_status(request: Request) -> JSONResponse:
     """GET /relay/{recipient}/status — check inbox stats for recipient."""
     now = time.time()
@@ -842,40 +1025,10 @@ async def get_relay_status(request: Request) -> JSONResponse:
         # force_fs=True: server-side self-recursion guard (see post handler).
         # Without it relay_status() returns the v0.1 HTTP-mode stub
         # (mailboxes={}) instead of the authoritative FS stats.
-        status = relay_ops.relay_status(force_fs=True)
+        status = await _run_blocking("status", relay_ops.relay_status, force_fs=True)
         mailbox = status.get("mailboxes", {}).get(recipient, {})
-        
-        marketplace_data = None
-        try:
-            from mcp_server_nucleus.runtime.marketplace import lookup_by_address, ReputationSignals, TrustTier
-            from datetime import datetime
-            
-            address = f"{recipient}@nucleus"
-            card = lookup_by_address(address)
-            if card is not None:
-                metrics = ReputationSignals.compute_signals(address)
-                tier_enum = TrustTier.evaluate(card, metrics)
-                tier_badge = TrustTier.get_display_badge(tier_enum)
-                
-                last_seen = metrics.get("last_seen_at")
-                last_interaction_at = None
-                if last_seen:
-                    try:
-                        dt = datetime.fromisoformat(last_seen.replace("Z", "+00:00"))
-                        last_interaction_at = dt.timestamp()
-                    except Exception:
-                        pass
-                
-                marketplace_data = {
-                    "registered": True,
-                    "tier": tier_badge,
-                    "reputation_score": metrics.get("connection_count", 0),
-                    "last_interaction_at": last_interaction_at
-                }
-        except Exception as e:
-            logger.warning("Failed to lookup marketplace status for %s: %s", recipient, e)
-            marketplace_data = None
-        
+        marketplace_data = await _run_blocking("status", _marketplace_status, recipient)
+
         response = {
             "recipient": recipient,
             "queue_depth": mailbox.get("total", 0),
@@ -887,6 +1040,41 @@ async def get_relay_status(request: Request) -> JSONResponse:
         return _err(503, "status_unavailable", f"Failed to get relay status: {e}", rate_headers=rate_headers)
 
 
+def _marketplace_status(recipient: str) -> Optional[Dict[str, Any]]:
+    """Marketplace card summary for GET /relay/{recipient}/status (blocking)."""
+    marketplace_data = None
+    try:
+        from mcp_server_nucleus.runtime.marketplace import lookup_by_address, ReputationSignals, TrustTier
+        from datetime import datetime
+        
+        address = f"{recipient}@nucleus"
+        card = lookup_by_address(address)
+        if card is not None:
+            metrics = ReputationSignals.compute_signals(address)
+            tier_enum = TrustTier.evaluate(card, metrics)
+            tier_badge = TrustTier.get_display_badge(tier_enum)
+            
+            last_seen = metrics.get("last_seen_at")
+            last_interaction_at = None
+            if last_seen:
+                try:
+                    dt = datetime.fromisoformat(last_seen.replace("Z", "+00:00"))
+                    last_interaction_at = dt.timestamp()
+                except Exception:
+                    pass
+            
+            marketplace_data = {
+                "registered": True,
+                "tier": tier_badge,
+                "reputation_score": metrics.get("connection_count", 0),
+                "last_interaction_at": last_interaction_at
+            }
+    except Exception as e:
+        logger.warning("Failed to lookup marketplace status for %s: %s", recipient, e)
+        marketplace_data = None
+    return marketplace_data
+
+
 # Route registration helper
 relay_route = Route("/relay/{recipient}", post_relay, methods=["POST"])
 relay_get_route = Route("/relay/{recipient}", get_relay, methods=["GET"])
@@ -5,6 +5,7 @@ Public API (batch 1, scaffold only — no existing caller is repointed here yet)
     from mcp_server_nucleus.memory import MemoryFacade
     mf = MemoryFacade()                 # honours NUCLEUS_MEMORY_SOR (default off)
     mf.capture(surface, payload, ...)   # -> {id, key, ts, persisted}
+    mf.capture_many([{...}, ...])       # -> [{id, key, ts, persisted}, ...]
     mf.recall(query, ...)               # -> [ranked hits]
     mf.curate(id_or_key, action)        # -> {ok, ...}
 
@@ -0,0 +1,93 @@
+"""Ledger → SoR backfill (Move 2 batch 6, dedup-by-key).
+
+Copies the live engrams of an ADUN ``engrams/ledger.jsonl`` into the SoR so
+engrams written before ``NUCLEUS_MEMORY_SOR`` was turned on (or brought in by
+``nucleus import``) become recallable through the ``MemoryFacade``.
+
+  * Latest-live only — the ledger is resolved with ``engram_ledger`` rules, so
+    superseded versions and tombstoned keys never become SoR rows.
+  * Dedup-by-key — keys that already have a SoR row (dual-written by the
+    batch-2/3 mirrors, or a previous backfill run) are skipped, so re-running
+    the backfill is idempotent.
+  * Bulk — rows go in through ``MemoryFacade.capture_many`` in chunks of
+    ``batch_size``, one transaction each, rather than one transaction per
+    engram. Large loads go in as a single transaction with the FTS shadow
+    rebuilt once at the end.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .facade import MemoryFacade
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Below this many rows the per-row FTS trigger is cheaper than a full
+# ``'rebuild'`` of the FTS shadow.
+_DEFER_FTS_MIN_ROWS = 5000
+
+
+def _sor_record(engram: dict) -> dict:
+    """Map one ADUN engram onto ``capture``'s fields (same shape as the
+    ``memory_pipeline`` mirror, so backfilled and mirrored rows agree)."""
+    return {
+        "surface": engram.get("source_agent", "unknown"),
+        "payload": engram.get("value", ""),
+        "kind": engram.get("context", "note"),
+        "ts": engram.get("timestamp"),
+        "key": engram.get("key"),
+        "meta": {
+            "op_type": "BACKFILL",
+            "intensity": engram.get("intensity"),
+            "version": engram.get("version"),
+        },
+    }
+
+
+def backfill_sor_from_ledger(
+    ledger_path: Union[str, Path],
+    *,
+    facade: Optional[MemoryFacade] = None,
+    brain_path: Union[None, str, Path] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    vector_sink: Any = None,
+) -> dict:
+    """Bulk-insert the ledger's live engrams whose key is not yet in the SoR.
+
+    ``facade`` defaults to an enabled ``MemoryFacade`` for ``brain_path``.
+    Returns ``{"live", "inserted", "skipped_existing", "skipped_empty"}``.
+    """
+    from mcp_server_nucleus.runtime.engram_ledger import load_live_engrams
+
+    if facade is None:
+        facade = MemoryFacade(brain_path=brain_path, enabled=True)
+    stats = {"live": 0, "inserted": 0, "skipped_existing": 0, "skipped_empty": 0}
+    store = facade._store()
+    ledger_path = Path(ledger_path)
+    if store is None or not ledger_path.exists():
+        return stats
+
+    engrams = load_live_engrams(ledger_path)
+    stats["live"] = len(engrams)
+    existing = store.existing_keys(e.get("key") for e in engrams)
+    pending = []
+    for engram in engrams:
+        key = engram.get("key")
+        if key and key in existing:
+            stats["skipped_existing"] += 1
+        elif not engram.get("value"):
+            stats["skipped_empty"] += 1
+        else:
+            pending.append(_sor_record(engram))
+
+    if len(pending) >= _DEFER_FTS_MIN_ROWS:
+        # Large load: one transaction, FTS shadow rebuilt once at the end.
+        batches = [pending]
+    else:
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    for chunk in batches:
+        results = facade.capture_many(chunk, defer_fts=len(chunk) >= _DEFER_FTS_MIN_ROWS,
+                                      vector_sink=vector_sink)
+        stats["inserted"] += sum(1 for r in results if r["persisted"])
+    return stats
@@ -6,6 +6,7 @@ Target design (``scratchpad/move2_manifest.md`` Part B): every memory caller —
 captures — eventually delegates to this facade's three verbs:
 
     capture(surface, payload, *, kind, tags, meta, ts, key) -> {id, key, ts}
+    capture_many([{surface, payload, ...}, ...])               -> [{id, key, ts}]
     recall(query, *, kind, tags, since, surface, limit, mode)  -> [ranked hits]
     curate(target, action)                                     -> {ok}
 
@@ -132,6 +133,66 @@ class MemoryFacade:
                 pass
         return result
 
+    def capture_many(
+        self,
+        records: Iterable[dict],
+        *,
+        defer_fts: bool = False,
+        vector_sink: Any = None,
+    ) -> list:
+        """Capture many engrams in one SoR transaction. Flag-OFF: no-op scaffold.
+
+        Each record is a dict of ``capture``'s arguments (``surface``,
+        ``payload``, ``kind``, ``tags``, ``meta``, ``ts``, ``key``). Returns one
+        result per record, in input order, shaped like ``capture``'s; a record
+        without a payload comes back with ``persisted=False`` and an ``error``
+        while the rest are still written. See ``SorStore.insert_many`` for
+        ``defer_fts``. ``vector_sink`` is fed the
+        rows after the commit, best-effort as in ``capture`` — in one
+        ``index_many`` call (batched embedding) when the sink has it.
+        """
+        records = list(records)
+        store = self._store()
+        if store is None:
+            return [
+                {"id": None, "key": r.get("key"), "ts": r.get("ts"), "persisted": False}
+                for r in records
+            ]
+        results = store.insert_many(
+            (
+                {
+                    "surface": r.get("surface"),
+                    "text": r.get("payload"),
+                    "kind": r.get("kind", "note"),
+                    "tags": r.get("tags"),
+                    "meta": r.get("meta"),
+                    "ts": r.get("ts"),
+                    "key": r.get("key"),
+                }
+                for r in records
+            ),
+            defer_fts=defer_fts,
+        )
+        for result in results:
+            result["persisted"] = result["id"] is not None
+        if vector_sink is not None and hasattr(vector_sink, "index_many"):
+            try:
+                vector_sink.index_many(
+                    (result["id"], record.get("payload"), record.get("meta"))
+                    for result, record in zip(results, records)
+                    if result["persisted"]
+                )
+            except Exception:  # noqa: BLE001 — index sink is best-effort/additive
+                pass
+            return results
+        for result, record in zip(results, records):
+            if vector_sink is not None and result["persisted"]:
+                try:
+                    vector_sink.index(result["id"], record.get("payload"), metadata=record.get("meta"))
+                except Exception:  # noqa: BLE001 — index sink is best-effort/additive
+                    pass
+        return results
+
     def recall(
         self,
         query: str = "",
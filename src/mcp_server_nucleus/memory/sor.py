@@ -14,8 +14,8 @@ Design provenance (see ``scratchpad/move2_manifest.md`` Part B / Batch 0):
   - FTS5 shadow powers ranked ``recall`` (the "beats grep" product gate). Literal
     tokens containing ``.`` / ``/`` / ``-`` make FTS5 raise ``fts5: syntax
     error``; ``_fts_match`` applies the documented try-then-quote retry
-    (ref: eidetic-daemon internal/store/store.go Search() PR #77, and the
-    future-FTS5 note in ``runtime/vector_store.py``).
+    (ref: eidetic-daemon internal/store/store.go Search() PR #77; shared as
+    ``runtime.common.fts_match``).
   - ``curate`` writes an overlay row pointing at the target (mirrors
     ``mcp__eidetic__nucleus_curate``); the original ``engrams`` row is never
     modified — non-destructive.
@@ -33,7 +33,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Iterable, Optional, Union
 
-from mcp_server_nucleus.runtime.common import open_hardened_sqlite
+from mcp_server_nucleus.runtime.common import SQLitePool, fts_match, get_sqlite_pool
 
 # Valid non-destructive curation overlay actions (mirrors eidetic nucleus_curate
 # plus an explicit soft ``delete``; ``delete`` is an overlay, never a row DELETE).
@@ -46,6 +46,13 @@ _HIDDEN_ACTIONS = frozenset({"archive", "delete"})
 _CANONICAL_BOOST = 10.0
 _DEMOTE_PENALTY = 10.0
 
+# The insert-side FTS trigger, kept separately so ``insert_many(defer_fts=True)``
+# can drop and recreate it around a bulk load.
+_FTS_INSERT_TRIGGER = """CREATE TRIGGER IF NOT EXISTS engrams_ai AFTER INSERT ON engrams BEGIN
+    INSERT INTO engrams_fts(rowid, text, tags, kind, surface)
+    VALUES (new.id, new.text, new.tags, new.kind, new.surface);
+END;"""
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS engrams (
     id INTEGER PRIMARY KEY,
@@ -69,10 +76,7 @@ CREATE VIRTUAL TABLE IF NOT EXISTS engrams_fts USING fts5(
 );
 
 -- Keep the FTS5 shadow in lockstep with the engrams table.
-CREATE TRIGGER IF NOT EXISTS engrams_ai AFTER INSERT ON engrams BEGIN
-    INSERT INTO engrams_fts(rowid, text, tags, kind, surface)
-    VALUES (new.id, new.text, new.tags, new.kind, new.surface);
-END;
+""" + _FTS_INSERT_TRIGGER + """
 CREATE TRIGGER IF NOT EXISTS engrams_ad AFTER DELETE ON engrams BEGIN
     INSERT INTO engrams_fts(engrams_fts, rowid, text, tags, kind, surface)
     VALUES ('delete', old.id, old.text, old.tags, old.kind, old.surface);
@@ -92,6 +96,29 @@ CREATE TABLE IF NOT EXISTS curation_overlay (
     created_at TEXT
 );
 CREATE INDEX IF NOT EXISTS idx_curation_target ON curation_overlay(target_id);
+
+-- Latest overlay action per target, maintained on every curate so recall
+-- looks up only its candidates instead of scanning the overlay history.
+CREATE TABLE IF NOT EXISTS curation_latest (
+    target_id INTEGER PRIMARY KEY,
+    action TEXT NOT NULL,
+    overlay_id INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS curation_overlay_ai AFTER INSERT ON curation_overlay BEGIN
+    INSERT INTO curation_latest(target_id, action, overlay_id)
+    VALUES (new.target_id, new.action, new.id)
+    ON CONFLICT(target_id) DO UPDATE SET
+        action = excluded.action, overlay_id = excluded.overlay_id
+    WHERE excluded.overlay_id > curation_latest.overlay_id;
+END;
+"""
+
+# One-time backfill for SoR files created before ``curation_latest`` existed.
+_BACKFILL_CURATION_LATEST = """
+INSERT OR REPLACE INTO curation_latest(target_id, action, overlay_id)
+SELECT co.target_id, co.action, co.id FROM curation_overlay co
+WHERE co.id = (SELECT MAX(id) FROM curation_overlay WHERE target_id = co.target_id)
+  AND NOT EXISTS (SELECT 1 FROM curation_latest)
 """
 
 _RELATIVE_SINCE_RE = re.compile(r"^(\d+)([dhm])$")
@@ -144,19 +171,27 @@ class SorStore:
     def __init__(self, db_path: Union[str, Path]):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool: Optional[SQLitePool] = None
         self.ensure_schema()
 
     # -- connection / schema ------------------------------------------------
-    def _connect(self) -> sqlite3.Connection:
-        # Inherit the shared primary-store concurrency posture
-        # (WAL + busy_timeout + synchronous=NORMAL) from runtime/common.py.
-        conn = open_hardened_sqlite(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
-
+    # Connections come from the process-wide pool for this db path: one
+    # long-lived hardened connection per reading thread plus a single
+    # serialized writer (WAL + busy_timeout + synchronous=NORMAL, see
+    # runtime/common.py). Constructing a SorStore per call is therefore cheap —
+    # the schema script runs once per path per process, not per instance.
     def ensure_schema(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(SCHEMA)
+        self._pool = get_sqlite_pool(
+            self.db_path,
+            schema=SCHEMA + _BACKFILL_CURATION_LATEST + ";",
+            row_factory=sqlite3.Row,
+        )
+
+    def _reader(self) -> sqlite3.Connection:
+        return self._pool.reader()
+
+    def _writer(self):
+        return self._pool.writer()
 
     # -- write --------------------------------------------------------------
     def insert(
@@ -178,7 +213,7 @@ class SorStore:
         key = key or uuid.uuid4().hex
         tags_str = _normalize_tags(tags)
         meta_str = _normalize_meta(meta)
-        with self._connect() as conn:
+        with self._writer() as conn:
             cur = conn.execute(
                 "INSERT INTO engrams "
                 "(key, surface, text, tags, kind, meta, created_at, optional_date, source) "
@@ -188,31 +223,100 @@ class SorStore:
             row_id = cur.lastrowid
         return {"id": row_id, "key": key, "ts": created_at}
 
+    def insert_many(
+        self,
+        records: Iterable[dict],
+        *,
+        defer_fts: bool = False,
+        source: str = "facade",
+    ) -> list:
+        """Insert many engrams in one transaction. Returns ``[{id, key, ts}]`` in
+        input order.
+
+        Each record takes ``insert``'s fields as keys (``surface``, ``text``,
+        ``kind``, ``tags``, ``meta``, ``ts``, ``key``, ``source``). Ids are
+        assigned up front under ``BEGIN IMMEDIATE`` so the rows go in with a
+        single ``executemany``. With ``defer_fts`` the per-row FTS trigger is
+        dropped for the load and the shadow is rebuilt once at the end — worth it
+        for large replays/imports, not for a handful of rows (``'rebuild'``
+        re-indexes the whole table). A record without ``text`` is rejected on its
+        own, as ``insert`` would reject it: its result carries ``id=None`` and an
+        ``error``, and the rest of the batch is still inserted.
+        """
+        now = _now_iso()
+        rows = []
+        results = []
+        inserted = []
+        for rec in records:
+            text = rec.get("text")
+            created_at = rec.get("ts") or now
+            key = rec.get("key") or uuid.uuid4().hex
+            if not text:
+                results.append({"id": None, "key": key, "ts": created_at,
+                                "error": "text (payload) is required"})
+                continue
+            rows.append((
+                key,
+                rec.get("surface"),
+                text,
+                _normalize_tags(rec.get("tags")),
+                rec.get("kind") or "note",
+                _normalize_meta(rec.get("meta")),
+                created_at,
+                "",
+                rec.get("source") or source,
+            ))
+            inserted.append({"id": None, "key": key, "ts": created_at})
+            results.append(inserted[-1])
+        if not rows:
+            return results
+        with self._writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            first_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM engrams").fetchone()[0] + 1
+            if defer_fts:
+                conn.execute("DROP TRIGGER IF EXISTS engrams_ai")
+            conn.executemany(
+                "INSERT INTO engrams "
+                "(id, key, surface, text, tags, kind, meta, created_at, optional_date, source) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((first_id + i, *row) for i, row in enumerate(rows)),
+            )
+            if defer_fts:
+                conn.execute(_FTS_INSERT_TRIGGER)
+                conn.execute("INSERT INTO engrams_fts(engrams_fts) VALUES ('rebuild')")
+        for i, result in enumerate(inserted):
+            result["id"] = first_id + i
+        return results
+
     # -- read ---------------------------------------------------------------
     def _fts_match(self, conn: sqlite3.Connection, sql: str, match_expr: str, tail_params: tuple):
         """Run an FTS5 MATCH query with the try-then-quote retry.
 
         Literal tokens containing ``.`` / ``/`` / ``-`` are parsed as FTS5 syntax
         and raise ``fts5: syntax error``; retry once phrase-quoting the whole
-        expression (with ``"``-escape doubling). FTS5's own error string is the
-        discriminator; any other OperationalError propagates unchanged.
+        expression. Shared with the other FTS5 shadows via
+        ``runtime.common.fts_match``.
+        """
+        return fts_match(conn, sql, match_expr, tail_params)
+
+    def _latest_overlays(self, conn: sqlite3.Connection, target_ids: Iterable[int]) -> dict:
+        """Map ``target_id`` -> latest overlay action for the given ids only.
+
+        Served from the ``curation_latest`` table (primary-key lookups), so the
+        cost tracks the candidate count, not the overlay history.
         """
-        try:
-            return conn.execute(sql, (match_expr, *tail_params)).fetchall()
-        except sqlite3.OperationalError as exc:
-            msg = str(exc).lower()
-            if "fts5" in msg or "syntax error" in msg or "no such column" in msg:
-                quoted = '"' + match_expr.replace('"', '""') + '"'
-                return conn.execute(sql, (quoted, *tail_params)).fetchall()
-            raise
-
-    def _latest_overlays(self, conn: sqlite3.Connection) -> dict:
-        """Map ``target_id`` -> latest overlay action (by overlay row id)."""
-        rows = conn.execute(
-            "SELECT target_id, action FROM curation_overlay co "
-            "WHERE co.id = (SELECT MAX(id) FROM curation_overlay WHERE target_id = co.target_id)"
-        ).fetchall()
-        return {r["target_id"]: r["action"] for r in rows}
+        ids = list(dict.fromkeys(target_ids))
+        overlays: dict = {}
+        # Stay under SQLite's default bound-parameter limit.
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = conn.execute(
+                "SELECT target_id, action FROM curation_latest WHERE target_id IN ("
+                + ",".join("?" * len(chunk)) + ")",
+                chunk,
+            ).fetchall()
+            overlays.update({r["target_id"]: r["action"] for r in rows})
+        return overlays
 
     def search(
         self,
@@ -249,28 +353,28 @@ class SorStore:
         # Fetch headroom so curation-hidden rows don't starve the result set.
         fetch_cap = max(limit * 4, 40)
         rows: list = []
-        with self._connect() as conn:
-            if query:
-                sql = (
-                    "SELECT e.id, e.key, e.surface, e.text, e.tags, e.kind, "
-                    "e.created_at, e.source, bm25(engrams_fts) AS rank "
-                    "FROM engrams_fts JOIN engrams e ON e.id = engrams_fts.rowid "
-                    "WHERE engrams_fts MATCH ?" + where_extra +
-                    " ORDER BY rank LIMIT ?"
-                )
-                raw = self._fts_match(conn, sql, query, (*filter_params, fetch_cap))
-                # bm25: lower is more relevant → negate so higher == better.
-                candidates = [(r, -float(r["rank"])) for r in raw]
-            else:
-                sql = (
-                    "SELECT e.id, e.key, e.surface, e.text, e.tags, e.kind, "
-                    "e.created_at, e.source "
-                    "FROM engrams e WHERE 1=1" + where_extra +
-                    " ORDER BY e.id DESC LIMIT ?"
-                )
-                raw = conn.execute(sql, (*filter_params, fetch_cap)).fetchall()
-                candidates = [(r, 1.0) for r in raw]
-            overlays = self._latest_overlays(conn)
+        conn = self._reader()
+        if query:
+            sql = (
+                "SELECT e.id, e.key, e.surface, e.text, e.tags, e.kind, "
+                "e.created_at, e.source, bm25(engrams_fts) AS rank "
+                "FROM engrams_fts JOIN engrams e ON e.id = engrams_fts.rowid "
+                "WHERE engrams_fts MATCH ?" + where_extra +
+                " ORDER BY rank LIMIT ?"
+            )
+            raw = self._fts_match(conn, sql, query, (*filter_params, fetch_cap))
+            # bm25: lower is more relevant → negate so higher == better.
+            candidates = [(r, -float(r["rank"])) for r in raw]
+        else:
+            sql = (
+                "SELECT e.id, e.key, e.surface, e.text, e.tags, e.kind, "
+                "e.created_at, e.source "
+                "FROM engrams e WHERE 1=1" + where_extra +
+                " ORDER BY e.id DESC LIMIT ?"
+            )
+            raw = conn.execute(sql, (*filter_params, fetch_cap)).fetchall()
+            candidates = [(r, 1.0) for r in raw]
+        overlays = self._latest_overlays(conn, (r["id"] for r, _ in candidates))
 
         results = []
         for row, base_score in candidates:
@@ -308,7 +412,7 @@ class SorStore:
             raise ValueError(
                 f"SorStore.curate: action must be one of {CURATION_ACTIONS}, got {action!r}"
             )
-        with self._connect() as conn:
+        with self._writer() as conn:
             if isinstance(target, int):
                 row = conn.execute(
                     "SELECT id, key FROM engrams WHERE id = ?", (target,)
@@ -328,6 +432,20 @@ class SorStore:
         return {"ok": True, "id": row["id"], "key": row["key"], "action": action}
 
     # -- introspection ------------------------------------------------------
+    def existing_keys(self, keys: Iterable[str]) -> set:
+        """Subset of ``keys`` that already have at least one SoR row."""
+        wanted = [k for k in dict.fromkeys(keys) if k]
+        found: set = set()
+        conn = self._reader()
+        for i in range(0, len(wanted), 500):
+            chunk = wanted[i:i + 500]
+            rows = conn.execute(
+                "SELECT DISTINCT key FROM engrams WHERE key IN ("
+                + ",".join("?" * len(chunk)) + ")",
+                chunk,
+            ).fetchall()
+            found.update(r["key"] for r in rows)
+        return found
+
     def count(self) -> int:
-        with self._connect() as conn:
-            return int(conn.execute("SELECT COUNT(*) FROM engrams").fetchone()[0])
+        return int(self._reader().execute("SELECT COUNT(*) FROM engrams").fetchone()[0])
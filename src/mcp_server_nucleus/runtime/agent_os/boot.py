@@ -267,26 +267,18 @@ def _log_stub_interaction(prompt: str, text: str, session_id: str, agent_id: str
     """Mirror the real engines' interaction capture so the stubbed call is still
     recorded through Nucleus subsystems (raw interaction log + budget manager)."""
     try:
-        from ..common import get_brain_path
-
-        raw_path = get_brain_path() / "raw"
-        raw_path.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-        (raw_path / f"llm_interaction_{ts}.json").write_text(
-            json.dumps(
-                {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "engine": "STUB",
-                    "model": "stub-deterministic-v0",
-                    "session_id": session_id,
-                    "agent_id": agent_id,
-                    "prompt": str(prompt)[:5000],
-                    "response_text": text,
-                },
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
+        from ..interaction_log import log_interaction
+
+        log_interaction(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "engine": "STUB",
+                "model": "stub-deterministic-v0",
+                "session_id": session_id,
+                "agent_id": agent_id,
+                "prompt": str(prompt)[:5000],
+                "response_text": text,
+            }
         )
     except Exception:  # noqa: BLE001 — capture is best-effort
         pass
@@ -583,8 +575,11 @@ def demo() -> int:
                 found_event = ev
     print(f"\n  events.jsonl LLM_GENERATE row (a raw provider call would write NONE):")
     print("    " + json.dumps(found_event, ensure_ascii=False) if found_event else "    <none>")
-    raw_logs = list((tmp / "raw").glob("llm_interaction_*.json")) if (tmp / "raw").exists() else []
-    print(f"  interaction captured to .brain/raw/: {len(raw_logs)} file(s)")
+    from ..interaction_log import flush as flush_interactions, iter_interactions
+
+    flush_interactions()
+    raw_logs = list(iter_interactions(brain_path=tmp))
+    print(f"  interaction captured to .brain/raw/interactions/: {len(raw_logs)} record(s)")
 
     # --- PROOF 2: a real recalled memory appeared in the injected context. -----
     hr("PROOF 2 — real recalled MEMORY was injected before the agent thought")
@@ -40,6 +40,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .llm_cache import cached_generate
+
 try:
     from curl_cffi import requests as _curl_requests
 except ImportError:  # pragma: no cover - tests stub via patch
@@ -272,6 +274,7 @@ class AntigravityOAuthLLM:
 
     # ── Core interface (matches AnthropicLLM) ────────────────
 
+    @cached_generate
     def generate_content(
         self, prompt: str, **kwargs: Any,
     ) -> AntigravityOAuthResponse:
@@ -69,7 +69,7 @@ class BrainOps(Capability):
             },
             {
                 "name": "brain_consolidate_logs",
-                "description": "Consolidate raw JSON logs in .brain/raw/ into a daily archive.",
+                "description": "Consolidate legacy per-call JSON logs in .brain/raw/ into the compressed interaction log.",
                 "parameters": {"type": "object", "properties": {}}
             },
             {
@@ -207,46 +207,16 @@ class BrainOps(Capability):
 
 
         elif tool_name == "brain_consolidate_logs":
-            # Consolidate raw logs into daily archives
-            import json
-            from datetime import datetime
-            
+            # Fold legacy one-file-per-call logs into a sealed interaction-log
+            # segment (new interactions are already written there).
+            from ..interaction_log import import_legacy_files
+
             brain_path = Path(os.environ.get("NUCLEUS_BRAIN_PATH", ".brain"))
-            raw_path = brain_path / "raw"
-            archive_dir = brain_path / "archive"
-            archive_dir.mkdir(parents=True, exist_ok=True)
-            
-            if not raw_path.exists():
-                return "No raw logs to consolidate."
-                
-            logs = list(raw_path.glob("*.json"))
-            if not logs:
+            result = import_legacy_files(brain_path)
+            if not result["files"]:
                 return "0 logs found. Nothing to consolidate."
-            
-            # Group by date
-            count = 0
-            size_saved = 0
-            
-            # Use current date for the archive bucket
-            # Ideally we group by the timestamp in the file, but for V1 just dumping current pile is fine.
-            today = datetime.now().strftime("%Y-%m-%d")
-            archive_file = archive_dir / f"raw_interactions_{today}.jsonl"
-            
-            with open(archive_file, "a", encoding='utf-8') as out_f:
-                for log_file in logs:
-                    try:
-                         content = log_file.read_text()
-                         # Minify JSON line
-                         data = json.loads(content)
-                         out_f.write(json.dumps(data, ensure_ascii=False) + "\n")
-                         
-                         size_saved += log_file.stat().st_size
-                         log_file.unlink() # Delete original
-                         count += 1
-                    except Exception as e:
-                        print(f"Error consolidating {log_file}: {e}")
-                        
-            return f"✅ Consolidated {count} raw logs into {archive_file.name}. Saved {size_saved/1024:.2f} KB of inode space."
+            return (f"✅ Consolidated {result['files']} raw logs into raw/interactions/. "
+                    f"Saved {result['bytes']/1024:.2f} KB of inode space.")
 
         return f"Tool {tool_name} not found in BrainOps."
 
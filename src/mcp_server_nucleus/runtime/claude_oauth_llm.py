@@ -36,6 +36,8 @@ import os
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from .llm_cache import cached_generate
+
 try:
     from curl_cffi import requests as _curl_requests
 except ImportError:  # pragma: no cover - tests stub via patch
@@ -156,6 +158,7 @@ class ClaudeOAuthLLM:
 
     # ── Core interface (matches AnthropicLLM) ────────────────
 
+    @cached_generate
     def generate_content(self, prompt: str, **kwargs: Any) -> ClaudeOAuthResponse:
         """Generate text via /v1/messages?beta=true with OAuth bearer.
 
@@ -4,16 +4,19 @@ Nucleus Runtime - Common Utilities
 Shared utilities and constants for the Nucleus runtime.
 """
 
+import contextlib
 import os
 import json
 import logging
 import shutil
 import sqlite3
 import sys
+import threading
+import weakref
 from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Union, TYPE_CHECKING
+from typing import Callable, Dict, Any, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Type-only: runtime.project is imported lazily inside function bodies
@@ -131,6 +134,235 @@ def open_hardened_sqlite(
     return conn
 
 
+def fts_match(conn: sqlite3.Connection, sql: str, match_expr: str, tail_params: tuple = ()):
+    """Run an FTS5 ``MATCH ?`` query (``match_expr`` binds first) with the
+    try-then-quote retry.
+
+    Literal tokens containing ``.`` / ``/`` / ``-`` are parsed as FTS5 syntax
+    and raise ``fts5: syntax error`` (a stray ``"`` raises ``unterminated
+    string``); retry once phrase-quoting the whole expression (with
+    ``"``-escape doubling). FTS5's own error string is the discriminator; any
+    other OperationalError propagates unchanged.
+    """
+    try:
+        return conn.execute(sql, (match_expr, *tail_params)).fetchall()
+    except sqlite3.OperationalError as exc:
+        msg = str(exc).lower()
+        if ("fts5" in msg or "syntax error" in msg or "no such column" in msg
+                or "unterminated string" in msg):
+            quoted = '"' + match_expr.replace('"', '""') + '"'
+            return conn.execute(sql, (quoted, *tail_params)).fetchall()
+        raise
+
+
+# Marks a registered schema not yet applied to any file.
+_UNAPPLIED = object()
+
+
+class _ReaderSlot:
+    """Thread-local holder for a pooled reader; its finalizer closes the conn."""
+
+    __slots__ = ("conn", "gen", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection, gen: int):
+        self.conn = conn
+        self.gen = gen
+
+
+def _release_reader(conn: sqlite3.Connection, readers: set, lock: threading.Lock) -> None:
+    with lock:
+        readers.discard(conn)
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+class SQLitePool:
+    """Per-process connection pool for one SQLite file.
+
+    Readers get one long-lived connection per thread (opened and hardened once,
+    then reused, and closed when the thread exits); writes go through a single
+    shared connection serialized by a lock, matching SQLite's one-writer model
+    so in-process writers queue here instead of spinning on ``busy_timeout``.
+    Connections are re-opened after a ``fork`` (a pool inherited from the
+    parent is never reused by the child), and when the file is deleted or
+    replaced: every checkout compares the file's (st_dev, st_ino) with the one
+    the pool opened, so no connection keeps writing to an unlinked inode.
+    Registered schemas are re-applied to the new file.
+
+    Use ``get_sqlite_pool`` rather than constructing this directly so every
+    caller in the process shares one pool (and one schema pass) per db path.
+    """
+
+    def __init__(self, db_path: Union[str, Path], *, row_factory: Any = None,
+                 configure: Optional[Callable[[sqlite3.Connection], None]] = None):
+        self.db_path = Path(db_path)
+        self._row_factory = row_factory
+        self._configure = configure
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._readers: set = set()
+        self._readers_lock = threading.Lock()
+        # File identity the open connections point at; bumping _gen retires
+        # every reader opened before it.
+        self._identity: Optional[tuple] = None
+        self._gen = 0
+        # schema hash -> script, and the file identity each was applied to.
+        self._schemas: Dict[int, str] = {}
+        self._schema_identity: Dict[int, Optional[tuple]] = {}
+
+    def _file_identity(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _open(self, check_same_thread: bool) -> sqlite3.Connection:
+        conn = open_hardened_sqlite(self.db_path, check_same_thread=check_same_thread)
+        if self._row_factory is not None:
+            conn.row_factory = self._row_factory
+        if self._configure is not None:
+            self._configure(conn)
+        if self._identity is None:
+            self._identity = self._file_identity()
+        return conn
+
+    def _check_fork(self) -> None:
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._local = threading.local()
+            self._writer = None
+            self._readers = set()
+
+    def _checkout(self) -> None:
+        """Re-open on fork or file replacement; apply schemas the file lacks."""
+        self._check_fork()
+        identity = self._file_identity()
+        if identity == self._identity and all(
+            self._schema_identity.get(h, _UNAPPLIED) == identity for h in self._schemas
+        ):
+            return
+        with self._write_lock:
+            identity = self._file_identity()
+            if identity != self._identity:
+                if self._identity is not None:
+                    logger.warning("SQLite file %s was replaced or removed; reopening", self.db_path)
+                    self._gen += 1
+                    if self._writer is not None:
+                        try:
+                            self._writer.close()
+                        except sqlite3.Error:
+                            pass
+                        self._writer = None
+                self._identity = identity
+            pending = [h for h in self._schemas
+                       if self._schema_identity.get(h, _UNAPPLIED) != identity]
+            if not pending:
+                return
+            if self._writer is None:
+                self._writer = self._open(check_same_thread=False)
+            for h in pending:
+                self._writer.executescript(self._schemas[h])
+            self._writer.commit()
+            # The first write may have just created the file.
+            self._identity = identity = self._file_identity()
+            for h in pending:
+                self._schema_identity[h] = identity
+
+    def ensure_schema(self, schema: str) -> None:
+        """Register an idempotent DDL script; applied now and to any recreated file."""
+        self._schemas.setdefault(hash(schema), schema)
+        self._checkout()
+
+    def reader(self) -> sqlite3.Connection:
+        """This thread's read connection (created on first use)."""
+        self._checkout()
+        slot = getattr(self._local, "slot", None)
+        if slot is None or slot.gen != self._gen:
+            # Opened without the same-thread check so the finalizer / close()
+            # can release it from whichever thread runs them.
+            conn = self._open(check_same_thread=False)
+            # Replacing a stale slot drops it, and its finalizer closes it.
+            slot = _ReaderSlot(conn, self._gen)
+            self._local.slot = slot
+            readers, lock = self._readers, self._readers_lock
+            with lock:
+                readers.add(conn)
+            # The thread-local slot is dropped when the thread dies; close the
+            # connection then instead of holding it until ``close()``.
+            weakref.finalize(slot, _release_reader, conn, readers, lock)
+        return slot.conn
+
+    @contextlib.contextmanager
+    def writer(self):
+        """Serialized write connection; commits on exit, rolls back on error."""
+        self._checkout()
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open(check_same_thread=False)
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close every pooled connection (the pool re-opens lazily)."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._identity = None
+            self._gen += 1
+        with self._readers_lock:
+            for conn in self._readers:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._readers.clear()
+        self._local = threading.local()
+
+
+_sqlite_pools: Dict[tuple, "SQLitePool"] = {}
+_sqlite_pools_lock = threading.Lock()
+
+
+def get_sqlite_pool(
+    db_path: Union[str, Path],
+    *,
+    schema: Optional[str] = None,
+    row_factory: Any = None,
+    configure: Optional[Callable[[sqlite3.Connection], None]] = None,
+) -> SQLitePool:
+    """Shared ``SQLitePool`` for ``db_path`` and these connection options.
+
+    ``schema`` (an ``executescript`` body of idempotent ``CREATE ... IF NOT
+    EXISTS`` statements) is registered on the pool and applied once per
+    database file, so hot constructors no longer re-run DDL and a file that
+    is deleted or replaced gets its schema back. Pools are keyed on
+    (path, ``row_factory``, ``configure``) — ``configure(conn)`` is
+    per-connection setup run after the hardening PRAGMAs — so callers with
+    different options never receive each other's connections.
+    """
+    key = (str(Path(db_path).resolve()), row_factory, configure)
+    with _sqlite_pools_lock:
+        pool = _sqlite_pools.get(key)
+        if pool is None:
+            pool = _sqlite_pools[key] = SQLitePool(
+                key[0], row_factory=row_factory, configure=configure
+            )
+    if schema is not None:
+        pool.ensure_schema(schema)
+    return pool
+
+
 def get_nucleus_bin_path() -> str:
     """Return the directory containing the nucleus executable."""
     nucleus_bin = shutil.which("nucleus")
@@ -6,27 +6,46 @@ Builds a lightweight in-memory graph of engram relationships based on:
 3. Temporal proximity (engrams written within N seconds of each other)
 4. Value similarity (shared keywords between engram values)
 
-The graph is computed on-demand from the engram ledger (no separate persistence).
-This keeps it consistent with the source of truth and avoids stale state.
+The graph is computed from the live engrams of the ledger without comparing
+every pair: context and prefix edges come from grouping nodes into buckets,
+temporal edges from one sweep over the nodes sorted by timestamp, and
+semantic edges from a keyword → node inverted index. ``max_degree`` bounds
+the edges kept per node (dense buckets are then linked to their nearest
+members in time rather than as a full clique).
+
+A built graph is cached in-process and in ``engrams/context_graph.json``,
+keyed by the ledger's (inode, size, mtime) and the build parameters, so it is
+rebuilt only after the ledger changes. Callers get copies, so mutating a
+returned graph never leaks into later results.
 
 Usage:
     from mcp_server_nucleus.runtime.context_graph import build_context_graph
     graph = build_context_graph()
 """
 
+import copy
 import json
+import logging
+import os
 import re
+import threading
 from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 
 from .common import get_brain_path, make_response
 
+logger = logging.getLogger("nucleus.context_graph")
+
 
 # ── Configuration ─────────────────────────────────────────────
-MAX_ENGRAMS = 500          # Safety cap on engrams to process
+MAX_ENGRAMS = int(os.environ.get("NUCLEUS_CONTEXT_GRAPH_MAX_ENGRAMS", "500"))  # Safety cap on engrams to process
 TEMPORAL_WINDOW_SECS = 60  # Engrams within 60s are temporally linked
 MIN_KEYWORD_OVERLAP = 2    # Minimum shared keywords for value similarity
+MAX_KEYWORDS = 20          # Keywords kept per node
+SNAPSHOT_NAME = "context_graph.json"
+SNAPSHOT_FORMAT = 1
 STOP_WORDS = frozenset({
     "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
     "have", "has", "had", "do", "does", "did", "will", "would", "could",
@@ -38,10 +57,18 @@ STOP_WORDS = frozenset({
 })
 
 
-def _extract_keywords(text: str) -> Set[str]:
-    """Extract meaningful keywords from text, removing stop words."""
+def _default_max_degree() -> Optional[int]:
+    try:
+        value = int(os.environ.get("NUCLEUS_CONTEXT_GRAPH_MAX_DEGREE", "0"))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _extract_keywords(text: str) -> List[str]:
+    """Meaningful keywords from text in first-seen order, stop words removed."""
     words = re.findall(r'[a-zA-Z]{3,}', text.lower())
-    return {w for w in words if w not in STOP_WORDS}
+    return list(dict.fromkeys(w for w in words if w not in STOP_WORDS))
 
 
 def _get_key_prefix(key: str) -> str:
@@ -57,49 +84,116 @@ def _parse_timestamp(ts_str: str) -> Optional[float]:
     try:
         dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
         return dt.timestamp()
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, AttributeError):
         return None
 
 
-def _load_engrams() -> List[Dict]:
-    """Load engrams from ledger with safety cap."""
-    brain = get_brain_path()
-    ledger = brain / "engrams" / "ledger.jsonl"
-    if not ledger.exists():
-        return []
+def _ledger_path() -> Path:
+    return get_brain_path() / "engrams" / "ledger.jsonl"
 
-    engrams = []
-    with open(ledger, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                try:
-                    engrams.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-
-    # Sort by timestamp (most recent first) and cap
-    engrams.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-    return engrams[:MAX_ENGRAMS]
-
-
-def build_context_graph(
-    include_edges: bool = True,
-    min_intensity: int = 1,
-) -> Dict[str, Any]:
-    """Build the context graph from the engram ledger.
 
-    Args:
-        include_edges: Whether to include edge list (can be large).
-        min_intensity: Minimum engram intensity to include.
+def _ledger_signature(ledger: Path) -> Optional[List[int]]:
+    try:
+        st = ledger.stat()
+    except OSError:
+        return None
+    return [st.st_ino, st.st_size, st.st_mtime_ns]
 
-    Returns:
-        Dict with nodes, edges, clusters, and statistics.
-    """
-    engrams = _load_engrams()
 
-    # Filter by intensity
-    engrams = [e for e in engrams if e.get("intensity", 5) >= min_intensity]
+def _load_engrams(ledger: Optional[Path] = None, max_engrams: int = MAX_ENGRAMS) -> List[Dict]:
+    """Live engrams (latest version per key) from the ledger, most recent first, capped."""
+    from .engram_ledger import load_live_engrams
 
+    ledger = ledger or _ledger_path()
+    if not ledger.exists():
+        return []
+    engrams = load_live_engrams(ledger)
+    # Sort by timestamp (most recent first) and cap
+    engrams.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
+    return engrams[:max_engrams]
+
+
+# ── Edge construction ─────────────────────────────────────────
+
+class _EdgeSet:
+    """Typed undirected edges, one per (pair, type)."""
+
+    def __init__(self):
+        self.edges: List[Dict[str, Any]] = []
+        self._seen: Set[Tuple[str, str, str]] = set()
+
+    def add(self, a: str, b: str, rel_type: str, weight: float) -> None:
+        if a == b:
+            return
+        pair = (a, b, rel_type) if a < b else (b, a, rel_type)
+        if pair not in self._seen:
+            self._seen.add(pair)
+            self.edges.append({"source": a, "target": b, "type": rel_type, "weight": weight})
+
+
+def _link_bucket(edges: _EdgeSet, members: List[int], nodes: List[Dict], rel_type: str,
+                 weight: float, window: Optional[int]) -> None:
+    """Connect the nodes of one bucket: all pairs, or with ``window`` each node
+    to the next ``window`` members in timestamp order."""
+    if len(members) < 2:
+        return
+    if window is None:
+        for x, i in enumerate(members):
+            for j in members[x + 1:]:
+                edges.add(nodes[i]["id"], nodes[j]["id"], rel_type, weight)
+        return
+    ordered = sorted(members, key=lambda i: nodes[i]["ts"] or 0.0)
+    for x, i in enumerate(ordered):
+        for j in ordered[x + 1:x + 1 + window]:
+            edges.add(nodes[i]["id"], nodes[j]["id"], rel_type, weight)
+
+
+def _temporal_edges(edges: _EdgeSet, nodes: List[Dict], window: Optional[int]) -> None:
+    """Sorted sweep: each node links forward while within ``TEMPORAL_WINDOW_SECS``."""
+    timed = sorted((n["ts"], n["id"]) for n in nodes if n["ts"])
+    for x, (ts1, id1) in enumerate(timed):
+        y = x + 1
+        while y < len(timed) and timed[y][0] - ts1 <= TEMPORAL_WINDOW_SECS:
+            if window is not None and y - x > window:
+                break
+            edges.add(id1, timed[y][1], "temporal", 0.6)
+            y += 1
+
+
+def _semantic_edges(edges: _EdgeSet, nodes: List[Dict], window: Optional[int]) -> None:
+    """Keyword-overlap edges via an inverted index: only nodes sharing a
+    keyword are ever compared."""
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for i, n in enumerate(nodes):
+        for kw in n["keywords"]:
+            postings[kw].append(i)
+    for i, n in enumerate(nodes):
+        overlap: Dict[int, int] = defaultdict(int)
+        for kw in n["keywords"]:
+            for j in postings[kw]:
+                if j > i:
+                    overlap[j] += 1
+        matches = [(count, j) for j, count in overlap.items() if count >= MIN_KEYWORD_OVERLAP]
+        if window is not None and len(matches) > window:
+            matches.sort(key=lambda m: (-m[0], m[1]))
+            matches = matches[:window]
+        for count, j in sorted(matches, key=lambda m: m[1]):
+            edges.add(n["id"], nodes[j]["id"], "semantic", min(count / 10.0, 1.0))
+
+
+def _cap_degree(edges: List[Dict[str, Any]], max_degree: int) -> List[Dict[str, Any]]:
+    """Keep the heaviest edges such that no node exceeds ``max_degree``."""
+    degree: Dict[str, int] = defaultdict(int)
+    kept = []
+    for e in sorted(edges, key=lambda e: -e["weight"]):
+        if degree[e["source"]] < max_degree and degree[e["target"]] < max_degree:
+            degree[e["source"]] += 1
+            degree[e["target"]] += 1
+            kept.append(e)
+    return kept
+
+
+def _compute_graph(engrams: List[Dict], max_degree: Optional[int]) -> Dict[str, Any]:
     if not engrams:
         return {
             "nodes": [],
@@ -109,69 +203,57 @@ def build_context_graph(
         }
 
     # ── Build nodes ───────────────────────────────────────────
+    # Timestamps and keyword sets are derived once per node.
     nodes = []
-    key_to_idx: Dict[str, int] = {}
     for i, e in enumerate(engrams):
         key = e.get("key", f"unknown_{i}")
-        key_to_idx[key] = i
+        timestamp = e.get("timestamp", "")
         nodes.append({
             "id": key,
             "context": e.get("context", "Unknown"),
             "intensity": e.get("intensity", 5),
             "prefix": _get_key_prefix(key),
-            "keywords": list(_extract_keywords(e.get("value", "")))[:20],
-            "timestamp": e.get("timestamp", ""),
+            "keywords": _extract_keywords(e.get("value", ""))[:MAX_KEYWORDS],
+            "timestamp": timestamp,
+            "ts": _parse_timestamp(timestamp),
         })
 
     # ── Build edges ───────────────────────────────────────────
-    edges: List[Dict[str, Any]] = []
-    edge_set: Set[Tuple[str, str, str]] = set()
-
-    def _add_edge(a: str, b: str, rel_type: str, weight: float = 1.0):
-        pair = (*sorted([a, b]), rel_type)
-        if pair not in edge_set and a != b:
-            edge_set.add(pair)
-            edges.append({"source": a, "target": b, "type": rel_type, "weight": weight})
-
-    for i, n1 in enumerate(nodes):
-        for j, n2 in enumerate(nodes):
-            if j <= i:
-                continue
-
-            # 1. Same context → context edge
-            if n1["context"] == n2["context"]:
-                _add_edge(n1["id"], n2["id"], "context", 0.5)
-
-            # 2. Same key prefix → prefix edge (stronger)
-            if n1["prefix"] == n2["prefix"] and n1["prefix"] != n1["id"]:
-                _add_edge(n1["id"], n2["id"], "prefix", 0.8)
-
-            # 3. Temporal proximity
-            ts1 = _parse_timestamp(n1["timestamp"])
-            ts2 = _parse_timestamp(n2["timestamp"])
-            if ts1 and ts2 and abs(ts1 - ts2) <= TEMPORAL_WINDOW_SECS:
-                _add_edge(n1["id"], n2["id"], "temporal", 0.6)
-
-            # 4. Keyword overlap
-            kw1 = set(n1["keywords"])
-            kw2 = set(n2["keywords"])
-            overlap = kw1 & kw2
-            if len(overlap) >= MIN_KEYWORD_OVERLAP:
-                weight = min(len(overlap) / 10.0, 1.0)
-                _add_edge(n1["id"], n2["id"], "semantic", weight)
+    # Per-type candidate window: a node gets at most ~max_degree edges of a
+    # type before the final cap picks the heaviest across types.
+    window = max(1, max_degree // 2) if max_degree else None
+    edge_set = _EdgeSet()
 
-    # ── Build clusters ────────────────────────────────────────
-    # Cluster by context
+    # 1. Same context → context edge
     context_clusters: Dict[str, List[str]] = defaultdict(list)
-    for n in nodes:
+    context_members: Dict[str, List[int]] = defaultdict(list)
+    for i, n in enumerate(nodes):
         context_clusters[n["context"]].append(n["id"])
+        context_members[n["context"]].append(i)
+    for members in context_members.values():
+        _link_bucket(edge_set, members, nodes, "context", 0.5, window)
 
-    # Cluster by prefix
+    # 2. Same key prefix → prefix edge (stronger)
     prefix_clusters: Dict[str, List[str]] = defaultdict(list)
-    for n in nodes:
+    prefix_members: Dict[str, List[int]] = defaultdict(list)
+    for i, n in enumerate(nodes):
         if n["prefix"] != n["id"]:  # Only meaningful prefixes
             prefix_clusters[n["prefix"]].append(n["id"])
+            prefix_members[n["prefix"]].append(i)
+    for members in prefix_members.values():
+        _link_bucket(edge_set, members, nodes, "prefix", 0.8, window)
+
+    # 3. Temporal proximity
+    _temporal_edges(edge_set, nodes, window)
+
+    # 4. Keyword overlap
+    _semantic_edges(edge_set, nodes, window)
+
+    edges = edge_set.edges
+    if max_degree:
+        edges = _cap_degree(edges, max_degree)
 
+    # ── Build clusters ────────────────────────────────────────
     # Remove single-item prefix clusters
     prefix_clusters = {k: v for k, v in prefix_clusters.items() if len(v) > 1}
 
@@ -200,16 +282,108 @@ def build_context_graph(
         "density": round(unique_pairs / max(max_pairs, 1), 4),
     }
 
-    result = {
+    return {
         "nodes": [{"id": n["id"], "context": n["context"], "intensity": n["intensity"]} for n in nodes],
+        "edges": edges,
         "clusters": clusters,
         "stats": stats,
     }
 
-    if include_edges:
-        result["edges"] = edges
 
-    return result
+# ── Cache ─────────────────────────────────────────────────────
+
+class _CachedGraph:
+    __slots__ = ("key", "graph", "_adjacency")
+
+    def __init__(self, key: List, graph: Dict[str, Any]):
+        self.key = key
+        self.graph = graph
+        self._adjacency: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+    @property
+    def adjacency(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self._adjacency is None:
+            adj: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for e in self.graph["edges"]:
+                adj[e["source"]].append(e)
+                adj[e["target"]].append(e)
+            self._adjacency = adj
+        return self._adjacency
+
+
+_cache: Dict[str, _CachedGraph] = {}
+_cache_lock = threading.Lock()
+
+
+def _load_snapshot(path: Path, key: List) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if data.get("format") != SNAPSHOT_FORMAT or data.get("key") != key:
+        return None
+    return data.get("graph")
+
+
+def _save_snapshot(path: Path, key: List, graph: Dict[str, Any]) -> None:
+    tmp = path.with_name(f".{SNAPSHOT_NAME}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps({"format": SNAPSHOT_FORMAT, "key": key, "graph": graph},
+                                  separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Context graph snapshot write failed: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _get_graph(min_intensity: int, max_degree: Optional[int]) -> _CachedGraph:
+    """The graph for the current ledger: memory cache, then snapshot, then build."""
+    ledger = _ledger_path()
+    params = [min_intensity, max_degree, MAX_ENGRAMS]
+    key = [_ledger_signature(ledger), params]
+    slot = f"{ledger}|{params}"
+    with _cache_lock:
+        cached = _cache.get(slot)
+        if cached is not None and cached.key == key:
+            return cached
+
+        snapshot = ledger.parent / SNAPSHOT_NAME
+        graph = _load_snapshot(snapshot, key) if key[0] is not None else None
+        if graph is None:
+            engrams = _load_engrams(ledger)
+            # Filter by intensity
+            engrams = [e for e in engrams if e.get("intensity", 5) >= min_intensity]
+            graph = _compute_graph(engrams, max_degree)
+            if key[0] is not None:
+                _save_snapshot(snapshot, key, graph)
+        cached = _cache[slot] = _CachedGraph(key, graph)
+        return cached
+
+
+def build_context_graph(
+    include_edges: bool = True,
+    min_intensity: int = 1,
+    max_degree: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build the context graph from the engram ledger.
+
+    Args:
+        include_edges: Whether to include edge list (can be large).
+        min_intensity: Minimum engram intensity to include.
+        max_degree: Cap on edges per node (heaviest kept); defaults to
+            ``NUCLEUS_CONTEXT_GRAPH_MAX_DEGREE``, unset meaning uncapped.
+
+    Returns:
+        Dict with nodes, edges, clusters, and statistics.
+    """
+    if max_degree is None:
+        max_degree = _default_max_degree()
+    graph = _get_graph(min_intensity, max_degree).graph
+    # Deep copy: the cached graph is shared by every caller.
+    return copy.deepcopy({k: v for k, v in graph.items() if include_edges or k != "edges"})
 
 
 def render_ascii_graph(max_nodes: int = 30, min_intensity: int = 1) -> str:
@@ -286,7 +460,8 @@ def get_engram_neighbors(key: str, max_depth: int = 1) -> Dict[str, Any]:
     Returns:
         Dict with the target node, its neighbors, and connecting edges.
     """
-    graph = build_context_graph(include_edges=True)
+    cached = _get_graph(1, _default_max_degree())
+    graph = cached.graph
 
     # Find the target node
     target = None
@@ -298,30 +473,30 @@ def get_engram_neighbors(key: str, max_depth: int = 1) -> Dict[str, Any]:
     if not target:
         return {"error": f"Engram '{key}' not found in graph", "node_count": graph["stats"]["node_count"]}
 
-    # BFS to find neighbors within max_depth
+    # BFS over the adjacency lists to find neighbors within max_depth
+    adjacency = cached.adjacency
     visited = {key}
     frontier = {key}
     neighbor_edges = []
 
     for _ in range(max_depth):
         next_frontier = set()
-        for edge in graph.get("edges", []):
-            src, tgt = edge["source"], edge["target"]
-            if src in frontier and tgt not in visited:
-                next_frontier.add(tgt)
-                neighbor_edges.append(edge)
-            elif tgt in frontier and src not in visited:
-                next_frontier.add(src)
-                neighbor_edges.append(edge)
+        for node_id in frontier:
+            for edge in adjacency.get(node_id, ()):
+                other = edge["target"] if edge["source"] == node_id else edge["source"]
+                if other not in visited:
+                    next_frontier.add(other)
+                    neighbor_edges.append(edge)
         visited.update(next_frontier)
         frontier = next_frontier
 
     neighbor_nodes = [n for n in graph["nodes"] if n["id"] in visited and n["id"] != key]
 
-    return {
+    # Nodes and edges are the cached graph's own dicts; hand out copies.
+    return copy.deepcopy({
         "target": target,
         "neighbors": neighbor_nodes,
         "edges": neighbor_edges,
         "neighbor_count": len(neighbor_nodes),
         "depth": max_depth,
-    }
+    })
@@ -10,6 +10,7 @@ import json
 import logging
 import sqlite3
 import os
+import threading
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -23,12 +24,34 @@ logger = logging.getLogger("nucleus.db")
 
 def _notify_tasks_changed() -> None:
     """Proactively signal ChangeLedger that tasks state changed."""
+    try:
+        from .task_index import invalidate_task_indexes
+        invalidate_task_indexes()
+    except Exception:
+        pass
     try:
         from .event_bus import get_change_ledger
         get_change_ledger().record_change("tasks.json", "modified")
     except Exception:
         pass
 
+# Columns list_tasks may order by (validated: the name is spliced into SQL).
+TASK_ORDER_COLUMNS = frozenset({
+    "priority", "status", "created_at", "updated_at", "claimed_at", "id",
+})
+
+
+def _parse_task_order(order_by: Optional[str]):
+    """``"-priority"`` -> ``("priority", True)``; rejects unknown columns."""
+    if not order_by:
+        return None, False
+    desc = order_by.startswith("-")
+    column = order_by.lstrip("-")
+    if column not in TASK_ORDER_COLUMNS:
+        raise ValueError(f"Invalid order_by column: {column!r}. Allowed: {sorted(TASK_ORDER_COLUMNS)}")
+    return column, desc
+
+
 class StorageBackend(ABC):
     """Abstract interface for Nucleus storage backend."""
     
@@ -64,8 +87,15 @@ class StorageBackend(ABC):
         
     @abstractmethod
     def list_tasks(self, status: Optional[str] = None, priority: Optional[int] = None, 
-                   skill: Optional[str] = None, claimed_by: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List tasks matching filters."""
+                   skill: Optional[str] = None, claimed_by: Optional[str] = None,
+                   limit: Optional[int] = None, offset: int = 0,
+                   order_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List tasks matching filters.
+
+        ``order_by`` is a column from ``TASK_ORDER_COLUMNS``, prefixed with
+        ``-`` for descending; ``None`` keeps insertion order. ``limit`` and
+        ``offset`` page the ordered result.
+        """
         pass
         
     @abstractmethod
@@ -94,6 +124,11 @@ class StorageBackend(ABC):
             return False
         return self.update_task(task_id, {"claimed_by": agent_id, "status": "IN_PROGRESS"})
 
+# listings.json path -> (file stamp, listings, in-memory FTS5 connection).
+_json_listing_fts: Dict[str, tuple] = {}
+_json_listing_fts_lock = threading.Lock()
+
+
 class JSONBackend(StorageBackend):
     """Legacy file-based storage backend for backward compatibility."""
     
@@ -147,20 +182,48 @@ class JSONBackend(StorageBackend):
         self._save_listings(listings)
         return listing.id
 
+    def _listing_search_index(self):
+        """``(listings in file order, in-memory FTS5 over topic/description)``.
+
+        Built once per change of ``listings.json`` (inode, size, mtime) and
+        shared by every JSONBackend for the path — ``get_storage_backend``
+        builds a backend per call — so a search no longer re-parses the file
+        and scans every listing.
+        """
+        try:
+            st = self.listings_path.stat()
+            stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            stamp = None
+        key = str(self.listings_path)
+        with _json_listing_fts_lock:
+            cached = _json_listing_fts.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+        listings = list(self._load_listings().values())
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("CREATE VIRTUAL TABLE listings_fts USING fts5(topic, description)")
+        conn.executemany(
+            "INSERT INTO listings_fts(rowid, topic, description) VALUES (?, ?, ?)",
+            [(i, lst.topic, lst.description) for i, lst in enumerate(listings)],
+        )
+        with _json_listing_fts_lock:
+            _json_listing_fts[key] = (stamp, listings, conn)
+        return listings, conn
+
     def search_listings(self, query: str, limit: int = 20, offset: int = 0) -> List[ContextListing]:
-        listings = self._load_listings()
-        query = query.lower()
-        results = []
-        skipped = 0
-        for lst in listings.values():
-            if not query or query in lst.topic.lower() or query in lst.description.lower():
-                if skipped < offset:
-                    skipped += 1
-                    continue
-                results.append(lst)
-                if len(results) >= limit:
-                    break
-        return results
+        from .common import fts_match
+        listings, conn = self._listing_search_index()
+        if not query:
+            return listings[offset:offset + limit]
+        with _json_listing_fts_lock:
+            rows = fts_match(
+                conn,
+                "SELECT rowid FROM listings_fts WHERE listings_fts MATCH ? "
+                "ORDER BY rank, rowid LIMIT ? OFFSET ?",
+                query, (limit, offset),
+            )
+        return [listings[row[0]] for row in rows]
 
     def get_listing(self, listing_id: str) -> Optional[ContextListing]:
         listings = self._load_listings()
@@ -182,7 +245,10 @@ class JSONBackend(StorageBackend):
         return task_dict["id"]
         
     def list_tasks(self, status: Optional[str] = None, priority: Optional[int] = None, 
-                   skill: Optional[str] = None, claimed_by: Optional[str] = None) -> List[Dict[str, Any]]:
+                   skill: Optional[str] = None, claimed_by: Optional[str] = None,
+                   limit: Optional[int] = None, offset: int = 0,
+                   order_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        column, desc = _parse_task_order(order_by)
         tasks = self._load_tasks()
         result = []
         for t in tasks:
@@ -191,7 +257,11 @@ class JSONBackend(StorageBackend):
             if skill and skill not in t.get("required_skills", []): continue
             if claimed_by and t.get("claimed_by") != claimed_by: continue
             result.append(t)
-        return result
+        if column:
+            # Stable sort; missing values sort last.
+            result.sort(key=lambda t: (t.get(column) is None, t.get(column)), reverse=desc)
+        end = None if limit is None else offset + limit
+        return result[offset:end]
         
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         tasks = self._load_tasks()
@@ -213,27 +283,96 @@ class JSONBackend(StorageBackend):
             self._save_tasks(tasks)
         return changed
 
+_TASK_SKILLS_SOURCE = (
+    "json_each(CASE WHEN json_valid({col}) AND json_type({col}) = 'array' "
+    "THEN {col} ELSE '[]' END)"
+)
+_TASK_SKILLS_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS tasks_skills_ai AFTER INSERT ON tasks BEGIN
+    INSERT OR IGNORE INTO task_skills(skill, task_id)
+    SELECT value, new.id FROM {_TASK_SKILLS_SOURCE.format(col="new.required_skills")};
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_skills_au AFTER UPDATE OF id, required_skills ON tasks BEGIN
+    DELETE FROM task_skills WHERE task_id = old.id;
+    INSERT OR IGNORE INTO task_skills(skill, task_id)
+    SELECT value, new.id FROM {_TASK_SKILLS_SOURCE.format(col="new.required_skills")};
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_skills_ad AFTER DELETE ON tasks BEGIN
+    DELETE FROM task_skills WHERE task_id = old.id;
+END;
+"""
+_TASK_SKILLS_BACKFILL = (
+    "INSERT OR IGNORE INTO task_skills(skill, task_id) "
+    f"SELECT j.value, t.id FROM tasks t, {_TASK_SKILLS_SOURCE.format(col='t.required_skills')} j"
+)
+
+
+# FTS5 shadow of listing topic/description for ranked search_listings. A plain
+# (not external-content) table keyed by listing id: listings has a TEXT primary
+# key, so its implicit rowids are not stable across VACUUM.
+_LISTINGS_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS listings_fts USING fts5(topic, description, id UNINDEXED)",
+    """CREATE TRIGGER IF NOT EXISTS listings_fts_ai AFTER INSERT ON listings BEGIN
+        INSERT INTO listings_fts(topic, description, id) VALUES (new.topic, new.description, new.id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS listings_fts_ad AFTER DELETE ON listings BEGIN
+        DELETE FROM listings_fts WHERE id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS listings_fts_au AFTER UPDATE OF topic, description ON listings BEGIN
+        DELETE FROM listings_fts WHERE id = old.id;
+        INSERT INTO listings_fts(topic, description, id) VALUES (new.topic, new.description, new.id);
+    END""",
+)
+
+
+def _configure_sqlite_conn(conn: sqlite3.Connection) -> None:
+    # Autocommit: each statement commits unless a transaction is opened
+    # explicitly. WAL / busy_timeout / synchronous come from the pool's
+    # hardened open.
+    conn.isolation_level = None
+    conn.execute("PRAGMA foreign_keys=ON")         # Enforce referential integrity
+
+
+# (path, st_dev, st_ino) of every database file _init_db has run against, so a
+# deleted or recreated nucleus.db gets its tables again.
+_sqlite_initialized: set = set()
+_sqlite_init_lock = threading.Lock()
+
+
+def _db_file_key(db_path: Path) -> Optional[tuple]:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (str(db_path.resolve()), st.st_dev, st.st_ino)
+
+
 class SQLiteBackend(StorageBackend):
     """Local SQLite database backend for Sovereign OS defaults."""
     
     def __init__(self, brain_path: Path):
         self.db_path = brain_path / "nucleus.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        # get_storage_backend() builds a backend per call; connections and the
+        # schema pass are per process, not per instance.
+        from .common import get_sqlite_pool
+        self._pool = get_sqlite_pool(
+            self.db_path, row_factory=sqlite3.Row, configure=_configure_sqlite_conn
+        )
+        key = _db_file_key(self.db_path)
+        if key is None or key not in _sqlite_initialized:
+            with _sqlite_init_lock:
+                key = _db_file_key(self.db_path)
+                if key is None or key not in _sqlite_initialized:
+                    self._init_db()
+                    # Keyed after init: the first write may have created the file.
+                    key = _db_file_key(self.db_path)
+                    if key is not None:
+                        _sqlite_initialized.add(key)
         
     def _get_conn(self):
-        conn = sqlite3.connect(
-            str(self.db_path),
-            timeout=10,  # Handle concurrent agent access gracefully
-            isolation_level=None  # Manage transactions explicitly if needed
-        )
-        conn.row_factory = sqlite3.Row
-        # Production PRAGMAs for concurrent agent access
-        conn.execute("PRAGMA journal_mode=WAL")       # Allow concurrent readers + writer
-        conn.execute("PRAGMA busy_timeout=5000")       # Wait up to 5s instead of failing immediately
-        conn.execute("PRAGMA synchronous=NORMAL")      # Safe with WAL, faster than FULL
-        conn.execute("PRAGMA foreign_keys=ON")         # Enforce referential integrity
-        return conn
+        """This thread's connection (opened and PRAGMA-configured once)."""
+        return self._pool.reader()
         
     def _init_db(self):
         with self._get_conn() as conn:
@@ -256,6 +395,25 @@ class SQLiteBackend(StorageBackend):
             # Index for searches
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_topic ON listings(topic COLLATE NOCASE)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_desc ON listings(description COLLATE NOCASE)')
+
+            # FTS5 shadow for search_listings; backfilled once when first created.
+            try:
+                cursor.execute('BEGIN IMMEDIATE')
+                had_listings_fts = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'listings_fts'"
+                ).fetchone() is not None
+                for stmt in _LISTINGS_FTS_SCHEMA:
+                    cursor.execute(stmt)
+                if not had_listings_fts:
+                    cursor.execute(
+                        'INSERT INTO listings_fts(topic, description, id) '
+                        'SELECT topic, description, id FROM listings'
+                    )
+                cursor.execute('COMMIT')
+            except sqlite3.OperationalError as e:  # e.g. SQLite built without FTS5
+                if conn.in_transaction:
+                    cursor.execute('ROLLBACK')
+                logger.warning(f"listings FTS5 shadow unavailable; search uses LIKE: {e}")
             
             # Transactions table
             cursor.execute('''
@@ -291,6 +449,25 @@ class SQLiteBackend(StorageBackend):
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_required_role ON tasks(required_role)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_claimed_by ON tasks(claimed_by)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_status_priority ON tasks(status, priority)')
+
+            # Normalized skills so list_tasks(skill=...) filters in SQL. Kept in
+            # sync with tasks.required_skills (a JSON array) by triggers.
+            had_skills_table = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_skills'"
+            ).fetchone() is not None
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS task_skills (
+                    skill TEXT NOT NULL,
+                    task_id TEXT NOT NULL,
+                    PRIMARY KEY (skill, task_id)
+                ) WITHOUT ROWID
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_task_skills_task ON task_skills(task_id)')
+            cursor.executescript(_TASK_SKILLS_TRIGGERS)
+            if not had_skills_table:
+                cursor.execute(_TASK_SKILLS_BACKFILL)
 
             # Migration: add columns to existing databases (ALTER TABLE is idempotent-safe via try/except)
             for col in ["required_role", "plan_ref",
@@ -325,22 +502,35 @@ class SQLiteBackend(StorageBackend):
         return listing.id
 
     def search_listings(self, query: str, limit: int = 20, offset: int = 0) -> List[ContextListing]:
+        from .common import fts_match
         with self._get_conn() as conn:
             if not query:
-                cursor = conn.execute(
+                rows = conn.execute(
                     'SELECT * FROM listings ORDER BY created_at DESC LIMIT ? OFFSET ?',
                     (limit, offset)
-                )
+                ).fetchall()
             else:
-                like_query = f"%{query}%"
-                cursor = conn.execute(
-                    '''SELECT * FROM listings 
-                       WHERE topic LIKE ? OR description LIKE ? 
-                       ORDER BY created_at DESC LIMIT ? OFFSET ?''',
-                    (like_query, like_query, limit, offset)
-                )
-            
-            return [ContextListing(**dict(row)) for row in cursor.fetchall()]
+                try:
+                    # BM25-ranked (best first), newest first among equal ranks.
+                    rows = fts_match(
+                        conn,
+                        '''SELECT l.* FROM listings_fts JOIN listings l ON l.id = listings_fts.id
+                           WHERE listings_fts MATCH ?
+                           ORDER BY rank, l.created_at DESC LIMIT ? OFFSET ?''',
+                        query, (limit, offset)
+                    )
+                except sqlite3.OperationalError as e:
+                    if "listings_fts" not in str(e):
+                        raise
+                    like_query = f"%{query}%"
+                    rows = conn.execute(
+                        '''SELECT * FROM listings
+                           WHERE topic LIKE ? OR description LIKE ?
+                           ORDER BY created_at DESC LIMIT ? OFFSET ?''',
+                        (like_query, like_query, limit, offset)
+                    ).fetchall()
+
+            return [ContextListing(**dict(row)) for row in rows]
 
     def get_listing(self, listing_id: str) -> Optional[ContextListing]:
         with self._get_conn() as conn:
@@ -386,7 +576,10 @@ class SQLiteBackend(StorageBackend):
         return task_dict["id"]
 
     def list_tasks(self, status: Optional[str] = None, priority: Optional[int] = None, 
-                   skill: Optional[str] = None, claimed_by: Optional[str] = None) -> List[Dict[str, Any]]:
+                   skill: Optional[str] = None, claimed_by: Optional[str] = None,
+                   limit: Optional[int] = None, offset: int = 0,
+                   order_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        column, desc = _parse_task_order(order_by)
         query = "SELECT * FROM tasks WHERE 1=1"
         params = []
         
@@ -399,6 +592,18 @@ class SQLiteBackend(StorageBackend):
         if claimed_by:
             query += " AND claimed_by = ?"
             params.append(claimed_by)
+        if skill:
+            query += " AND id IN (SELECT task_id FROM task_skills WHERE skill = ?)"
+            params.append(skill)
+
+        # rowid == insertion order: the order callers always got.
+        if column:
+            query += f" ORDER BY {column} {'DESC' if desc else 'ASC'}, rowid"
+        else:
+            query += " ORDER BY rowid"
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
             
         with self._get_conn() as conn:
             cursor = conn.execute(query, params)
@@ -407,10 +612,6 @@ class SQLiteBackend(StorageBackend):
                 t = dict(row)
                 t["blocked_by"] = json.loads(t["blocked_by"]) if t["blocked_by"] else []
                 t["required_skills"] = json.loads(t["required_skills"]) if t["required_skills"] else []
-                
-                if skill and skill not in t["required_skills"]:
-                    continue
-                    
                 results.append(t)
             return results
 
@@ -636,7 +837,10 @@ class PostgresBackend(StorageBackend):
         return task_dict["id"]
 
     def list_tasks(self, status: Optional[str] = None, priority: Optional[int] = None, 
-                   skill: Optional[str] = None, claimed_by: Optional[str] = None) -> List[Dict[str, Any]]:
+                   skill: Optional[str] = None, claimed_by: Optional[str] = None,
+                   limit: Optional[int] = None, offset: int = 0,
+                   order_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        column, desc = _parse_task_order(order_by)
         query = "SELECT * FROM tasks WHERE 1=1"
         params = []
         
@@ -652,6 +856,14 @@ class PostgresBackend(StorageBackend):
         if skill:
             query += " AND required_skills @> %s::jsonb"
             params.append(json.dumps([skill]))
+        if column:
+            query += f" ORDER BY {column} {'DESC' if desc else 'ASC'}, id"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+        if offset:
+            query += " OFFSET %s"
+            params.append(offset)
             
         with self._get_conn() as conn:
             with conn.cursor() as cursor:
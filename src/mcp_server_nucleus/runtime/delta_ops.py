@@ -540,10 +540,9 @@ def _auto_delta_from_session_end(data: dict):
         today_key = f"brief_rec_{datetime.now().strftime('%Y%m%d')}"
         intent = None
 
-        from .hardening import safe_read_jsonl
-        engrams = safe_read_jsonl(ledger_path)
-        for e in engrams:
-            if e.get("key") == today_key and not e.get("deleted", False):
+        from .engram_ledger import load_live_engrams
+        for e in load_live_engrams(ledger_path):
+            if e.get("key") == today_key:
                 intent = e.get("value", "")
 
         if not intent:
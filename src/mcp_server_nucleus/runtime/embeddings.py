@@ -0,0 +1,233 @@
+"""Batched, content-addressed embedding pipeline.
+
+``embed_many(embed_batch, texts, model=..., task_type=...)`` embeds a list of
+texts with as few provider calls as possible:
+
+  * each text is keyed by sha256(model, task_type, text). Duplicates within a
+    call are embedded once, and keys already in the persistent cache
+    (``<brain>/cache/embeddings.db``, float32 blobs) are not embedded at all;
+  * the remaining texts go out in batches of ``NUCLEUS_EMBED_BATCH`` (default
+    100, the Gemini batch limit), with at most ``NUCLEUS_EMBED_CONCURRENCY``
+    batches (default 4) in flight at once.
+
+``NUCLEUS_EMBED_CACHE=0`` turns the persistent cache off; in-call dedup stays.
+``NUCLEUS_EMBED_PROVIDER=local`` makes ``get_embedding_client`` return a
+``LocalEmbedder``. It has the same ``embed_content`` / ``embed_many`` surface
+as ``DualEngineLLM`` but produces deterministic hashing embeddings
+(``vector_index.HashingEmbedder``), so indexing and its tests run offline.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("nucleus.embeddings")
+
+DEFAULT_BATCH = 100
+DEFAULT_CONCURRENCY = 4
+_LOOKUP_CHUNK = 500
+
+_EMBED_CACHE_FALSY = frozenset({"0", "false", "no", "off"})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    task_type TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+EmbedBatch = Callable[[List[str], str], List[List[float]]]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def embedding_key(model: str, task_type: str, text: str) -> str:
+    h = hashlib.sha256()
+    for part in (model, task_type, text):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class EmbeddingCache:
+    """Persistent ``key -> float32 vector`` store (see ``embedding_key``)."""
+
+    def __init__(self, db_path: Path):
+        from .common import get_sqlite_pool
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_sqlite_pool(self.db_path, schema=SCHEMA)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        conn = self._pool.reader()
+        found: Dict[str, List[float]] = {}
+        keys = list(keys)
+        for start in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[start:start + _LOOKUP_CHUNK]
+            for key, blob in conn.execute(
+                "SELECT key, vector FROM embeddings WHERE key IN "
+                f"({','.join('?' * len(chunk))})", chunk,
+            ):
+                vec = array("f")
+                vec.frombytes(blob)
+                found[key] = vec.tolist()
+        return found
+
+    def put_many(self, model: str, task_type: str,
+                 items: Sequence[tuple]) -> None:
+        """Store ``(key, vector)`` pairs; empty vectors are skipped."""
+        now = time.time()
+        rows = [
+            (key, model, task_type, len(vec), array("f", vec).tobytes(), now)
+            for key, vec in items if vec
+        ]
+        if not rows:
+            return
+        with self._pool.writer() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(key, model, task_type, dim, vector, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """The current brain's cache, or None when ``NUCLEUS_EMBED_CACHE`` is off."""
+    if os.environ.get("NUCLEUS_EMBED_CACHE", "").strip().lower() in _EMBED_CACHE_FALSY:
+        return None
+    from .common import get_brain_path
+
+    path = str(get_brain_path() / "cache" / "embeddings.db")
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = EmbeddingCache(Path(path))
+        return cache
+
+
+_DEFAULT_CACHE = object()
+
+
+def embed_many(
+    embed_batch: EmbedBatch,
+    texts: Sequence[str],
+    *,
+    model: str,
+    task_type: str = "retrieval_document",
+    batch_size: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    cache=_DEFAULT_CACHE,
+) -> List[List[float]]:
+    """Embeddings for ``texts`` in input order (``[]`` where the provider gave none).
+
+    ``embed_batch(texts, task_type)`` makes one provider call and returns one
+    vector per text. ``cache`` defaults to ``get_embedding_cache()``; pass None
+    to skip it.
+    """
+    texts = ["" if t is None else str(t) for t in texts]
+    if not texts:
+        return []
+    if cache is _DEFAULT_CACHE:
+        try:
+            cache = get_embedding_cache()
+        except Exception as exc:  # noqa: BLE001 — embed without the cache
+            logger.warning("Embedding cache unavailable: %s", exc)
+            cache = None
+    keys = [embedding_key(model, task_type, t) for t in texts]
+    unique: Dict[str, str] = dict(zip(keys, texts))
+
+    vectors: Dict[str, List[float]] = {}
+    if cache is not None:
+        try:
+            vectors = cache.get_many(list(unique))
+        except sqlite3.Error as exc:
+            logger.warning("Embedding cache read failed: %s", exc)
+    missing = [k for k in unique if k not in vectors]
+
+    if missing:
+        size = batch_size or _env_int("NUCLEUS_EMBED_BATCH", DEFAULT_BATCH)
+        batches = [missing[i:i + size] for i in range(0, len(missing), size)]
+
+        def run(batch: List[str]) -> List[List[float]]:
+            out = list(embed_batch([unique[k] for k in batch], task_type))
+            if len(out) != len(batch):
+                raise ValueError(f"embedder returned {len(out)} vectors for {len(batch)} texts")
+            return out
+
+        workers = min(len(batches), max_concurrency or _env_int(
+            "NUCLEUS_EMBED_CONCURRENCY", DEFAULT_CONCURRENCY))
+        if workers <= 1:
+            results = [run(b) for b in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers,
+                                    thread_name_prefix="nucleus-embed") as pool:
+                results = list(pool.map(run, batches))
+        fresh = [(k, list(v or [])) for batch, out in zip(batches, results)
+                 for k, v in zip(batch, out)]
+        vectors.update(fresh)
+        if cache is not None:
+            try:
+                cache.put_many(model, task_type, fresh)
+            except sqlite3.Error as exc:
+                logger.warning("Embedding cache write failed: %s", exc)
+
+    return [vectors[k] for k in keys]
+
+
+class LocalEmbedder:
+    """Offline stand-in for ``DualEngineLLM``'s embedding surface."""
+
+    def __init__(self, dim: Optional[int] = None):
+        from .vector_index import DEFAULT_DIM, HashingEmbedder
+
+        self._embedder = HashingEmbedder(dim or _env_int("NUCLEUS_LOCAL_EMBEDDER_DIM", DEFAULT_DIM))
+        self.model_name = f"local-{self._embedder.name}"
+
+    def _embed_batch(self, texts: List[str], task_type: str) -> List[List[float]]:
+        return self._embedder.embed(texts).tolist()
+
+    def embed_content(self, text: str, task_type: str = "retrieval_document",
+                      title: Optional[str] = None) -> Dict[str, List[float]]:
+        return {"embedding": self._embed_batch([text], task_type)[0]}
+
+    def embed_many(self, texts: Sequence[str], task_type: str = "retrieval_document",
+                   **kwargs) -> List[List[float]]:
+        return embed_many(self._embed_batch, texts, model=self.model_name,
+                          task_type=task_type, **kwargs)
+
+
+def get_embedding_client(model_name: str = "gemini-embedding-001"):
+    """``LocalEmbedder`` under ``NUCLEUS_EMBED_PROVIDER=local``, else ``DualEngineLLM``."""
+    if (os.environ.get("NUCLEUS_EMBED_PROVIDER") or "").strip().lower() == "local":
+        return LocalEmbedder()
+    from .llm_client import DualEngineLLM
+
+    return DualEngineLLM(model_name=model_name)
+
+
+__all__ = [
+    "EmbeddingCache", "LocalEmbedder", "embed_many", "embedding_key",
+    "get_embedding_cache", "get_embedding_client",
+]
@@ -101,18 +101,12 @@ class PatternCollector:
         now = datetime.now(timezone.utc).isoformat()
 
         try:
-            for line in ledger.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    engram = json.loads(line)
-                    ctx = engram.get("context", "unknown")
-                    intensity = engram.get("intensity", 5)
-                    context_counts[ctx] += 1
-                    intensity_buckets[f"intensity_{intensity}"] += 1
-                except (json.JSONDecodeError, KeyError):
-                    continue
+            from .engram_ledger import load_live_engrams
+            for engram in load_live_engrams(ledger):
+                ctx = engram.get("context", "unknown")
+                intensity = engram.get("intensity", 5)
+                context_counts[ctx] += 1
+                intensity_buckets[f"intensity_{intensity}"] += 1
 
             for ctx, count in context_counts.most_common(10):
                 patterns.append(Pattern(
@@ -2,24 +2,86 @@
 Engram Cache — In-memory index for JSONL ledger reads.
 ======================================================
 Eliminates O(n) full-file scans on every query/search by maintaining
-an in-memory cache with file-modification-time invalidation.
+an in-memory index that follows the ledger files by byte offset.
+
+Both ``ledger.jsonl`` and ``history.jsonl`` are append-only. The cache
+remembers how far into each file it has read; when a file only grew, it
+parses just the appended tail and merges it in. A full reload happens only
+when the file was replaced or rewritten (inode change, shrink, or a changed
+fingerprint at the resume offset — see ``engram_ledger.LedgerCursor``).
+
+Entries are held in a compact slotted form (the fields queries filter and
+search on, plus the record's byte offset); full ledger records are decoded
+from disk only for the rows actually returned. There is no cap — every live
+engram stays searchable however large the brain grows.
 
 Thread-safe. Falls back gracefully to direct file reads on any error.
 """
 
 import json
-import os
 import threading
-import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .engram_ledger import LedgerCursor, default_winner
 
 logger = logging.getLogger("nucleus.engram_cache")
 
-# Maximum engrams to hold in memory. When the ledger exceeds this,
-# only the most recent entries are cached (oldest are dropped).
-MAX_CACHED_ENGRAMS = 10_000
+
+class _Slot:
+    """Compact in-memory view of one ledger record."""
+
+    __slots__ = ("key", "value", "context", "intensity", "version",
+                 "timestamp", "quarantined", "offset")
+
+    def __init__(self, record: Dict, offset: int):
+        self.key = record.get("key", "") or ""
+        self.value = record.get("value", "") or ""
+        self.context = record.get("context", "") or ""
+        self.intensity = record.get("intensity", 5)
+        self.version = record.get("version", 1)
+        self.timestamp = record.get("timestamp", "") or ""
+        self.quarantined = bool(record.get("quarantined", False))
+        self.offset = offset
+
+    def as_record(self) -> Dict:
+        """Minimal record for when the on-disk line can no longer be read."""
+        return {
+            "key": self.key,
+            "value": self.value,
+            "context": self.context,
+            "intensity": self.intensity,
+            "version": self.version,
+            "timestamp": self.timestamp,
+        }
+
+
+class _HistorySlot:
+    """Compact flat view of one history.jsonl (Store-shape) row."""
+
+    __slots__ = ("key", "value", "context", "intensity", "timestamp",
+                 "signature", "source_agent")
+
+    def __init__(self, flat: Dict):
+        self.key = flat["key"]
+        self.value = flat["value"]
+        self.context = flat["context"]
+        self.intensity = flat["intensity"]
+        self.timestamp = flat["timestamp"]
+        self.signature = flat["signature"]
+        self.source_agent = flat["source_agent"]
+
+    def as_record(self) -> Dict:
+        return {
+            "key": self.key,
+            "value": self.value,
+            "context": self.context,
+            "intensity": self.intensity,
+            "timestamp": self.timestamp,
+            "signature": self.signature,
+            "source_agent": self.source_agent,
+        }
 
 
 class EngramCache:
@@ -28,102 +90,117 @@ class EngramCache:
     Provides O(1) lookups by key and fast filtered queries by context
     and intensity, avoiding repeated full-file scans.
 
-    Invalidation: Checks file mtime before each access. If the file
-    changed since last load, re-reads it. This is a single stat() call
-    per access (microseconds) vs reading potentially thousands of lines.
+    Freshness: one ``stat()`` per access. If the file grew, only the new
+    tail is parsed; writers therefore no longer need to invalidate the
+    cache after appending.
     """
 
     def __init__(self):
         self._lock = threading.Lock()
-        self._engrams: List[Dict] = []
-        self._by_key: Dict[str, Dict] = {}
-        self._by_context: Dict[str, List[Dict]] = {}
-        self._last_mtime: float = 0.0
         self._last_path: Optional[str] = None
+        self._cursor: Optional[LedgerCursor] = None
         self._load_count: int = 0
-        self._total_on_disk: int = 0
-        self._capped: bool = False
+        self._tail_count: int = 0
+        self._reset_ledger()
         # Independent state for history.jsonl (Store-shape projection store).
         # Tracked separately so a write to one file does not invalidate the other.
-        self._history_engrams: List[Dict] = []
-        self._history_last_mtime: float = 0.0
         self._history_last_path: Optional[str] = None
+        self._history_cursor: Optional[LedgerCursor] = None
         self._history_load_count: int = 0
-        self._history_total_on_disk: int = 0
-        self._history_capped: bool = False
-
-    def _needs_reload(self, ledger_path: Path) -> bool:
-        """Check if cache is stale (file modified since last load)."""
-        try:
-            current_mtime = ledger_path.stat().st_mtime
-            return (
-                str(ledger_path) != self._last_path
-                or current_mtime != self._last_mtime
-            )
-        except OSError:
-            return True
-
-    def _load(self, ledger_path: Path) -> None:
-        """Reload the cache from the JSONL file."""
-        engrams = []
-        by_key = {}
-        by_context: Dict[str, List[Dict]] = {}
-
-        try:
-            with open(ledger_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-                    try:
-                        e = json.loads(stripped)
-                    except json.JSONDecodeError:
-                        continue
-
-                    if e.get("deleted", False) or e.get("quarantined", False):
-                        continue
+        self._history_tail_count: int = 0
+        self._history_engrams: List[_HistorySlot] = []
+
+    def _reset_ledger(self) -> None:
+        # Winning record per key (quarantined winners included — they hide
+        # the key without letting an older version resurface).
+        self._winners: Dict[str, _Slot] = {}
+        self._by_key: Dict[str, _Slot] = {}
+        self._by_context: Dict[str, Dict[str, _Slot]] = {}
+        self._keyless: List[_Slot] = []
+
+    # ── Ledger maintenance ─────────────────────────────────────────
+
+    def _hide(self, key: str) -> None:
+        slot = self._by_key.pop(key, None)
+        if slot is not None:
+            ctx = self._by_context.get(slot.context.lower())
+            if ctx is not None:
+                ctx.pop(key, None)
+                if not ctx:
+                    del self._by_context[slot.context.lower()]
+
+    def _apply(self, offset: int, record: Dict) -> None:
+        """Merge one ledger record (latest-version-per-key, tombstones hide)."""
+        key = record.get("key", "")
+        if record.get("deleted", False):
+            if key:
+                self._winners.pop(key, None)
+                self._hide(key)
+            return
+        slot = _Slot(record, offset)
+        if not key:
+            if not slot.quarantined:
+                self._keyless.append(slot)
+            return
+        existing = self._winners.get(key)
+        if existing is not None:
+            current = {"version": existing.version, "timestamp": existing.timestamp}
+            candidate = {"version": slot.version, "timestamp": slot.timestamp}
+            if default_winner(current, candidate) is current:
+                return
+            self._hide(key)
+        self._winners[key] = slot
+        if slot.quarantined:
+            return
+        self._by_key[key] = slot
+        self._by_context.setdefault(slot.context.lower(), {})[key] = slot
 
-                    engrams.append(e)
-                    key = e.get("key", "")
-                    if key:
-                        by_key[key] = e
-                    ctx = e.get("context", "").lower()
-                    if ctx not in by_context:
-                        by_context[ctx] = []
-                    by_context[ctx].append(e)
-
-            total_on_disk = len(engrams)
-            capped = total_on_disk > MAX_CACHED_ENGRAMS
-            if capped:
-                # Keep only the most recent entries (tail of file)
-                engrams = engrams[-MAX_CACHED_ENGRAMS:]
-                by_key = {e.get("key", ""): e for e in engrams if e.get("key")}
-                by_context = {}
-                for e in engrams:
-                    ctx = e.get("context", "").lower()
-                    if ctx not in by_context:
-                        by_context[ctx] = []
-                    by_context[ctx].append(e)
-                logger.info(f"EngramCache capped: {total_on_disk} on disk, {MAX_CACHED_ENGRAMS} cached")
-
-            self._engrams = engrams
-            self._by_key = by_key
-            self._by_context = by_context
-            self._total_on_disk = total_on_disk
-            self._capped = capped
-            self._last_mtime = ledger_path.stat().st_mtime
+    def _ensure_loaded(self, ledger_path: Path) -> None:
+        """Bring the cache up to date (tail read, or full reload on rewrite)."""
+        if str(ledger_path) != self._last_path or self._cursor is None:
             self._last_path = str(ledger_path)
-            self._load_count += 1
+            self._cursor = LedgerCursor(ledger_path)
+            self._reset_ledger()
+        fresh = self._cursor.inode is None
+        try:
+            status = self._cursor.poll(self._apply, self._reset_ledger)
         except OSError as e:
             logger.debug(f"EngramCache load failed: {e}")
-            self._engrams = []
-            self._by_key = {}
-            self._by_context = {}
+            self._cursor.reset()
+            self._reset_ledger()
+            return
+        if status == "reloaded" or (fresh and status == "appended"):
+            self._load_count += 1
+        elif status == "appended":
+            self._tail_count += 1
 
-    def _ensure_loaded(self, ledger_path: Path) -> None:
-        """Ensure cache is fresh (reload if stale)."""
-        if self._needs_reload(ledger_path):
-            self._load(ledger_path)
+    def _visible(self) -> Iterable[_Slot]:
+        yield from self._by_key.values()
+        yield from self._keyless
+
+    def _materialize(self, slots: List[_Slot]) -> List[Dict]:
+        """Decode the full on-disk records for ``slots`` (one file open)."""
+        out: List[Dict] = []
+        try:
+            f = open(self._last_path, "rb")
+        except (OSError, TypeError):
+            return [s.as_record() for s in slots]
+        with f:
+            for s in slots:
+                record = None
+                try:
+                    f.seek(s.offset)
+                    record = json.loads(f.readline())
+                except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+                    record = None
+                # A concurrent rewrite can move lines; only trust a match.
+                if not isinstance(record, dict) or record.get("key", "") != s.key \
+                        or (record.get("value", "") or "") != s.value:
+                    record = s.as_record()
+                out.append(record)
+        return out
+
+    # ── History maintenance ────────────────────────────────────────
 
     @staticmethod
     def _normalize_history_row(row: Dict) -> Optional[Dict]:
@@ -155,60 +232,44 @@ class EngramCache:
             "source_agent": snap.get("source_agent", ""),
         }
 
-    def _needs_reload_history(self, history_path: Path) -> bool:
-        try:
-            current_mtime = history_path.stat().st_mtime
-            return (
-                str(history_path) != self._history_last_path
-                or current_mtime != self._history_last_mtime
-            )
-        except OSError:
-            return True
-
-    def _load_history(self, history_path: Path) -> None:
-        """Reload the history-side cache from history.jsonl (Store shape)."""
-        history_engrams: List[Dict] = []
-        try:
-            with open(history_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-                    try:
-                        raw = json.loads(stripped)
-                    except json.JSONDecodeError:
-                        continue
-                    flat = self._normalize_history_row(raw)
-                    if flat is not None:
-                        history_engrams.append(flat)
-
-            total_on_disk = len(history_engrams)
-            capped = total_on_disk > MAX_CACHED_ENGRAMS
-            if capped:
-                history_engrams = history_engrams[-MAX_CACHED_ENGRAMS:]
-                logger.info(
-                    f"EngramCache (history) capped: {total_on_disk} on disk, "
-                    f"{MAX_CACHED_ENGRAMS} cached"
-                )
-
-            self._history_engrams = history_engrams
-            self._history_total_on_disk = total_on_disk
-            self._history_capped = capped
-            self._history_last_mtime = history_path.stat().st_mtime
+    def _apply_history(self, offset: int, row: Dict) -> None:
+        flat = self._normalize_history_row(row)
+        if flat is not None:
+            self._history_engrams.append(_HistorySlot(flat))
+
+    def _reset_history(self) -> None:
+        self._history_engrams = []
+
+    def _ensure_loaded_history(self, history_path: Path) -> None:
+        if str(history_path) != self._history_last_path or self._history_cursor is None:
             self._history_last_path = str(history_path)
-            self._history_load_count += 1
+            self._history_cursor = LedgerCursor(history_path)
+            self._history_engrams = []
+        fresh = self._history_cursor.inode is None
+        try:
+            status = self._history_cursor.poll(self._apply_history, self._reset_history)
         except OSError as e:
             logger.debug(f"EngramCache history load failed: {e}")
+            self._history_cursor.reset()
             self._history_engrams = []
-
-    def _ensure_loaded_history(self, history_path: Path) -> None:
-        if not history_path.exists():
-            self._history_engrams = []
-            self._history_last_mtime = 0.0
-            self._history_last_path = str(history_path)
             return
-        if self._needs_reload_history(history_path):
-            self._load_history(history_path)
+        if status == "reloaded" or (fresh and status == "appended"):
+            self._history_load_count += 1
+        elif status == "appended":
+            self._history_tail_count += 1
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    @staticmethod
+    def _match_in(slot, search_q: str, case_sensitive: bool) -> List[str]:
+        key_s = slot.key if case_sensitive else slot.key.lower()
+        value_s = slot.value if case_sensitive else slot.value.lower()
+        match_in = []
+        if search_q in key_s:
+            match_in.append("key")
+        if search_q in value_s:
+            match_in.append("value")
+        return match_in
 
     def query(self, ledger_path: Path, context: Optional[str] = None,
               min_intensity: int = 1, limit: int = 50) -> Tuple[List[Dict], int]:
@@ -221,15 +282,15 @@ class EngramCache:
             self._ensure_loaded(ledger_path)
 
             if context:
-                candidates = self._by_context.get(context.lower(), [])
+                candidates = self._by_context.get(context.lower(), {}).values()
             else:
-                candidates = self._engrams
+                candidates = self._visible()
 
-            filtered = [e for e in candidates if e.get("intensity", 5) >= min_intensity]
-            filtered.sort(key=lambda x: x.get("intensity", 5), reverse=True)
+            filtered = [s for s in candidates if s.intensity >= min_intensity]
+            filtered.sort(key=lambda s: s.intensity, reverse=True)
 
             total = len(filtered)
-            return filtered[:limit], total
+            return self._materialize(filtered[:limit]), total
 
     def search(self, ledger_path: Path, query: str,
                case_sensitive: bool = False, limit: int = 50) -> Tuple[List[Dict], int]:
@@ -243,27 +304,20 @@ class EngramCache:
 
             search_q = query if case_sensitive else query.lower()
             matches = []
-
-            for e in self._engrams:
-                key = e.get("key", "")
-                value = e.get("value", "")
-                key_s = key if case_sensitive else key.lower()
-                value_s = value if case_sensitive else value.lower()
-
-                match_in = []
-                if search_q in key_s:
-                    match_in.append("key")
-                if search_q in value_s:
-                    match_in.append("value")
-
+            for s in self._visible():
+                match_in = self._match_in(s, search_q, case_sensitive)
                 if match_in:
-                    result = dict(e)
-                    result["_match_in"] = match_in
-                    matches.append(result)
+                    matches.append((s, match_in))
 
-            matches.sort(key=lambda x: x.get("intensity", 5), reverse=True)
+            matches.sort(key=lambda m: m[0].intensity, reverse=True)
             total = len(matches)
-            return matches[:limit], total
+            top = matches[:limit]
+            results = []
+            for record, (_, match_in) in zip(self._materialize([m[0] for m in top]), top):
+                result = dict(record)
+                result["_match_in"] = match_in
+                results.append(result)
+            return results, total
 
     def search_dual(
         self,
@@ -286,22 +340,15 @@ class EngramCache:
             self._ensure_loaded_history(history_path)
 
             search_q = query if case_sensitive else query.lower()
-            matches: List[Dict] = []
+            matches: List[Tuple[object, List[str], str]] = []
             seen_keys: Dict[str, str] = {}
 
-            def _scan(records: List[Dict], source: str) -> None:
-                for e in records:
-                    key = e.get("key", "")
-                    value = e.get("value", "")
-                    key_s = key if case_sensitive else key.lower()
-                    value_s = value if case_sensitive else value.lower()
-                    match_in = []
-                    if search_q in key_s:
-                        match_in.append("key")
-                    if search_q in value_s:
-                        match_in.append("value")
+            def _scan(records: Iterable, source: str) -> None:
+                for s in records:
+                    match_in = self._match_in(s, search_q, case_sensitive)
                     if not match_in:
                         continue
+                    key = s.key
                     if key and key in seen_keys:
                         logger.debug(
                             f"EngramCache.search_dual dedup: key={key!r} "
@@ -309,56 +356,62 @@ class EngramCache:
                             f"keeping {seen_keys[key]}"
                         )
                         continue
-                    result = dict(e)
-                    result["_match_in"] = match_in
-                    result["source"] = source
-                    matches.append(result)
+                    matches.append((s, match_in, source))
                     if key:
                         seen_keys[key] = source
 
-            _scan(self._engrams, "ledger")
+            _scan(self._visible(), "ledger")
             _scan(self._history_engrams, "history")
 
-            matches.sort(key=lambda x: x.get("intensity", 5), reverse=True)
+            matches.sort(key=lambda m: m[0].intensity, reverse=True)
             total = len(matches)
-            return matches[:limit], total
+            top = matches[:limit]
+            ledger_rows = iter(self._materialize([m[0] for m in top if m[2] == "ledger"]))
+            results: List[Dict] = []
+            for s, match_in, source in top:
+                result = dict(next(ledger_rows)) if source == "ledger" else s.as_record()
+                result["_match_in"] = match_in
+                result["source"] = source
+                results.append(result)
+            return results, total
 
     def get_by_key(self, ledger_path: Path, key: str) -> Optional[Dict]:
         """O(1) lookup by engram key."""
         with self._lock:
             self._ensure_loaded(ledger_path)
-            return self._by_key.get(key)
+            slot = self._by_key.get(key)
+            return self._materialize([slot])[0] if slot is not None else None
 
     def invalidate(self) -> None:
-        """Force cache invalidation (e.g., after a write).
+        """Force a full reload on next access.
 
-        Invalidates BOTH ledger and history caches — write paths may land
-        in either file (write_engram → ledger, relay projection → history),
-        so a write event must invalidate both to keep search consistent.
+        Appends are picked up automatically by the tail reader, so writers do
+        not need this; it remains for callers that rewrite a file in a way the
+        cursor cannot detect. Invalidates BOTH ledger and history caches.
         """
         with self._lock:
-            self._last_mtime = 0.0
-            self._last_path = None
-            self._history_last_mtime = 0.0
-            self._history_last_path = None
+            self._cursor = None
+            self._history_cursor = None
 
     @property
     def stats(self) -> Dict:
         """Cache statistics for diagnostics."""
         with self._lock:
             return {
-                "cached_engrams": len(self._engrams),
-                "total_on_disk": self._total_on_disk,
-                "capped": self._capped,
-                "max_cached": MAX_CACHED_ENGRAMS,
+                "cached_engrams": len(self._by_key) + len(self._keyless),
+                "total_on_disk": len(self._winners) + len(self._keyless),
+                "capped": False,
                 "contexts": list(self._by_context.keys()),
                 "unique_keys": len(self._by_key),
                 "load_count": self._load_count,
+                "tail_count": self._tail_count,
+                "offset": self._cursor.offset if self._cursor else 0,
                 "last_path": self._last_path,
                 "history_cached_engrams": len(self._history_engrams),
-                "history_total_on_disk": self._history_total_on_disk,
-                "history_capped": self._history_capped,
+                "history_total_on_disk": len(self._history_engrams),
+                "history_capped": False,
                 "history_load_count": self._history_load_count,
+                "history_tail_count": self._history_tail_count,
                 "history_last_path": self._history_last_path,
             }
 
@@ -0,0 +1,361 @@
+"""
+Engram Similarity Index — inverted keyword index for ADUN matching.
+===================================================================
+``MemoryPipeline.propose_ops`` has to answer two questions per candidate atom:
+"is this an exact duplicate?" and "which engram is most similar?". Answering
+them by scanning every live engram makes ``process()`` O(atoms × engrams ×
+words). This index keeps, per live engram key:
+
+  * the byte offset of its winning ledger record (so the full record is one
+    seek away instead of kept in memory),
+  * its version/timestamp (for latest-version resolution while replaying),
+  * its stop-word-stripped token set, computed once per engram version,
+  * a hash of its normalized value (exact-duplicate lookup),
+
+plus ``token → {keys}`` postings. Jaccard is computed only for engrams that
+share at least one token with the candidate — the only ones that can clear a
+non-zero threshold.
+
+The index follows the append-only ledger (see ``engram_ledger``): it records
+the byte offset it has consumed and replays only the appended tail. A snapshot
+is persisted next to the ledger so a fresh process resumes from its offset
+instead of re-tokenizing the whole brain. A rewrite of the ledger (compaction,
+inode change, shrink, or a mismatched fingerprint at the resume offset)
+triggers a full rebuild.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Optional, Set
+
+from .engram_ledger import LedgerCursor
+
+logger = logging.getLogger("nucleus.engram_index")
+
+SNAPSHOT_NAME = "similarity_index.json"
+SNAPSHOT_FORMAT = 1
+# Persist the snapshot after this many applied records or seconds, whichever
+# comes first. The snapshot is only a resume point — the ledger stays the
+# source of truth — so lagging it is safe.
+SNAPSHOT_EVERY_RECORDS = 500
+SNAPSHOT_EVERY_S = 60.0
+
+STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "shall",
+    "for", "and", "but", "or", "nor", "not", "so", "yet",
+    "to", "of", "in", "on", "at", "by", "with", "from",
+    "this", "that", "it", "its", "we", "our", "their",
+})
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lower-cased whitespace tokens with stop words removed."""
+    return frozenset(text.lower().split()) - STOP_WORDS
+
+
+def engram_tokens(engram: Dict) -> FrozenSet[str]:
+    """Token set ADUN similarity compares against: value words ∪ key words."""
+    value_words = tokenize(engram.get("value", "") or "")
+    key_words = tokenize((engram.get("key", "") or "").replace("_", " "))
+    return value_words | key_words
+
+
+def _value_hash(value: str) -> str:
+    return hashlib.sha1(value.strip().lower().encode("utf-8")).hexdigest()
+
+
+class EngramSimilarityIndex:
+    """Token → engram-key inverted index over one ``ledger.jsonl``."""
+
+    def __init__(self, ledger_path: Path):
+        self.ledger_path = Path(ledger_path)
+        self.snapshot_path = self.ledger_path.parent / SNAPSHOT_NAME
+        self._lock = threading.RLock()
+        self._cursor = LedgerCursor(self.ledger_path)
+        self._clear()
+        self._snapshot_loaded = False
+        self._pending = 0
+        self._last_snapshot = time.monotonic()
+        self._snapshot_in_flight = False
+        self._rebuilds = 0
+
+    def _clear(self) -> None:
+        # key -> {"offset", "version", "ts", "tokens", "vhash"}
+        self._entries: Dict[str, Dict] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._exact: Dict[str, Set[str]] = {}
+
+    # ── Maintenance ────────────────────────────────────────────────
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tok in entry["tokens"]:
+            keys = self._postings.get(tok)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[tok]
+        keys = self._exact.get(entry["vhash"])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._exact[entry["vhash"]]
+
+    def _insert(self, key: str, entry: Dict) -> None:
+        self._entries[key] = entry
+        for tok in entry["tokens"]:
+            self._postings.setdefault(tok, set()).add(key)
+        self._exact.setdefault(entry["vhash"], set()).add(key)
+
+    def _apply(self, offset: int, record: Dict) -> None:
+        """Fold one ledger record (at ``offset``) into the index."""
+        key = record.get("key")
+        if not key:
+            return
+        if record.get("deleted", False):
+            self._remove(key)
+            return
+        version = record.get("version", 1)
+        ts = record.get("timestamp", "")
+        existing = self._entries.get(key)
+        if existing is not None:
+            # Same precedence as engram_ledger.default_winner.
+            if version < existing["version"]:
+                return
+            if version == existing["version"] and not ts > existing["ts"]:
+                return
+            self._remove(key)
+        self._insert(key, {
+            "offset": offset,
+            "version": version,
+            "ts": ts,
+            "tokens": engram_tokens(record),
+            "vhash": _value_hash(record.get("value", "") or ""),
+        })
+        self._pending += 1
+
+    def sync(self) -> None:
+        """Bring the index up to date with the ledger on disk."""
+        with self._lock:
+            if not self._snapshot_loaded:
+                self._snapshot_loaded = True
+                self._load_snapshot()
+            status = self._cursor.poll(self._apply, self._clear)
+            if status == "reloaded":
+                self._rebuilds += 1
+                self._pending = max(self._pending, SNAPSHOT_EVERY_RECORDS)
+            self._maybe_snapshot()
+
+    def observe_append(self, record: Dict, offset: int, end: int) -> None:
+        """Incremental hook for a record the caller just appended at ``offset``.
+
+        Applied only when the index is exactly caught up to ``offset``; if
+        another writer appended in between, the next ``sync`` replays the tail
+        instead.
+        """
+        with self._lock:
+            if not self._snapshot_loaded or not self._cursor.advance(offset, end):
+                return
+            self._apply(offset, record)
+            self._maybe_snapshot()
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    def _read_entry(self, key: str) -> Optional[Dict]:
+        """Read the record the index holds for ``key``, if it is still there.
+
+        The compactor can ``os.replace`` the ledger at any time, after which a
+        cached offset points at some other record. Only trust a record whose
+        key, version, timestamp and value all match the entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        record = self._cursor.read_at(entry["offset"])
+        if (
+            not isinstance(record, dict)
+            or record.get("key") != key
+            or record.get("deleted", False)
+            or record.get("version", 1) != entry["version"]
+            or record.get("timestamp", "") != entry["ts"]
+            or _value_hash(record.get("value", "") or "") != entry["vhash"]
+        ):
+            return None
+        return record
+
+    def _lookup(self, pick: Callable[[], Optional[str]]) -> Optional[Dict]:
+        """Run ``pick`` and read its key's record, re-syncing once on a stale offset."""
+        with self._lock:
+            key = pick()
+            if key is None:
+                return None
+            record = self._read_entry(key)
+            if record is not None:
+                return record
+            logger.debug(f"Stale similarity index offset for '{key}'; re-syncing")
+            self.sync()
+            key = pick()
+            return self._read_entry(key) if key is not None else None
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Latest live record for ``key`` (None if absent or deleted)."""
+        return self._lookup(lambda: key if key in self._entries else None)
+
+    def find_exact(self, value: str) -> Optional[Dict]:
+        """Live engram whose normalized value equals ``value``'s."""
+        vhash = _value_hash(value)
+
+        def pick() -> Optional[str]:
+            keys = self._exact.get(vhash)
+            if not keys:
+                return None
+            return min(keys, key=lambda k: self._entries[k]["offset"])
+
+        record = self._lookup(pick)
+        # Guard against a hash collision.
+        if record and (record.get("value", "") or "").strip().lower() == value.strip().lower():
+            return record
+        return None
+
+    def find_similar(self, candidate: str, threshold: float = 0.6) -> Optional[Dict]:
+        """Most similar live engram by Jaccard over token sets, or None.
+
+        Only engrams sharing at least one token are scored, and those whose
+        token count alone caps Jaccard below ``threshold`` are skipped.
+        """
+        words = tokenize(candidate)
+        if not words:
+            return None
+        n = len(words)
+
+        def pick() -> Optional[str]:
+            candidates: Set[str] = set()
+            for tok in words:
+                keys = self._postings.get(tok)
+                if keys:
+                    candidates |= keys
+            best_key = None
+            best_score = 0.0
+            best_offset = 0
+            for key in candidates:
+                entry = self._entries[key]
+                tokens = entry["tokens"]
+                m = len(tokens)
+                # Jaccard <= min(n, m) / max(n, m)
+                if min(n, m) < threshold * max(n, m):
+                    continue
+                inter = len(words & tokens)
+                score = inter / (n + m - inter)
+                if score < threshold:
+                    continue
+                if score > best_score or (score == best_score and entry["offset"] < best_offset):
+                    best_key, best_score, best_offset = key, score, entry["offset"]
+            return best_key
+
+        return self._lookup(pick)
+
+    @property
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "keys": len(self._entries),
+                "tokens": len(self._postings),
+                "offset": self._cursor.offset,
+                "rebuilds": self._rebuilds,
+                "snapshot": str(self.snapshot_path),
+            }
+
+    # ── Snapshot persistence ───────────────────────────────────────
+
+    def _load_snapshot(self) -> None:
+        try:
+            st = self.ledger_path.stat()
+            data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        try:
+            cursor = data["cursor"]
+            if data.get("format") != SNAPSHOT_FORMAT or cursor.get("inode") != st.st_ino:
+                return
+            if cursor["offset"] > st.st_size:
+                return
+            for key, (offset, version, ts, tokens, vhash) in data["entries"].items():
+                self._insert(key, {
+                    "offset": offset, "version": version, "ts": ts,
+                    "tokens": frozenset(tokens), "vhash": vhash,
+                })
+            # Resume point; ``poll`` still verifies the fingerprint.
+            self._cursor.restore(cursor)
+            self._pending = 0
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable similarity snapshot: {e}")
+            self._clear()
+            self._cursor.reset()
+
+    def _maybe_snapshot(self) -> None:
+        if not self._pending:
+            return
+        due = (
+            self._pending >= SNAPSHOT_EVERY_RECORDS
+            or time.monotonic() - self._last_snapshot >= SNAPSHOT_EVERY_S
+        )
+        if due and not self._snapshot_in_flight:
+            # Serializing a large index takes a while; keep it off the
+            # caller's path. The worker re-takes the lock to copy state.
+            self._snapshot_in_flight = True
+            threading.Thread(
+                target=self.save_snapshot, name="engram-index-snapshot", daemon=True
+            ).start()
+
+    def save_snapshot(self) -> None:
+        """Atomically persist the index state (tmp file + ``os.replace``)."""
+        with self._lock:
+            data = {
+                "format": SNAPSHOT_FORMAT,
+                "cursor": self._cursor.to_dict(),
+                "entries": {
+                    key: [e["offset"], e["version"], e["ts"], sorted(e["tokens"]), e["vhash"]]
+                    for key, e in self._entries.items()
+                },
+            }
+            self._pending = 0
+            self._last_snapshot = time.monotonic()
+        tmp = self.snapshot_path.with_name(f".{SNAPSHOT_NAME}.{os.getpid()}.tmp")
+        try:
+            payload = json.dumps(data, separators=(",", ":"))
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.snapshot_path)
+        except OSError as e:
+            logger.debug(f"Similarity snapshot write failed: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+        finally:
+            self._snapshot_in_flight = False
+
+
+# Process-wide registry: MemoryPipeline is constructed per call, the index
+# must outlive it.
+_indexes: Dict[str, EngramSimilarityIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_similarity_index(ledger_path: Path) -> EngramSimilarityIndex:
+    """Get (creating on first use) the shared index for ``ledger_path``."""
+    path = str(Path(ledger_path))
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = EngramSimilarityIndex(Path(path))
+        return index
@@ -0,0 +1,385 @@
+"""
+Engram Ledger — append-only record resolution and compaction.
+=============================================================
+``engrams/ledger.jsonl`` is an append-only log. ADD and UPDATE append a full
+engram record; DELETE appends a tombstone (``{"key", "deleted": true, ...}``).
+Nothing on the write path rewrites the file, so a single ADUN op is an O(1)
+append regardless of brain size.
+
+Readers resolve the log into the live view with ``resolve_latest``:
+
+  * a tombstone supersedes every earlier record for its key;
+  * a live record after a tombstone resurrects the key;
+  * between two live records, the higher ``version`` wins, ties broken by the
+    later ``timestamp`` (the same precedence the pre-ADUN dedup used).
+
+Superseded records and tombstones are dead weight. ``compact_ledger`` rewrites
+the file atomically (temp file + ``os.replace`` under the ``engrams`` lock)
+with only the live records, and ``maybe_compact_async`` runs it on a daemon
+thread once the dead-record ratio crosses ``NUCLEUS_LEDGER_COMPACT_RATIO``.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger("nucleus.engram_ledger")
+
+# Compaction policy. All three are env-overridable so operators can tune a
+# busy brain without a release.
+DEFAULT_COMPACT_RATIO = 0.5          # dead / total records
+DEFAULT_COMPACT_MIN_RECORDS = 1000   # below this a rewrite is not worth it
+DEFAULT_COMPACT_INTERVAL_S = 300.0   # min seconds between background checks
+
+Winner = Callable[[Dict, Dict], Dict]
+
+# Background compactor bookkeeping (process-wide, keyed by ledger path).
+_compact_lock = threading.Lock()
+_compact_last_check: Dict[str, float] = {}
+_compact_in_flight: set = set()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def is_tombstone(record: Dict) -> bool:
+    """True for a DELETE record (or a legacy soft-deleted line)."""
+    return bool(record.get("deleted", False))
+
+
+def make_tombstone(key: str) -> Dict:
+    """Build the tombstone record appended for a DELETE."""
+    now = datetime.now().isoformat()
+    return {
+        "key": key,
+        "op_type": "DELETE",
+        "timestamp": now,
+        "deleted": True,
+        "deleted_at": now,
+    }
+
+
+def default_winner(existing: Dict, candidate: Dict) -> Dict:
+    """Live-vs-live precedence: higher version, then later timestamp."""
+    e_ver = candidate.get("version", 1)
+    ex_ver = existing.get("version", 1)
+    if e_ver > ex_ver:
+        return candidate
+    if e_ver == ex_ver and candidate.get("timestamp", "") > existing.get("timestamp", ""):
+        return candidate
+    return existing
+
+
+def iter_records(ledger_path: Path) -> Iterator[Dict]:
+    """Yield every parseable record in the ledger, in file order."""
+    try:
+        with open(ledger_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return
+
+
+def resolve_latest(records: Iterable[Dict], winner: Optional[Winner] = None) -> Dict:
+    """Fold ledger records into the latest record per key.
+
+    Returns a dict with:
+      * ``by_key``  — key → winning record (tombstones included, so callers
+                      can tell "deleted" from "never existed");
+      * ``keyless`` — live records without a key (kept as-is);
+      * ``total``   — number of records consumed.
+    """
+    pick = winner or default_winner
+    by_key: Dict[str, Dict] = {}
+    keyless: List[Dict] = []
+    total = 0
+    for rec in records:
+        total += 1
+        key = rec.get("key")
+        if not key:
+            if not is_tombstone(rec):
+                keyless.append(rec)
+            continue
+        existing = by_key.get(key)
+        if existing is None or is_tombstone(rec) or is_tombstone(existing):
+            by_key[key] = rec
+        else:
+            by_key[key] = pick(existing, rec)
+    return {"by_key": by_key, "keyless": keyless, "total": total}
+
+
+class LedgerCursor:
+    """Byte-offset cursor that follows an append-only JSONL file.
+
+    Remembers the offset it has consumed, the file's inode and a short
+    fingerprint of the bytes just before the offset. ``poll`` feeds only the
+    appended tail to ``apply``; if the file was replaced (inode change),
+    truncated, or rewritten in place (fingerprint mismatch), it calls
+    ``on_rewind`` and replays from the start instead.
+    """
+
+    FINGERPRINT_BYTES = 64
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.offset = 0
+        self.inode: Optional[int] = None
+        self.fingerprint = b""
+
+    def reset(self) -> None:
+        self.offset = 0
+        self.inode = None
+        self.fingerprint = b""
+
+    def _read_fingerprint(self, f, offset: int) -> bytes:
+        start = max(0, offset - self.FINGERPRINT_BYTES)
+        f.seek(start)
+        return f.read(offset - start)
+
+    def poll(self, apply: Callable[[int, Dict], None],
+             on_rewind: Callable[[], None]) -> str:
+        """Feed new records to ``apply(offset, record)``.
+
+        Returns ``"missing"``, ``"unchanged"``, ``"appended"`` or
+        ``"reloaded"``. A partial trailing line (a write still in flight) is
+        left for the next poll.
+        """
+        try:
+            st = self.path.stat()
+        except OSError:
+            if self.inode is not None or self.offset:
+                on_rewind()
+            self.reset()
+            return "missing"
+        with open(self.path, "rb") as f:
+            rewound = (
+                (self.inode is not None and st.st_ino != self.inode)
+                or st.st_size < self.offset
+                or (self.offset and self._read_fingerprint(f, self.offset) != self.fingerprint)
+            )
+            if rewound:
+                on_rewind()
+                self.offset = 0
+            self.inode = st.st_ino
+            if st.st_size == self.offset:
+                return "reloaded" if rewound else "unchanged"
+            f.seek(self.offset)
+            pos = self.offset
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                line_start = pos
+                pos += len(raw)
+                if not raw.strip():
+                    continue
+                try:
+                    record = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                apply(line_start, record)
+            self.offset = pos
+            self.fingerprint = self._read_fingerprint(f, pos)
+        return "reloaded" if rewound else "appended"
+
+    def advance(self, offset: int, end: int) -> bool:
+        """Account for a record the caller itself appended at ``offset``.
+
+        Returns False (cursor untouched) unless the cursor was exactly at
+        ``offset`` — another writer got in between and ``poll`` must replay.
+        """
+        if self.inode is None or self.offset != offset:
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                self.fingerprint = self._read_fingerprint(f, end)
+        except OSError:
+            return False
+        self.offset = end
+        return True
+
+    def read_at(self, offset: int) -> Optional[Dict]:
+        """Decode the single record starting at ``offset``."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                return json.loads(f.readline())
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+    def to_dict(self) -> Dict:
+        return {"inode": self.inode, "offset": self.offset,
+                "fingerprint": self.fingerprint.hex()}
+
+    def restore(self, data: Dict) -> None:
+        self.inode = data.get("inode")
+        self.offset = int(data.get("offset", 0))
+        self.fingerprint = bytes.fromhex(data.get("fingerprint", ""))
+
+
+def live_records(resolved: Dict) -> List[Dict]:
+    """Live (non-tombstoned) records from a ``resolve_latest`` result."""
+    live = [e for e in resolved["by_key"].values() if not is_tombstone(e)]
+    return live + resolved["keyless"]
+
+
+def load_live_engrams(ledger_path: Path, winner: Optional[Winner] = None) -> List[Dict]:
+    """Resolve the ledger into its live engrams (latest version per key)."""
+    return live_records(resolve_latest(iter_records(ledger_path), winner))
+
+
+def append_records(brain_path: Path, records: Iterable[Dict]) -> int:
+    """Append records to the ledger in one write under the ``engrams`` lock.
+
+    For callers outside ``MemoryPipeline`` (recipes, CLI) that need to add
+    versions or tombstones. Holding the lock keeps the append from landing
+    between the compactor's read and its ``os.replace``. Returns the number
+    of records written.
+    """
+    lines = [json.dumps(r, ensure_ascii=False) + "\n" for r in records]
+    if not lines:
+        return 0
+    ledger_path = Path(brain_path) / "engrams" / "ledger.jsonl"
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+
+    from .locking import get_lock
+    with get_lock("engrams", brain_path).section(timeout=30.0):
+        with open(ledger_path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+    return len(lines)
+
+
+def ledger_stats(ledger_path: Path) -> Dict:
+    """Record counts and dead ratio for the ledger (one sequential read)."""
+    resolved = resolve_latest(iter_records(ledger_path))
+    total = resolved["total"]
+    live = len(live_records(resolved))
+    dead = total - live
+    try:
+        size = ledger_path.stat().st_size
+    except OSError:
+        size = 0
+    return {
+        "path": str(ledger_path),
+        "records": total,
+        "live": live,
+        "dead": dead,
+        "dead_ratio": round(dead / total, 4) if total else 0.0,
+        "bytes": size,
+    }
+
+
+def compact_ledger(brain_path: Path, min_dead_ratio: Optional[float] = None,
+                   force: bool = False) -> Dict:
+    """Atomically rewrite the ledger keeping only live records.
+
+    The read and rewrite both happen under the ``engrams`` lock so no append
+    can land between them. The new file is written next to the ledger and
+    swapped in with ``os.replace``; a crash mid-compaction leaves the old
+    ledger intact.
+
+    Args:
+        brain_path: Brain root (``<brain>/engrams/ledger.jsonl``).
+        min_dead_ratio: Skip unless dead/total reaches this ratio. Defaults to
+            ``NUCLEUS_LEDGER_COMPACT_RATIO``.
+        force: Compact regardless of the ratio / minimum-record policy.
+    """
+    ledger_path = Path(brain_path) / "engrams" / "ledger.jsonl"
+    if not ledger_path.exists():
+        return {"status": "missing", "path": str(ledger_path)}
+
+    if min_dead_ratio is None:
+        min_dead_ratio = _env_float("NUCLEUS_LEDGER_COMPACT_RATIO", DEFAULT_COMPACT_RATIO)
+    min_records = int(_env_float("NUCLEUS_LEDGER_COMPACT_MIN_RECORDS", DEFAULT_COMPACT_MIN_RECORDS))
+
+    from .locking import get_lock
+    started = time.monotonic()
+    with get_lock("engrams", brain_path).section(timeout=30.0):
+        records = list(iter_records(ledger_path))
+        resolved = resolve_latest(records)
+        total = resolved["total"]
+        live_by_id = {id(e) for e in live_records(resolved)}
+        dead = total - len(live_by_id)
+        ratio = dead / total if total else 0.0
+        if not force and (dead == 0 or total < min_records or ratio < min_dead_ratio):
+            return {
+                "status": "skipped",
+                "records": total,
+                "dead": dead,
+                "dead_ratio": round(ratio, 4),
+                "threshold": min_dead_ratio,
+            }
+
+        bytes_before = ledger_path.stat().st_size
+        tmp_path = ledger_path.with_name(f".{ledger_path.name}.compact.{os.getpid()}")
+        kept = 0
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as out:
+                # Survivors keep their original file order.
+                for rec in records:
+                    if id(rec) not in live_by_id:
+                        continue
+                    out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                    kept += 1
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(tmp_path, ledger_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        bytes_after = ledger_path.stat().st_size
+
+    result = {
+        "status": "compacted",
+        "records_before": total,
+        "records_after": kept,
+        "dead_removed": total - kept,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+    }
+    logger.info(f"Engram ledger compacted: {result}")
+    return result
+
+
+def maybe_compact_async(brain_path: Path) -> bool:
+    """Schedule a background compaction check for this brain if due.
+
+    Cheap on the hot path: at most one check per
+    ``NUCLEUS_LEDGER_COMPACT_INTERVAL_S`` per ledger, at most one compactor
+    thread in flight per ledger. Returns True when a check was scheduled.
+    """
+    ledger_path = str(Path(brain_path) / "engrams" / "ledger.jsonl")
+    interval = _env_float("NUCLEUS_LEDGER_COMPACT_INTERVAL_S", DEFAULT_COMPACT_INTERVAL_S)
+    now = time.monotonic()
+    with _compact_lock:
+        last = _compact_last_check.get(ledger_path)
+        if ledger_path in _compact_in_flight or (last is not None and now - last < interval):
+            return False
+        _compact_last_check[ledger_path] = now
+        _compact_in_flight.add(ledger_path)
+
+    def _run():
+        try:
+            compact_ledger(Path(brain_path))
+        except Exception as e:
+            logger.warning(f"Background ledger compaction failed: {e}")
+        finally:
+            with _compact_lock:
+                _compact_in_flight.discard(ledger_path)
+
+    threading.Thread(target=_run, name="engram-ledger-compactor", daemon=True).start()
+    return True
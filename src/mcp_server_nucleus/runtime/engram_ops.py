@@ -158,13 +158,6 @@ def _brain_write_engram_impl(key: str, value: str, context: str, intensity: int)
             key=key,
         )
         
-        # Invalidate cache after write
-        try:
-            from .engram_cache import get_engram_cache
-            get_engram_cache().invalidate()
-        except Exception:
-            pass
-
         # Emit event for audit trail
         _emit_event("engram_written", "brain_write_engram", {
             "key": key,
@@ -230,7 +223,7 @@ def _brain_query_engrams_impl(context: str, min_intensity: int, limit: int = 50)
             })
 
         if legacy_present:
-            # Use in-memory cache for O(1) repeated reads (mtime-invalidated)
+            # Use in-memory cache for O(1) repeated reads (tails appends, reloads on rewrite)
             from .engram_cache import get_engram_cache
             engrams, total_matching = get_engram_cache().query(
                 engram_path, context=context, min_intensity=min_intensity, limit=limit
@@ -313,7 +306,7 @@ def _brain_search_engrams_impl(query: str, case_sensitive: bool = False, limit:
             })
 
         if legacy_present:
-            # Use in-memory cache for O(1) repeated reads (mtime-invalidated per file)
+            # Use in-memory cache for O(1) repeated reads (tails each file independently)
             from .engram_cache import get_engram_cache
             matches, total_matching = get_engram_cache().search_dual(
                 ledger_path, history_path,
@@ -2,17 +2,56 @@
 Nucleus Runtime - Event Operations
 ==================================
 Core logic for event stream management.
+
+Emission is write-behind: ``_emit_event`` builds and serializes the event on
+the caller's thread, enqueues it and returns its id. A single background
+worker drains the queue in batches — one append per file per batch for
+``events.jsonl`` and the interaction log, one ``activity_summary.json``
+rewrite per batch — and runs the engram auto-hook, ChangeLedger signal,
+trigger evaluation, registered hooks and substrate reactions off the request
+path, each inside the emitting call's ``contextvars`` context (so tenant
+brain resolution is unchanged).
+
+``NUCLEUS_EVENTS_SYNC=1`` processes every event inline on the caller's thread
+(tests, one-shot CLIs). ``flush_events()`` waits for the queue to drain; it
+also runs at interpreter exit, and readers of ``events.jsonl`` (``_read_events``,
+``event_stream.read_events``, the morning brief, the satellite view) flush
+first, bounded by ``EVENT_FLUSH_ON_READ_S``, so a reader sees its own writes
+without blocking behind a stuck hook.
 """
 
+import atexit
+import contextvars
+import hashlib
 import json
 import os
+import queue
+import threading
 import time
 import uuid
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
 from .common import get_brain_path, logger
 
+_EVENTS_SYNC_FLAG = "NUCLEUS_EVENTS_SYNC"
+_EVENTS_SYNC_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+# Bound on queued-but-unwritten events; emitters block (backpressure) past it.
+EVENT_QUEUE_MAX = int(os.environ.get("NUCLEUS_EVENT_QUEUE_MAX", "10000"))
+# Most events the worker folds into one batch.
+EVENT_BATCH_MAX = 256
+# How long interpreter exit waits for the queue to drain.
+EVENT_FLUSH_ON_EXIT_S = 5.0
+# How long readers wait for the queue before reading what is on disk.
+EVENT_FLUSH_ON_READ_S = 2.0
+
+
+def _events_sync() -> bool:
+    return os.environ.get(_EVENTS_SYNC_FLAG, "").strip().lower() in _EVENTS_SYNC_TRUTHY
+
+
 # Artery 5: Extensible event hook registry
 _event_hooks: list = []
 
@@ -22,35 +61,245 @@ def register_event_hook(callback):
     """
     _event_hooks.append(callback)
 
-def _log_interaction(emitter: str, event_type: str, data: Dict[str, Any]) -> None:
-    """Log a cryptographic hash of the interaction for user trust (V9 Security)."""
+def _interaction_entry(emitter: str, event_type: str, data: Dict[str, Any]) -> str:
+    """One interaction-log line: a hash of the interaction (V9 Security)."""
+    # Create a stable string representation for hashing
+    payload = json.dumps({"type": event_type, "emitter": emitter, "data": data}, sort_keys=True)
+    h = hashlib.sha256(payload.encode()).hexdigest()
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "emitter": emitter,
+        "type": event_type,
+        "hash": h,
+        "alg": "sha256"
+    }
+    return json.dumps(entry, ensure_ascii=False) + "\n"
+
+class _PendingEvent:
+    """An emitted event waiting for the worker."""
+
+    __slots__ = ("brain", "event", "line", "ctx")
+
+    def __init__(self, brain: Path, event: Dict[str, Any], line: str, ctx: contextvars.Context):
+        self.brain = brain
+        self.event = event
+        self.line = line
+        self.ctx = ctx
+
+
+def _process_batch(batch: List[_PendingEvent]) -> None:
+    """Persist and fan out a batch of events, grouped by brain, in order."""
+    by_brain: Dict[Path, List[_PendingEvent]] = {}
+    for item in batch:
+        by_brain.setdefault(item.brain, []).append(item)
+
+    for brain, items in by_brain.items():
+        ledger = brain / "ledger"
+        try:
+            with open(ledger / "events.jsonl", "a", encoding="utf-8") as f:
+                f.write("".join(item.line for item in items))
+        except Exception as e:
+            logger.warning(f"Failed to append {len(items)} event(s) to {ledger}: {e}")
+            continue
+
+        # Log interaction for security audit (Trust Signal)
+        try:
+            lines = "".join(
+                _interaction_entry(i.event["emitter"], i.event["type"], i.event["data"])
+                for i in items
+            )
+            with open(ledger / "interaction_log.jsonl", "a", encoding="utf-8") as f:
+                f.write(lines)
+        except Exception as e:
+            logger.warning(f"Failed to log interaction trust signal: {e}")
+
+        last_match = None
+        match_count = 0
+        for item in items:
+            matching_agents = item.ctx.run(_fan_out, item.event)
+            if matching_agents:
+                match_count += 1
+                last_match = {
+                    "event_type": item.event["type"],
+                    "matched_agents": matching_agents,
+                    "timestamp": item.event["timestamp"],
+                }
+
+        _update_activity_summary(brain, items[-1].event, len(items), last_match, match_count)
+
+
+def _update_activity_summary(
+    brain: Path,
+    last_event: Dict[str, Any],
+    event_count: int,
+    last_match: Optional[Dict[str, Any]],
+    match_count: int,
+) -> None:
+    """Fold a batch into the satellite-view summary (Tier 2 precomputation)."""
     try:
-        import hashlib
-        brain = get_brain_path()
-        log_path = brain / "ledger" / "interaction_log.jsonl"
-        
-        # Create a stable string representation for hashing
-        payload = json.dumps({"type": event_type, "emitter": emitter, "data": data}, sort_keys=True)
-        h = hashlib.sha256(payload.encode()).hexdigest()
-        
-        entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "emitter": emitter,
-            "type": event_type,
-            "hash": h,
-            "alg": "sha256"
-        }
-        
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-    except Exception as e:
-        logger.warning(f"Failed to log interaction trust signal: {e}")
+        summary_path = brain / "ledger" / "activity_summary.json"
+        summary = {}
+        if summary_path.exists():
+            with open(summary_path, "r", encoding="utf-8") as f:
+                summary = json.load(f)
+
+        summary["last_event"] = last_event
+        summary["updated_at"] = last_event["timestamp"]
+        summary["event_count"] = summary.get("event_count", 0) + event_count
+        if last_match is not None:
+            summary["last_trigger_match"] = last_match
+            summary["trigger_match_count"] = summary.get("trigger_match_count", 0) + match_count
+
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+    except Exception:
+        pass  # Don't fail event emit if summary update fails
+
+
+def _fan_out(event: Dict[str, Any]) -> list:
+    """Run every per-event reaction; returns the trigger-matched agents."""
+    event_type = event["type"]
+    emitter = event["emitter"]
+    data = event["data"]
+    matching_agents: list = []
+
+    # MDR_016: Auto-write engram hook
+    # Significant events auto-generate engrams via ADUN pipeline
+    try:
+        from .engram_hooks import process_event_for_engram
+        process_event_for_engram(event_type, data)
+    except Exception:
+        pass  # Never let auto-engram break event emission
+
+    # Proactive hook: signal ChangeLedger immediately (bypasses Watchdog latency)
+    try:
+        from .event_bus import get_change_ledger
+        get_change_ledger().record_change("events.jsonl", event_type)
+    except Exception:
+        pass  # Never let ledger updates break event emission
+
+    # Evaluate triggers for this event (Artery 4: alive nervous system)
+    if not os.environ.get("NUCLEUS_DISABLE_ARTERY_4"):
+        try:
+            from .trigger_ops import _evaluate_triggers_impl
+            matching_agents = _evaluate_triggers_impl(event_type, emitter) or []
+            if matching_agents:
+                logger.info(f"Triggers matched: {matching_agents} for {event_type}")
+        except Exception:
+            pass  # Never let trigger evaluation break event emission
+
+    # Artery 5: Fire registered event hooks
+    for hook in _event_hooks:
+        try:
+            hook(event_type, emitter, data)
+        except Exception:
+            pass  # Never let hooks break event emission
+
+    # Substrate auto-wiring: make the organism REACT to its own events
+    try:
+        _substrate_react(event_type, data)
+    except Exception:
+        pass
+    return matching_agents
+
+
+class _EventEmitter:
+    """Bounded queue + one daemon worker that drains it in batches."""
+
+    def __init__(self, maxsize: int = EVENT_QUEUE_MAX):
+        self._queue: "queue.Queue[_PendingEvent]" = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._unfinished = 0
+        self._worker: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self._atexit_registered = False
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: the parent's worker and queue do not exist here.
+                self._pid = os.getpid()
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self._unfinished = 0
+                self._worker = None
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="nucleus-event-emitter", daemon=True
+                )
+                self._worker.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush, EVENT_FLUSH_ON_EXIT_S)
+                self._atexit_registered = True
+
+    def submit(self, item: _PendingEvent) -> None:
+        if threading.current_thread() is self._worker:
+            # Emitted by a hook on the worker itself: waiting on our own
+            # queue could deadlock, so handle it inline.
+            _process_batch([item])
+            return
+        self._ensure_worker()
+        with self._lock:
+            self._unfinished += 1
+        try:
+            self._queue.put(item)
+        except BaseException:
+            self._done(1)
+            raise
+
+    def _done(self, n: int) -> None:
+        with self._lock:
+            self._unfinished -= n
+            if self._unfinished <= 0:
+                self._unfinished = 0
+                self._idle.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < EVENT_BATCH_MAX:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                _process_batch(batch)
+            except Exception as e:
+                logger.warning(f"Event batch processing failed: {e}")
+            finally:
+                self._done(len(batch))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted event is processed. False on timeout."""
+        if threading.current_thread() is self._worker:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._unfinished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+
+_emitter = _EventEmitter()
+
+
+def flush_events(timeout: Optional[float] = None) -> bool:
+    """Block until queued events are written and their hooks have run."""
+    return _emitter.flush(timeout)
+
 
 def _emit_event(event_type: str, emitter: str, data: Dict[str, Any], description: str = "") -> str:
-    """Core logic for emitting an event."""
+    """Core logic for emitting an event.
+
+    Returns the event id once the event is queued; persistence and hooks run
+    on the emitter worker (inline under ``NUCLEUS_EVENTS_SYNC``).
+    """
     try:
         brain = get_brain_path()
-        events_path = brain / "ledger" / "events.jsonl"
         
         event_id = f"evt-{int(time.time())}-{str(uuid.uuid4())[:8]}"
         timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -63,79 +312,19 @@ def _emit_event(event_type: str, emitter: str, data: Dict[str, Any], description
             "data": data,
             "description": description
         }
-        
-        with open(events_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event, ensure_ascii=False) + "\n")
-
-        # Log interaction for security audit (Trust Signal)
-        _log_interaction(emitter, event_type, data)
-        
-        # Update activity summary for fast satellite view (Tier 2 precomputation)
-        try:
-            summary_path = brain / "ledger" / "activity_summary.json"
-            summary = {}
-            if summary_path.exists():
-                with open(summary_path, "r", encoding="utf-8") as f:
-                    summary = json.load(f)
-            
-            summary["last_event"] = event
-            summary["updated_at"] = timestamp
-            summary["event_count"] = summary.get("event_count", 0) + 1
-            
-            with open(summary_path, "w", encoding="utf-8") as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
-        except Exception:
-            pass  # Don't fail event emit if summary update fails
-
-        # MDR_016: Auto-write engram hook
-        # Significant events auto-generate engrams via ADUN pipeline
-        try:
-            from .engram_hooks import process_event_for_engram
-            process_event_for_engram(event_type, data)
-        except Exception:
-            pass  # Never let auto-engram break event emission
-
-        # Proactive hook: signal ChangeLedger immediately (bypasses Watchdog latency)
-        try:
-            from .event_bus import get_change_ledger
-            get_change_ledger().record_change("events.jsonl", event_type)
-        except Exception:
-            pass  # Never let ledger updates break event emission
+        # Serialized here so later mutation of ``data`` by the caller cannot
+        # change what gets written.
+        item = _PendingEvent(
+            brain,
+            event,
+            json.dumps(event, ensure_ascii=False) + "\n",
+            contextvars.copy_context(),
+        )
 
-        # Evaluate triggers for this event (Artery 4: alive nervous system)
-        if not os.environ.get("NUCLEUS_DISABLE_ARTERY_4"):
-            try:
-                from .trigger_ops import _evaluate_triggers_impl
-                matching_agents = _evaluate_triggers_impl(event_type, emitter)
-                if matching_agents:
-                    logger.info(f"Triggers matched: {matching_agents} for {event_type}")
-                    try:
-                        summary_path = brain / "ledger" / "activity_summary.json"
-                        if summary_path.exists():
-                            with open(summary_path, "r") as f:
-                                summary = json.load(f)
-                            summary["last_trigger_match"] = {
-                                "event_type": event_type,
-                                "matched_agents": matching_agents,
-                                "timestamp": timestamp
-                            }
-                            summary["trigger_match_count"] = summary.get("trigger_match_count", 0) + 1
-                            with open(summary_path, "w") as f:
-                                json.dump(summary, f, indent=2)
-                    except Exception:
-                        pass
-            except Exception:
-                pass  # Never let trigger evaluation break event emission
-
-        # Artery 5: Fire registered event hooks
-        for hook in _event_hooks:
-            try:
-                hook(event_type, emitter, data)
-            except Exception:
-                pass  # Never let hooks break event emission
-
-        # Substrate auto-wiring: make the organism REACT to its own events
-        _substrate_react(event_type, data)
+        if _events_sync():
+            _process_batch([item])
+        else:
+            _emitter.submit(item)
 
         return event_id
     except Exception as e:
@@ -194,19 +383,14 @@ def _substrate_react(event_type: str, data: Dict[str, Any]):
 def _read_events(limit: int = 10) -> List[Dict[str, Any]]:
     """Core logic for reading events."""
     try:
+        # Bounded: a slow hook must not stall the read; on timeout we
+        # return whatever has already been persisted.
+        flush_events(timeout=EVENT_FLUSH_ON_READ_S)
         brain = get_brain_path()
         events_path = brain / "ledger" / "events.jsonl"
-        
-        if not events_path.exists():
-            return []
-            
-        events = []
-        with open(events_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    events.append(json.loads(line))
-        
-        return events[-limit:]
+
+        from .event_tail import tail_records
+        return tail_records(events_path, limit)[::-1]
     except Exception as e:
         import sys
         sys.stderr.write(f"Error reading events: {e}\n"); sys.stderr.flush()
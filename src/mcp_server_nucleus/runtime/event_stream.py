@@ -32,24 +32,11 @@ def read_events(brain_path: Path, limit: int = 50) -> List[Dict]:
     Read the last N events from the stream.
     Returns events in reverse chronological order (newest first).
     """
-    events_path = get_events_path(brain_path)
-    
-    if not events_path.exists():
-        return []
-    
-    # Read all events
-    events = []
-    with open(events_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    
-    # Return last N, reversed (newest first)
-    return events[-limit:][::-1]
+    from .event_ops import EVENT_FLUSH_ON_READ_S, flush_events
+    from .event_tail import tail_records
+    # Bounded: events still queued by _emit_event land first.
+    flush_events(timeout=EVENT_FLUSH_ON_READ_S)
+    return tail_records(get_events_path(brain_path), limit)
 
 
 def emit_event(
@@ -100,19 +87,20 @@ def get_unprocessed_events(
     """
     Get events that haven't been processed yet.
     Optionally filter by severity.
+
+    With ``last_processed_id``: the (up to 100) events after it, newest
+    first, so ``events[0]`` is the next resume point.
     """
-    events = read_events(brain_path, limit=100)
-    
-    # If we have a last processed ID, skip events until we find it
+    events = None
+    # Resume after the last processed event (seek, not a full scan); an id
+    # that is no longer in the stream falls back to the latest events.
     if last_processed_id:
-        found = False
-        filtered = []
-        for event in events:
-            if found:
-                filtered.append(event)
-            elif event.get('event_id') == last_processed_id:
-                found = True
-        events = filtered if found else events
+        from .event_tail import read_events_after
+        after = read_events_after(get_events_path(brain_path), last_processed_id, limit=100)
+        if after is not None:
+            events = after[::-1]
+    if events is None:
+        events = read_events(brain_path, limit=100)
     
     # Filter by severity if specified
     if severity_filter:
@@ -0,0 +1,304 @@
+"""
+Event Tail — seek-based readers for ``ledger/events.jsonl``.
+============================================================
+The event ledger only grows (``rotate_events`` is the one rewrite), and
+almost every reader wants its end: the last N events, or the events after
+the one a poller saw last. Parsing the whole file for that is O(file).
+
+  * ``iter_reverse_lines`` reads fixed-size blocks backwards from EOF and
+    yields complete lines newest-first, so ``tail_records(path, N)`` decodes
+    only the lines it returns (plus any it filters out).
+  * ``EventOffsetIndex`` is a sparse sidecar (``events.offsets.json``) that
+    maps every ``INDEX_EVERY``-th event id to its byte offset and timestamp.
+    It follows the file with ``engram_ledger.LedgerCursor``, so it indexes
+    only appended bytes and rebuilds after a rotation.
+  * ``read_events_after(path, event_id)`` resumes after ``event_id``: a short
+    reverse scan covers pollers that are nearly caught up; otherwise the id
+    is located by seek (exact checkpoint, or the checkpoint preceding the
+    timestamp encoded in ``evt-<epoch>-…`` ids) and read forward from there.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .engram_ledger import LedgerCursor
+
+logger = logging.getLogger("nucleus.event_tail")
+
+BLOCK_SIZE = 64 * 1024
+INDEX_NAME = "events.offsets.json"
+INDEX_FORMAT = 1
+# Index one event in this many. Locating an arbitrary id then costs at most
+# one forward read of this many lines past the nearest checkpoint.
+INDEX_EVERY = 256
+# Lines scanned backwards from EOF before ``read_events_after`` falls back
+# to the sidecar index.
+REVERSE_SCAN_LINES = 2 * INDEX_EVERY
+
+
+def iter_reverse_lines(path: Path, block_size: int = BLOCK_SIZE) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for each complete line, newest first.
+
+    ``line`` excludes the trailing newline. A final line without a newline
+    (a write still in flight) is skipped.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        head = b""        # start of a line whose beginning is in an earlier block
+        past_last_newline = False
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + head
+            parts = buf.split(b"\n")
+            head = parts[0]
+            # Each of parts[1:] starts right after a newline.
+            line_end = pos + len(buf)
+            for part in reversed(parts[1:]):
+                line_start = line_end - len(part)
+                if past_last_newline:
+                    yield line_start, part
+                else:
+                    # Bytes after the final newline: empty or in flight.
+                    past_last_newline = True
+                line_end = line_start - 1
+        if past_last_newline:
+            yield 0, head
+
+
+def tail_records(
+    path: Path,
+    limit: int,
+    predicate: Optional[Callable[[Dict], bool]] = None,
+) -> List[Dict]:
+    """Last ``limit`` decodable records (matching ``predicate``), newest first."""
+    if limit <= 0:
+        return []
+    out: List[Dict] = []
+    try:
+        for _, line in iter_reverse_lines(path):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if predicate is not None and not predicate(record):
+                continue
+            out.append(record)
+            if len(out) >= limit:
+                break
+    except FileNotFoundError:
+        return []
+    return out
+
+
+def _iter_forward(path: Path, offset: int) -> Iterator[Dict]:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            if not raw.strip():
+                continue
+            try:
+                yield json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+
+
+def _id_epoch(event_id: str) -> Optional[int]:
+    """Epoch second encoded in ``evt-<epoch>-<suffix>`` ids (``_emit_event``)."""
+    parts = event_id.split("-")
+    if len(parts) < 3 or parts[0] != "evt" or not parts[1].isdigit():
+        return None
+    return int(parts[1])
+
+
+def _timestamp_epoch(ts: str) -> float:
+    """Epoch seconds of an ISO-8601 stamp (``Z`` or any offset; naive = UTC).
+
+    ``inf`` when it does not parse, so it never counts as "before" anything.
+    """
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (TypeError, ValueError, AttributeError):
+        return math.inf
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class EventOffsetIndex:
+    """Sparse ``event_id → byte offset`` checkpoints over one events file."""
+
+    def __init__(self, events_path: Path):
+        self.events_path = Path(events_path)
+        self.index_path = self.events_path.with_name(INDEX_NAME)
+        self._lock = threading.RLock()
+        self._cursor = LedgerCursor(self.events_path)
+        self._loaded = False
+        self._clear()
+
+    def _clear(self) -> None:
+        self._count = 0
+        self._ids: Dict[str, int] = {}
+        # Parallel lists, in file order.
+        self._offsets: List[int] = []
+        self._timestamps: List[str] = []
+        # ``_timestamps`` parsed; compared instead of the strings, whose
+        # formats (``Z`` vs ``+00:00``, fractional seconds) do not sort.
+        self._epochs: List[float] = []
+
+    def _apply(self, offset: int, record: Dict) -> None:
+        if self._count % INDEX_EVERY == 0:
+            event_id = record.get("event_id")
+            if event_id:
+                self._ids[event_id] = offset
+            self._offsets.append(offset)
+            ts = str(record.get("timestamp", ""))
+            self._timestamps.append(ts)
+            self._epochs.append(_timestamp_epoch(ts))
+        self._count += 1
+
+    def sync(self) -> None:
+        """Index whatever was appended since the last sync; persist if changed."""
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._load()
+            status = self._cursor.poll(self._apply, self._clear)
+            if status in ("appended", "reloaded"):
+                self._save()
+
+    def checkpoint_for(self, event_id: str) -> Optional[int]:
+        """Offset to start a forward search for ``event_id`` from.
+
+        The exact offset when ``event_id`` is a checkpoint; else the last
+        checkpoint strictly before the id's encoded timestamp; else None.
+        """
+        with self._lock:
+            offset = self._ids.get(event_id)
+            if offset is not None:
+                return offset
+            epoch = _id_epoch(event_id)
+            if epoch is None:
+                return None
+            # Checkpoints stamped before the id's second precede the event.
+            i = bisect_left(self._epochs, epoch) - 1
+            while i >= 0 and not self._epochs[i] < epoch:
+                i -= 1
+            return self._offsets[i] if i >= 0 else 0
+
+    # ── Persistence ────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data.get("format") != INDEX_FORMAT or data.get("every") != INDEX_EVERY:
+                return
+            for event_id, offset, ts in data["entries"]:
+                if event_id:
+                    self._ids[event_id] = offset
+                self._offsets.append(offset)
+                self._timestamps.append(ts)
+                self._epochs.append(_timestamp_epoch(ts))
+            self._count = int(data["count"])
+            # ``poll`` still verifies inode and fingerprint before resuming.
+            self._cursor.restore(data["cursor"])
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            self._clear()
+            self._cursor.reset()
+
+    def _save(self) -> None:
+        ids_by_offset = {offset: event_id for event_id, offset in self._ids.items()}
+        data = {
+            "format": INDEX_FORMAT,
+            "every": INDEX_EVERY,
+            "count": self._count,
+            "cursor": self._cursor.to_dict(),
+            "entries": [
+                [ids_by_offset.get(offset), offset, ts]
+                for offset, ts in zip(self._offsets, self._timestamps)
+            ],
+        }
+        tmp = self.index_path.with_name(f".{INDEX_NAME}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logger.debug(f"Event offset index write failed: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+_indexes: Dict[str, EventOffsetIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_event_index(events_path: Path) -> EventOffsetIndex:
+    """Get (creating on first use) the shared offset index for ``events_path``."""
+    path = str(Path(events_path))
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = EventOffsetIndex(Path(path))
+        return index
+
+
+def read_events_after(
+    events_path: Path,
+    event_id: str,
+    limit: Optional[int] = None,
+) -> Optional[List[Dict]]:
+    """Events strictly after ``event_id``, oldest first (at most ``limit``).
+
+    Returns None when ``event_id`` is not in the file.
+    """
+    events_path = Path(events_path)
+    if not events_path.exists():
+        return None
+
+    # Pollers are usually close to the end: look back a little first.
+    newer: List[Dict] = []
+    try:
+        for n, (_, line) in enumerate(iter_reverse_lines(events_path)):
+            if n >= REVERSE_SCAN_LINES:
+                break
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if record.get("event_id") == event_id:
+                newer.reverse()
+                return newer[:limit] if limit is not None else newer
+            newer.append(record)
+    except OSError:
+        return None
+
+    index = get_event_index(events_path)
+    index.sync()
+    start = index.checkpoint_for(event_id)
+    if start is None:
+        start = 0
+    found = False
+    out: List[Dict] = []
+    for record in _iter_forward(events_path, start):
+        if found:
+            out.append(record)
+            if limit is not None and len(out) >= limit:
+                break
+        elif record.get("event_id") == event_id:
+            found = True
+    return out if found else None
+
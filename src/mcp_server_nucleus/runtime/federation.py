@@ -21,11 +21,13 @@ Version: 1.1.0-DSoR
 from __future__ import annotations
 
 import asyncio
+import base64
 import hashlib
 import json
 import logging
 import os
 import random
+import struct
 import time
 import uuid
 from abc import ABC, abstractmethod
@@ -148,6 +150,28 @@ DEFAULT_ELECTION_TIMEOUT_MIN = 150
 DEFAULT_ELECTION_TIMEOUT_MAX = 300
 DEFAULT_GOSSIP_FANOUT = 3
 DEFAULT_SUSPECT_TIMEOUT = 5.0
+DEFAULT_RPC_IDLE_TIMEOUT = 30.0
+DEFAULT_RPC_MAX_INFLIGHT = 64
+# Merkle sync: leaf buckets are the first MERKLE_DEPTH hex digits of
+# sha256(key) (16**4 = 65536 buckets); peers must agree on it to walk trees.
+MERKLE_DEPTH = 4
+_SYNC_PREFIXES_PER_RPC = 256
+_SYNC_ENTRIES_PER_RPC = 512
+# Size budget per sync RPC, each way. One-shot connections are read with
+# StreamReader.readline, whose default limit is 64 KiB. A sync_entries
+# request's pushed entries, want list and envelope all count against it, and
+# the reply's pending list (a subset of the want list) is left room for.
+_SYNC_REPLY_BYTES_POOLED = 4 * 1024 * 1024
+_SYNC_REPLY_BYTES_ONESHOT = 48 * 1024
+_SYNC_ENVELOPE_BYTES = 1024
+
+# Pooled RPC wire format: after this line is exchanged in both directions,
+# each frame is a 4-byte big-endian length + a JSON envelope {"rid", "body"}.
+_RPC_HANDSHAKE = b"NUCLEUS-FED-RPC/1\n"
+MAX_RPC_FRAME_BYTES = 16 * 1024 * 1024
+# How long a peer that answered the handshake as a legacy (one message per
+# connection) server is used in that mode before the handshake is retried.
+_LEGACY_PEER_RECHECK_S = 300.0
 
 # =============================================================================
 # CORE DATA STRUCTURES
@@ -182,37 +206,97 @@ class VectorClock:
 
 
 class MerkleTree:
-    """Merkle tree for efficient state comparison and synchronization."""
-    
-    def __init__(self):
+    """Hash-bucketed Merkle tree for incremental state comparison and range sync.
+
+    A key lives in the leaf bucket named by the first ``depth`` hex digits of
+    sha256(key). Every node is identified by a hex prefix: the root is ``""``,
+    and each internal node has up to 16 children, one per next digit. An
+    update re-hashes only its bucket and that bucket's ``depth`` ancestors, and
+    does so lazily on the next ``get_root``. Two trees with the same ``depth``
+    can be compared top-down (``children``), visiting only the subtrees whose
+    hashes differ. At leaf level, ``children`` returns the bucket's
+    ``{key: leaf_hash}``. An empty tree's root is ``""``.
+    """
+
+    _DIGITS = "0123456789abcdef"
+
+    def __init__(self, depth: int = MERKLE_DEPTH):
+        self.depth = depth
         self.leaves: Dict[str, str] = {}
-        self._root: str = ""
-        self._dirty = True
-    
+        self._buckets: Dict[str, Dict[str, str]] = {}
+        self._nodes: Dict[str, str] = {}  # prefix -> hash, non-empty nodes only
+        self._dirty: Set[str] = set()  # leaf prefixes changed since the last rehash
+
+    def _bucket_of(self, key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()[:self.depth]
+
     def update(self, key: str, value: bytes) -> None:
         value_hash = hashlib.sha256(value).hexdigest()
-        self.leaves[key] = hashlib.sha256(f"{key}:{value_hash}".encode()).hexdigest()
-        self._dirty = True
-    
+        leaf = hashlib.sha256(f"{key}:{value_hash}".encode()).hexdigest()
+        if self.leaves.get(key) == leaf:
+            return
+        self.leaves[key] = leaf
+        prefix = self._bucket_of(key)
+        self._buckets.setdefault(prefix, {})[key] = leaf
+        self._dirty.add(prefix)
+
     def remove(self, key: str) -> None:
         if key in self.leaves:
             del self.leaves[key]
-            self._dirty = True
-    
+            prefix = self._bucket_of(key)
+            bucket = self._buckets.get(prefix, {})
+            bucket.pop(key, None)
+            if not bucket:
+                self._buckets.pop(prefix, None)
+            self._dirty.add(prefix)
+
+    def _rehash(self) -> None:
+        level = set()
+        for prefix in self._dirty:
+            bucket = self._buckets.get(prefix)
+            if bucket:
+                body = "\n".join(f"{k}:{h}" for k, h in sorted(bucket.items()))
+                self._nodes[prefix] = hashlib.sha256(body.encode()).hexdigest()
+            else:
+                self._nodes.pop(prefix, None)
+            level.add(prefix[:-1])
+        self._dirty.clear()
+        for _ in range(self.depth):
+            parents = set()
+            for prefix in level:
+                parts = [f"{d}{self._nodes[prefix + d]}" for d in self._DIGITS
+                         if prefix + d in self._nodes]
+                if parts:
+                    self._nodes[prefix] = hashlib.sha256("".join(parts).encode()).hexdigest()
+                else:
+                    self._nodes.pop(prefix, None)
+                if prefix:
+                    parents.add(prefix[:-1])
+            level = parents
+
     def get_root(self) -> str:
         if self._dirty:
-            if not self.leaves:
-                self._root = ""
-            else:
-                sorted_hashes = sorted(self.leaves.values())
-                combined = ":".join(sorted_hashes)
-                self._root = hashlib.sha256(combined.encode()).hexdigest()
-            self._dirty = False
-        return self._root
-    
+            self._rehash()
+        return self._nodes.get("", "")
+
     def diff(self, other_root: str) -> bool:
         return self.get_root() != other_root
 
+    def keys(self, prefix: str = "") -> List[str]:
+        """Every key stored under ``prefix``."""
+        if len(prefix) >= self.depth:
+            return list(self._buckets.get(prefix, {}))
+        return [k for child in self.children(prefix) for k in self.keys(child)]
+
+    def children(self, prefix: str) -> Dict[str, str]:
+        """Child prefix -> hash under ``prefix``; ``{key: leaf_hash}`` for a leaf bucket."""
+        if self._dirty:
+            self._rehash()
+        if len(prefix) >= self.depth:
+            return dict(self._buckets.get(prefix, {}))
+        return {prefix + d: self._nodes[prefix + d] for d in self._DIGITS
+                if prefix + d in self._nodes}
+
 
 @dataclass
 class FederationPeer:
@@ -295,6 +379,20 @@ class RaftLogEntry:
     command: Dict[str, Any]
     timestamp: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "term": self.term, "index": self.index, "command": self.command,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RaftLogEntry':
+        ts = data.get("timestamp")
+        return cls(
+            term=data["term"], index=data["index"], command=data.get("command", {}),
+            timestamp=datetime.fromisoformat(ts) if ts else datetime.now(tz=timezone.utc),
+        )
+
 
 @dataclass
 class SyncResult:
@@ -306,6 +404,12 @@ class SyncResult:
     sync_time_ms: float
     new_merkle_root: str
     error: Optional[str] = None
+    entries_sent: int = 0
+    entries_received: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    round_trips: int = 0
+    rpc_time_ms: float = 0.0
 
 
 @dataclass
@@ -325,6 +429,9 @@ class FederationConfig:
     brain_path: Path = field(default_factory=lambda: Path(".brain"))
     enable_consensus: bool = True
     enable_auto_sync: bool = True
+    enable_rpc_pool: bool = True
+    rpc_idle_timeout: float = DEFAULT_RPC_IDLE_TIMEOUT
+    rpc_max_inflight: int = DEFAULT_RPC_MAX_INFLIGHT
 
 
 @dataclass
@@ -355,14 +462,128 @@ class FederationState:
 
 
 
+def _encode_frame(envelope: Dict[str, Any]) -> bytes:
+    body = json.dumps(envelope).encode()
+    if len(body) > MAX_RPC_FRAME_BYTES:
+        raise ValueError(f"federation RPC frame of {len(body)} bytes exceeds {MAX_RPC_FRAME_BYTES}")
+    return struct.pack("!I", len(body)) + body
+
+
+async def _read_frame(reader: asyncio.StreamReader,
+                      idle_timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Next frame from ``reader``; None on a clean EOF between frames.
+
+    ``idle_timeout`` bounds only the wait for the header, so a timeout never
+    leaves half a frame consumed.
+    """
+    try:
+        header = await asyncio.wait_for(reader.readexactly(4), timeout=idle_timeout)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+    (length,) = struct.unpack("!I", header)
+    if length > MAX_RPC_FRAME_BYTES:
+        raise ValueError(f"federation RPC frame of {length} bytes exceeds {MAX_RPC_FRAME_BYTES}")
+    return json.loads(await reader.readexactly(length))
+
+
+class _PeerConnection:
+    """One persistent stream to a peer, multiplexing RPCs by request id."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 max_inflight: int):
+        self.reader = reader
+        self.writer = writer
+        self.closed = False
+        self.last_used = time.monotonic()
+        self._next_rid = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        # Backpressure: callers queue here once max_inflight RPCs are outstanding.
+        self._slots = asyncio.Semaphore(max(1, max_inflight))
+        self._write_lock = asyncio.Lock()
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    @property
+    def idle(self) -> bool:
+        return not self._pending
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                frame = await _read_frame(self.reader)
+                if frame is None:
+                    break
+                future = self._pending.get(frame.get("rid"))
+                if future is not None and not future.done():
+                    future.set_result(frame.get("body"))
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Federation connection read failed: {e}")
+        finally:
+            self.closed = True
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("federation connection closed"))
+
+    async def request(self, message: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        self.last_used = time.monotonic()
+        await asyncio.wait_for(self._slots.acquire(), timeout=timeout)
+        try:
+            if self.closed:
+                raise ConnectionError("federation connection closed")
+            self._next_rid += 1
+            rid = self._next_rid
+            future = asyncio.get_running_loop().create_future()
+            self._pending[rid] = future
+            try:
+                async with self._write_lock:
+                    self.writer.write(_encode_frame({"rid": rid, "body": message}))
+                    await self.writer.drain()
+                return await asyncio.wait_for(future, timeout=timeout)
+            finally:
+                self._pending.pop(rid, None)
+        finally:
+            self._slots.release()
+            self.last_used = time.monotonic()
+
+    async def close(self) -> None:
+        self.closed = True
+        self._reader_task.cancel()
+        try:
+            self.writer.close()
+            await self.writer.wait_closed()
+        except Exception:
+            pass
+
+
 class NetworkManager:
-    """Handles low-level TCP/JSON communication between brains."""
+    """Handles low-level TCP/JSON communication between brains.
+
+    With ``config.enable_rpc_pool`` (default) each peer gets one persistent
+    connection. It opens with a ``_RPC_HANDSHAKE`` line, then carries
+    length-prefixed frames tagged with request ids, so concurrent gossip,
+    probe, vote and append RPCs share one stream.
+      * At most ``rpc_max_inflight`` RPCs are outstanding per connection,
+        in each direction.
+      * A connection idle for ``rpc_idle_timeout`` seconds is closed.
+      * A peer that answers the handshake like a pre-pool server (it closes
+        the connection) is sent one newline-delimited message per
+        connection, as before. The server still accepts that legacy form.
+    """
     
     def __init__(self, config: FederationConfig, engine: 'FederationEngine'):
         self.config = config
         self.engine = engine
         self.server: Optional[asyncio.AbstractServer] = None
         self.running = False
+        self.connections_opened = 0
+        self._pool: Dict[str, _PeerConnection] = {}
+        self._pool_locks: Dict[str, asyncio.Lock] = {}
+        self._legacy_peers: Dict[str, float] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        self._inbound: Dict[asyncio.StreamWriter, asyncio.Task] = {}
     
     async def start(self) -> None:
         """Start the federation RPC server."""
@@ -376,10 +597,22 @@ class NetworkManager:
             logger.error(f"Failed to start federation server: {e}")
     
     async def stop(self) -> None:
-        """Stop the federation RPC server."""
+        """Stop the federation RPC server and close pooled connections."""
         self.running = False
+        if self._reaper:
+            self._reaper.cancel()
+            self._reaper = None
+        pool, self._pool = list(self._pool.values()), {}
+        for conn in pool:
+            await conn.close()
         if self.server:
             self.server.close()
+            # Persistent inbound streams outlive server.close(); end them too.
+            handlers = list(self._inbound.values())
+            for writer in list(self._inbound):
+                writer.close()
+            if handlers:
+                await asyncio.wait(handlers, timeout=1.0)
             await self.server.wait_closed()
     
     def _verify_federation_token(self, message: Dict[str, Any]) -> Tuple[bool, str]:
@@ -407,29 +640,37 @@ class NetworkManager:
         auth_manager.consume_token(token, resource_type="federation_ipc")
         return True, "ok"
 
+    async def _dispatch(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        sender_id = message.get("sender_id", "unknown")
+        msg_type = message.get("type", "unknown")
+
+        # v0.6.0 DSoR/Security: Verify IPC Token
+        # A9: enforcement lives in _verify_federation_token (flag-gated,
+        # no-op when NUCLEUS_FEDERATION_ANCHOR is off).
+        accepted, reason = self._verify_federation_token(message)
+        if not accepted:
+            logger.warning(f"Rejected federation RPC ({msg_type}) from {sender_id}: {reason}")
+            return {"success": False, "error": "unauthorized"}
+
+        # Dispatch to engine
+        return await self.engine.handle_message(message)
+
     async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         """Handle an incoming brain-to-brain RPC connection."""
+        self._inbound[writer] = asyncio.current_task()
         try:
             line = await reader.readline()
             if not line:
                 return
 
-            message = json.loads(line.decode())
-            sender_id = message.get("sender_id", "unknown")
-            msg_type = message.get("type", "unknown")
-
-            # v0.6.0 DSoR/Security: Verify IPC Token
-            # A9: enforcement lives in _verify_federation_token (flag-gated,
-            # no-op when NUCLEUS_FEDERATION_ANCHOR is off).
-            accepted, reason = self._verify_federation_token(message)
-            if not accepted:
-                logger.warning(f"Rejected federation RPC ({msg_type}) from {sender_id}: {reason}")
-                writer.write((json.dumps({"success": False, "error": "unauthorized"}) + "\n").encode())
+            if line == _RPC_HANDSHAKE:
+                writer.write(_RPC_HANDSHAKE)
                 await writer.drain()
+                await self._serve_pooled(reader, writer)
                 return
 
-            # Dispatch to engine
-            response = await self.engine.handle_message(message)
+            # Legacy: one newline-delimited message per connection.
+            response = await self._dispatch(json.loads(line.decode()))
             
             if response:
                 writer.write((json.dumps(response) + "\n").encode())
@@ -438,12 +679,58 @@ class NetworkManager:
         except Exception as e:
             logger.debug(f"Federation connection error: {e}")
         finally:
+            self._inbound.pop(writer, None)
             writer.close()
             try:
                 await writer.wait_closed()
             except Exception:
                 pass
     
+    async def _serve_pooled(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve framed RPCs on one connection until EOF or idle timeout."""
+        slots = asyncio.Semaphore(max(1, self.config.rpc_max_inflight))
+        write_lock = asyncio.Lock()
+        tasks: Set[asyncio.Task] = set()
+
+        async def serve(rid: Any, message: Dict[str, Any]) -> None:
+            try:
+                try:
+                    response = await self._dispatch(message)
+                except Exception as e:
+                    logger.debug(f"Federation RPC {message.get('type')} failed: {e}")
+                    response = None
+                async with write_lock:
+                    writer.write(_encode_frame({"rid": rid, "body": response}))
+                    await writer.drain()
+            except Exception as e:
+                logger.debug(f"Federation RPC reply failed: {e}")
+            finally:
+                slots.release()
+
+        # Clients reap at rpc_idle_timeout; the server waits twice that so a
+        # live client always closes first.
+        idle = 2 * self.config.rpc_idle_timeout
+        try:
+            while True:
+                # Backpressure: stop reading while rpc_max_inflight are being served.
+                await slots.acquire()
+                try:
+                    frame = await _read_frame(reader, idle_timeout=idle)
+                except asyncio.TimeoutError:
+                    slots.release()
+                    if tasks:
+                        continue
+                    break
+                if frame is None:
+                    slots.release()
+                    break
+                task = asyncio.create_task(serve(frame.get("rid"), frame.get("body") or {}))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in list(tasks):
+                task.cancel()
+
     def _stamp_federation_token(self, message: Dict[str, Any]) -> None:
         """A9 (NUCLEUS_FEDERATION_ANCHOR): attach a real IPC token to an
         outbound federation RPC.
@@ -467,15 +754,76 @@ class NetworkManager:
 
     async def send_message(self, address: str, message: Dict[str, Any], timeout: float = 3.0) -> Optional[Dict[str, Any]]:
         """Send an RPC message to a remote brain."""
+        # Enrich message
+        message["sender_id"] = self.config.brain_id
+        message["timestamp"] = datetime.now(tz=timezone.utc).isoformat()
+
+        self._stamp_federation_token(message)
+
+        if self.config.enable_rpc_pool and self._legacy_peers.get(address, 0.0) <= time.monotonic():
+            try:
+                conn = await self._connection(address, timeout)
+                if conn is not None:
+                    return await conn.request(message, timeout)
+            except asyncio.TimeoutError:
+                logger.debug(f"Timeout sending {message.get('type')} to {address}")
+                return None
+            except Exception as e:
+                logger.debug(f"Failed to send {message.get('type')} to {address}: {e}")
+                return None
+        return await self._send_oneshot(address, message, timeout)
+
+    async def _connection(self, address: str, timeout: float) -> Optional[_PeerConnection]:
+        """The pooled connection to ``address``; None if the peer is a legacy server."""
+        conn = self._pool.get(address)
+        if conn is not None and not conn.closed:
+            return conn
+        async with self._pool_locks.setdefault(address, asyncio.Lock()):
+            conn = self._pool.get(address)
+            if conn is not None and not conn.closed:
+                return conn
+            if self._legacy_peers.get(address, 0.0) > time.monotonic():
+                return None  # another caller just found a legacy server
+            host, port = address.rsplit(":", 1) if ":" in address else (address, "9000")
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), timeout=timeout)
+            self.connections_opened += 1
+            try:
+                writer.write(_RPC_HANDSHAKE)
+                await writer.drain()
+                ack = await asyncio.wait_for(reader.readline(), timeout=timeout)
+            except BaseException:
+                writer.close()
+                raise
+            if ack != _RPC_HANDSHAKE:
+                # A pre-pool server fails to parse the handshake and hangs up.
+                writer.close()
+                self._legacy_peers[address] = time.monotonic() + _LEGACY_PEER_RECHECK_S
+                logger.info(f"Federation peer {address} has no pooled RPC; one connection per message")
+                return None
+            self._legacy_peers.pop(address, None)
+            conn = self._pool[address] = _PeerConnection(reader, writer, self.config.rpc_max_inflight)
+            if self._reaper is None or self._reaper.done():
+                self._reaper = asyncio.create_task(self._reap_idle())
+            return conn
+
+    async def _reap_idle(self) -> None:
+        """Close pooled connections idle for longer than ``rpc_idle_timeout``."""
+        idle = self.config.rpc_idle_timeout
+        while self._pool:
+            await asyncio.sleep(max(0.05, idle / 2))
+            now = time.monotonic()
+            for address, conn in list(self._pool.items()):
+                if conn.closed or (conn.idle and now - conn.last_used >= idle):
+                    if self._pool.get(address) is conn:
+                        del self._pool[address]
+                    await conn.close()
+
+    async def _send_oneshot(self, address: str, message: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """Legacy transport: one connection and one newline-delimited message."""
         try:
             host, port = address.rsplit(":", 1) if ":" in address else (address, "9000")
             reader, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), timeout=timeout)
-
-            # Enrich message
-            message["sender_id"] = self.config.brain_id
-            message["timestamp"] = datetime.now(tz=timezone.utc).isoformat()
-
-            self._stamp_federation_token(message)
+            self.connections_opened += 1
 
             writer.write((json.dumps(message) + "\n").encode())
             await writer.drain()
@@ -1069,13 +1417,23 @@ class ConsensusManager:
 # =============================================================================
 
 class SyncManager:
-    """State synchronization using Merkle trees and CRDT merge."""
+    """State synchronization using Merkle trees and CRDT merge.
+
+    Replicated state is a last-writer-wins map: ``entries[key]`` holds
+    ``(value, lamport, origin)``, and the greater ``(lamport, origin)`` wins a
+    merge. ``sync_with_peer`` compares Merkle roots first. If they differ, it
+    walks both trees one level at a time (``sync_nodes``) and keeps only the
+    subtrees whose hashes differ. Then it exchanges just the keys in the
+    differing leaf buckets (``sync_entries``). Deletes are not replicated.
+    """
     
     def __init__(self, engine: 'FederationEngine'):
         self.engine = engine
         self.config = engine.config
         self.state = engine.state
         self.merkle_tree = MerkleTree()
+        self.entries: Dict[str, Tuple[bytes, int, str]] = {}
+        self.lamport = 0
         self.running = False
         self._sync_task: Optional[asyncio.Task] = None
         self.sync_in_progress: Set[str] = set()
@@ -1102,12 +1460,28 @@ class SyncManager:
             except asyncio.CancelledError:
                 break
     
+    async def _rpc(self, address: str, message: Dict[str, Any], metrics: Dict[str, float]) -> Optional[Dict[str, Any]]:
+        """send_message, tallying JSON bytes, round trips and wall time into ``metrics``."""
+        t0 = time.perf_counter()
+        resp = await self.engine.network.send_message(address, message)
+        metrics["rpc_time_ms"] += (time.perf_counter() - t0) * 1000
+        metrics["round_trips"] += 1
+        metrics["bytes_sent"] += len(json.dumps(message))
+        if resp is not None:
+            metrics["bytes_received"] += len(json.dumps(resp))
+        return resp
+    
+    def _reply_budget(self) -> int:
+        """Bytes of entries/nodes per sync RPC, each way."""
+        return _SYNC_REPLY_BYTES_POOLED if self.config.enable_rpc_pool else _SYNC_REPLY_BYTES_ONESHOT
+    
     async def sync_with_peer(self, peer_id: str, full: bool = False) -> SyncResult:
         if peer_id in self.sync_in_progress:
             return SyncResult(False, peer_id, 0, 0, 0, self.merkle_tree.get_root(), "Sync in progress")
         
         self.sync_in_progress.add(peer_id)
         start_time = time.perf_counter()
+        metrics = {"bytes_sent": 0, "bytes_received": 0, "round_trips": 0, "rpc_time_ms": 0.0}
         
         try:
             peer = self.state.peers.get(peer_id)
@@ -1121,9 +1495,9 @@ class SyncManager:
                 "vector_clock": self.state.vector_clock.to_dict()
             }
             
-            resp = await self.engine.network.send_message(peer.address, sync_req)
+            resp = await self._rpc(peer.address, sync_req, metrics)
             if not resp or not resp.get("success"):
-                return SyncResult(False, peer_id, 0, 0, 0, "", "Peer sync request failed")
+                return SyncResult(False, peer_id, 0, 0, 0, "", "Peer sync request failed", **metrics)
                 
             remote_root = resp.get("merkle_root")
             peer.merkle_root = remote_root
@@ -1133,16 +1507,147 @@ class SyncManager:
             remote_vc = VectorClock.from_dict(remote_vc_dict)
             self.state.vector_clock = self.state.vector_clock.merge(remote_vc).increment(self.config.brain_id)
             
-            peer.last_sync = datetime.now(tz=timezone.utc)
+            # 2. Walk the differing subtrees down to the leaf buckets and
+            # reconcile their keys. Peers from before range sync don't send
+            # merkle_depth; for those the root + VC exchange is all there is.
+            counts = {"sent": 0, "received": 0, "conflicts": 0}
+            if remote_root != self.merkle_tree.get_root() and resp.get("merkle_depth") == self.merkle_tree.depth:
+                error = await self._reconcile(peer.address, metrics, counts)
+                if error:
+                    elapsed = (time.perf_counter() - start_time) * 1000
+                    return SyncResult(False, peer_id, counts["sent"] + counts["received"], counts["conflicts"],
+                                      elapsed, self.merkle_tree.get_root(), error,
+                                      entries_sent=counts["sent"], entries_received=counts["received"], **metrics)
             
-            # In a full sync, we would iterate through Merkle diffs here
-            # and request missing chunks. For MVP, root match + VC merge is enough.
+            peer.last_sync = datetime.now(tz=timezone.utc)
             
             elapsed = (time.perf_counter() - start_time) * 1000
-            return SyncResult(True, peer_id, 0, 0, elapsed, self.merkle_tree.get_root())
+            return SyncResult(True, peer_id, counts["sent"] + counts["received"], counts["conflicts"],
+                              elapsed, self.merkle_tree.get_root(),
+                              entries_sent=counts["sent"], entries_received=counts["received"], **metrics)
         finally:
             self.sync_in_progress.discard(peer_id)
     
+    async def _reconcile(self, address: str, metrics: Dict[str, float], counts: Dict[str, int]) -> Optional[str]:
+        """Find the keys that differ from the peer's and exchange them. Returns an error or None."""
+        tree = self.merkle_tree
+        push: List[str] = []  # keys the peer lacks or may hold an older version of
+        want: List[str] = []  # keys we lack or may hold an older version of
+        level = [""]
+        while level:
+            remote = await self._fetch_nodes(address, level, metrics)
+            if remote is None:
+                return "Peer node request failed"
+            next_level = []
+            for prefix in level:
+                mine, theirs = tree.children(prefix), remote.get(prefix, {})
+                if len(prefix) >= tree.depth:
+                    # Leaf bucket: children are keys -> leaf hashes.
+                    for key, leaf in mine.items():
+                        if key not in theirs:
+                            push.append(key)
+                        elif theirs[key] != leaf:
+                            push.append(key)
+                            want.append(key)
+                            counts["conflicts"] += 1
+                    want.extend(k for k in theirs if k not in mine)
+                    continue
+                for child in set(mine) | set(theirs):
+                    if child not in theirs:
+                        push.extend(tree.keys(child))
+                    elif mine.get(child) != theirs[child]:
+                        next_level.append(child)
+            level = sorted(next_level)
+        
+        # The peer merges what we push before it answers what we want, so for
+        # a conflicting key it returns the LWW winner even when both go in
+        # the same RPC.
+        budget = self._reply_budget() - _SYNC_ENVELOPE_BYTES
+        push_at = want_at = 0
+        pending: List[str] = []
+        while push_at < len(push) or want_at < len(want) or pending:
+            # Want list first, capped at half the budget so pushes and the
+            # reply's entries still get room.
+            wanted = list(pending)
+            if not wanted:
+                size = 0
+                while want_at < len(want) and len(wanted) < _SYNC_ENTRIES_PER_RPC:
+                    cost = len(want[want_at]) + 4
+                    if wanted and size + cost > budget // 2:
+                        break
+                    wanted.append(want[want_at])
+                    size += cost
+                    want_at += 1
+            want_cost = sum(len(k) + 4 for k in wanted)
+            chunk: Dict[str, List[Any]] = {}
+            size = want_cost
+            while push_at < len(push) and len(chunk) < _SYNC_ENTRIES_PER_RPC:
+                key = push[push_at]
+                encoded = self._encode_entry(key)
+                cost = len(key) + len(encoded[0]) + len(encoded[2]) + 32
+                if (chunk or wanted) and size + cost > budget:
+                    break
+                chunk[key] = encoded
+                size += cost
+                push_at += 1
+            resp = await self._rpc(address, {
+                "type": "sync_entries",
+                "want": wanted,
+                "entries": chunk,
+                # The reply also echoes unsent wanted keys in ``pending``.
+                "max_bytes": max(budget - want_cost, 1),
+            }, metrics)
+            if not resp or not resp.get("success"):
+                return "Peer entry exchange failed"
+            counts["sent"] += len(chunk)
+            received = resp.get("entries", {})
+            self._merge_entries(received)
+            counts["received"] += len(received)
+            pending = [k for k in resp.get("pending", []) if k in wanted]
+        return None
+    
+    async def _fetch_nodes(self, address: str, prefixes: List[str], metrics: Dict[str, float]) -> Optional[Dict[str, Dict[str, str]]]:
+        """The peer's ``children`` for each prefix, over as many RPCs as its reply budget needs."""
+        nodes: Dict[str, Dict[str, str]] = {}
+        todo = list(prefixes)
+        while todo:
+            batch = todo[:_SYNC_PREFIXES_PER_RPC]
+            resp = await self._rpc(address, {
+                "type": "sync_nodes", "prefixes": batch, "max_bytes": self._reply_budget(),
+            }, metrics)
+            if not resp or not resp.get("success"):
+                return None
+            if not resp.get("nodes"):
+                return None  # the peer made no progress
+            nodes.update(resp["nodes"])
+            todo = [p for p in todo if p not in nodes]
+        return nodes
+    
+    def _encode_entry(self, key: str) -> List[Any]:
+        value, lamport, origin = self.entries[key]
+        return [base64.b64encode(value).decode("ascii"), lamport, origin]
+    
+    def _merge_entries(self, entries: Dict[str, List[Any]]) -> int:
+        """LWW-merge ``{key: [b64 value, lamport, origin]}``; returns how many won."""
+        changed = 0
+        for key, (encoded, lamport, origin) in entries.items():
+            current = self.entries.get(key)
+            if current is not None and (current[1], current[2]) >= (lamport, origin):
+                continue
+            value = base64.b64decode(encoded)
+            self.entries[key] = (value, lamport, origin)
+            self.lamport = max(self.lamport, lamport)
+            self.merkle_tree.update(key, value)
+            changed += 1
+            if self.on_state_changed:
+                try:
+                    self.on_state_changed({"key": key, "value": value, "lamport": lamport, "origin": origin})
+                except Exception as e:
+                    logger.warning(f"on_state_changed failed for {key}: {e}")
+        if changed:
+            self.state.merkle_root = self.merkle_tree.get_root()
+        return changed
+    
     async def handle_sync_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming Merkle sync request."""
         # Update remote info for this peer if we have it
@@ -1157,13 +1662,59 @@ class SyncManager:
         return {
             "success": True,
             "merkle_root": self.merkle_tree.get_root(),
+            "merkle_depth": self.merkle_tree.depth,
             "vector_clock": self.state.vector_clock.to_dict()
         }
     
+    async def handle_nodes_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle ``sync_nodes``: our ``children`` for each requested prefix.
+
+        Stops once the reply would pass ``max_bytes`` (always answering at
+        least one prefix). The caller asks again for any it didn't get.
+        """
+        budget = min(int(request.get("max_bytes") or _SYNC_REPLY_BYTES_ONESHOT), _SYNC_REPLY_BYTES_POOLED)
+        nodes: Dict[str, Dict[str, str]] = {}
+        size = 0
+        for prefix in request.get("prefixes", [])[:_SYNC_PREFIXES_PER_RPC]:
+            children = self.merkle_tree.children(str(prefix))
+            cost = sum(len(k) + len(h) + 6 for k, h in children.items()) + len(prefix) + 6
+            if nodes and size + cost > budget:
+                break
+            nodes[prefix] = children
+            size += cost
+        return {"success": True, "nodes": nodes}
+    
+    async def handle_entries_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle ``sync_entries``: merge the pushed entries, return the wanted ones.
+
+        Wanted keys that don't fit in ``max_bytes`` come back in ``pending``.
+        """
+        self._merge_entries(request.get("entries", {}))
+        budget = min(int(request.get("max_bytes") or _SYNC_REPLY_BYTES_ONESHOT), _SYNC_REPLY_BYTES_POOLED)
+        entries: Dict[str, List[Any]] = {}
+        pending: List[str] = []
+        size = 0
+        for key in request.get("want", [])[:_SYNC_ENTRIES_PER_RPC]:
+            if key not in self.entries:
+                continue
+            if pending:
+                pending.append(key)
+                continue
+            encoded = self._encode_entry(key)
+            cost = len(key) + len(encoded[0]) + len(encoded[2]) + 32
+            if entries and size + cost > budget:
+                pending.append(key)
+                continue
+            entries[key] = encoded
+            size += cost
+        return {"success": True, "entries": entries, "pending": pending}
+    
     async def force_sync(self) -> List[SyncResult]:
         return [await self.sync_with_peer(p.peer_id, full=True) for p in self.state.peers.values() if p.is_healthy()]
     
     def update_local_state(self, key: str, value: bytes) -> None:
+        self.lamport += 1
+        self.entries[key] = (value, self.lamport, self.config.brain_id)
         self.merkle_tree.update(key, value)
         self.state.merkle_root = self.merkle_tree.get_root()
         self.state.vector_clock = self.state.vector_clock.increment(self.config.brain_id)
@@ -1588,6 +2139,12 @@ class FederationEngine:
             
         elif msg_type == "sync_merkle":
             return await self.sync.handle_sync_request(message)
+
+        elif msg_type == "sync_nodes":
+            return await self.sync.handle_nodes_request(message)
+            
+        elif msg_type == "sync_entries":
+            return await self.sync.handle_entries_request(message)
             
         logger.warning(f"Unknown federation message type: {msg_type} from {sender_id}")
         return {"success": False, "error": "unknown_message_type"}
@@ -1770,6 +2327,9 @@ class FederationEngine:
                     "items_synced": r.items_synced,
                     "conflicts_resolved": r.conflicts_resolved,
                     "sync_time_ms": r.sync_time_ms,
+                    "bytes_sent": r.bytes_sent,
+                    "bytes_received": r.bytes_received,
+                    "round_trips": r.round_trips,
                     "new_merkle_root": r.new_merkle_root,
                     "error": r.error,
                 },
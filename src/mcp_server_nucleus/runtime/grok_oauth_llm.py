@@ -39,6 +39,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .llm_cache import cached_generate
+
 try:
     from curl_cffi import requests as _curl_requests
 except ImportError:  # pragma: no cover - tests stub via patch
@@ -268,6 +270,7 @@ class GrokOAuthLLM:
 
     # ── Core interface (matches AnthropicLLM) ────────────────
 
+    @cached_generate
     def generate_content(
         self, prompt: str, **kwargs: Any,
     ) -> GrokOAuthResponse:
@@ -72,27 +72,30 @@ def check_engram_ledger() -> Dict[str, Any]:
                 "message": "Ledger not yet created (normal for new brain)",
             }
         
-        # Count engrams
-        count = 0
+        from .engram_ledger import live_records, resolve_latest
+
+        # Count live engrams (latest version per key, tombstones excluded)
+        records = []
         corrupted = 0
         with open(ledger_path, "r", encoding="utf-8") as f:
             for line in f:
                 if line.strip():
                     try:
-                        json.loads(line)
-                        count += 1
+                        records.append(json.loads(line))
                     except json.JSONDecodeError:
                         corrupted += 1
+        count = len(live_records(resolve_latest(records)))
         
         status = HealthStatus.HEALTHY
         if corrupted > 0:
-            status = HealthStatus.DEGRADED if corrupted < count * 0.1 else HealthStatus.UNHEALTHY
+            status = HealthStatus.DEGRADED if corrupted < len(records) * 0.1 else HealthStatus.UNHEALTHY
         
         return {
             "component": "engram_ledger",
             "status": status,
             "exists": True,
             "count": count,
+            "records": len(records),
             "corrupted_lines": corrupted,
         }
     except Exception as e:
@@ -30,6 +30,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from .common import get_brain_path
+from .engram_ledger import load_live_engrams
 
 logger = logging.getLogger("nucleus.heartbeat")
 
@@ -313,42 +314,32 @@ def _check_stale_blockers(brain: Path) -> List[Dict]:
     stale = []
     
     try:
-        with open(engram_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        for e in load_live_engrams(engram_path):
+            intensity = e.get("intensity", 5)
+            value = str(e.get("value", "")).lower()
+            key = e.get("key", "unknown")
+            ts_str = e.get("timestamp", "")
+            
+            if intensity < 8:
+                continue
+            if "blocker" not in value and "blocked" not in value and "blocking" not in value:
+                continue
+            
+            if ts_str:
                 try:
-                    e = json.loads(line)
-                    if e.get("deleted", False):
-                        continue
-                    
-                    intensity = e.get("intensity", 5)
-                    value = str(e.get("value", "")).lower()
-                    key = e.get("key", "unknown")
-                    ts_str = e.get("timestamp", "")
-                    
-                    if intensity < 8:
-                        continue
-                    if "blocker" not in value and "blocked" not in value and "blocking" not in value:
-                        continue
-                    
-                    if ts_str:
-                        try:
-                            ts = datetime.fromisoformat(ts_str)
-                            if ts < cutoff:
-                                age_hours = int((now - ts).total_seconds() / 3600)
-                                stale.append({
-                                    "signal": "STALE_BLOCKER",
-                                    "key": key,
-                                    "age_hours": age_hours,
-                                    "intensity": intensity,
-                                    "message": f"⏰ STALE BLOCKER: '{key}' is {age_hours}h old. Should we revisit?",
-                                    "value_preview": str(e.get("value", ""))[:100],
-                                })
-                        except (ValueError, TypeError):
-                            pass
-                except json.JSONDecodeError:
-                    continue
+                    ts = datetime.fromisoformat(ts_str)
+                    if ts < cutoff:
+                        age_hours = int((now - ts).total_seconds() / 3600)
+                        stale.append({
+                            "signal": "STALE_BLOCKER",
+                            "key": key,
+                            "age_hours": age_hours,
+                            "intensity": intensity,
+                            "message": f"⏰ STALE BLOCKER: '{key}' is {age_hours}h old. Should we revisit?",
+                            "value_preview": str(e.get("value", ""))[:100],
+                        })
+                except (ValueError, TypeError):
+                    pass
     except Exception as ex:
         logger.debug(f"Stale blocker check error: {ex}")
     
@@ -366,42 +357,32 @@ def _check_stale_decisions(brain: Path) -> List[Dict]:
     stale = []
     
     try:
-        with open(engram_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        for e in load_live_engrams(engram_path):
+            context = e.get("context", "")
+            intensity = e.get("intensity", 5)
+            key = e.get("key", "unknown")
+            ts_str = e.get("timestamp", "")
+            
+            if context != "Decision":
+                continue
+            if intensity < 7:
+                continue
+            
+            if ts_str:
                 try:
-                    e = json.loads(line)
-                    if e.get("deleted", False):
-                        continue
-                    
-                    context = e.get("context", "")
-                    intensity = e.get("intensity", 5)
-                    key = e.get("key", "unknown")
-                    ts_str = e.get("timestamp", "")
-                    
-                    if context != "Decision":
-                        continue
-                    if intensity < 7:
-                        continue
-                    
-                    if ts_str:
-                        try:
-                            ts = datetime.fromisoformat(ts_str)
-                            if ts < cutoff:
-                                age_days = int((now - ts).total_seconds() / 86400)
-                                stale.append({
-                                    "signal": "STALE_DECISION",
-                                    "key": key,
-                                    "age_days": age_days,
-                                    "intensity": intensity,
-                                    "message": f"🤔 Decision '{key}' hasn't been revisited in {age_days}d. Still valid?",
-                                    "value_preview": str(e.get("value", ""))[:100],
-                                })
-                        except (ValueError, TypeError):
-                            pass
-                except json.JSONDecodeError:
-                    continue
+                    ts = datetime.fromisoformat(ts_str)
+                    if ts < cutoff:
+                        age_days = int((now - ts).total_seconds() / 86400)
+                        stale.append({
+                            "signal": "STALE_DECISION",
+                            "key": key,
+                            "age_days": age_days,
+                            "intensity": intensity,
+                            "message": f"🤔 Decision '{key}' hasn't been revisited in {age_days}d. Still valid?",
+                            "value_preview": str(e.get("value", ""))[:100],
+                        })
+                except (ValueError, TypeError):
+                    pass
     except Exception as ex:
         logger.debug(f"Stale decision check error: {ex}")
     
@@ -422,25 +403,16 @@ def _check_velocity_drop(brain: Path) -> Optional[Dict]:
     total_count = 0
     
     try:
-        with open(engram_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        for e in load_live_engrams(engram_path):
+            total_count += 1
+            ts_str = e.get("timestamp", "")
+            if ts_str:
                 try:
-                    e = json.loads(line)
-                    if e.get("deleted", False):
-                        continue
-                    total_count += 1
-                    ts_str = e.get("timestamp", "")
-                    if ts_str:
-                        try:
-                            ts = datetime.fromisoformat(ts_str)
-                            if ts >= window:
-                                recent_count += 1
-                        except (ValueError, TypeError):
-                            pass
-                except json.JSONDecodeError:
-                    continue
+                    ts = datetime.fromisoformat(ts_str)
+                    if ts >= window:
+                        recent_count += 1
+                except (ValueError, TypeError):
+                    pass
     except Exception as ex:
         logger.debug(f"Velocity check error: {ex}")
         return None
@@ -0,0 +1,456 @@
+"""Segmented, append-only log of LLM interactions (``<brain>/raw/interactions/``).
+
+``_log_interaction`` used to write one pretty-printed JSON file per LLM call
+under ``.brain/raw/``. Now ``log_interaction(record)`` queues the record, and a
+background writer appends it as one JSON line to this process's open segment,
+``open-<start_us>-<pid>.jsonl``. Records keep the same shape as before.
+
+  * The writer thread flushes every ``NUCLEUS_INTERACTION_LOG_FLUSH_S`` seconds
+    (default 1) and again at interpreter exit. Each flush opens each file once.
+  * A segment is sealed once it reaches ``NUCLEUS_INTERACTION_LOG_SEGMENT_BYTES``
+    (default 8 MiB) or ``NUCLEUS_INTERACTION_LOG_SEGMENT_S`` seconds (default
+    3600). Sealing compresses it to ``seg-<start_us>-<pid>.jsonl[.gz|.zst]``
+    according to ``NUCLEUS_INTERACTION_LOG_COMPRESS``:
+      - ``gzip`` (the default);
+      - ``zstd`` (needs the ``zstandard`` package; falls back to gzip without it);
+      - ``none``.
+    It then appends the segment's time range to ``index.jsonl``.
+  * When a writer process exits, its open segment is left in place. The next
+    writer in that brain claims it by an atomic rename. If the segment is still
+    within the size and age limits, the writer keeps appending to it. Otherwise
+    it seals it first. A short-lived CLI process therefore does not leave a
+    file of its own behind.
+
+``iter_interactions(since, until)`` streams records in a time range. It opens
+only the sealed segments whose indexed range overlaps the query, plus the open
+segments and any ``llm_interaction_*.json`` files written before this log
+existed. ``import_legacy_files()`` folds those legacy files into one sealed
+segment.
+"""
+from __future__ import annotations
+
+import atexit
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger("nucleus.interaction_log")
+
+DEFAULT_FLUSH_S = 1.0
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+DEFAULT_SEGMENT_S = 3600.0
+MAX_PENDING = 100_000
+
+LOG_DIRNAME = "interactions"
+INDEX_NAME = "index.jsonl"
+LEGACY_GLOB = "llm_interaction_*.json"
+
+TimeBound = Union[None, float, str, datetime]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def log_dir(brain_path: Path) -> Path:
+    return Path(brain_path) / "raw" / LOG_DIRNAME
+
+
+def _epoch(value: TimeBound) -> Optional[float]:
+    """Seconds since the epoch for a float, ISO-8601 string or datetime."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _record_epoch(record: Dict[str, Any]) -> Optional[float]:
+    ts = record.get("timestamp")
+    return _epoch(ts) if isinstance(ts, str) else None
+
+
+def _segment_start(path: Path) -> int:
+    """``start_us`` from an ``open-``/``seg-`` file name (0 when unparseable)."""
+    try:
+        return int(path.name.split("-")[1])
+    except (IndexError, ValueError):
+        return 0
+
+
+def _segment_pid(path: Path) -> Optional[int]:
+    try:
+        return int(path.name.split("-")[2].split(".")[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# ── Compression ────────────────────────────────────────────────────
+
+
+def _compression() -> str:
+    mode = (os.environ.get("NUCLEUS_INTERACTION_LOG_COMPRESS") or "gzip").strip().lower()
+    if mode == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            logger.debug("zstandard not installed; sealing interaction segments with gzip")
+            return "gzip"
+    return mode if mode in ("zstd", "none") else "gzip"
+
+
+def _write_sealed(dest: Path, data: bytes, mode: str) -> None:
+    if mode == "zstd":
+        import zstandard
+
+        dest.write_bytes(zstandard.ZstdCompressor(level=6).compress(data))
+    elif mode == "gzip":
+        dest.write_bytes(gzip.compress(data, compresslevel=6))
+    else:
+        dest.write_bytes(data)
+
+
+def _open_text(path: Path) -> io.TextIOBase:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        import zstandard
+
+        raw = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _iter_lines(path: Path) -> Iterator[Dict[str, Any]]:
+    try:
+        with _open_text(path) as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # torn tail of a segment whose writer died mid-line
+    except FileNotFoundError:
+        return  # sealed or claimed by another process while we listed
+
+
+# ── Sealing ────────────────────────────────────────────────────────
+
+
+def _read_index(directory: Path) -> List[Dict[str, Any]]:
+    entries = []
+    for entry in _iter_lines(directory / INDEX_NAME):
+        if entry.get("segment"):
+            entries.append(entry)
+    return entries
+
+
+def seal_segment(path: Path) -> Optional[Path]:
+    """Compress the open segment ``path`` and index its time range; returns the sealed file.
+
+    The caller must own ``path`` (its writer, or whoever claimed it by rename).
+    """
+    directory = path.parent
+    data = path.read_bytes()
+    if not data.strip():
+        path.unlink(missing_ok=True)
+        return None
+    start = end = None
+    count = 0
+    for line in data.splitlines():
+        try:
+            ts = _record_epoch(json.loads(line))
+        except ValueError:
+            continue
+        count += 1
+        if ts is not None:
+            start = ts if start is None else min(start, ts)
+            end = ts if end is None else max(end, ts)
+    mode = _compression()
+    stem = path.name.split(".")[0].replace("open-", "seg-", 1)
+    sealed = directory / (stem + {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}.get(mode, ".jsonl"))
+    tmp = directory / f".{sealed.name}.{os.getpid()}.tmp"
+    _write_sealed(tmp, data, mode)
+    os.replace(tmp, sealed)
+    entry = {"segment": sealed.name, "start": start, "end": end,
+             "count": count, "bytes": len(data)}
+    with (directory / INDEX_NAME).open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(entry) + "\n")
+    path.unlink(missing_ok=True)
+    return sealed
+
+
+# ── Writer ─────────────────────────────────────────────────────────
+
+
+class _OpenSegment:
+    __slots__ = ("path", "start_s", "size")
+
+    def __init__(self, path: Path, start_s: float, size: int):
+        self.path = path
+        self.start_s = start_s
+        self.size = size
+
+
+class InteractionLogWriter:
+    """Queues interaction records and appends them to per-brain open segments."""
+
+    def __init__(self, flush_interval_s: Optional[float] = None,
+                 max_pending: int = MAX_PENDING):
+        self._flush_interval = flush_interval_s
+        self._pending: deque = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._atexit_registered = False
+        self._segments: Dict[Path, _OpenSegment] = {}
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def append(self, brain_path: Path, record: Dict[str, Any]) -> None:
+        self._pending.append((Path(brain_path), record))
+        if self._thread is None:
+            self._start()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="nucleus-interaction-log", daemon=True
+            )
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def _after_fork(self) -> None:
+        # The child's pid differs, so it must not append to the parent's segment,
+        # and the parent still writes the records it had queued.
+        self._pending = deque(maxlen=self._pending.maxlen)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._segments = {}
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._flush_interval or _env_float(
+                "NUCLEUS_INTERACTION_LOG_FLUSH_S", DEFAULT_FLUSH_S) or DEFAULT_FLUSH_S)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # noqa: BLE001 — capture never takes the process down
+                logger.warning("interaction log flush failed: %s", e)
+
+    def flush(self) -> int:
+        """Append every queued record now; returns records written."""
+        with self._lock:
+            batches: Dict[Path, List[str]] = {}
+            while True:
+                try:
+                    brain, record = self._pending.popleft()
+                except IndexError:
+                    break
+                batches.setdefault(brain, []).append(
+                    json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            written = 0
+            for brain, lines in batches.items():
+                try:
+                    self._write(log_dir(brain), "".join(lines).encode("utf-8"))
+                    written += len(lines)
+                except OSError as e:
+                    logger.warning("Failed to log %d interaction(s) under %s: %s",
+                                   len(lines), brain, e)
+            return written
+
+    def _write(self, directory: Path, data: bytes) -> None:
+        seg = self._segments.get(directory)
+        if seg is None:
+            seg = self._segments[directory] = self._open(directory)
+        elif (seg.size >= _env_float("NUCLEUS_INTERACTION_LOG_SEGMENT_BYTES", DEFAULT_SEGMENT_BYTES)
+              or time.time() - seg.start_s >= _env_float("NUCLEUS_INTERACTION_LOG_SEGMENT_S",
+                                                          DEFAULT_SEGMENT_S)):
+            seal_segment(seg.path)
+            seg = self._segments[directory] = self._new_segment(directory)
+        with seg.path.open("ab") as fh:
+            fh.write(data)
+        seg.size += len(data)
+
+    @staticmethod
+    def _new_segment(directory: Path) -> _OpenSegment:
+        now = time.time()
+        return _OpenSegment(
+            directory / f"open-{int(now * 1e6):016d}-{os.getpid()}.jsonl", now, 0)
+
+    def _open(self, directory: Path) -> _OpenSegment:
+        """First write to ``directory`` in this process: adopt or seal orphans."""
+        directory.mkdir(parents=True, exist_ok=True)
+        max_bytes = _env_float("NUCLEUS_INTERACTION_LOG_SEGMENT_BYTES", DEFAULT_SEGMENT_BYTES)
+        max_age = _env_float("NUCLEUS_INTERACTION_LOG_SEGMENT_S", DEFAULT_SEGMENT_S)
+        indexed = {e["segment"].split(".")[0] for e in _read_index(directory)}
+        adopted: Optional[_OpenSegment] = None
+        for orphan in sorted(directory.glob("open-*")):
+            if _pid_alive(_segment_pid(orphan)):
+                continue
+            start_us = _segment_start(orphan)
+            claimed = directory / f"open-{start_us:016d}-{os.getpid()}.jsonl"
+            try:
+                os.rename(orphan, claimed)  # atomic: exactly one claimant wins
+            except FileNotFoundError:
+                continue
+            if orphan.name.split(".")[0].replace("open-", "seg-", 1) in indexed:
+                claimed.unlink(missing_ok=True)  # sealed before its writer died
+                continue
+            size = claimed.stat().st_size
+            if (adopted is None and size < max_bytes
+                    and time.time() - start_us / 1e6 < max_age):
+                adopted = _OpenSegment(claimed, start_us / 1e6, size)
+            else:
+                seal_segment(claimed)
+        return adopted or self._new_segment(directory)
+
+
+_writer = InteractionLogWriter()
+
+
+def get_writer() -> InteractionLogWriter:
+    return _writer
+
+
+def log_interaction(record: Dict[str, Any], brain_path: Optional[Path] = None) -> None:
+    """Queue one interaction record (``timestamp``, ``engine``, ``model``, ...)."""
+    if brain_path is None:
+        from .common import get_brain_path
+
+        brain_path = get_brain_path()  # resolved on the caller's thread (contextvar)
+    _writer.append(brain_path, record)
+
+
+def flush() -> int:
+    return _writer.flush()
+
+
+# ── Reader ─────────────────────────────────────────────────────────
+
+
+def iter_interactions(
+    since: TimeBound = None,
+    until: TimeBound = None,
+    *,
+    brain_path: Optional[Path] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Interaction records with ``since <= timestamp < until``, oldest segment first.
+
+    Records are yielded in segment order, and in write order within a segment.
+    Records queued in this process but not yet flushed are not included; call
+    ``flush()`` first if you need them.
+    """
+    if brain_path is None:
+        from .common import get_brain_path
+
+        brain_path = get_brain_path()
+    lo, hi = _epoch(since), _epoch(until)
+    directory = log_dir(brain_path)
+
+    def keep(record: Dict[str, Any]) -> bool:
+        if lo is None and hi is None:
+            return True
+        ts = _record_epoch(record)
+        return ts is not None and (lo is None or ts >= lo) and (hi is None or ts < hi)
+
+    sources = []
+    index = _read_index(directory)
+    for entry in index:
+        start, end = entry.get("start"), entry.get("end")
+        if (lo is not None and end is not None and end < lo) or (
+                hi is not None and start is not None and start >= hi):
+            continue
+        sources.append(directory / entry["segment"])
+    if directory.is_dir():
+        # An open file whose sealed copy is indexed was left by a crash mid-seal.
+        indexed = {e["segment"].split(".")[0] for e in index}
+        sources.extend(p for p in directory.glob("open-*")
+                       if p.name.split(".")[0].replace("open-", "seg-", 1) not in indexed)
+    sources.sort(key=_segment_start)
+    for path in sources:
+        for record in _iter_lines(path):
+            if keep(record):
+                yield record
+
+    raw = Path(brain_path) / "raw"
+    if raw.is_dir():
+        for path in sorted(raw.glob(LEGACY_GLOB)):
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if keep(record):
+                yield record
+
+
+def import_legacy_files(brain_path: Optional[Path] = None) -> Dict[str, int]:
+    """Fold ``raw/llm_interaction_*.json`` files into one sealed segment and delete them."""
+    if brain_path is None:
+        from .common import get_brain_path
+
+        brain_path = get_brain_path()
+    raw = Path(brain_path) / "raw"
+    files = sorted(raw.glob(LEGACY_GLOB)) if raw.is_dir() else []
+    if not files:
+        return {"files": 0, "bytes": 0}
+    directory = log_dir(brain_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    seg = InteractionLogWriter._new_segment(directory)
+    imported, size, done = 0, 0, []
+    with seg.path.open("ab") as fh:
+        for path in files:
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+                size += path.stat().st_size
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping unreadable interaction file %s: %s", path, e)
+                continue
+            fh.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+            done.append(path)
+            imported += 1
+    seal_segment(seg.path)
+    for path in done:
+        path.unlink(missing_ok=True)
+    return {"files": imported, "bytes": size}
+
+
+__all__ = [
+    "InteractionLogWriter", "flush", "get_writer", "import_legacy_files",
+    "iter_interactions", "log_dir", "log_interaction", "seal_segment",
+]
@@ -0,0 +1,351 @@
+"""Content-addressed response cache in front of the LLM clients (opt-in).
+
+Daemons (morning brief, consolidation, critic, skill extraction) often send
+byte-identical prompts minutes apart. With ``NUCLEUS_LLM_CACHE=1`` every
+provider's ``generate_content`` (wrapped by ``cached_generate``) first looks
+up sha256(provider, model, system instruction, prompt, params) in
+``<brain>/cache/llm_responses.db``. A hit returns a ``CachedLLMResponse``
+before the token-budget check, the network call, interaction logging and
+usage recording, so it spends nothing.
+
+  * Entries live for ``NUCLEUS_LLM_CACHE_TTL_S`` seconds (default 600).
+  * The store is capped at ``NUCLEUS_LLM_CACHE_MAX_BYTES`` (default 64 MiB).
+    Least-recently-used entries are evicted by payload size.
+  * ``NUCLEUS_LLM_CACHE_SWR=1`` (stale-while-revalidate) serves an expired
+    entry for up to ``NUCLEUS_LLM_CACHE_STALE_S`` more seconds (default 3600)
+    and refreshes it on a background thread.
+
+Only plain-text calls are cached. A non-string prompt, tool declarations,
+params that are not JSON, or a response without text bypass the cache.
+Hit / miss / stale-hit / bytes- and tokens-saved counters persist in the same
+database (``stats()``), so savings from every process show up in ``/status``.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("nucleus.llm_cache")
+
+_CACHE_TRUTHY = frozenset({"1", "true", "yes", "on"})
+DEFAULT_TTL_S = 600.0
+DEFAULT_STALE_S = 3600.0
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_MMAP_BYTES = 64 * 1024 * 1024
+
+# Calls carrying tools can trigger side effects; never replay them.
+_UNCACHEABLE_PARAMS = frozenset({"tools", "tool_config"})
+# Routing/bookkeeping kwargs that do not change the request sent upstream.
+_PRIVATE_PARAMS = frozenset({"_agent_id"})
+
+_COUNTERS = ("hits", "misses", "stale_hits", "bytes_saved", "tokens_saved", "evictions")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT,
+    model TEXT,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def _flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in _CACHE_TRUTHY
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def cache_enabled() -> bool:
+    """True when ``NUCLEUS_LLM_CACHE`` opts this process into the cache."""
+    return _flag("NUCLEUS_LLM_CACHE")
+
+
+@dataclass
+class CachedLLMResponse:
+    """A replayed response; same ``text``/``model``/``usage`` shape as the clients'."""
+    text: str
+    model: str = ""
+    usage: Dict[str, int] = field(default_factory=dict)
+    cached: bool = True
+
+
+def request_key(client: Any, prompt: Any, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Content address of one call, or None when it must not be cached."""
+    if not isinstance(prompt, str):
+        return None
+    params = {k: v for k, v in kwargs.items() if k not in _PRIVATE_PARAMS}
+    if _UNCACHEABLE_PARAMS & params.keys():
+        return None
+    material = [
+        type(client).__name__,
+        getattr(client, "_provider_id", None) or getattr(client, "engine", None),
+        getattr(client, "model_name", None),
+        getattr(client, "system_instruction", None),
+        prompt,
+        params,
+    ]
+    try:
+        blob = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _response_payload(prompt: str, response: Any) -> Optional[Dict[str, Any]]:
+    try:
+        text = response.text  # the Gemini SDK raises when a response has no text part
+    except Exception:
+        return None
+    if not isinstance(text, str) or not text:
+        return None
+    usage = getattr(response, "usage", None)
+    usage = usage if isinstance(usage, dict) else {}
+    tokens = int(usage.get("input_tokens", 0) or 0) + int(usage.get("output_tokens", 0) or 0)
+    return {
+        "text": text,
+        "model": str(getattr(response, "model", "") or ""),
+        "usage": usage,
+        # 4 chars ~= 1 token when the provider did not report usage.
+        "tokens": tokens or (len(prompt) + len(text)) // 4,
+    }
+
+
+def _configure(conn: sqlite3.Connection) -> None:
+    conn.execute(f"PRAGMA mmap_size={_MMAP_BYTES}")
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with TTL, LRU-by-bytes eviction and SWR."""
+
+    def __init__(self, db_path: Path, *, ttl_s: float = DEFAULT_TTL_S,
+                 max_bytes: int = DEFAULT_MAX_BYTES, swr: bool = False,
+                 stale_s: float = DEFAULT_STALE_S):
+        from .common import get_sqlite_pool
+
+        self.db_path = Path(db_path)
+        self.ttl_s = float(ttl_s)
+        self.max_bytes = int(max_bytes)
+        self.swr = bool(swr)
+        self.stale_s = float(stale_s) if swr else 0.0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_sqlite_pool(self.db_path, schema=SCHEMA, configure=_configure)
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+
+    # ── Store ──────────────────────────────────────────────────────
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, **deltas: int) -> None:
+        conn.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            [(name, int(n)) for name, n in deltas.items() if n],
+        )
+
+    def lookup(self, key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """``(payload, stale)`` for ``key``; ``(None, False)`` is a miss."""
+        row = self._pool.reader().execute(
+            "SELECT payload, size, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        age = now - row[2] if row is not None else None
+        if age is None or age > self.ttl_s + self.stale_s:
+            with self._pool.writer() as conn:
+                self._bump(conn, misses=1)
+            return None, False
+        stale = age > self.ttl_s
+        payload = json.loads(row[0])
+        with self._pool.writer() as conn:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._bump(conn, hits=1, stale_hits=int(stale), bytes_saved=row[1],
+                       tokens_saved=payload.get("tokens", 0))
+        return payload, stale
+
+    def put(self, key: str, client: Any, payload: Dict[str, Any]) -> bool:
+        blob = json.dumps(payload, ensure_ascii=False)
+        size = len(blob.encode("utf-8"))
+        if size > self.max_bytes:
+            return False
+        now = time.time()
+        with self._pool.writer() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, provider, model, payload, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, getattr(client, "_provider_id", None) or type(client).__name__,
+                 getattr(client, "model_name", None), blob, size, now, now),
+            )
+            self._evict(conn, now)
+        return True
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_s - self.stale_s,)
+        ).rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        victims = []
+        if total > self.max_bytes:
+            excess, freed = total - self.max_bytes, 0
+            for key, size in conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at"
+            ):
+                victims.append((key,))
+                freed += size
+                if freed >= excess:
+                    break
+            conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._bump(conn, evictions=expired + len(victims))
+
+    def clear(self) -> None:
+        with self._pool.writer() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """Persisted counters plus current size of the store."""
+        conn = self._pool.reader()
+        out: Dict[str, Any] = {name: 0 for name in _COUNTERS}
+        out.update(dict(conn.execute("SELECT name, value FROM counters")))
+        entries, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        lookups = out["hits"] + out["misses"]
+        out.update(
+            entries=entries, bytes=size, max_bytes=self.max_bytes, ttl_s=self.ttl_s,
+            swr=self.swr, hit_rate=round(out["hits"] / lookups, 4) if lookups else 0.0,
+        )
+        return out
+
+    # ── Call path ──────────────────────────────────────────────────
+
+    def _store_response(self, key: str, client: Any, prompt: str, response: Any) -> None:
+        payload = _response_payload(prompt, response)
+        if payload is None:
+            return
+        try:
+            self.put(key, client, payload)
+        except sqlite3.Error as exc:
+            logger.warning("LLM cache write failed: %s", exc)
+
+    def _revalidate(self, key: str, client: Any, method: Callable, prompt: str,
+                    kwargs: Dict[str, Any]) -> None:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                self._store_response(key, client, prompt, method(client, prompt, **kwargs))
+            except Exception as exc:  # noqa: BLE001 — the stale answer was already served
+                logger.info("LLM cache revalidation failed: %s", exc)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name="nucleus-llm-cache-revalidate", daemon=True).start()
+
+    def generate(self, client: Any, method: Callable, prompt: Any,
+                 kwargs: Dict[str, Any]) -> Any:
+        """Serve ``method(client, prompt, **kwargs)`` through the cache."""
+        key = request_key(client, prompt, kwargs)
+        if key is None:
+            return method(client, prompt, **kwargs)
+        try:
+            payload, stale = self.lookup(key)
+        except (sqlite3.Error, ValueError) as exc:
+            logger.warning("LLM cache read failed: %s", exc)
+            return method(client, prompt, **kwargs)
+        _record_metric("hits" if payload is not None else "misses")
+        if payload is not None:
+            if stale:
+                _record_metric("stale_hits")
+                self._revalidate(key, client, method, prompt, dict(kwargs))
+            return CachedLLMResponse(
+                text=payload["text"], model=payload.get("model", ""),
+                usage=payload.get("usage") or {},
+            )
+        response = method(client, prompt, **kwargs)
+        self._store_response(key, client, prompt, response)
+        return response
+
+
+def _record_metric(name: str) -> None:
+    try:
+        from nucleus_wedge.metrics import incr
+        incr(f"llm_cache.{name}")
+    except Exception:
+        pass
+
+
+_caches: Dict[str, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+_warned = False
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """The cache for the current brain, or None when ``NUCLEUS_LLM_CACHE`` is off."""
+    if not cache_enabled():
+        return None
+    from .common import get_brain_path
+
+    path = str(get_brain_path() / "cache" / "llm_responses.db")
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = LLMResponseCache(
+                Path(path),
+                ttl_s=_env_float("NUCLEUS_LLM_CACHE_TTL_S", DEFAULT_TTL_S),
+                max_bytes=int(_env_float("NUCLEUS_LLM_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+                swr=_flag("NUCLEUS_LLM_CACHE_SWR"),
+                stale_s=_env_float("NUCLEUS_LLM_CACHE_STALE_S", DEFAULT_STALE_S),
+            )
+        return cache
+
+
+def cached_generate(method: Callable) -> Callable:
+    """Decorate a client's ``generate_content(self, prompt, **kwargs)`` with the cache."""
+
+    @functools.wraps(method)
+    def wrapper(self, prompt, **kwargs):
+        global _warned
+        try:
+            cache = get_llm_cache()
+        except Exception as exc:  # noqa: BLE001 — a broken cache must not block the call
+            if not _warned:
+                logger.warning("LLM response cache unavailable: %s", exc)
+                _warned = True
+            cache = None
+        if cache is None:
+            return method(self, prompt, **kwargs)
+        return cache.generate(self, method, prompt, kwargs)
+
+    return wrapper
+
+
+__all__ = [
+    "CachedLLMResponse", "LLMResponseCache", "cache_enabled", "cached_generate",
+    "get_llm_cache", "request_key",
+]
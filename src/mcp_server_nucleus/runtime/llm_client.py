@@ -17,10 +17,12 @@ import tempfile
 import importlib.util
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 from enum import Enum
 from dataclasses import dataclass, field
 
+from .llm_cache import cached_generate
+
 # Configure logger
 logger = logging.getLogger("nucleus.llm")
 
@@ -461,34 +463,26 @@ class DualEngineLLM:
     def _log_interaction(self, prompt: str, response: Any):
         """
         Automatic Capture (Brain Consolidation - Phase 1).
-        Saves the raw interaction to disk for later mining/consolidation.
+        Queues the raw interaction on the segmented interaction log
+        (runtime/interaction_log.py) for later mining/consolidation.
         """
         try:
-            from .common import get_brain_path
-            brain_path = get_brain_path()
-            raw_path = brain_path / "raw"
-            raw_path.mkdir(parents=True, exist_ok=True)
-            
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-            filename = raw_path / f"llm_interaction_{timestamp}.json"
-            
+            from .interaction_log import log_interaction
+
             # Extract text from response (Best effort)
             response_text = self._safe_text(response) or "Unknown"
-                
-            data = {
+
+            log_interaction({
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "engine": self.engine,
                 "model": self.model_name,
                 "prompt": str(prompt)[:5000], # Truncate massive prompts 
                 "response_text": response_text
-            }
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
+            })
         except Exception as e:
             logger.warning(f"Failed to log interaction: {e}")
 
+    @cached_generate
     def generate_content(self, prompt: str, **kwargs) -> Any:
         try:
             # ── Token Budget Check (42-Round Audit: Round 14) ─────────
@@ -655,6 +649,36 @@ class DualEngineLLM:
              logger.error(f"❌ LLM Embed Content Failed ({self.engine}): {e}")
              raise
 
+    def _embed_batch(self, texts: List[str], task_type: str) -> List[List[float]]:
+        """One provider call embedding every text in ``texts`` (in order)."""
+        if self.engine == "NEW":
+            response = self.client.models.embed_content(
+                model=self.model_name,
+                contents=list(texts),
+                config={'task_type': task_type.replace("retrieval_", "RETRIEVAL_").upper()},
+            )
+            return [list(e.values or []) for e in (getattr(response, 'embeddings', None) or [])]
+        if self.engine == "LEGACY":
+            result = genai_legacy.embed_content(
+                model="models/gemini-embedding-001",
+                content=list(texts),
+                task_type=task_type,
+            )
+            return result.get('embedding') or []
+        return [self.embed_content(t, task_type=task_type).get('embedding', []) for t in texts]
+
+    def embed_many(self, texts: List[str], task_type: str = "retrieval_document",
+                   **kwargs) -> List[List[float]]:
+        """Batched, cached ``embed_content`` for many texts (see runtime/embeddings.py)."""
+        from .embeddings import embed_many
+
+        try:
+            return embed_many(self._embed_batch, texts, model=self.model_name,
+                              task_type=task_type, **kwargs)
+        except Exception as e:
+            logger.error(f"❌ LLM Embed Many Failed ({self.engine}): {e}")
+            raise
+
     @staticmethod
     def _safe_text(obj) -> str:
         """Extract .text from a Gemini response/chunk, suppressing SDK warnings."""
@@ -785,6 +809,7 @@ class AnthropicLLM:
 
     # ── Core interface (matches DualEngineLLM) ──────────────
 
+    @cached_generate
     def generate_content(self, prompt: str, **kwargs) -> AnthropicResponse:
         """Generate text via Anthropic Messages API."""
         # ── Token Budget Check ──
@@ -1136,21 +1161,15 @@ class AnthropicLLM:
 
     def _log_interaction(self, prompt: str, response: AnthropicResponse):
         try:
-            from .common import get_brain_path
-            brain_path = get_brain_path()
-            raw_path = brain_path / "raw"
-            raw_path.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-            filename = raw_path / f"llm_interaction_{timestamp}.json"
-            data = {
+            from .interaction_log import log_interaction
+
+            log_interaction({
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "engine": self.engine,
                 "model": self.model_name,
                 "prompt": str(prompt)[:5000],
                 "response_text": response.text,
-            }
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            })
         except Exception as e:
             logger.warning(f"Failed to log interaction: {e}")
 
@@ -1248,6 +1267,7 @@ class GroqLLM:
 
     # ── Core interface (matches DualEngineLLM) ──────────────
 
+    @cached_generate
     def generate_content(self, prompt: str, **kwargs) -> GroqResponse:
         """Generate text via Groq's OpenAI-compatible chat completions."""
         session_id = os.environ.get("NUCLEUS_SESSION_ID", "default")
@@ -1543,21 +1563,15 @@ class GroqLLM:
 
     def _log_interaction(self, prompt: str, response: GroqResponse):
         try:
-            from .common import get_brain_path
-            brain_path = get_brain_path()
-            raw_path = brain_path / "raw"
-            raw_path.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-            filename = raw_path / f"llm_interaction_{timestamp}.json"
-            data = {
+            from .interaction_log import log_interaction
+
+            log_interaction({
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "engine": self.engine,
                 "model": self.model_name,
                 "prompt": str(prompt)[:5000],
                 "response_text": response.text,
-            }
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            })
         except Exception as e:
             logger.warning(f"Failed to log interaction: {e}")
 
@@ -146,6 +146,9 @@ class MemoryPipeline:
         # vector index for hybrid recall re-rank. Never constructed while
         # NUCLEUS_MEMORY_SOR is off (flag-OFF stays a byte-for-byte no-op).
         self._sor_vector_sink = None
+        # ADD/UPDATE mirror records buffered during ``commit_ops`` so one batch of
+        # operations lands in the SoR as one transaction (None = not batching).
+        self._sor_pending: Optional[List[Dict]] = None
 
     # ── STEP 1: Extract Atoms ──────────────────────────────────────
 
@@ -187,59 +190,26 @@ class MemoryPipeline:
     def _load_active_engrams(self) -> List[Dict]:
         """Load all active (non-deleted) engrams from the ledger.
 
-        Deduplicates by key on read: if multiple engrams share a key,
-        only the one with the highest version (or latest timestamp) is kept.
-        This ensures queries always return clean data even if the ledger
-        file contains pre-ADUN duplicates.
+        The ledger is append-only (see ``engram_ledger``): UPDATEs append a
+        newer version and DELETEs append a tombstone. Reads resolve the latest
+        record per key — highest version (or latest timestamp) wins, and a
+        tombstone hides every earlier record for its key. This also keeps
+        queries clean when the file contains pre-ADUN duplicates.
         """
         if not self.ledger_path.exists():
             return []
 
-        raw_engrams = []
-        with open(self.ledger_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        e = json.loads(line)
-                        if not e.get("deleted", False):
-                            raw_engrams.append(e)
-                    except json.JSONDecodeError:
-                        continue
-
-        # Deduplicate by key: keep the entry with highest version,
-        # breaking ties by latest timestamp.
-        seen: Dict[str, Dict] = {}
-        for e in raw_engrams:
-            key = e.get("key")
-            if not key:
-                # Engrams without keys are kept as-is (append to result)
-                continue
-            existing = seen.get(key)
-            if existing is None:
-                seen[key] = e
-            elif _anchor_flag_on():
-                seen[key] = self._resolve_dedup_winner(existing, e)
-            else:
-                # Compare: higher version wins, then later timestamp
-                e_ver = e.get("version", 1)
-                ex_ver = existing.get("version", 1)
-                if e_ver > ex_ver:
-                    seen[key] = e
-                elif e_ver == ex_ver:
-                    e_ts = e.get("timestamp", "")
-                    ex_ts = existing.get("timestamp", "")
-                    if e_ts > ex_ts:
-                        seen[key] = e
-
-        # Also include keyless engrams (rare but possible)
-        keyless = [e for e in raw_engrams if not e.get("key")]
-        return list(seen.values()) + keyless
+        from .engram_ledger import load_live_engrams
+        winner = self._resolve_dedup_winner if _anchor_flag_on() else None
+        return load_live_engrams(self.ledger_path, winner)
 
     def _find_similar(self, candidate: str, existing: List[Dict], threshold: float = 0.6) -> Optional[Dict]:
         """
         Find the most similar existing engram to a candidate atom.
 
-        Uses keyword overlap scoring (v0 — no embeddings needed).
+        Uses keyword overlap scoring (v0 — no embeddings needed). This is the
+        linear-scan reference; ``propose_ops`` answers the same question from
+        the inverted index in ``engram_index`` when it is available.
 
         Args:
             candidate: The candidate fact string.
@@ -249,15 +219,8 @@ class MemoryPipeline:
         Returns:
             The most similar engram dict, or None.
         """
-        candidate_words = set(candidate.lower().split())
-        # Remove common stop words for better matching
-        stop_words = {"the", "a", "an", "is", "are", "was", "were", "be", "been",
-                      "being", "have", "has", "had", "do", "does", "did", "will",
-                      "would", "could", "should", "may", "might", "shall",
-                      "for", "and", "but", "or", "nor", "not", "so", "yet",
-                      "to", "of", "in", "on", "at", "by", "with", "from",
-                      "this", "that", "it", "its", "we", "our", "their"}
-        candidate_words -= stop_words
+        from .engram_index import engram_tokens, tokenize
+        candidate_words = tokenize(candidate)
 
         if not candidate_words:
             return None
@@ -266,10 +229,7 @@ class MemoryPipeline:
         best_score = 0.0
 
         for engram in existing:
-            value_words = set(engram.get("value", "").lower().split()) - stop_words
-            key_words = set(engram.get("key", "").lower().replace("_", " ").split()) - stop_words
-
-            combined = value_words | key_words
+            combined = engram_tokens(engram)
 
             if not combined:
                 continue
@@ -285,6 +245,24 @@ class MemoryPipeline:
 
         return best_match
 
+    def _similarity_index(self):
+        """Shared inverted index for this ledger, synced to disk; None on failure.
+
+        Anchored brains (NUCLEUS_ENGRAM_ANCHOR) resolve duplicates through
+        signature verification, which the index cannot do from token sets, so
+        they keep the full-scan path.
+        """
+        if _anchor_flag_on() or not self.ledger_path.exists():
+            return None
+        try:
+            from .engram_index import get_similarity_index
+            index = get_similarity_index(self.ledger_path)
+            index.sync()
+            return index
+        except Exception as e:
+            logger.debug(f"Similarity index unavailable, falling back to scan: {e}")
+            return None
+
     # ── STEP 3: Propose Operations ─────────────────────────────────
 
     def propose_ops(
@@ -312,16 +290,20 @@ class MemoryPipeline:
         Returns:
             List of operation dicts with op type and metadata.
         """
-        existing = self._load_active_engrams()
+        index = self._similarity_index()
+        existing = self._load_active_engrams() if index is None else []
         operations = []
 
         for atom in atoms:
             # Check for exact key-value duplicate
             exact_match = None
-            for e in existing:
-                if e.get("value", "").strip().lower() == atom.strip().lower():
-                    exact_match = e
-                    break
+            if index is not None:
+                exact_match = index.find_exact(atom)
+            else:
+                for e in existing:
+                    if e.get("value", "").strip().lower() == atom.strip().lower():
+                        exact_match = e
+                        break
 
             if exact_match:
                 operations.append({
@@ -333,7 +315,10 @@ class MemoryPipeline:
                 continue
 
             # Check for similar (potential UPDATE)
-            similar = self._find_similar(atom, existing)
+            if index is not None:
+                similar = index.find_similar(atom)
+            else:
+                similar = self._find_similar(atom, existing)
             if similar:
                 operations.append({
                     "op": EngramOp.UPDATE,
@@ -505,7 +490,15 @@ class MemoryPipeline:
             Summary of committed operations.
         """
         results = {"added": 0, "updated": 0, "deleted": 0, "skipped": 0, "details": []}
+        self._sor_pending = [] if _sor_flag_on() else None
+        try:
+            self._commit_ops(operations, results)
+        finally:
+            self._flush_sor_mirror()
+            self._sor_pending = None
+        return results
 
+    def _commit_ops(self, operations: List[Dict], results: Dict) -> None:
         for op in operations:
             op_type = op["op"] if isinstance(op["op"], str) else op["op"].value
 
@@ -565,8 +558,6 @@ class MemoryPipeline:
                 results["deleted"] += 1
                 results["details"].append({"op": "DELETE", "key": op.get("target_key", "")})
 
-        return results
-
     def _append_to_ledger(self, engram: Dict):
         """Append a new engram to the ledger (file-locked for concurrent safety)."""
         secrets = _scan_for_secrets(engram.get("value", ""))
@@ -574,91 +565,59 @@ class MemoryPipeline:
             logger.warning("Possible credential in engram '%s': %s — review before sharing brain",
                            engram.get("key", "?"), ", ".join(secrets))
             engram["_secret_warning"] = secrets
+        self._append_record(engram)
+
+    def _append_record(self, record: Dict):
+        """Append one raw record (engram version or tombstone) under the engrams lock."""
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+        def _write():
+            with open(self.ledger_path, "ab") as f:
+                offset = f.tell()
+                f.write(data)
+            return offset
+
         try:
             from .locking import get_lock
             with get_lock("engrams", self.brain_path).section():
-                with open(self.ledger_path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(engram, ensure_ascii=False) + "\n")
+                offset = _write()
         except Exception as lock_err:
             # Fallback to unlocked write if locking unavailable
             logger.warning("File locking unavailable for ledger append, falling back to unlocked write: %s", lock_err)
-            with open(self.ledger_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(engram, ensure_ascii=False) + "\n")
+            offset = _write()
+        # Keep the similarity index incremental: it folds this record in
+        # directly when it is caught up to ``offset`` (else the next sync
+        # replays the tail).
+        try:
+            from .engram_index import get_similarity_index
+            get_similarity_index(self.ledger_path).observe_append(record, offset, offset + len(data))
+        except Exception as e:
+            logger.debug(f"Similarity index update skipped: {e}")
 
     def _update_in_ledger(self, key: str, new_engram: Dict):
-        """Update an existing engram in the ledger (file-locked rewrite)."""
-        if not self.ledger_path.exists():
-            self._append_to_ledger(new_engram)
-            return
+        """Record a new version of ``key`` by appending it (O(1), no rewrite).
 
-        try:
-            from .locking import get_lock
-            lock = get_lock("engrams", self.brain_path)
-        except Exception as lock_err:
-            logger.warning("File locking unavailable for ledger update — concurrent writes risk corruption: %s", lock_err)
-            lock = None
-
-        def _do_update():
-            lines = []
-            updated = False
-            with open(self.ledger_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            e = json.loads(line)
-                            if e.get("key") == key and not e.get("deleted", False):
-                                lines.append(json.dumps(new_engram) + "\n")
-                                updated = True
-                            else:
-                                lines.append(line)
-                        except json.JSONDecodeError:
-                            lines.append(line)
-            if not updated:
-                lines.append(json.dumps(new_engram) + "\n")
-            with open(self.ledger_path, "w", encoding="utf-8") as f:
-                f.writelines(lines)
-
-        if lock:
-            with lock.section():
-                _do_update()
-        else:
-            _do_update()
+        Readers resolve the latest version per key, so the superseded record
+        stays on disk until the background compactor drops it.
+        """
+        self._append_to_ledger(new_engram)
+        self._schedule_compaction()
 
     def _delete_in_ledger(self, key: str):
-        """Soft-delete an engram by marking it as deleted (file-locked)."""
+        """Soft-delete an engram by appending a tombstone record (O(1), no rewrite)."""
         if not self.ledger_path.exists():
             return
+        from .engram_ledger import make_tombstone
+        self._append_record(make_tombstone(key))
+        self._schedule_compaction()
 
+    def _schedule_compaction(self):
+        """Kick the background compactor; it decides whether a rewrite is due."""
         try:
-            from .locking import get_lock
-            lock = get_lock("engrams", self.brain_path)
-        except Exception as lock_err:
-            logger.warning("File locking unavailable for ledger delete — concurrent writes risk corruption: %s", lock_err)
-            lock = None
-
-        def _do_delete():
-            lines = []
-            with open(self.ledger_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            e = json.loads(line)
-                            if e.get("key") == key:
-                                e["deleted"] = True
-                                e["deleted_at"] = datetime.now().isoformat()
-                                lines.append(json.dumps(e) + "\n")
-                            else:
-                                lines.append(line)
-                        except json.JSONDecodeError:
-                            lines.append(line)
-            with open(self.ledger_path, "w", encoding="utf-8") as f:
-                f.writelines(lines)
-
-        if lock:
-            with lock.section():
-                _do_delete()
-        else:
-            _do_delete()
+            from .engram_ledger import maybe_compact_async
+            maybe_compact_async(self.brain_path)
+        except Exception as e:
+            logger.debug(f"Ledger compaction scheduling skipped: {e}")
 
     def _append_to_history(self, engram: Dict, op_type: str):
         """Append an entry to the history log for audit-ability."""
@@ -706,6 +665,9 @@ class MemoryPipeline:
             markers (e.g. ``DEDUP_MIGRATION``) are history-only and never become
             SoR rows. The ADUN op-classification (extract/compare/propose) is
             untouched — only this persistence tail forks into the SoR.
+          * Batched — inside ``commit_ops`` ADD/UPDATE records are buffered and
+            written with one ``capture_many`` (one SoR transaction per batch);
+            a DELETE flushes the buffer before archiving.
 
         Reads are unchanged in this batch (the read repoint is manifest batch 4).
         """
@@ -715,20 +677,22 @@ class MemoryPipeline:
         # (DEDUP_MIGRATION, …) are history-only and never become SoR rows.
         if op_type not in ("ADD", "UPDATE", "DELETE"):
             return
-        global _sor_mirror_warned
+        key = engram.get("key")
+        if op_type != "DELETE" and self._sor_pending is not None:
+            # Inside commit_ops: buffered, flushed as one capture_many.
+            self._sor_pending.append(self._sor_record(engram, op_type))
+            return
+        # A DELETE may target a key captured earlier in this batch; flush first
+        # so the archive overlay finds its row.
+        self._flush_sor_mirror()
         try:
-            if self._sor_facade is None:
-                from mcp_server_nucleus.memory.facade import MemoryFacade
-
-                self._sor_facade = MemoryFacade(brain_path=self.brain_path, enabled=True)
-            key = engram.get("key")
             if op_type == "DELETE":
                 # Soft-delete → non-destructive overlay-archive of the SoR row.
                 # (If the key was never captured into the SoR — e.g. it was added
                 # while the flag was off — curate() returns ok=False, not an
                 # exception, so this stays a graceful no-op.)
                 if key:
-                    self._sor_facade.curate(key, "archive")
+                    self._mirror_facade().curate(key, "archive")
                 return
             # ADD / UPDATE → capture the (new) engram version into the SoR. The
             # same key means an UPDATE lands as a new SoR row sharing the key,
@@ -745,36 +709,67 @@ class MemoryPipeline:
             #     the mirror. The facade itself already wraps ``sink.index()`` best-
             #     effort (facade.capture), so an index failure never breaks the
             #     primary write — which has already completed before this mirror.
-            sink = self._sor_vector_sink
-            if sink is None:
-                try:
-                    from .vector_store import VectorStore
-
-                    sink = self._sor_vector_sink = VectorStore()
-                except Exception:  # noqa: BLE001 — derived-index sink is best-effort
-                    sink = None
-            self._sor_facade.capture(
-                surface=engram.get("source_agent", "unknown"),
-                payload=engram.get("value", ""),
-                kind=engram.get("context", "note"),
-                tags=None,
-                ts=engram.get("timestamp"),
-                key=key,
-                meta={
-                    "op_type": op_type,
-                    "intensity": engram.get("intensity"),
-                    "version": engram.get("version"),
-                },
-                vector_sink=sink,
+            self._mirror_facade().capture(
+                **self._sor_record(engram, op_type), vector_sink=self._mirror_sink()
             )
         except Exception as exc:  # noqa: BLE001 — fault isolation is the whole point
-            if not _sor_mirror_warned:
-                logger.warning(
-                    "ADUN SoR mirror failed; primary write_engram unaffected "
-                    "(suppressing further mirror warnings this process): %s",
-                    exc,
-                )
-                _sor_mirror_warned = True
+            self._warn_mirror_failed(exc)
+
+    def _mirror_facade(self):
+        if self._sor_facade is None:
+            from mcp_server_nucleus.memory.facade import MemoryFacade
+
+            self._sor_facade = MemoryFacade(brain_path=self.brain_path, enabled=True)
+        return self._sor_facade
+
+    def _mirror_sink(self):
+        sink = self._sor_vector_sink
+        if sink is None:
+            try:
+                from .vector_store import VectorStore
+
+                sink = self._sor_vector_sink = VectorStore()
+            except Exception:  # noqa: BLE001 — derived-index sink is best-effort
+                sink = None
+        return sink
+
+    @staticmethod
+    def _sor_record(engram: Dict, op_type: str) -> Dict:
+        return {
+            "surface": engram.get("source_agent", "unknown"),
+            "payload": engram.get("value", ""),
+            "kind": engram.get("context", "note"),
+            "tags": None,
+            "ts": engram.get("timestamp"),
+            "key": engram.get("key"),
+            "meta": {
+                "op_type": op_type,
+                "intensity": engram.get("intensity"),
+                "version": engram.get("version"),
+            },
+        }
+
+    def _flush_sor_mirror(self) -> None:
+        """Write the buffered ADD/UPDATE mirror records in one SoR transaction."""
+        pending = self._sor_pending
+        if not pending:
+            return
+        self._sor_pending = []
+        try:
+            self._mirror_facade().capture_many(pending, vector_sink=self._mirror_sink())
+        except Exception as exc:  # noqa: BLE001 — same fault isolation as the single mirror
+            self._warn_mirror_failed(exc)
+
+    @staticmethod
+    def _warn_mirror_failed(exc: Exception) -> None:
+        global _sor_mirror_warned
+        if not _sor_mirror_warned:
+            logger.warning(
+                "ADUN SoR mirror failed; primary write_engram unaffected "
+                "(suppressing further mirror warnings this process): %s",
+                exc,
+            )
+            _sor_mirror_warned = True
 
     # ── MAINTENANCE ────────────────────────────────────────────────
 
@@ -791,43 +786,16 @@ class MemoryPipeline:
         if not self.ledger_path.exists():
             return {"error": "Ledger file not found", "path": str(self.ledger_path)}
 
-        # Read all lines (including deleted ones — we preserve those as-is)
-        all_entries = []
-        with open(self.ledger_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        all_entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-
+        # Read all lines (including tombstones — a key whose latest record is a
+        # tombstone keeps exactly that tombstone).
+        from .engram_ledger import is_tombstone, iter_records, resolve_latest
+        all_entries = list(iter_records(self.ledger_path))
         total_before = len(all_entries)
 
-        # Separate deleted and active entries
-        deleted = [e for e in all_entries if e.get("deleted", False)]
-        active = [e for e in all_entries if not e.get("deleted", False)]
-
-        # Deduplicate active entries by key
-        seen: Dict[str, Dict] = {}
-        keyless = []
-        for e in active:
-            key = e.get("key")
-            if not key:
-                keyless.append(e)
-                continue
-            existing = seen.get(key)
-            if existing is None:
-                seen[key] = e
-            else:
-                e_ver = e.get("version", 1)
-                ex_ver = existing.get("version", 1)
-                if e_ver > ex_ver:
-                    seen[key] = e
-                elif e_ver == ex_ver:
-                    e_ts = e.get("timestamp", "")
-                    ex_ts = existing.get("timestamp", "")
-                    if e_ts > ex_ts:
-                        seen[key] = e
+        resolved = resolve_latest(all_entries)
+        seen = {k: e for k, e in resolved["by_key"].items() if not is_tombstone(e)}
+        deleted = [e for e in resolved["by_key"].values() if is_tombstone(e)]
+        keyless = resolved["keyless"]
 
         deduped_active = list(seen.values()) + keyless
         total_after = len(deduped_active) + len(deleted)
@@ -915,8 +883,12 @@ class MemoryPipeline:
         # If explicit key is given, use it for the first atom
         if key and atoms:
             # Check if this key already exists
-            existing = self._load_active_engrams()
-            existing_match = next((e for e in existing if e.get("key") == key), None)
+            index = self._similarity_index()
+            if index is not None:
+                existing_match = index.get(key)
+            else:
+                existing = self._load_active_engrams()
+                existing_match = next((e for e in existing if e.get("key") == key), None)
 
             if existing_match:
                 if operation and operation.lower() == "update":
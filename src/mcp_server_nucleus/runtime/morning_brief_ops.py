@@ -35,18 +35,13 @@ def _find_engram_by_key(brain: Path, key: str) -> Optional[dict]:
     ledger = brain / "engrams" / "ledger.jsonl"
     if not ledger.exists():
         return None
-    result = None
     try:
-        with open(ledger, "r") as f:
-            for line in f:
-                try:
-                    e = json.loads(line.strip())
-                    if e.get("key") == key and not e.get("deleted", False):
-                        result = e
-                except (json.JSONDecodeError, KeyError):
-                    continue
+        from .engram_ledger import is_tombstone, iter_records, resolve_latest
+        result = resolve_latest(e for e in iter_records(ledger) if e.get("key") == key)["by_key"].get(key)
     except OSError:
         return None
+    if result is None or is_tombstone(result):
+        return None
     return result
 
 
@@ -316,34 +311,29 @@ def _retrieve_top_engrams(brain: Path, limit: int = 10) -> Dict:
     engrams = []
     now = datetime.now()
 
-    with open(engram_path, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                try:
-                    e = json.loads(line)
-                    if e.get("deleted", False) or e.get("quarantined", False):
-                        continue
-
-                    # Compute score: intensity × 2 + recency_bonus + context_bonus
-                    intensity = e.get("intensity", 5)
-                    score = intensity * 2
-
-                    # Recency bonus
-                    ts = e.get("timestamp", "")
-                    if ts:
-                        try:
-                            age = now - datetime.fromisoformat(ts)
-                            if age.days < 7:
-                                score += 2
-                            elif age.days < 30:
-                                score += 1
-                        except (ValueError, TypeError):
-                            pass
-
-                    e["_score"] = score
-                    engrams.append(e)
-                except json.JSONDecodeError:
-                    continue
+    from .engram_ledger import load_live_engrams
+    for e in load_live_engrams(engram_path):
+        if e.get("quarantined", False):
+            continue
+
+        # Compute score: intensity × 2 + recency_bonus + context_bonus
+        intensity = e.get("intensity", 5)
+        score = intensity * 2
+
+        # Recency bonus
+        ts = e.get("timestamp", "")
+        if ts:
+            try:
+                age = now - datetime.fromisoformat(ts)
+                if age.days < 7:
+                    score += 2
+                elif age.days < 30:
+                    score += 1
+            except (ValueError, TypeError):
+                pass
+
+        e["_score"] = score
+        engrams.append(e)
 
     # Sort by score DESC, take top N
     engrams.sort(key=lambda x: x.get("_score", 0), reverse=True)
@@ -409,6 +399,9 @@ def _retrieve_tasks(brain: Path) -> Dict:
 
 def _retrieve_yesterday(brain: Path) -> Dict:
     """Retrieve recent activity from the event log (last 24h)."""
+    from .event_ops import EVENT_FLUSH_ON_READ_S, flush_events
+    # Bounded: events still queued by _emit_event land first.
+    flush_events(timeout=EVENT_FLUSH_ON_READ_S)
     events_path = brain / "ledger" / "events.jsonl"
     if not events_path.exists():
         return {"events": [], "count": 0, "message": "No events logged yet."}
@@ -418,29 +411,33 @@ def _retrieve_yesterday(brain: Path) -> Dict:
     cutoff = datetime.now() - timedelta(hours=lookback_hours)
     recent = []
 
-    with open(events_path, "r", encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                try:
-                    ev = json.loads(line)
-                    ts = ev.get("timestamp", "")
-                    if ts:
-                        try:
-                            event_time = datetime.fromisoformat(ts)
-                            if event_time >= cutoff:
-                                recent.append({
-                                    "event": ev.get("event_type", ev.get("event", "?")),
-                                    "emitter": ev.get("emitter", "?"),
-                                    "time": ts,
-                                    "detail": str(ev.get("data", ev.get("metadata", "")))[:100],
-                                })
-                        except (ValueError, TypeError):
-                            pass
-                except json.JSONDecodeError:
-                    continue
+    # The log is appended in time order: walk it backwards from EOF and stop
+    # at the first event older than the cutoff instead of parsing all of it.
+    from .event_tail import iter_reverse_lines
 
-    # Most recent first
-    recent.reverse()
+    for _, line in iter_reverse_lines(events_path):
+        if not line.strip():
+            continue
+        try:
+            ev = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        ts = ev.get("timestamp", "")
+        if not ts:
+            continue
+        try:
+            event_time = datetime.fromisoformat(ts)
+            if event_time < cutoff:
+                break
+        except (ValueError, TypeError):
+            continue
+        # Most recent first
+        recent.append({
+            "event": ev.get("event_type", ev.get("event", "?")),
+            "emitter": ev.get("emitter", "?"),
+            "time": ts,
+            "detail": str(ev.get("data", ev.get("metadata", "")))[:100],
+        })
 
     return {
         "events": recent[:15],
@@ -33,17 +33,12 @@ def _load_strategy_context(brain: Path) -> list:
     cutoff = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
     strategy = []
     try:
-        with open(ledger_path, "r") as f:
-            for line in f:
-                try:
-                    e = json.loads(line.strip())
-                    if (e.get("context") == "Strategy"
-                        and e.get("intensity", 0) >= 7
-                        and not e.get("deleted", False)
-                        and e.get("timestamp", "") > cutoff):
-                        strategy.append(e)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+        from .engram_ledger import load_live_engrams
+        for e in load_live_engrams(ledger_path):
+            if (e.get("context") == "Strategy"
+                and e.get("intensity", 0) >= 7
+                and e.get("timestamp", "") > cutoff):
+                strategy.append(e)
     except OSError:
         pass
     return strategy
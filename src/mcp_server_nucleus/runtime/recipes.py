@@ -307,37 +307,27 @@ def install_recipe(brain_path: Path, recipe_data: Dict[str, Any]) -> Dict[str, A
     # 1. Write engram templates to the canonical engram ledger (JSONL)
     engrams = recipe_data.get("engram_templates", [])
     if engrams:
+        from .engram_ledger import append_records, load_live_engrams
         ledger_file = brain_path / "engrams" / "ledger.jsonl"
-        ledger_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Read existing keys to avoid duplicates
-        existing_keys = set()
-        if ledger_file.exists():
-            with open(ledger_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            existing_keys.add(json.loads(line).get("key", ""))
-                        except Exception:
-                            pass
-
-        new_count = 0
-        with open(ledger_file, "a", encoding="utf-8") as f:
-            for eng in engrams:
-                if eng["key"] not in existing_keys:
-                    record = {
-                        "key": eng["key"],
-                        "value": eng["value"],
-                        "context": eng.get("context", "Feature"),
-                        "intensity": eng.get("intensity", 5),
-                        "version": 1,
-                        "timestamp": now,
-                        "source": f"recipe:{recipe_name}",
-                    }
-                    f.write(json.dumps(record) + "\n")
-                    new_count += 1
-
-        summary["engrams_written"] = new_count
+
+        # Skip keys that are already live (deleted keys may be reinstalled)
+        existing_keys = {e.get("key", "") for e in load_live_engrams(ledger_file)}
+
+        records = []
+        for eng in engrams:
+            if eng["key"] not in existing_keys:
+                records.append({
+                    "key": eng["key"],
+                    "value": eng["value"],
+                    "context": eng.get("context", "Feature"),
+                    "intensity": eng.get("intensity", 5),
+                    "version": 1,
+                    "timestamp": now,
+                    "source": f"recipe:{recipe_name}",
+                })
+                existing_keys.add(eng["key"])
+
+        summary["engrams_written"] = append_records(brain_path, records)
 
     # 2. Create scheduled tasks
     tasks = recipe_data.get("scheduled_tasks", [])
@@ -474,28 +464,18 @@ def uninstall_recipe(brain_path: Path, recipe_name: str) -> Dict[str, Any]:
         "tasks_removed": 0,
     }
 
-    # Remove engrams sourced from this recipe (mark deleted in JSONL ledger)
+    # Remove engrams sourced from this recipe (append tombstones to the ledger)
     ledger_file = brain_path / "engrams" / "ledger.jsonl"
     if ledger_file.exists():
         try:
+            from .engram_ledger import append_records, load_live_engrams, make_tombstone
             source_tag = f"recipe:{recipe_name}"
-            lines = []
-            removed = 0
-            with open(ledger_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        e = json.loads(line)
-                        if e.get("source") == source_tag:
-                            e["deleted"] = True
-                            removed += 1
-                        lines.append(json.dumps(e) + "\n")
-                    except json.JSONDecodeError:
-                        lines.append(line)
-            with open(ledger_file, "w", encoding="utf-8") as f:
-                f.writelines(lines)
-            summary["engrams_removed"] = removed
+            tombstones = [
+                make_tombstone(e["key"])
+                for e in load_live_engrams(ledger_file)
+                if e.get("key") and e.get("source") == source_tag
+            ]
+            summary["engrams_removed"] = append_records(brain_path, tombstones)
         except Exception:
             pass
 
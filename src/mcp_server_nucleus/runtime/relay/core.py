@@ -88,6 +88,64 @@ def _is_shipped_artifact_anchored(ref: str, *, repo: Optional[str] = None) -> bo
     )
 
 
+# ── Relay index hooks (runtime/relay/index.py) ───────────────────
+#
+# The index is a cache over the bucket files: every helper here degrades to
+# the glob path (return None) or a no-op on any index error, and writes the
+# index only after the JSON file itself has been written.
+
+
+def _relay_index():
+    try:
+        from .index import get_relay_index
+        return get_relay_index()
+    except Exception as exc:
+        logger.debug("relay index unavailable: %s", exc)
+        return None
+
+
+def _indexed_paths(dirs: List[Path], **filters: Any):
+    """Bucket files in glob-reader order from the index, or None to glob."""
+    index = _relay_index()
+    if index is None:
+        return None
+    try:
+        return (row.path for row in index.iter_rows(dirs, **filters))
+    except Exception as exc:
+        logger.debug("relay index query failed, scanning buckets: %s", exc)
+        return None
+
+
+def _index_record(path: Path, msg: Dict[str, Any]) -> None:
+    index = _relay_index()
+    if index is None:
+        return
+    try:
+        index.record(path, msg)
+    except Exception as exc:
+        # Reconciliation picks the file up on a later query.
+        logger.debug("relay index record skipped for %s: %s", path.name, exc)
+
+
+def _notify_waiters(relay_dir: Path) -> None:
+    """Wake relay_wait / relay_listen / long-poll waiters on ``relay_dir``."""
+    try:
+        from .hub import notify_bucket
+        notify_bucket(relay_dir)
+    except Exception as exc:
+        logger.debug("relay hub notify skipped: %s", exc)
+
+
+def _index_forget(paths: List[Path]) -> None:
+    index = _relay_index()
+    if index is None or not paths:
+        return
+    try:
+        index.forget(paths)
+    except Exception as exc:
+        logger.debug("relay index forget skipped: %s", exc)
+
+
 # ── Core relay operations ─────────────────────────────────────────
 
 def _find_message_by_id(recipient: str, msg_id: str, force_fs: bool = False) -> Optional[Path]:
@@ -103,6 +161,12 @@ def _find_message_by_id(recipient: str, msg_id: str, force_fs: bool = False) ->
         return None
     if not relay_dir.exists():
         return None
+    indexed = _indexed_paths([relay_dir], message_id=msg_id, newest_first=False)
+    if indexed is not None:
+        for path in indexed:
+            if path.exists():
+                return path
+        return None
     # Filename match is a hint only — confirm the embedded id before declaring
     # a duplicate, else a coincidental filename tail causes a silent drop.
     hits = list(relay_dir.glob(f"*_{msg_id}.json")) + list(relay_dir.glob(f"{msg_id}.json"))
@@ -524,6 +588,8 @@ def relay_post(
     tmp_path = relay_dir / f".{filename}.tmp"
     tmp_path.write_text(json.dumps(message, indent=2, default=str), encoding="utf-8")
     os.replace(tmp_path, path)
+    _index_record(path, message)
+    _notify_waiters(relay_dir)
 
     # Implicit ACK on Reply: mark parent message as read by the sender
     if in_reply_to:
@@ -612,7 +678,9 @@ def relay_inbox(
                 "task_id": task_id,
                 "unread_only": False,
             }
-        candidates = sorted(comment_dir.glob("*.json"), key=lambda p: p.name, reverse=True)
+        candidates = _indexed_paths([comment_dir])
+        if candidates is None:
+            candidates = sorted(comment_dir.glob("*.json"), key=lambda p: p.name, reverse=True)
         messages = []
         for f in candidates:
             if len(messages) >= limit:
@@ -653,11 +721,15 @@ def relay_inbox(
 
     dirs = _iter_inbox_dirs(me)
 
-    # Collect candidate files across all dirs (main dual-reads legacy bucket)
-    candidates: List[Path] = []
-    for d in dirs:
-        candidates.extend(d.glob("*.json"))
-    candidates.sort(key=lambda p: p.name, reverse=True)
+    # Candidate files across all dirs (main dual-reads legacy bucket), newest
+    # first. The index pre-applies the unread filter so only candidates are
+    # parsed; the checks below still run against each parsed file.
+    candidates = _indexed_paths(dirs, unread_only=unread_only, session_id=session_id)
+    if candidates is None:
+        candidates = []
+        for d in dirs:
+            candidates.extend(d.glob("*.json"))
+        candidates.sort(key=lambda p: p.name, reverse=True)
 
     # ADR-0042 D3 (flag-gated): compute the reader's project once so the
     # (project, role) predicate can drop cross-project envelopes that share this
@@ -834,6 +906,13 @@ def relay_context_sync(
     }
 
 
+def _message_id_candidates(directory: Path, message_id: str):
+    """Files in ``directory`` that may carry ``message_id`` (all of them
+    when the index is off)."""
+    indexed = _indexed_paths([directory], message_id=message_id, newest_first=False)
+    return indexed if indexed is not None else directory.glob("*.json")
+
+
 def relay_read(
     message_id: str,
     recipient: Optional[str] = None,
@@ -865,7 +944,7 @@ def relay_read(
         }
 
     for d in _iter_inbox_dirs(me):
-        for f in d.glob("*.json"):
+        for f in _message_id_candidates(d, message_id):
             try:
                 msg = _parse_relay_message(f)
                 if msg.get("id") == message_id:
@@ -893,6 +972,7 @@ def relay_read(
                         msg["read_by_sessions"] = read_by_sessions
                     
                     f.write_text(json.dumps(msg, indent=2, default=str), encoding="utf-8")
+                    _index_record(f, msg)
 
                     # Project to engram
                     try:
@@ -964,7 +1044,7 @@ def relay_ack(
 
     # Dual-read: main can ack messages that landed in legacy claude_code/ bucket
     for d in _iter_inbox_dirs(me):
-        for f in d.glob("*.json"):
+        for f in _message_id_candidates(d, message_id):
             try:
                 msg = _parse_relay_message(f)
                 if msg.get("id") == message_id:
@@ -989,6 +1069,7 @@ def relay_ack(
                         read_by_sessions[session_id] = now_iso
                         msg["read_by_sessions"] = read_by_sessions
                     f.write_text(json.dumps(msg, indent=2, default=str), encoding="utf-8")
+                    _index_record(f, msg)
                     # Metrics: count acked messages
                     try:
                         from ..prometheus import inc_relay_message
@@ -1030,6 +1111,36 @@ def relay_ack(
     }
 
 
+def _indexed_bucket_status(index, directory: Path, spine_on: bool,
+                           my_project: Optional[str],
+                           reader_bucket: Optional[str]) -> Optional[Dict[str, Any]]:
+    """One ``relay_status`` mailbox entry from index metadata, or None to scan."""
+    if index is None:
+        return None
+    try:
+        if not spine_on:
+            return index.bucket_stats(directory)
+        total = unread = 0
+        latest = None
+        for row in index.iter_rows([directory], include_invalid=True):
+            if row.valid:
+                surface, warn = _project_visible(row.project, my_project, reader_bucket)
+                if warn:
+                    _warn_legacy_untagged(row.id)
+                if not surface:
+                    continue
+                if not row.read:
+                    unread += 1
+                created = row.created_at or ""
+                if latest is None or created > latest:
+                    latest = created
+            total += 1
+        return {"total": total, "unread": unread, "latest_message_at": latest}
+    except Exception as exc:
+        logger.debug("relay index status failed for %s: %s", directory.name, exc)
+        return None
+
+
 def relay_status(force_fs: bool = False) -> Dict[str, Any]:
     """Get relay status across all session types.
 
@@ -1099,6 +1210,7 @@ def relay_status(force_fs: bool = False) -> Dict[str, Any]:
     # byte-identical to today.
     _spine_on = _project_spine_on()
     _my_proj = _reader_project() if _spine_on else None
+    index = _relay_index()
 
     for d in sorted(base.iterdir()):
         if not d.is_dir():
@@ -1111,6 +1223,13 @@ def relay_status(force_fs: bool = False) -> Dict[str, Any]:
             resolve_canonical_inbox_name(recipient) if _spine_on else None
         )
 
+        counts = _indexed_bucket_status(index, d, _spine_on, _my_proj, _reader_bucket)
+        if counts is not None:
+            status["mailboxes"][recipient] = counts
+            status["total_messages"] += counts["total"]
+            status["total_unread"] += counts["unread"]
+            continue
+
         for f in d.glob("*.json"):
             try:
                 msg = _parse_relay_message(f)
@@ -1171,6 +1290,7 @@ def relay_clear(
                     msg_time = datetime.fromisoformat(created.replace("Z", "+00:00")).timestamp()
                     if msg_time < cutoff:
                         f.unlink()
+                        _index_forget([f])
                         deleted += 1
             except Exception:
                 errors += 1
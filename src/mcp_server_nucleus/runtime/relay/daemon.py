@@ -91,6 +91,9 @@ class _PollDaemon:
             ]
 
         relay_dir = _get_relay_dir(self.recipient)
+        indexed = self._scan_indexed(relay_dir)
+        if indexed is not None:
+            return indexed
         pending = []
         try:
             for fpath in sorted(relay_dir.glob("*.json")):
@@ -120,6 +123,30 @@ class _PollDaemon:
             logger.debug(f"relay_poll scan error for {self.recipient}: {exc}")
         return pending
 
+    def _scan_indexed(self, relay_dir: Path) -> Optional[List[Dict[str, Any]]]:
+        """``_scan`` from the relay index (no file parsing), or None to glob."""
+        try:
+            from .index import get_relay_index
+            index = get_relay_index()
+            if index is None:
+                return None
+            rows = list(index.iter_rows([relay_dir], unread_only=True, newest_first=False))
+        except Exception as exc:
+            logger.debug(f"relay_poll index scan failed for {self.recipient}: {exc}")
+            return None
+        return [
+            {
+                "relay_id": row.id or row.stem,
+                "subject": row.subject or "",
+                "from": row.sender or "",
+                "priority": row.priority or "normal",
+                "in_reply_to": row.in_reply_to,
+            }
+            for row in rows
+            if row.file != _POLL_SIGNAL_FILENAME
+            and not (self.session_id and row.to_session_id and row.to_session_id != self.session_id)
+        ]
+
     def _write_signal(self, pending: List[Dict[str, Any]]) -> None:
         signal = {
             "running": True,
@@ -155,6 +182,17 @@ class _PollDaemon:
         logger.info(f"relay_poll daemon stopped for bucket '{self.recipient}'")
 
 
+def _notify_relay_waiters(path: str) -> None:
+    """Bump the hub generation of the bucket ``path`` landed in."""
+    if os.path.basename(path) == _POLL_SIGNAL_FILENAME:
+        return  # Rewritten by the poll daemon every cycle; not a message
+    try:
+        from .hub import notify_bucket
+        notify_bucket(os.path.dirname(path))
+    except Exception:
+        pass  # Waiters fall back to their poll interval
+
+
 class RelayWatchHandler:
     """Watches .brain/relay/ for new message files.
 
@@ -187,6 +225,7 @@ class RelayWatchHandler:
         src = str(event.src_path)
         if not src.endswith(".json") or src.endswith("pending.json") or src.endswith(".tmp"):
             return
+        _notify_relay_waiters(src)
         if src in self._seen_files:
             return
         self._seen_files.add(src)
@@ -199,11 +238,20 @@ class RelayWatchHandler:
         src = str(event.src_path)
         if not src.endswith(".json") or src.endswith("pending.json") or src.endswith(".tmp"):
             return
+        _notify_relay_waiters(src)
         # Only process if not yet seen (new file written in two steps)
         if src not in self._seen_files:
             self._seen_files.add(src)
             self._on_new_relay_message(Path(src))
 
+    def on_moved(self, event):
+        """Atomic writes (tmp + os.replace) arrive as moves: wake waiters."""
+        if event.is_directory:
+            return
+        dest = str(getattr(event, "dest_path", "") or "")
+        if dest.endswith(".json") and not dest.endswith("pending.json"):
+            _notify_relay_waiters(dest)
+
     def _on_new_relay_message(self, path: Path):
         """Process a newly arrived relay message."""
         import time
@@ -287,6 +335,8 @@ def start_relay_watcher(brain_path: Optional[Path] = None) -> Dict[str, Any]:
                     handler.on_created(event)
                 def on_modified(self, event):
                     handler.on_modified(event)
+                def on_moved(self, event):
+                    handler.on_moved(event)
 
             _relay_observer = Observer()
             _relay_observer.schedule(WatchdogRelay(), str(relay_dir), recursive=True)
@@ -472,12 +522,21 @@ def relay_archive(
 
     # Delete originals after successful archival.
     deleted = 0
+    removed: List[Path] = []
     for f, _ts, _data in to_archive:
         try:
             f.unlink()
             deleted += 1
+            removed.append(f)
         except OSError as exc:
             logger.warning(f"Failed to delete archived relay {f.name}: {exc}")
+    try:
+        from .index import get_relay_index
+        index = get_relay_index(brain)
+        if index is not None:
+            index.forget(removed)
+    except Exception as exc:
+        logger.debug(f"relay_archive: index update skipped: {exc}")
 
     return {
         "recipient": me,
@@ -597,6 +656,29 @@ def relay_poll_status(recipient: str) -> Dict[str, Any]:
     }
 
 
+def _indexed_rows(relay_dir: Path, **filters: Any) -> Optional[List[Any]]:
+    """Index rows in ``relay_dir`` (oldest first), or None when the relay
+    index is unavailable."""
+    try:
+        from .index import get_relay_index
+        index = get_relay_index()
+        if index is None:
+            return None
+        return [
+            row for row in index.iter_rows([relay_dir], newest_first=False, **filters)
+            if row.file != _POLL_SIGNAL_FILENAME
+        ]
+    except Exception as exc:
+        logger.debug(f"relay index lookup failed: {exc}")
+        return None
+
+
+def _indexed_replies(relay_dir: Path, in_reply_to: str) -> Optional[List[Any]]:
+    """Index rows in ``relay_dir`` replying to ``in_reply_to`` (oldest first),
+    or None when the relay index is unavailable."""
+    return _indexed_rows(relay_dir, in_reply_to=in_reply_to)
+
+
 def relay_wait(
     in_reply_to: str,
     recipient: str,
@@ -605,8 +687,10 @@ def relay_wait(
 ) -> Dict[str, Any]:
     """Poll recipient's inbox until a reply to `in_reply_to` arrives.
 
-    Blocks synchronously for up to `timeout_s` seconds, polling every
-    `poll_interval_s` seconds. Intended for cross-thread / cross-agent
+    Blocks synchronously for up to `timeout_s` seconds. Wakes as soon as
+    the bucket changes (relay hub: same-process posts, the relay watcher,
+    or the HTTP long-poll); `poll_interval_s` is only the fallback re-scan
+    interval when no notification arrives. Intended for cross-thread / cross-agent
     tandem coordination where one agent posts a relay and needs to wait
     for the other agent's reply before proceeding.
 
@@ -617,7 +701,7 @@ def relay_wait(
         in_reply_to: The relay_id this function waits for a reply to.
         recipient:   The bucket to scan (e.g. 'windsurf', 'claude_code_main').
         timeout_s:   Max seconds to wait before returning timed_out=True.
-        poll_interval_s: Seconds between inbox scans.
+        poll_interval_s: Max seconds between inbox scans without a wake-up.
 
     Returns:
         {found: True,  relay_id: str, subject: str, waited_s: int}
@@ -631,16 +715,30 @@ def relay_wait(
     # branch, which matches replies regardless of read state.
     from ..relay_transport import is_http_mode, read_inbox as _transport_read
 
+    from .hub import bucket_generations, wait_for_change
+
     relay_dir = _get_relay_dir(recipient)
-    deadline = time.monotonic() + timeout_s
+    started = time.monotonic()
+    deadline = started + timeout_s
     waited = 0
+    cursor = None
 
     while True:
-        if is_http_mode():
+        http = is_http_mode()
+        if http:
+            # Long-poll: after the first listing the server holds the GET
+            # until a message lands past `cursor` (servers without cursor
+            # support answer at once and we fall back to sleeping below).
             try:
-                messages = _transport_read(recipient, unread_only=False, limit=200)
+                messages = _transport_read(
+                    recipient, unread_only=False, limit=200,
+                    wait_s=max(deadline - time.monotonic(), 0) if cursor else None,
+                    cursor=cursor,
+                )
+                cursor = getattr(messages, "cursor", None)
             except Exception:
-                messages = []
+                messages, cursor = [], None
+            waited = int(time.monotonic() - started)
             for m in messages:
                 if m.get("in_reply_to") == in_reply_to:
                     return {
@@ -651,8 +749,21 @@ def relay_wait(
                         "waited_s": waited,
                     }
         else:
+            # Generations before the scan: a reply landing mid-scan still
+            # wakes the wait below.
+            generations = bucket_generations([relay_dir])
+            # Index first (None = unavailable → scan the bucket as before).
+            replies = _indexed_replies(relay_dir, in_reply_to)
+            if replies:
+                return {
+                    "found": True,
+                    "relay_id": replies[0].id or replies[0].stem,
+                    "subject": replies[0].subject or "",
+                    "from": replies[0].sender or "",
+                    "waited_s": waited,
+                }
             try:
-                for fpath in sorted(relay_dir.glob("*.json")):
+                for fpath in (sorted(relay_dir.glob("*.json")) if replies is None else []):
                     if fpath.parent.name in ("processed", "acks"):
                         continue
                     try:
@@ -672,11 +783,16 @@ def relay_wait(
 
         remaining = deadline - time.monotonic()
         if remaining <= 0:
-            return {"found": False, "timed_out": True, "waited_s": waited}
+            return {"found": False, "timed_out": True, "waited_s": int(time.monotonic() - started)}
 
-        sleep_for = min(poll_interval_s, remaining)
-        time.sleep(sleep_for)
-        waited += int(sleep_for)
+        # Block on the relay hub: relay_post in this process and the relay
+        # watcher (other writers) wake us as soon as the bucket changes;
+        # poll_interval_s is only the fallback when neither fires.
+        if not http:
+            wait_for_change([relay_dir], generations, min(poll_interval_s, remaining))
+        elif cursor is None:
+            time.sleep(min(poll_interval_s, remaining))
+        waited = int(time.monotonic() - started)
 
 
 def relay_listen(
@@ -699,8 +815,9 @@ def relay_listen(
     The function NEVER raises on timeout — it returns
     {found: False, call_again: True, known_ids: [...]} so the caller can
     retry in the next turn, incrementing attempt each time.
-    Adaptive interval: actual poll frequency = min(poll_s * attempt, 30s)
-    so long-running tasks get progressively gentler polling.
+    Arrivals wake the call immediately via the relay hub (see relay_wait).
+    Adaptive fallback interval: min(poll_s * attempt, 30s) between re-scans
+    when nothing notifies, so long-running tasks get progressively gentler polling.
 
     Args:
         recipient:    Bucket to watch (e.g. 'windsurf').
@@ -722,6 +839,8 @@ def relay_listen(
                   known_ids: [str, ...], next_attempt: int, next_poll_s: int,
                   hint: "call relay_listen again with known_ids=... attempt=..."}
     """
+    from .hub import bucket_generations, wait_for_change
+
     effective_poll = min(poll_s * max(attempt, 1), 30)
     relay_dir = _get_relay_dir(recipient)
 
@@ -743,25 +862,39 @@ def relay_listen(
             except Exception:
                 pass
         else:
-            try:
-                for fpath in relay_dir.glob("*.json"):
-                    if fpath.name == _POLL_SIGNAL_FILENAME:
-                        continue
-                    if fpath.parent.name in ("processed", "acks"):
-                        continue
-                    seen.add(fpath.stem)
-            except Exception:
-                pass
+            rows = _indexed_rows(relay_dir, include_invalid=True)
+            if rows is not None:
+                seen.update(row.stem for row in rows)
+            else:
+                try:
+                    for fpath in relay_dir.glob("*.json"):
+                        if fpath.name == _POLL_SIGNAL_FILENAME:
+                            continue
+                        if fpath.parent.name in ("processed", "acks"):
+                            continue
+                        seen.add(fpath.stem)
+                except Exception:
+                    pass
 
-    deadline = time.monotonic() + window_s
+    started = time.monotonic()
+    deadline = started + window_s
     waited = 0
+    cursor = None
 
     while True:
-        if is_http_mode():
+        http = is_http_mode()
+        if http:
+            # Long-poll past `cursor` once we hold a listing (see relay_wait).
             try:
-                messages = _transport_read(recipient, unread_only=True, limit=200)
+                messages = _transport_read(
+                    recipient, unread_only=True, limit=200,
+                    wait_s=max(deadline - time.monotonic(), 0) if cursor else None,
+                    cursor=cursor,
+                )
+                cursor = getattr(messages, "cursor", None)
             except Exception:
-                messages = []
+                messages, cursor = [], None
+            waited = int(time.monotonic() - started)
             for m in messages:
                 mid = m.get("id", "")
                 if not mid or mid in seen:
@@ -785,8 +918,42 @@ def relay_listen(
                     "recipient": recipient,
                 }
         else:
+            generations = bucket_generations([relay_dir])
+            # Index first: only unread, parseable arrivals are candidates, so
+            # the one surfaced is the only file parsed (for its context).
+            rows = _indexed_rows(relay_dir, unread_only=True)
+            for row in rows or []:
+                if row.stem in seen:
+                    continue
+                if in_reply_to and row.in_reply_to != in_reply_to:
+                    seen.add(row.stem)
+                    continue
+                try:
+                    data = json.loads(row.path.read_text(encoding="utf-8"))
+                except Exception:
+                    seen.add(row.stem)
+                    continue
+                # A stale index row can lag an in-place relay_read; the
+                # payload on disk is authoritative, as in the glob scan.
+                if data.get("read") is True:
+                    seen.add(row.stem)
+                    continue
+                return {
+                    "found": True,
+                    "relay": {
+                        "relay_id": data.get("id", row.stem),
+                        "subject": data.get("subject", ""),
+                        "from": data.get("from", ""),
+                        "priority": data.get("priority", "normal"),
+                        "in_reply_to": data.get("in_reply_to"),
+                        "context": data.get("context", {}),
+                        "is_convergence": bool(data.get("context", {}).get("convergence")),
+                    },
+                    "waited_s": waited,
+                    "recipient": recipient,
+                }
             try:
-                for fpath in sorted(relay_dir.glob("*.json")):
+                for fpath in (sorted(relay_dir.glob("*.json")) if rows is None else []):
                     if fpath.name == _POLL_SIGNAL_FILENAME:
                         continue
                     if fpath.parent.name in ("processed", "acks"):
@@ -828,7 +995,7 @@ def relay_listen(
             return {
                 "found": False,
                 "call_again": True,
-                "waited_s": waited,
+                "waited_s": int(time.monotonic() - started),
                 "recipient": recipient,
                 "known_ids": list(seen),
                 "next_attempt": attempt + 1,
@@ -840,9 +1007,12 @@ def relay_listen(
                 ),
             }
 
-        sleep_for = min(effective_poll, remaining)
-        time.sleep(sleep_for)
-        waited += int(sleep_for)
+        # Hub wake-up on arrival; effective_poll is the fallback interval.
+        if not http:
+            wait_for_change([relay_dir], generations, min(effective_poll, remaining))
+        elif cursor is None:
+            time.sleep(min(effective_poll, remaining))
+        waited = int(time.monotonic() - started)
 
 
 
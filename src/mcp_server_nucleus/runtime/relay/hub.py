@@ -0,0 +1,110 @@
+"""Relay notification hub — wake mailbox waiters when a bucket changes.
+
+``relay_wait``, ``relay_listen`` and the HTTP long-poll on
+``GET /relay/{recipient}`` used to sleep a fixed interval between bucket
+scans, so a reply was noticed up to ``poll_interval_s`` late. They now block
+on this hub instead: every bucket directory has a generation counter, and a
+waiter records the generations of the buckets it watches, scans, then waits
+until one of them moves (or its poll interval runs out, which keeps the old
+behaviour as the fallback).
+
+Generations are bumped by:
+  * ``relay_post`` in this process, right after the message file is in
+    place — same-process handoffs (and HTTP-mode posts served here) wake at
+    once;
+  * ``RelayWatchHandler`` for every ``*.json`` created, modified or renamed
+    into a bucket — writes by other processes wake waiters as soon as the
+    watchdog observer (started with the MCP server) sees them. Without
+    watchdog those writes are picked up by the fallback poll;
+  * ``rescan_buckets`` when a bucket directory's mtime moved since the last
+    rescan — the HTTP long-poll calls it on every poll tick, since the HTTP
+    app runs no watcher and other processes write buckets directly.
+
+The counters are process-local and only ever compared for equality, so a
+spurious wake-up costs one indexed re-scan and nothing else.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+_cond = threading.Condition()
+_generations: Dict[str, int] = {}
+# Directory mtimes seen by ``rescan_buckets`` (None = directory missing).
+_dir_mtimes: Dict[str, Optional[int]] = {}
+
+
+def _key(directory: PathLike) -> str:
+    return os.path.normcase(os.path.realpath(os.fspath(directory)))
+
+
+def notify_bucket(directory: PathLike) -> None:
+    """Record a change in ``directory`` and wake everyone waiting on it."""
+    key = _key(directory)
+    with _cond:
+        _generations[key] = _generations.get(key, 0) + 1
+        _cond.notify_all()
+
+
+def bucket_generations(dirs: Iterable[PathLike]) -> Tuple[int, ...]:
+    """Current generations of ``dirs`` — pass to ``wait_for_change``."""
+    keys = [_key(d) for d in dirs]
+    with _cond:
+        return tuple(_generations.get(k, 0) for k in keys)
+
+
+def wait_for_change(
+    dirs: Iterable[PathLike],
+    since: Tuple[int, ...],
+    timeout: Optional[float],
+) -> bool:
+    """Block until a generation of ``dirs`` differs from ``since``.
+
+    Returns True on a change, False when ``timeout`` seconds pass first.
+    """
+    keys = [_key(d) for d in dirs]
+    deadline = None if timeout is None else time.monotonic() + max(timeout, 0.0)
+    with _cond:
+        while tuple(_generations.get(k, 0) for k in keys) == since:
+            if deadline is None:
+                _cond.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _cond.wait(remaining)
+        return True
+
+
+def rescan_buckets(dirs: Iterable[PathLike]) -> bool:
+    """Bump the generation of every dir whose mtime moved since the last rescan.
+
+    One ``stat`` per directory. A message file created or renamed into a
+    bucket by another process changes the directory mtime, so this stands in
+    for the watcher where none runs. The first rescan of a directory only
+    records its mtime. Returns True if any generation was bumped.
+    """
+    seen: Dict[str, Optional[int]] = {}
+    for d in dirs:
+        try:
+            seen[_key(d)] = os.stat(d).st_mtime_ns
+        except OSError:
+            seen[_key(d)] = None
+    changed = False
+    with _cond:
+        for key, mtime in seen.items():
+            if key in _dir_mtimes and _dir_mtimes[key] != mtime:
+                _generations[key] = _generations.get(key, 0) + 1
+                changed = True
+            _dir_mtimes[key] = mtime
+        if changed:
+            _cond.notify_all()
+    return changed
+
+
+__all__ = ["notify_bucket", "bucket_generations", "wait_for_change", "rescan_buckets"]
@@ -0,0 +1,435 @@
+"""Relay mailbox index — SQLite metadata over the per-message JSON files.
+
+The JSON files under ``.brain/relay/<bucket>/`` stay the durable payloads and
+the source of truth; this index (``.brain/relay_index.db``) only records, per
+file, the envelope fields readers filter on (id, recipient, created_at, from,
+in_reply_to, to_session_id, project, priority, subject, the coarse ``read``
+flag) plus the per-session acks from ``read_by_sessions``. Inbox, read/ack
+lookups, status counts, ``relay_wait`` and the poll daemon query it instead of
+globbing a bucket and parsing every file in it.
+
+Writers in this package (``relay_post``, ``relay_ack``/``relay_read``,
+``relay_archive``, ``relay_clear``) update the index in the same call, one
+transaction per message. Everything else that touches a bucket — other
+processes, older builds, hooks that move files to ``processed/`` — is caught
+by reconciliation: before a bucket is queried its directory mtime is compared
+with the one recorded at the last reconcile, and each indexed file's
+(mtime, size) with its row (in-place rewrites such as a foreign ``relay_read``
+leave the directory mtime alone); on a mismatch, or every
+``NUCLEUS_RELAY_INDEX_RECONCILE_S`` seconds (default 30), the bucket is
+re-listed with ``scandir`` and only files whose (mtime, size) changed are
+parsed again.
+
+``NUCLEUS_RELAY_INDEX=0`` turns the index off (every reader globs, as before).
+``rebuild_relay_index()`` / ``nucleus relay reindex`` rebuild it from the files.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..common import get_brain_path, get_sqlite_pool
+
+logger = logging.getLogger("nucleus.relay_index")
+
+INDEX_NAME = "relay_index.db"
+
+_RELAY_INDEX_FLAG = "NUCLEUS_RELAY_INDEX"
+_RELAY_INDEX_FALSY = frozenset({"0", "false", "no", "off"})
+
+DEFAULT_RECONCILE_S = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS relay_messages (
+    bucket        TEXT NOT NULL,
+    file          TEXT NOT NULL,
+    valid         INTEGER NOT NULL,
+    id            TEXT,
+    recipient     TEXT,
+    created_at    TEXT,
+    sender        TEXT,
+    in_reply_to   TEXT,
+    to_session_id TEXT,
+    project       TEXT,
+    priority      TEXT,
+    subject       TEXT,
+    read          INTEGER NOT NULL DEFAULT 0,
+    mtime_ns      INTEGER NOT NULL,
+    size          INTEGER NOT NULL,
+    PRIMARY KEY (bucket, file)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_relay_messages_id ON relay_messages(id);
+CREATE INDEX IF NOT EXISTS idx_relay_messages_reply ON relay_messages(in_reply_to);
+CREATE INDEX IF NOT EXISTS idx_relay_messages_unread ON relay_messages(bucket, read, file);
+
+CREATE TABLE IF NOT EXISTS relay_acks (
+    bucket     TEXT NOT NULL,
+    file       TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    acked_at   TEXT,
+    PRIMARY KEY (bucket, file, session_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS relay_buckets (
+    bucket        TEXT PRIMARY KEY,
+    dir_mtime_ns  INTEGER NOT NULL,
+    reconciled_at REAL NOT NULL
+);
+"""
+
+_COLUMNS = ("bucket", "file", "valid", "id", "recipient", "created_at", "sender",
+            "in_reply_to", "to_session_id", "project", "priority", "subject",
+            "read", "mtime_ns", "size")
+_INSERT = (
+    f"INSERT OR REPLACE INTO relay_messages ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)})"
+)
+
+
+def relay_index_enabled() -> bool:
+    """False iff ``NUCLEUS_RELAY_INDEX`` is set falsy (default on)."""
+    return os.environ.get(_RELAY_INDEX_FLAG, "").strip().lower() not in _RELAY_INDEX_FALSY
+
+
+def _reconcile_s() -> float:
+    try:
+        return float(os.environ.get("NUCLEUS_RELAY_INDEX_RECONCILE_S", DEFAULT_RECONCILE_S))
+    except ValueError:
+        return DEFAULT_RECONCILE_S
+
+
+def _envelope_row(bucket: str, name: str, msg: Optional[Dict[str, Any]],
+                  mtime_ns: int, size: int) -> Tuple:
+    if msg is None:
+        # Unparseable file: counted by relay_status, never surfaced.
+        return (bucket, name, 0, None, None, None, None, None, None, None,
+                None, None, 0, mtime_ns, size)
+    project = msg.get("project")
+    return (
+        bucket, name, 1,
+        msg.get("id") or msg.get("message_id"),
+        msg.get("to"),
+        msg.get("created_at"),
+        msg.get("from"),
+        msg.get("in_reply_to"),
+        msg.get("to_session_id"),
+        # JSON-encoded: a malformed tag (int/list) must round-trip as-is for
+        # the _project_visible predicate.
+        json.dumps(project) if project is not None else None,
+        msg.get("priority"),
+        msg.get("subject"),
+        1 if msg.get("read", False) else 0,
+        mtime_ns, size,
+    )
+
+
+def _ack_rows(bucket: str, name: str, msg: Optional[Dict[str, Any]]) -> List[Tuple]:
+    acks = (msg or {}).get("read_by_sessions") or {}
+    if not isinstance(acks, dict):
+        return []
+    return [(bucket, name, str(sid), str(ts) if ts is not None else None)
+            for sid, ts in acks.items()]
+
+
+class RelayRow:
+    """One indexed envelope (metadata only; ``path`` holds the payload)."""
+
+    __slots__ = ("path", "bucket", "file", "valid", "id", "created_at", "sender",
+                 "in_reply_to", "to_session_id", "_project", "priority", "subject", "read")
+
+    def __init__(self, root: Path, row: Tuple):
+        (self.bucket, self.file, self.valid, self.id, self.created_at, self.sender,
+         self.in_reply_to, self.to_session_id, self._project, self.priority,
+         self.subject, self.read) = row
+        self.path = root / self.bucket / self.file
+
+    @property
+    def project(self) -> Any:
+        return json.loads(self._project) if self._project is not None else None
+
+    @property
+    def stem(self) -> str:
+        return self.file[:-5] if self.file.endswith(".json") else self.file
+
+
+_ROW_SELECT = (
+    "SELECT bucket, file, valid, id, created_at, sender, in_reply_to, "
+    "to_session_id, project, priority, subject, read FROM relay_messages"
+)
+
+
+class RelayIndex:
+    """Per-brain relay index; see the module docstring."""
+
+    def __init__(self, brain_path: Path):
+        self.brain_path = Path(brain_path)
+        self.root = self.brain_path / "relay"
+        self.db_path = self.brain_path / INDEX_NAME
+        self._pool = get_sqlite_pool(self.db_path, schema=SCHEMA)
+        self._reconcile_lock = threading.Lock()
+
+    # ── Keys ───────────────────────────────────────────────────────
+
+    def bucket_of(self, directory: Path) -> str:
+        """Bucket key of a relay directory (``claude_code_main``, ``task_comments/t1``)."""
+        return Path(directory).relative_to(self.root).as_posix()
+
+    # ── Reconciliation ─────────────────────────────────────────────
+
+    def ensure_fresh(self, directories: Iterable[Path]) -> None:
+        for d in directories:
+            self._reconcile(Path(d))
+
+    def _reconcile(self, directory: Path, force: bool = False) -> None:
+        bucket = self.bucket_of(directory)
+        try:
+            dir_mtime = directory.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if not force and dir_mtime is not None:
+            reader = self._pool.reader()
+            row = reader.execute(
+                "SELECT dir_mtime_ns, reconciled_at FROM relay_buckets WHERE bucket = ?",
+                (bucket,),
+            ).fetchone()
+            if (row is not None and row[0] == dir_mtime
+                    and time.time() - row[1] < _reconcile_s()
+                    and not self._files_changed(reader, bucket, directory)):
+                return
+        with self._reconcile_lock:
+            self._rescan(bucket, directory, dir_mtime)
+
+    @staticmethod
+    def _files_changed(reader: Any, bucket: str, directory: Path) -> bool:
+        """True if an indexed file was rewritten in place since it was indexed.
+
+        ``relay_read``/``relay_ack`` rewrite a message without touching the
+        directory mtime; a foreign writer doing so would otherwise leave the
+        ``read`` flag and acks stale until the periodic reconcile.
+        """
+        for name, mtime, size in reader.execute(
+            "SELECT file, mtime_ns, size FROM relay_messages WHERE bucket = ?", (bucket,)
+        ):
+            try:
+                st = os.stat(directory / name)
+            except OSError:
+                return True
+            if (st.st_mtime_ns, st.st_size) != (mtime, size):
+                return True
+        return False
+
+    def _rescan(self, bucket: str, directory: Path, dir_mtime: Optional[int]) -> None:
+        # dir_mtime was read before listing: a file landing mid-scan leaves
+        # the recorded mtime stale, so the next query rescans.
+        on_disk: Dict[str, Tuple[int, int]] = {}
+        if dir_mtime is not None:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name.startswith(".") or not name.endswith(".json"):
+                            continue
+                        try:
+                            if not entry.is_file():
+                                continue
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        on_disk[name] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                dir_mtime = None
+
+        reader = self._pool.reader()
+        indexed = {
+            name: (mtime, size)
+            for name, mtime, size in reader.execute(
+                "SELECT file, mtime_ns, size FROM relay_messages WHERE bucket = ?", (bucket,)
+            )
+        }
+        changed = [name for name, sig in on_disk.items() if indexed.get(name) != sig]
+        gone = [name for name in indexed if name not in on_disk]
+
+        rows: List[Tuple] = []
+        acks: List[Tuple] = []
+        for name in changed:
+            mtime, size = on_disk[name]
+            try:
+                msg = json.loads((directory / name).read_text(encoding="utf-8"))
+                if not isinstance(msg, dict):
+                    msg = None
+            except (OSError, ValueError):
+                msg = None
+            rows.append(_envelope_row(bucket, name, msg, mtime, size))
+            acks.extend(_ack_rows(bucket, name, msg))
+
+        with self._pool.writer() as conn:
+            for name in gone + changed:
+                conn.execute("DELETE FROM relay_acks WHERE bucket = ? AND file = ?", (bucket, name))
+            conn.executemany(
+                "DELETE FROM relay_messages WHERE bucket = ? AND file = ?",
+                [(bucket, name) for name in gone],
+            )
+            conn.executemany(_INSERT, rows)
+            conn.executemany(
+                "INSERT OR REPLACE INTO relay_acks (bucket, file, session_id, acked_at) "
+                "VALUES (?, ?, ?, ?)", acks,
+            )
+            if dir_mtime is None:
+                conn.execute("DELETE FROM relay_buckets WHERE bucket = ?", (bucket,))
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO relay_buckets (bucket, dir_mtime_ns, reconciled_at) "
+                    "VALUES (?, ?, ?)", (bucket, dir_mtime, time.time()),
+                )
+
+    # ── Write hooks ────────────────────────────────────────────────
+
+    def record(self, path: Path, msg: Dict[str, Any]) -> None:
+        """Index ``msg`` as the current content of ``path`` (just written)."""
+        path = Path(path)
+        bucket = self.bucket_of(path.parent)
+        st = path.stat()
+        with self._pool.writer() as conn:
+            conn.execute(_INSERT, _envelope_row(bucket, path.name, msg, st.st_mtime_ns, st.st_size))
+            conn.execute("DELETE FROM relay_acks WHERE bucket = ? AND file = ?", (bucket, path.name))
+            conn.executemany(
+                "INSERT OR REPLACE INTO relay_acks (bucket, file, session_id, acked_at) "
+                "VALUES (?, ?, ?, ?)", _ack_rows(bucket, path.name, msg),
+            )
+
+    def forget(self, paths: Iterable[Path]) -> None:
+        """Drop index rows for deleted/moved files."""
+        keys = [(self.bucket_of(Path(p).parent), Path(p).name) for p in paths]
+        if not keys:
+            return
+        with self._pool.writer() as conn:
+            conn.executemany("DELETE FROM relay_messages WHERE bucket = ? AND file = ?", keys)
+            conn.executemany("DELETE FROM relay_acks WHERE bucket = ? AND file = ?", keys)
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    def iter_rows(
+        self,
+        directories: List[Path],
+        *,
+        unread_only: bool = False,
+        session_id: Optional[str] = None,
+        newest_first: bool = True,
+        in_reply_to: Optional[str] = None,
+        message_id: Optional[str] = None,
+        include_invalid: bool = False,
+    ) -> Iterator[RelayRow]:
+        """Rows of ``directories`` ordered by filename (the glob readers' order).
+
+        ``unread_only`` uses the per-session ack set when ``session_id`` is
+        given, else the coarse ``read`` flag (``relay_inbox`` semantics).
+        """
+        self.ensure_fresh(directories)
+        buckets = [self.bucket_of(d) for d in directories]
+        query = _ROW_SELECT + f" WHERE bucket IN ({', '.join('?' for _ in buckets)})"
+        params: List[Any] = list(buckets)
+        if not include_invalid:
+            query += " AND valid = 1"
+        if unread_only:
+            if session_id:
+                query += (" AND NOT EXISTS (SELECT 1 FROM relay_acks a WHERE a.bucket ="
+                          " relay_messages.bucket AND a.file = relay_messages.file"
+                          " AND a.session_id = ?)")
+                params.append(session_id)
+            else:
+                query += " AND read = 0"
+        if in_reply_to is not None:
+            query += " AND in_reply_to = ?"
+            params.append(in_reply_to)
+        if message_id is not None:
+            query += " AND id = ?"
+            params.append(message_id)
+        query += f" ORDER BY file {'DESC' if newest_first else 'ASC'}"
+        # Executed eagerly so index errors surface here (callers fall back to
+        # a glob); rows are materialized lazily.
+        cursor = self._pool.reader().execute(query, params)
+        return (RelayRow(self.root, tuple(row)) for row in cursor)
+
+    def find(self, directories: List[Path], message_id: str) -> List[RelayRow]:
+        """Rows carrying ``message_id`` in ``directories``."""
+        return list(self.iter_rows(directories, message_id=message_id, newest_first=False))
+
+    def bucket_stats(self, directory: Path) -> Dict[str, Any]:
+        """``{total, unread, latest_message_at}`` for one bucket (spine off)."""
+        self._reconcile(directory)
+        total, unread, latest = self._pool.reader().execute(
+            "SELECT COUNT(*), COALESCE(SUM(valid = 1 AND read = 0), 0), "
+            "MAX(CASE WHEN valid = 1 THEN COALESCE(created_at, '') END) "
+            "FROM relay_messages WHERE bucket = ?",
+            (self.bucket_of(directory),),
+        ).fetchone()
+        return {"total": total, "unread": unread, "latest_message_at": latest}
+
+    # ── Maintenance ────────────────────────────────────────────────
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Drop every row and re-index all buckets from the JSON files."""
+        with self._reconcile_lock:
+            with self._pool.writer() as conn:
+                conn.execute("DELETE FROM relay_acks")
+                conn.execute("DELETE FROM relay_messages")
+                conn.execute("DELETE FROM relay_buckets")
+        buckets = 0
+        if self.root.is_dir():
+            for d in sorted(self.root.iterdir()):
+                if not d.is_dir():
+                    continue
+                self._reconcile(d, force=True)
+                buckets += 1
+            comments = self.root / "task_comments"
+            if comments.is_dir():
+                for d in sorted(comments.iterdir()):
+                    if d.is_dir():
+                        self._reconcile(d, force=True)
+                        buckets += 1
+        messages, invalid = self._pool.reader().execute(
+            "SELECT COUNT(*), COALESCE(SUM(valid = 0), 0) FROM relay_messages"
+        ).fetchone()
+        return {
+            "buckets": buckets,
+            "messages": messages,
+            "unparseable": invalid,
+            "index": str(self.db_path),
+        }
+
+
+_indexes: Dict[str, RelayIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_relay_index(brain_path: Optional[Path] = None) -> Optional[RelayIndex]:
+    """Shared index for the brain, or None when disabled or unavailable.
+
+    Callers fall back to globbing the bucket when this returns None.
+    """
+    if not relay_index_enabled():
+        return None
+    brain = Path(brain_path) if brain_path is not None else get_brain_path()
+    key = str(brain)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            try:
+                index = _indexes[key] = RelayIndex(brain)
+            except Exception as e:
+                logger.warning(f"Relay index unavailable, falling back to bucket scans: {e}")
+                return None
+        return index
+
+
+def rebuild_relay_index(brain_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Rebuild the relay index from the mailbox files (``nucleus relay reindex``)."""
+    brain = Path(brain_path) if brain_path is not None else get_brain_path()
+    index = _indexes.get(str(brain)) or RelayIndex(brain)
+    _indexes.setdefault(str(brain), index)
+    return index.rebuild()
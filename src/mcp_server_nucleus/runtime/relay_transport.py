@@ -63,8 +63,11 @@ class InboxResult(list):
             or HTTP 429).
         transport_error: HTTP-level or connection error occurred;
             the returned list may be empty or partial.
+        cursor: Server change cursor for the inbox; pass it back as
+            ``read_inbox(cursor=...)`` to long-poll for the next arrival.
     """
 
+    cursor: Optional[str] = None
     _has_more: bool = False
     _rate_limited: bool = False
     _transport_error: bool = False
@@ -247,11 +250,17 @@ def read_inbox(
     unread_only: bool = True,
     limit: int = 50,
     bearer: Optional[str] = None,
+    wait_s: Optional[float] = None,
+    cursor: Optional[str] = None,
 ) -> InboxResult:
     """GET /relay/{canonical} → list of messages.
 
     FS mode: returns empty ``InboxResult`` (caller routes to relay_ops).
     HTTP mode: returns messages from server, or empty on error.
+
+    ``wait_s`` long-polls: the server holds the request until the inbox is
+    non-empty or, given the ``cursor`` of a previous result, until a new
+    message lands after it (server-capped; returns the listing on timeout).
     """
     if not is_http_mode():
         return InboxResult()
@@ -264,7 +273,13 @@ def read_inbox(
         "GET",
         f"/relay/{canonical}",
         bearer=bearer,
-        params={"unread_only": str(unread_only).lower(), "limit": limit},
+        params={
+            "unread_only": str(unread_only).lower(),
+            "limit": limit,
+            "wait_s": wait_s or None,
+            "cursor": cursor,
+        },
+        timeout=15 + int(wait_s or 0),
     )
 
     result = InboxResult()
@@ -284,6 +299,7 @@ def read_inbox(
         if isinstance(msgs, list):
             result.extend(msgs)
         result.has_more = bool(parsed.get("has_more", False))
+        result.cursor = parsed.get("cursor")
         result.transport_error = False
         result.rate_limited = bool(parsed.get("rate_limited", False)) or (rl_remaining == 0)
         return result
@@ -34,6 +34,9 @@ def _generate_sparkline(counts: List[int], chars: str = "▁▂▃▄▅▆▇
 def _get_activity_sparkline(days: int = 7) -> Dict:
     """Get activity sparkline for the last N days from events.jsonl."""
     try:
+        from .event_ops import EVENT_FLUSH_ON_READ_S, flush_events
+        # Bounded: queued events reach events.jsonl and the summary first.
+        flush_events(timeout=EVENT_FLUSH_ON_READ_S)
         brain = get_brain_path()
         
         # Fast path: use precomputed summary if available (Tier 2)
@@ -85,17 +88,12 @@ def _get_activity_sparkline(days: int = 7) -> Dict:
         day_counts = defaultdict(int)
         today = datetime.now().date()
         
-        # Read events efficiently (tail approach)
-        events = []
-        with open(events_path, "r", encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    events.append(line)
+        # Read events efficiently (tail approach: seek from EOF)
+        from .event_tail import tail_records
         
         # Only process last 500 events
-        for line in events[-500:]:
+        for evt in tail_records(events_path, 500):
             try:
-                evt = json.loads(line)
                 timestamp = evt.get("timestamp", "")
                 if timestamp:
                     # Parse timestamp (format: 2026-01-06T14:00:00+0530)
@@ -132,7 +132,8 @@ def _count_engrams_in_window(brain: Path, since: datetime) -> Dict[str, Any]:
     """Count engrams written since `since` by reading the EXISTING ledger.jsonl.
 
     Reads .brain/engrams/ledger.jsonl (the same file _brain_write_engram_impl
-    appends to via MemoryPipeline). Returns a count + the raw ledger size.
+    appends to via MemoryPipeline), resolved to the live engrams (latest
+    version per key, tombstones dropped). Returns a count + the live total.
     Missing ledger is reported honestly (count=0) but the substrate-artifact
     presence flag lets the verdict distinguish "empty substrate" from
     "substrate never ran".
@@ -140,25 +141,28 @@ def _count_engrams_in_window(brain: Path, since: datetime) -> Dict[str, Any]:
     ledger = brain / "engrams" / "ledger.jsonl"
     if not ledger.exists():
         return {"present": False, "count_in_window": 0, "total": 0, "error": "ledger.jsonl missing"}
-    total = 0
-    in_window = 0
+    from .engram_ledger import live_records, resolve_latest
+
+    records = []
     parse_errors = 0
     with ledger.open("r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            total += 1
             try:
-                rec = json.loads(line)
+                records.append(json.loads(line))
             except json.JSONDecodeError:
                 parse_errors += 1
-                continue
-            ts = _parse_iso(rec.get("timestamp") or rec.get("created_at") or rec.get("ts") or "")
-            if ts is None:
-                continue
-            if ts >= since:
-                in_window += 1
+    live = live_records(resolve_latest(records))
+    total = len(live)
+    in_window = 0
+    for rec in live:
+        ts = _parse_iso(rec.get("timestamp") or rec.get("created_at") or rec.get("ts") or "")
+        if ts is None:
+            continue
+        if ts >= since:
+            in_window += 1
     out: Dict[str, Any] = {
         "present": True,
         "count_in_window": in_window,
@@ -52,18 +52,12 @@ def _load_session_arc(brain: Path) -> dict:
     today_key = f"brief_rec_{datetime.now().strftime('%Y%m%d')}"
 
     try:
-        with open(ledger_path, "r") as f:
-            for line in f:
-                try:
-                    e = json.loads(line.strip())
-                    if e.get("deleted", False):
-                        continue
-                    if e.get("key", "").startswith("session_"):
-                        session_engrams.append(e)
-                    elif e.get("key") == today_key:
-                        brief_rec = e
-                except (json.JSONDecodeError, KeyError):
-                    continue
+        from .engram_ledger import load_live_engrams
+        for e in load_live_engrams(ledger_path):
+            if e.get("key", "").startswith("session_"):
+                session_engrams.append(e)
+            elif e.get("key") == today_key:
+                brief_rec = e
     except OSError:
         return {"recent_sessions": [], "todays_focus": None, "arc_summary": ""}
 
@@ -43,12 +43,14 @@ except ImportError as e:
     # Fallback to hardcoded relative path if traversal fails
     sys.path.append(src_root)
 
+import contextvars
 import json
 import logging
 import traceback
 import time
 import os
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 from mcp_server_nucleus import __version__ as _nucleus_version
 
 # Hypervisor imports — graceful degradation if unavailable
@@ -87,6 +89,17 @@ logging.getLogger("watchdog").setLevel(logging.ERROR)
 
 START_TIME = time.time()
 
+# Requests are served concurrently; the synchronous facade routers run on a
+# bounded thread pool so one slow call (engram search, task import) no
+# longer holds up every request queued behind it on the channel.
+STDIO_WORKERS = int(os.environ.get("NUCLEUS_STDIO_WORKERS", "8"))
+# Concurrent calls allowed per facade (or "resources"/"prompts").
+DEFAULT_FACADE_CONCURRENCY = int(os.environ.get("NUCLEUS_STDIO_FACADE_CONCURRENCY", "4"))
+FACADE_CONCURRENCY = {
+    # Locks, mode switches and deletes stay strictly ordered.
+    "nucleus_governance": 1,
+}
+
 def make_response(success: bool, data: Any = None, error: str = None) -> str:
     """Helper to create a formatted JSON response string."""
     response = {"success": success}
@@ -115,6 +128,11 @@ class StdioServer:
 
         self.mounter = get_mounter(self.brain_path) if get_mounter else None
 
+        # Concurrent dispatch state (see run / _run_sync)
+        self._inflight: Dict[Any, asyncio.Task] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+
     async def run(self):
         # Restore mounts from persistence
         if self.mounter:
@@ -134,16 +152,109 @@ class StdioServer:
                 try:
                     request = json.loads(line)
                     
-                    response = await self.handle_request(request)
-                    if response:
-                        out = json.dumps(response)
-                        print(out, flush=True)
+                    await self._accept(request)
                 except json.JSONDecodeError:
                     logger.error(f"Failed to decode JSON from line: {repr(line)}")
             except Exception as e:
                 logger.error(f"Server loop error: {e}")
                 traceback.print_exc(file=sys.stderr)
 
+        # stdin closed: finish what is in flight before exiting
+        if self._inflight:
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    async def _accept(self, request: Dict[str, Any]) -> None:
+        """Start serving one request without waiting for it to finish.
+
+        Requests with an id run as tasks and are answered as they complete
+        (JSON-RPC matches responses by id, not order). The handshake and
+        notifications are handled in arrival order; ``notifications/cancelled``
+        cancels the named in-flight request, which then sends no response.
+        """
+        method = request.get("method")
+        msg_id = request.get("id")
+        if method == "notifications/cancelled":
+            params = request.get("params") or {}
+            task = self._inflight.get(params.get("requestId"))
+            if task is not None:
+                logger.info(f"Cancelling request {params.get('requestId')!r}: {params.get('reason', '')}")
+                task.cancel()
+            return
+        if msg_id is None or method == "initialize":
+            await self._serve(request)
+            return
+        task = asyncio.create_task(self._serve(request))
+        self._inflight[msg_id] = task
+        task.add_done_callback(
+            lambda t, key=msg_id: self._inflight.pop(key, None) if self._inflight.get(key) is t else None
+        )
+
+    async def _serve(self, request: Dict[str, Any]) -> None:
+        msg_id = request.get("id")
+        try:
+            response = await self.handle_request(request)
+            if response:
+                self._write(response)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            # Runs as a task: anything unhandled here would otherwise vanish
+            # with it and leave the client waiting on this id forever.
+            logger.error(f"Request {msg_id!r} ({request.get('method')}) failed: {e}")
+            traceback.print_exc(file=sys.stderr)
+            if msg_id is None:
+                return
+            try:
+                self._write({
+                    "jsonrpc": "2.0",
+                    "id": msg_id,
+                    "error": {"code": -32603, "message": f"Internal error: {e}"}
+                })
+            except Exception as write_err:
+                logger.error(f"Failed to send error response for {msg_id!r}: {write_err}")
+
+    def _write(self, message: Dict[str, Any]) -> None:
+        """The single stdout writer. It runs on the event-loop thread only, so
+        responses from concurrent requests never interleave mid-line."""
+        print(json.dumps(message), flush=True)
+
+    async def _run_sync(self, key: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a synchronous router call on the worker pool.
+
+        At most ``FACADE_CONCURRENCY[key]`` (default
+        ``NUCLEUS_STDIO_FACADE_CONCURRENCY``) calls per key run at once. The
+        slot is released when the thread finishes, not when the awaiting
+        request is cancelled, so a cancelled call still counts until its sync
+        work actually stops.
+        """
+        loop = asyncio.get_running_loop()
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = asyncio.Semaphore(
+                FACADE_CONCURRENCY.get(key, DEFAULT_FACADE_CONCURRENCY)
+            )
+        await limit.acquire()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(STDIO_WORKERS, 1), thread_name_prefix="nucleus-stdio"
+            )
+        try:
+            future = self._executor.submit(contextvars.copy_context().run, fn, *args)
+        except BaseException:
+            limit.release()
+            raise
+
+        def _release(_):
+            try:
+                loop.call_soon_threadsafe(limit.release)
+            except RuntimeError:
+                pass  # Loop already closed (shutdown)
+
+        future.add_done_callback(_release)
+        return await asyncio.wrap_future(future)
+
     async def handle_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         method = request.get("method")
         msg_id = request.get("id")
@@ -399,7 +510,7 @@ class StdioServer:
         elif method == "resources/read":
             uri = request.get("params", {}).get("uri", "")
             try:
-                content = self._read_resource(uri)
+                content = await self._run_sync("resources", self._read_resource, uri)
                 return {
                     "jsonrpc": "2.0",
                     "id": msg_id,
@@ -455,7 +566,7 @@ class StdioServer:
             prompt_name = request.get("params", {}).get("name", "")
             prompt_args = request.get("params", {}).get("arguments", {})
             try:
-                text = self._get_prompt(prompt_name, prompt_args)
+                text = await self._run_sync("prompts", self._get_prompt, prompt_name, prompt_args)
                 return {
                     "jsonrpc": "2.0",
                     "id": msg_id,
@@ -797,7 +908,7 @@ class StdioServer:
                          f"Use the FastMCP server for full facade support.",
                 "available_facades": sorted(routers.keys()),
             }, indent=2)
-        return dispatch(action, params, router, facade_name)
+        return await self._run_sync(facade_name, dispatch, action, params, router, facade_name)
 
 def main():
     # Handle diagnostic flags for smoke tests
@@ -0,0 +1,246 @@
+"""
+Task Index — in-process scheduling index for ``_get_next_task``.
+================================================================
+Executors poll "next actionable task for these skills" constantly. Answering
+it from a fresh ``_list_tasks`` with a linear blocker lookup per dependency is
+O(tasks × blockers × tasks). This index is built from one ``_list_tasks``
+snapshot and keeps:
+
+  * ``tasks`` by id, plus the ids each agent holds IN_PROGRESS;
+  * a reverse dependency graph (blocker → dependents) and, per task, the
+    number of blockers not yet released;
+  * for every (role, skill) bucket, a heap of ready tasks ordered by
+    (priority, list position) — ready meaning claimable status, unclaimed,
+    zero unresolved blockers. Tasks with no required skills go in the ``""``
+    skill bucket, which matches every caller.
+
+A query peeks the heads of the buckets that apply to the caller, so it is
+O(buckets × log n); a head that is no longer ready is popped lazily.
+
+The index is a cache of the task store. It is rebuilt when it is stale:
+  * ``invalidate_task_indexes()`` is called from ``db._notify_tasks_changed``
+    on every in-process task write;
+  * a cheap ``stat`` signature of the local task files catches writes made
+    by other processes;
+  * an age limit (``NUCLEUS_TASK_INDEX_TTL_S``, default 10s) bounds how
+    stale merged external sources (commitment ledger, cloud tasks, a shared
+    Postgres) can get.
+"""
+
+import heapq
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+CLAIMABLE_STATUSES = frozenset({"TODO", "PENDING", "READY", "BLOCKED"})
+RELEASED_STATUSES = frozenset({"DONE", "COMPLETE"})
+
+DEFAULT_TTL_S = 10.0
+
+# Bumped by ``invalidate_task_indexes``; an index built at an older
+# generation is stale.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def invalidate_task_indexes() -> None:
+    """Mark every task index stale (called on each task-store write)."""
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+
+def _ttl_s() -> float:
+    try:
+        return float(os.environ.get("NUCLEUS_TASK_INDEX_TTL_S", DEFAULT_TTL_S))
+    except ValueError:
+        return DEFAULT_TTL_S
+
+
+def _source_signature(paths: Iterable[Path]) -> Tuple:
+    sig = []
+    for p in paths:
+        try:
+            st = p.stat()
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+class TaskIndex:
+    """Ready-task heaps plus a reverse dependency graph over one task list."""
+
+    def __init__(self, source_paths: Iterable[Path] = ()):
+        self._source_paths = list(source_paths)
+        self.lock = threading.RLock()
+        self._built_generation: Optional[int] = None
+        self._built_signature: Optional[Tuple] = None
+        self._built_at = 0.0
+        self._built_flags: Optional[Tuple] = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self.tasks: Dict[str, Dict] = {}
+        self._position: Dict[str, int] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._unresolved: Dict[str, int] = {}
+        self._released: Set[str] = set()
+        self._in_progress: Dict[str, Set[str]] = {}
+        # (role, skill) -> heap of (priority, position, task_id)
+        self._ready: Dict[Tuple[str, str], List[Tuple[int, int, str]]] = {}
+
+    # ── Staleness ──────────────────────────────────────────────────
+
+    def is_stale(self, flags: Tuple = ()) -> bool:
+        """True if the index must be rebuilt before answering a query."""
+        if self._built_generation != _generation or self._built_flags != flags:
+            return True
+        if time.monotonic() - self._built_at > _ttl_s():
+            return True
+        return _source_signature(self._source_paths) != self._built_signature
+
+    def rebuild(self, load_tasks: Callable[[], List[Dict]],
+                is_released: Callable[[Dict], bool],
+                flags: Tuple = (),
+                fetch_task: Optional[Callable[[str], Optional[Dict]]] = None) -> None:
+        """Rebuild from ``load_tasks()`` (a priority-sorted ``_list_tasks``).
+
+        ``is_released(task)`` decides whether a DONE/COMPLETE blocker releases
+        its dependents (the verify-gate check); it runs once per blocker.
+        Blockers missing from the listing are looked up once each with
+        ``fetch_task(blocker_id)`` (e.g. ``storage.get_task``), so a DONE
+        blocker outside the listing still releases its dependents.
+        """
+        # Read the generation and signature before loading: a write that
+        # lands while we build leaves the index stale rather than missed.
+        generation = _generation
+        signature = _source_signature(self._source_paths)
+        tasks = load_tasks()
+        self._clear()
+        for pos, task in enumerate(tasks):
+            tid = task.get("id")
+            if tid is None:
+                continue
+            self.tasks[tid] = task
+            self._position[tid] = pos
+            if (task.get("status") or "").upper() == "IN_PROGRESS" and task.get("claimed_by"):
+                self._in_progress.setdefault(task["claimed_by"], set()).add(tid)
+
+        def _releases(task: Optional[Dict]) -> bool:
+            return bool(task) and (task.get("status") or "").upper() in RELEASED_STATUSES \
+                and is_released(task)
+
+        for tid, task in self.tasks.items():
+            if _releases(task):
+                self._released.add(tid)
+
+        if fetch_task is not None:
+            outside = {
+                blocker_id
+                for task in self.tasks.values()
+                for blocker_id in task.get("blocked_by") or []
+                if blocker_id not in self.tasks
+            }
+            for blocker_id in outside:
+                try:
+                    blocker = fetch_task(blocker_id)
+                except Exception:
+                    blocker = None
+                if _releases(blocker):
+                    self._released.add(blocker_id)
+
+        for tid, task in self.tasks.items():
+            unresolved = 0
+            for blocker_id in task.get("blocked_by") or []:
+                self._dependents.setdefault(blocker_id, set()).add(tid)
+                if blocker_id not in self._released:
+                    unresolved += 1
+            self._unresolved[tid] = unresolved
+            self._push_if_ready(tid)
+
+        self._built_generation = generation
+        self._built_signature = signature
+        self._built_at = time.monotonic()
+        self._built_flags = flags
+
+    # ── Ready-set maintenance ──────────────────────────────────────
+
+    def _is_ready(self, tid: str) -> bool:
+        task = self.tasks.get(tid)
+        return (
+            task is not None
+            and (task.get("status") or "").upper() in CLAIMABLE_STATUSES
+            and not task.get("claimed_by")
+            and self._unresolved.get(tid, 0) == 0
+        )
+
+    def _push_if_ready(self, tid: str) -> None:
+        if not self._is_ready(tid):
+            return
+        task = self.tasks[tid]
+        role = task.get("required_role") or ""
+        entry = (task.get("priority", 3), self._position[tid], tid)
+        skills = {s.lower() for s in task.get("required_skills") or []} or {""}
+        for skill in skills:
+            heapq.heappush(self._ready.setdefault((role, skill), []), entry)
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    def in_progress_count(self, agent_id: str, visible: Callable[[Dict], bool]) -> int:
+        return sum(
+            1 for tid in self._in_progress.get(agent_id, ())
+            if tid in self.tasks
+            and (self.tasks[tid].get("status") or "").upper() == "IN_PROGRESS"
+            and self.tasks[tid].get("claimed_by") == agent_id
+            and visible(self.tasks[tid])
+        )
+
+    def next_ready(self, skills: Iterable[str],
+                   required_role: Optional[str] = None) -> Optional[Dict]:
+        """Best ready task for ``skills`` visible to ``required_role``.
+
+        ``required_role=None`` sees every task; a role sees unscoped tasks
+        and its own (the non-strict ``_list_tasks`` rule).
+        """
+        wanted = {s.lower() for s in skills} | {""}
+        if required_role:
+            roles = {"", required_role}
+            buckets = [(r, s) for r in roles for s in wanted]
+        else:
+            buckets = [key for key in self._ready if key[1] in wanted]
+        best = None
+        for key in buckets:
+            heap = self._ready.get(key)
+            while heap and not self._is_ready(heap[0][2]):
+                heapq.heappop(heap)
+            if heap and (best is None or heap[0] < best):
+                best = heap[0]
+        return self.tasks[best[2]] if best else None
+
+
+_indexes: Dict[str, TaskIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_task_index(brain_path: Path) -> TaskIndex:
+    """Get (creating on first use) the shared task index for a brain."""
+    brain_path = Path(brain_path)
+    key = str(brain_path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            paths = [
+                brain_path / "nucleus.db",
+                brain_path / "nucleus.db-wal",
+                brain_path / "ledger" / "tasks.json",
+            ]
+            try:
+                from mcp_server_nucleus.commitment_ledger import get_ledger_path
+                paths.append(Path(get_ledger_path(brain_path)))
+            except Exception:
+                pass
+            index = _indexes[key] = TaskIndex(paths)
+        return index
@@ -77,6 +77,8 @@ def _list_tasks(
     claimed_by: Optional[str] = None,
     required_role: Optional[str] = None,
     strict_role: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> List[Dict]:
     """List tasks natively from DB with optional filters and external provider merging.
 
@@ -88,13 +90,21 @@ def _list_tasks(
     ``required_role`` exactly matching the filter are returned. Used by
     ``wakeup_wait`` so a scoped agent doesn't get spammed by legacy
     unscoped tasks.
+
+    ``limit``/``offset`` page the merged, priority-sorted list. Without a role
+    filter the page is pushed down to storage: the first ``offset + limit``
+    rows by priority are all a page of the merged list can draw from the DB.
     """
     try:
         brain = get_brain_path()
         storage = get_storage_backend(brain)
 
         # Native DB filtering
-        filtered = storage.list_tasks(status, priority, skill, claimed_by)
+        if limit is not None and not required_role:
+            filtered = storage.list_tasks(status, priority, skill, claimed_by,
+                                          limit=offset + limit, order_by="priority")
+        else:
+            filtered = storage.list_tasks(status, priority, skill, claimed_by)
 
         # Role filter (post-DB — field is optional, may not exist on legacy tasks)
         if required_role:
@@ -184,6 +194,9 @@ def _list_tasks(
                 t["priority"] = 3
         filtered.sort(key=lambda x: x.get("priority", 3))
         
+        if limit is not None or offset:
+            end = None if limit is None else offset + limit
+            return filtered[offset:end]
         return filtered
     except Exception as e:
         logger.error(f"Error listing tasks: {e}")
@@ -465,61 +478,45 @@ def _get_next_task(skills: List[str], required_role: Optional[str] = None,
                    agent_id: Optional[str] = None) -> Optional[Dict]:
     """Get highest priority unblocked task matching skills and role scope.
 
+    Served from the in-process ``TaskIndex`` (runtime/task_index.py), which is
+    rebuilt from ``_list_tasks`` only after a task write or when it ages out.
+
     Fix #7: If agent_id is provided, skip tasks if this executor already has
     an IN_PROGRESS task — prevents one executor from hoarding all PENDING tasks.
     """
     try:
-        tasks = _list_tasks(required_role=required_role)  # Handles sorting + role filter
-        storage = get_storage_backend(get_brain_path())
+        from .task_index import get_task_index
+
+        index = get_task_index(get_brain_path())
+        gates = _verify_gates_enabled()
+
+        def _visible(task: Dict) -> bool:
+            # Non-strict role scope, as _list_tasks(required_role=...) applies it.
+            return not required_role or not task.get("required_role") or task.get("required_role") == required_role
+
+        with index.lock:
+            if index.is_stale(flags=(gates,)):
+                # Flag-gated (default OFF): a DONE/COMPLETE status alone is a
+                # forgeable claim. When gate-verification is on, the blocker
+                # releases dependents only if its evidence ref adjudicates to
+                # CONFIRMED on the release predicate (③ + G2). Fails closed.
+                index.rebuild(
+                    _list_tasks,  # Handles sorting; role scope is applied per query
+                    is_released=_blocker_release_confirmed if gates else (lambda _t: True),
+                    flags=(gates,),
+                    # Blockers _list_tasks did not return
+                    fetch_task=get_storage_backend(get_brain_path()).get_task,
+                )
 
-        # Fix #7: Executor starvation prevention — 1 task per executor
-        if agent_id:
-            already_claimed = sum(
-                1 for t in tasks
-                if t.get("status", "").upper() == "IN_PROGRESS"
-                and t.get("claimed_by") == agent_id
-            )
-            if already_claimed > 0:
-                logger.info(f"Executor {agent_id} already has {already_claimed} IN_PROGRESS task(s) — skipping task assignment")
-                return None
-
-        actionable = []
-        for task in tasks:
-            status = task.get("status", "").upper()
-            if status not in ["TODO", "PENDING", "READY", "BLOCKED"]:
-                continue
-            
-            if task.get("claimed_by"):
-                continue
-            
-            blocked_by = task.get("blocked_by", [])
-            if blocked_by:
-                blocking_done = True
-                for blocker_id in blocked_by:
-                    b_task = next((t for t in tasks if t["id"] == blocker_id), None)
-                    if not b_task:
-                        b_task = storage.get_task(blocker_id)
-                    if not b_task or b_task.get("status", "").upper() not in ["DONE", "COMPLETE"]:
-                        blocking_done = False
-                        break
-                    # Flag-gated (default OFF): a DONE/COMPLETE status alone is a
-                    # forgeable claim. When gate-verification is on, the blocker
-                    # releases dependents only if its evidence ref adjudicates to
-                    # CONFIRMED on the release predicate (③ + G2). Fails closed.
-                    if _verify_gates_enabled() and not _blocker_release_confirmed(b_task):
-                        blocking_done = False
-                        break
-                if not blocking_done:
-                    continue
-            
-            required = [s.lower() for s in task.get("required_skills", [])]
-            available = [s.lower() for s in skills]
-            
-            if not required or any(r in available for r in required):
-                actionable.append(task)
-        
-        actionable.sort(key=lambda t: t.get("priority", 3))
-        return actionable[0] if actionable else None
+            # Fix #7: Executor starvation prevention — 1 task per executor
+            if agent_id:
+                already_claimed = index.in_progress_count(agent_id, _visible)
+                if already_claimed > 0:
+                    logger.info(f"Executor {agent_id} already has {already_claimed} IN_PROGRESS task(s) — skipping task assignment")
+                    return None
+
+            task = index.next_ready(skills, required_role)
+            return dict(task) if task else None
     except Exception as e:
         logger.error(f"Error getting next task: {e}")
         return None
@@ -0,0 +1,397 @@
+"""Local embedding index for ``LocalSQLiteStore`` — semantic recall offline.
+
+Rows of ``memory.db`` are embedded by a pluggable local embedder and kept as a
+float32 matrix in ``memory.vec`` next to the database (read through
+``np.memmap``; matrix row ``i`` is ``memory_vectors.vec_row = i``). Vectors are
+L2-normalised, so similarity is a dot product:
+
+  * up to ``NUCLEUS_VECTOR_ANN_MIN_ROWS`` rows (default 50000) search is one
+    BLAS matrix-vector product over the whole matrix;
+  * above that an IVF index (spherical k-means into ~sqrt(n) lists, saved as
+    ``memory.vec.ivf.npz``) scores the ``NUCLEUS_VECTOR_NPROBE`` nearest lists
+    (default: an eighth of the lists, at least 16) plus a brute-force scan of rows added since it was trained,
+    and is retrained once that tail passes a quarter of the trained rows.
+
+The default ``HashingEmbedder`` is signed feature hashing of word unigrams and
+bigrams with sublinear tf — a fixed random projection of the sparse tf vector
+— so it needs no model download and no network. ``NUCLEUS_LOCAL_EMBEDDER=
+package.module:factory`` plugs in another embedder (any object with ``name``,
+``dim`` and ``embed(texts) -> (n, dim)``); changing it re-embeds every row.
+
+The matrix is append-only and is committed through the ``memory_vectors``
+table under the same SQLite write lock, so torn trailing bytes are truncated
+and memories without a vector (stored before this index existed, or lost to a
+crash) are backfilled by ``sync()``.
+"""
+from __future__ import annotations
+
+import importlib
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .common import open_hardened_sqlite
+
+logger = logging.getLogger("nucleus.vector_index")
+
+DEFAULT_DIM = 256
+DEFAULT_ANN_MIN_ROWS = 50_000
+DEFAULT_NPROBE = 16
+_EMBED_BATCH = 512
+_KMEANS_ITERS = 8
+_KMEANS_SAMPLE_PER_LIST = 64
+_ASSIGN_CHUNK = 8192
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_vectors (
+    vec_row INTEGER PRIMARY KEY,
+    memory_id TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS memory_vector_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+@lru_cache(maxsize=1 << 16)
+def _feature_slot(feature: str, dim: int) -> Tuple[int, float]:
+    # crc32, not hash(): slots must agree across processes (str hashing is salted).
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h % dim, (1.0 if h & 0x80000000 else -1.0)
+
+
+class HashingEmbedder:
+    """Offline embedder: signed hashing of word unigrams + bigrams, log tf."""
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = int(dim)
+        self.name = f"hashing-v1-{self.dim}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            tokens = _TOKEN_RE.findall((text or "").lower())
+            feats = Counter(tokens)
+            feats.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+            acc: Dict[int, float] = {}
+            for feat, tf in feats.items():
+                slot, sign = _feature_slot(feat, self.dim)
+                acc[slot] = acc.get(slot, 0.0) + sign * (1.0 + math.log(tf))
+            if acc:
+                out[i, list(acc)] = list(acc.values())
+        return _normalize(out)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def get_embedder():
+    """The embedder selected by ``NUCLEUS_LOCAL_EMBEDDER`` (default: hashing)."""
+    spec = (os.environ.get("NUCLEUS_LOCAL_EMBEDDER") or "hashing").strip()
+    if spec == "hashing":
+        return HashingEmbedder(_env_int("NUCLEUS_LOCAL_EMBEDDER_DIM", DEFAULT_DIM))
+    module, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module), attr or "get_embedder")()
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the ``k`` highest ``scores``, best first."""
+    if k < len(scores):
+        part = np.argpartition(-scores, k - 1)[:k]
+    else:
+        part = np.arange(len(scores))
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    out = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _ASSIGN_CHUNK):
+        chunk = np.asarray(vectors[start:start + _ASSIGN_CHUNK], dtype=np.float32)
+        out[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return out
+
+
+def train_ivf(matrix: np.ndarray, seed: int = 0) -> Dict[str, np.ndarray]:
+    """Spherical k-means IVF over ``matrix``: centroids + rows grouped by list."""
+    n = len(matrix)
+    nlist = max(1, int(math.sqrt(n)))
+    rng = np.random.default_rng(seed)
+    size = min(n, nlist * _KMEANS_SAMPLE_PER_LIST)
+    sample = np.asarray(matrix[np.sort(rng.choice(n, size=size, replace=False))])
+    centroids = sample[rng.choice(size, size=nlist, replace=False)].copy()
+    for _ in range(_KMEANS_ITERS):
+        assign = _nearest(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        filled = np.bincount(assign, minlength=nlist) > 0
+        centroids[filled] = _normalize(sums[filled])
+    assign = _nearest(matrix, centroids)
+    rows = np.argsort(assign, kind="stable").astype(np.int64)
+    offsets = np.searchsorted(assign[rows], np.arange(nlist + 1)).astype(np.int64)
+    return {"centroids": centroids, "rows": rows, "offsets": offsets,
+            "trained": np.int64(n)}
+
+
+class LocalVectorIndex:
+    """Embedding matrix + IVF for one ``memory.db`` (see module docstring)."""
+
+    def __init__(self, db_path: Path, embedder=None):
+        self.db_path = Path(db_path)
+        self.matrix_path = self.db_path.with_suffix(".vec")
+        self.ivf_path = self.db_path.with_suffix(".vec.ivf.npz")
+        self.embedder = embedder or get_embedder()
+        self.dim = int(self.embedder.dim)
+        self._row_bytes = self.dim * 4
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_key: Optional[Tuple[int, int]] = None
+        self._ivf: Optional[Dict[str, np.ndarray]] = None
+        self._ivf_mtime: Optional[int] = None
+        with open_hardened_sqlite(self.db_path) as conn:
+            conn.executescript(SCHEMA)
+
+    # ── Writes ─────────────────────────────────────────────────────
+
+    def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.asarray(self.embedder.embed(list(texts)), dtype=np.float32)
+        if vectors.shape != (len(texts), self.dim):
+            raise ValueError(
+                f"embedder {self.embedder.name!r} returned shape {vectors.shape}, "
+                f"expected ({len(texts)}, {self.dim})"
+            )
+        return _normalize(vectors)
+
+    @staticmethod
+    def _committed_rows(conn: sqlite3.Connection) -> int:
+        return conn.execute(
+            "SELECT COALESCE(MAX(vec_row) + 1, 0) FROM memory_vectors"
+        ).fetchone()[0]
+
+    def _matrix_size(self) -> int:
+        try:
+            return self.matrix_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _is_stale(self, conn: sqlite3.Connection) -> bool:
+        row = conn.execute(
+            "SELECT value FROM memory_vector_meta WHERE key = 'embedder'"
+        ).fetchone()
+        if row is None or row[0] != self.embedder.name:
+            return True
+        return self._matrix_size() < self._committed_rows(conn) * self._row_bytes
+
+    def _reset(self, conn: sqlite3.Connection) -> None:
+        """Drop every vector (embedder changed or matrix lost); sync() re-embeds."""
+        logger.info("Resetting local vector index for %s (embedder %s)",
+                    self.db_path, self.embedder.name)
+        conn.execute("DELETE FROM memory_vectors")
+        conn.execute(
+            "INSERT OR REPLACE INTO memory_vector_meta (key, value) VALUES ('embedder', ?)",
+            (self.embedder.name,),
+        )
+        conn.execute(
+            "DELETE FROM memory_vector_meta WHERE key IN ('synced_rowid', 'synced_count')"
+        )
+        # Unlink rather than truncate: readers in other processes keep their map.
+        self.matrix_path.unlink(missing_ok=True)
+        self.ivf_path.unlink(missing_ok=True)
+
+    def add(self, items: Sequence[Tuple[str, str]]) -> int:
+        """Embed ``(memory_id, content)`` pairs and append them; returns rows added."""
+        if not items:
+            return 0
+        vectors = self._embed([content or "" for _, content in items])
+        conn = open_hardened_sqlite(self.db_path)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            if self._is_stale(conn):
+                self._reset(conn)
+            ids = [memory_id for memory_id, _ in items]
+            have = set()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                have.update(r[0] for r in conn.execute(
+                    "SELECT memory_id FROM memory_vectors WHERE memory_id IN "
+                    f"({','.join('?' * len(chunk))})", chunk))
+            keep = []
+            for i, memory_id in enumerate(ids):
+                if memory_id not in have:
+                    have.add(memory_id)
+                    keep.append(i)
+            if keep:
+                start = self._committed_rows(conn)
+                with open(self.matrix_path, "a+b") as fh:
+                    fh.truncate(start * self._row_bytes)  # drop torn, uncommitted rows
+                    fh.write(vectors[keep].tobytes())
+                conn.executemany(
+                    "INSERT INTO memory_vectors (vec_row, memory_id) VALUES (?, ?)",
+                    [(start + j, ids[i]) for j, i in enumerate(keep)],
+                )
+            conn.commit()
+            return len(keep)
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def sync(self, batch: int = _EMBED_BATCH) -> int:
+        """Embed memories that have no vector yet; returns rows added.
+
+        Resumes past the ``synced_rowid`` watermark. ``synced_count`` records
+        how many memories sat at or below it; if that no longer matches
+        (``VACUUM`` renumbered rowids, or rows were deleted) the scan starts
+        over from the first row, re-embedding only rows without a vector.
+        """
+        added = 0
+        with open_hardened_sqlite(self.db_path) as conn:
+            if self._is_stale(conn):
+                conn.execute("BEGIN IMMEDIATE")
+                if self._is_stale(conn):
+                    self._reset(conn)
+            meta = dict(conn.execute(
+                "SELECT key, value FROM memory_vector_meta "
+                "WHERE key IN ('synced_rowid', 'synced_count')"
+            ).fetchall())
+            after = int(meta.get("synced_rowid", 0))
+            below = int(meta.get("synced_count", -1)) if after else 0
+            if after and conn.execute(
+                "SELECT COUNT(*) FROM memories WHERE rowid <= ?", (after,)
+            ).fetchone()[0] != below:
+                logger.info("Rowids of %s moved below the sync watermark; rescanning",
+                            self.db_path)
+                after = below = 0
+        while True:
+            with open_hardened_sqlite(self.db_path) as conn:
+                pending = conn.execute(
+                    "SELECT m.rowid, m.id, m.content, v.vec_row FROM memories m "
+                    "LEFT JOIN memory_vectors v ON v.memory_id = m.id "
+                    "WHERE m.rowid > ? ORDER BY m.rowid LIMIT ?", (after, batch),
+                ).fetchall()
+            if not pending:
+                return added
+            # Rows store() already indexed are skipped without re-embedding.
+            added += self.add([(memory_id, content)
+                               for _, memory_id, content, vec_row in pending if vec_row is None])
+            after = pending[-1][0]
+            below += len(pending)
+            with open_hardened_sqlite(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO memory_vector_meta (key, value) VALUES (?, ?)",
+                    [("synced_rowid", str(after)), ("synced_count", str(below))],
+                )
+
+    # ── Reads ──────────────────────────────────────────────────────
+
+    def _open_matrix(self, rows: int) -> np.ndarray:
+        if rows == 0:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        st = self.matrix_path.stat()
+        key = (st.st_ino, rows)
+        if self._matrix_key != key:
+            self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r",
+                                     shape=(rows, self.dim))
+            self._matrix_key = key
+        return self._matrix
+
+    def _ivf_for(self, matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        rows = len(matrix)
+        try:
+            mtime = self.ivf_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None and mtime != self._ivf_mtime:
+            try:
+                with np.load(self.ivf_path, allow_pickle=False) as data:
+                    ivf = {k: data[k] for k in data.files}
+                if str(ivf.get("embedder")) == self.embedder.name:
+                    self._ivf, self._ivf_mtime = ivf, mtime
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning("Ignoring unreadable IVF index %s: %s", self.ivf_path, exc)
+        ivf = self._ivf
+        trained = int(ivf["trained"]) if ivf is not None else 0
+        if ivf is None or trained > rows or (rows - trained) * 4 > trained:
+            ivf = train_ivf(matrix)
+            ivf["embedder"] = np.array(self.embedder.name)
+            tmp = self.ivf_path.with_name(f"{self.ivf_path.name}.{os.getpid()}.tmp.npz")
+            try:
+                np.savez(tmp, **ivf)
+                os.replace(tmp, self.ivf_path)
+                self._ivf_mtime = self.ivf_path.stat().st_mtime_ns
+            except OSError as exc:
+                logger.warning("Could not persist IVF index %s: %s", self.ivf_path, exc)
+                tmp.unlink(missing_ok=True)
+            self._ivf = ivf
+        return ivf
+
+    def _candidates(self, matrix: np.ndarray, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows to score exactly; None means all of them (brute force)."""
+        if len(matrix) <= _env_int("NUCLEUS_VECTOR_ANN_MIN_ROWS", DEFAULT_ANN_MIN_ROWS):
+            return None
+        ivf = self._ivf_for(matrix)
+        centroids, rows, offsets = ivf["centroids"], ivf["rows"], ivf["offsets"]
+        nprobe = _env_int("NUCLEUS_VECTOR_NPROBE", max(DEFAULT_NPROBE, len(centroids) // 8))
+        nprobe = min(len(centroids), nprobe)
+        probe = _top_k(centroids @ query, nprobe)
+        parts = [rows[offsets[p]:offsets[p + 1]] for p in probe]
+        parts.append(np.arange(int(ivf["trained"]), len(matrix), dtype=np.int64))
+        cand = np.concatenate(parts)
+        cand.sort()  # sequential reads from the memmap
+        return cand
+
+    def search(self, query: str, limit: int) -> List[Tuple[str, float]]:
+        """``(memory_id, cosine)`` for the ``limit`` nearest memories, best first."""
+        self.sync()
+        q = self._embed([query or ""])[0]
+        if not q.any():
+            return []
+        with self._lock:
+            with open_hardened_sqlite(self.db_path) as conn:
+                rows = self._committed_rows(conn)
+            matrix = self._open_matrix(rows)
+            cand = self._candidates(matrix, q)
+        if cand is None:
+            scores = matrix @ q
+            best = _top_k(scores, max(1, int(limit)))
+            hits = [(int(r), float(scores[r])) for r in best]
+        else:
+            scores = matrix[cand] @ q
+            best = _top_k(scores, max(1, int(limit)))
+            hits = [(int(cand[r]), float(scores[r])) for r in best]
+        hits = [(r, s) for r, s in hits if s > 0.0]
+        if not hits:
+            return []
+        with open_hardened_sqlite(self.db_path) as conn:
+            ids = dict(conn.execute(
+                "SELECT vec_row, memory_id FROM memory_vectors WHERE vec_row IN "
+                f"({','.join('?' * len(hits))})", [r for r, _ in hits]))
+        return [(ids[r], s) for r, s in hits if r in ids]
+
+
+__all__ = [
+    "HashingEmbedder", "LocalVectorIndex", "get_embedder", "train_ivf",
+]
@@ -2,13 +2,13 @@
 import logging
 import os
 import time
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional
 import sqlite3
 import json
 from pathlib import Path
-from .llm_client import DualEngineLLM
+from .embeddings import get_embedding_client
 from .storage import get_firestore_client, STORAGE_TYPE
-from ..runtime.common import get_brain_path, open_hardened_sqlite
+from ..runtime.common import fts_match, get_brain_path, open_hardened_sqlite
 
 logger = logging.getLogger("nucleus.vector_store")
 
@@ -30,6 +30,46 @@ def _sor_flag_on() -> bool:
     """True iff ``NUCLEUS_MEMORY_SOR`` is set truthy (default False)."""
     return os.environ.get(_SOR_FLAG, "").strip().lower() in _SOR_TRUTHY
 
+
+# Local semantic recall (runtime/vector_index.py): LocalSQLiteStore embeds rows
+# offline and fuses the cosine ranking with the keyword ranking. On by
+# default; NUCLEUS_LOCAL_VECTORS=0 restores keyword-only search.
+_LOCAL_VECTORS_FLAG = "NUCLEUS_LOCAL_VECTORS"
+_LOCAL_VECTORS_FALSY = frozenset({"0", "false", "no", "off"})
+
+# Reciprocal rank fusion: score = sum(1 / (_RRF_K + rank)) over the vector and
+# keyword rankings. Hashed embeddings collide, so raw cosine must not outrank
+# a real lexical match on its own; each side contributes at least
+# _FUSION_CANDIDATES_MIN candidates so a row ranked well by one side survives.
+_RRF_K = 60
+_FUSION_CANDIDATES_MIN = 20
+
+
+def _local_vectors_on() -> bool:
+    return os.environ.get(_LOCAL_VECTORS_FLAG, "").strip().lower() not in _LOCAL_VECTORS_FALSY
+
+
+# FTS5 shadow of memories.content for ranked keyword search. A plain (not
+# external-content) table keyed by the memory id: memories has no INTEGER
+# PRIMARY KEY, so its implicit rowids may be renumbered by VACUUM.
+_MEMORIES_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(content, id UNINDEXED)",
+    """CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN
+        INSERT INTO memories_fts(content, id) VALUES (new.content, new.id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN
+        DELETE FROM memories_fts WHERE id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS memories_fts_au AFTER UPDATE OF content ON memories BEGIN
+        DELETE FROM memories_fts WHERE id = old.id;
+        INSERT INTO memories_fts(content, id) VALUES (new.content, new.id);
+    END""",
+)
+
+# Firestore caps a batched write at 500 operations.
+_FIRESTORE_BATCH_LIMIT = 500
+
+
 class VectorStore:
     """
     Manages Vector Storage and Retrieval using Firestore and Gemini Embeddings.
@@ -40,7 +80,7 @@ class VectorStore:
         self.enabled = STORAGE_TYPE == "firestore"
         
         if self.enabled:
-            self.llm = DualEngineLLM(model_name="gemini-embedding-001")
+            self.llm = get_embedding_client("gemini-embedding-001")
         else:
             self.llm = None
             # Initialize Local SQLite Store for fallback
@@ -57,84 +97,57 @@ class VectorStore:
         fault-isolated — any failure is swallowed so an index miss never breaks
         the authoritative SoR capture. Returns the sink doc id (or ``None``).
         """
+        return self.index_many([(doc_id, text, metadata)])[0]
+
+    def index_many(self, items: Iterable[tuple]) -> List[Optional[str]]:
+        """Bulk ``index`` of ``(doc_id, text, metadata)`` triples.
+
+        Texts are embedded through ``embed_many`` (provider-sized batches,
+        deduplicated against the embedding cache) and written with Firestore
+        batched writes, or in one LocalSQLiteStore transaction. Best-effort like
+        ``index``: returns one sink doc id (or ``None``) per item.
+        """
+        items = list(items)
         try:
-            metadata = metadata or {}
             if getattr(self, "enabled", False) and getattr(self, "llm", None) is not None:
-                embedding_resp = self.llm.embed_content(text, task_type="retrieval_document")
-                vector = embedding_resp.get("embedding", [])
-                if not vector:
-                    return None
-                db = get_firestore_client()
-                doc_ref = db.collection(self.collection_name).document()
-                payload = {"content": text, "metadata": metadata, "created_at": time.time()}
+                vectors = self.llm.embed_many([text for _, text, _ in items],
+                                              task_type="retrieval_document")
                 try:
                     from google.cloud.firestore_v1.vector import Vector
-                    payload["embedding_vector"] = Vector(vector)
                 except ImportError:
-                    pass
-                doc_ref.set(payload)
-                return doc_ref.id
+                    Vector = None
+                db = get_firestore_client()
+                coll = db.collection(self.collection_name)
+                ids: List[Optional[str]] = []
+                batch, pending = db.batch(), 0
+                for (_, text, metadata), vector in zip(items, vectors):
+                    if not vector:
+                        ids.append(None)
+                        continue
+                    doc_ref = coll.document()
+                    payload = {"content": text, "metadata": metadata or {}, "created_at": time.time()}
+                    if Vector is not None:
+                        payload["embedding_vector"] = Vector(vector)
+                    batch.set(doc_ref, payload)
+                    ids.append(doc_ref.id)
+                    pending += 1
+                    if pending == _FIRESTORE_BATCH_LIMIT:
+                        batch.commit()
+                        batch, pending = db.batch(), 0
+                if pending:
+                    batch.commit()
+                return ids
             local = getattr(self, "local_store", None)
             if local is not None:
-                return local.store(text, metadata)
+                return local.store_many([(text, metadata or {}) for _, text, metadata in items])
         except Exception as exc:  # noqa: BLE001 — index sink is best-effort/additive
             logger.warning("VectorStore.index best-effort sink failed (ignored): %s", exc)
-        return None
-
-class LocalSQLiteStore:
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self._init_db()
-
-    def _init_db(self):
-        with open_hardened_sqlite(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS memories (
-                    id TEXT PRIMARY KEY,
-                    content TEXT,
-                    metadata TEXT,
-                    created_at REAL
-                )
-            """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_content ON memories(content)")
+        return [None] * len(items)
 
-    def store(self, content: str, metadata: Dict) -> str:
-        import uuid
-        doc_id = str(uuid.uuid4())
-        with open_hardened_sqlite(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO memories (id, content, metadata, created_at) VALUES (?, ?, ?, ?)",
-                (doc_id, content, json.dumps(metadata), time.time())
-            )
-        return doc_id
-
-    def search(self, query: str, limit: int) -> List[Dict]:
-        # Simplest possible keyword search for local fallback
-        # In a real scenario, this would use FTS5 or local embeddings
-        # NOTE for future-FTS5 migrator: if migrating from LIKE ? to FTS5
-        # MATCH ?, apply the Bug #3 try-then-retry pattern. Literal-input
-        # callers passing tokens FTS5 parses as syntax (e.g. `tb.py`,
-        # `feat/foo`, anything containing `.` / `/` / `-`) raise
-        # `fts5: syntax error`. Reference fix: eidetic-daemon
-        # internal/store/store.go Search() (PR #77 / 3c3fa72) — try as-is,
-        # retry once with phrase-quoting (`"..."` with `""`-escape doubling)
-        # on FTS5 syntax error. FTS5's own error string is the discriminator;
-        # context cancellation + other DB errors propagate unchanged.
-        with open_hardened_sqlite(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM memories WHERE content LIKE ? ORDER BY created_at DESC LIMIT ?",
-                (f"%{query}%", limit)
-            )
-            results = []
-            for row in cursor:
-                results.append({
-                    "id": row["id"],
-                    "content": row["content"],
-                    "metadata": json.loads(row["metadata"]),
-                    "score": 1.0 # Exact keyword match proxy
-                })
-            return results
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Read counterpart of ``index``: Firestore KNN when enabled, else the
+        LocalSQLiteStore embedding index (see ``search_memory``)."""
+        return self.search_memory(query, limit)
 
     def store_memory(self, content: str, metadata: Dict[str, Any] = None) -> str:
         """Embeds and stores a memory chunk. Returns the Document ID.
@@ -181,8 +194,7 @@ class LocalSQLiteStore:
         
         try:
             # Generate Embedding
-            embedding_resp = self.llm.embed_content(content, task_type="retrieval_document")
-            vector = embedding_resp.get('embedding', [])
+            vector = self.llm.embed_many([content], task_type="retrieval_document")[0]
             
             if not vector:
                 raise ValueError("Failed to generate embedding")
@@ -280,8 +292,7 @@ class LocalSQLiteStore:
 
         try:
             # Embed Query
-            embedding_resp = self.llm.embed_content(query, task_type="retrieval_query")
-            query_vector = embedding_resp.get('embedding', [])
+            query_vector = self.llm.embed_many([query], task_type="retrieval_query")[0]
             
             if not query_vector:
                 return []
@@ -318,3 +329,161 @@ class LocalSQLiteStore:
         except Exception as e:
             logger.error(f"Memory search failed: {e}")
             return []
+
+class LocalSQLiteStore:
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._init_db()
+        self._vectors = None
+        self._vectors_failed = False
+
+    def _init_db(self):
+        with open_hardened_sqlite(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS memories (
+                    id TEXT PRIMARY KEY,
+                    content TEXT,
+                    metadata TEXT,
+                    created_at REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_content ON memories(content)")
+            conn.commit()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                had_fts = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memories_fts'"
+                ).fetchone() is not None
+                for stmt in _MEMORIES_FTS_SCHEMA:
+                    conn.execute(stmt)
+                if not had_fts:
+                    conn.execute("INSERT INTO memories_fts(content, id) SELECT content, id FROM memories")
+                conn.commit()
+            except sqlite3.OperationalError as exc:  # e.g. SQLite built without FTS5
+                conn.rollback()
+                logger.warning("memories FTS5 shadow unavailable; keyword search uses LIKE: %s", exc)
+
+    def _vector_index(self):
+        """Lazy ``LocalVectorIndex`` for this db, or None (flag off / unavailable)."""
+        if self._vectors is None and not self._vectors_failed and _local_vectors_on():
+            try:
+                from .vector_index import LocalVectorIndex
+
+                self._vectors = LocalVectorIndex(self.db_path)
+            except Exception as exc:  # noqa: BLE001 — keyword search still works
+                logger.warning("Local vector index unavailable; keyword search only: %s", exc)
+                self._vectors_failed = True
+        return self._vectors if _local_vectors_on() else None
+
+    def store(self, content: str, metadata: Dict) -> str:
+        return self.store_many([(content, metadata)])[0]
+
+    def store_many(self, items: List[tuple]) -> List[str]:
+        """Insert ``(content, metadata)`` pairs in one transaction; returns their ids."""
+        import uuid
+        now = time.time()
+        rows = [(str(uuid.uuid4()), content, json.dumps(metadata), now) for content, metadata in items]
+        with open_hardened_sqlite(self.db_path) as conn:
+            conn.executemany(
+                "INSERT INTO memories (id, content, metadata, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        vectors = self._vector_index()
+        if vectors is not None and rows:
+            try:
+                vectors.add([(doc_id, content) for doc_id, content, _, _ in rows])
+            except Exception as exc:  # noqa: BLE001 — search-time sync() backfills it
+                logger.warning("Local vector index append failed (will backfill): %s", exc)
+        return [row[0] for row in rows]
+
+    def search(self, query: str, limit: int) -> List[Dict]:
+        """Memories ranked by RRF over the local-embedding and keyword rankings.
+
+        ``score`` is the fused RRF score. Rows tied on it keep keyword order
+        ahead of vector-only rows.
+        """
+        vectors = self._vector_index()
+        if vectors is None:
+            return self._keyword_search(query, limit)
+        pool = max(int(limit) * 4, _FUSION_CANDIDATES_MIN)
+        try:
+            hits = vectors.search(query, pool)
+        except Exception as exc:  # noqa: BLE001 — degrade to keyword search
+            logger.warning("Local vector search failed; keyword search only: %s", exc)
+            return self._keyword_search(query, limit)
+        keyword = self._keyword_search(query, pool)
+
+        fused: Dict[str, float] = {}
+        rows: Dict[str, Dict] = {}
+        for rank, row in enumerate(keyword, start=1):
+            fused[row["id"]] = 1.0 / (_RRF_K + rank)
+            rows[row["id"]] = row
+        for rank, row in enumerate(self._fetch(hits), start=1):
+            fused[row["id"]] = fused.get(row["id"], 0.0) + 1.0 / (_RRF_K + rank)
+            rows.setdefault(row["id"], row)
+        # sorted() is stable and ``fused`` holds keyword rows first.
+        ranked = sorted(fused, key=fused.__getitem__, reverse=True)[: max(0, int(limit))]
+        return [dict(rows[doc_id], score=fused[doc_id]) for doc_id in ranked]
+
+    def _fetch(self, hits: List[tuple]) -> List[Dict]:
+        if not hits:
+            return []
+        with open_hardened_sqlite(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = {
+                row["id"]: row
+                for row in conn.execute(
+                    "SELECT * FROM memories WHERE id IN (%s)" % ",".join("?" * len(hits)),
+                    [doc_id for doc_id, _ in hits],
+                )
+            }
+        return [
+            {
+                "id": doc_id,
+                "content": rows[doc_id]["content"],
+                "metadata": json.loads(rows[doc_id]["metadata"]),
+                "score": score,
+            }
+            for doc_id, score in hits
+            if doc_id in rows
+        ]
+
+    def _keyword_search(self, query: str, limit: int) -> List[Dict]:
+        """BM25-ranked FTS5 match over content (newest first without a query).
+
+        Falls back to the legacy ``LIKE`` scan only when the FTS5 shadow is
+        missing (SQLite built without FTS5)."""
+        with open_hardened_sqlite(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            if not (query or "").strip():
+                rows = conn.execute(
+                    "SELECT id, content, metadata, 1.0 AS score FROM memories "
+                    "ORDER BY created_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+            else:
+                try:
+                    # bm25: lower is more relevant → negate so higher == better.
+                    rows = fts_match(
+                        conn,
+                        "SELECT m.id, m.content, m.metadata, -bm25(memories_fts) AS score "
+                        "FROM memories_fts JOIN memories m ON m.id = memories_fts.id "
+                        "WHERE memories_fts MATCH ? ORDER BY rank, m.created_at DESC LIMIT ?",
+                        query, (limit,),
+                    )
+                except sqlite3.OperationalError as exc:
+                    if "memories_fts" not in str(exc):
+                        raise
+                    rows = conn.execute(
+                        "SELECT id, content, metadata, 1.0 AS score FROM memories "
+                        "WHERE content LIKE ? ORDER BY created_at DESC LIMIT ?",
+                        (f"%{query}%", limit)
+                    ).fetchall()
+            return [
+                {
+                    "id": row["id"],
+                    "content": row["content"],
+                    "metadata": json.loads(row["metadata"]),
+                    "score": float(row["score"]),
+                }
+                for row in rows
+            ]
@@ -92,14 +92,8 @@ def _get_intent_context(brain_path: Path) -> Dict[str, Any]:
         # Recent high-intensity engrams (intent signals)
         engram_path = brain_path / "engrams" / "ledger.jsonl"
         if engram_path.exists():
-            engrams = []
-            with open(engram_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            engrams.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
+            from .runtime.engram_ledger import load_live_engrams
+            engrams = load_live_engrams(engram_path)
             # Top 5 by intensity, most recent first
             engrams.sort(key=lambda e: (e.get("intensity", 0), e.get("timestamp", "")), reverse=True)
             intent["engrams"] = engrams[:5]
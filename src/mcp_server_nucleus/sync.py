@@ -1,10 +1,12 @@
 """Brain content sync — local ↔ hosted engram synchronization.
 
 Implements the client side of the engram sync protocol:
-    1. Read local engrams from .brain/engrams/ledger.jsonl
+    1. Read local engrams (and delete tombstones) from .brain/engrams/ledger.jsonl
     2. POST them to the hosted sync endpoint (NUCLEUS_SYNC_URL)
-    3. Receive remote engrams that are newer or missing locally
-    4. Apply remote engrams to local ledger via ADUN pipeline
+    3. Receive remote engrams that are newer or missing locally, plus
+       hosted deletes of keys held locally
+    4. Apply remote engrams to local ledger via ADUN pipeline, and the
+       deletes as local tombstones
     5. Persist sync state (last sync timestamp) for incremental sync
 
 Conflict resolution is deterministic and matches the server side:
@@ -54,34 +56,53 @@ def _get_brain_path() -> Path:
     return Path(get_brain_path())
 
 
-def _read_local_engrams(brain_path: Path) -> List[Dict[str, Any]]:
-    """Read all engrams from local ledger, returning latest version per key."""
+def _resolve_local_ledger(brain_path: Path) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """Resolve the local ledger into (live engrams, tombstoned key → deleted_at).
+
+    The ledger is append-only, so superseded versions and DELETE tombstones
+    are folded out here rather than pushed to the hosted side as live.
+    """
+    from mcp_server_nucleus.runtime.engram_ledger import (
+        is_tombstone, iter_records, live_records, resolve_latest,
+    )
+
     ledger_path = brain_path / "engrams" / "ledger.jsonl"
     if not ledger_path.exists():
-        return []
+        return [], {}
+
+    def _winner(existing: Dict[str, Any], candidate: Dict[str, Any]) -> Dict[str, Any]:
+        return candidate if _engram_rank(candidate) > _engram_rank(existing) else existing
 
-    engrams_by_key: Dict[str, Dict[str, Any]] = {}
     try:
-        with open(ledger_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    engram = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                key = engram.get("key")
-                if not key:
-                    continue
-                existing = engrams_by_key.get(key)
-                if existing is None or _engram_rank(engram) > _engram_rank(existing):
-                    engrams_by_key[key] = engram
+        resolved = resolve_latest(iter_records(ledger_path), _winner)
     except Exception as e:
         logger.warning("Failed to read local ledger: %s", e)
-        return []
+        return [], {}
 
-    return list(engrams_by_key.values())
+    live = [e for e in live_records(resolved) if e.get("key")]
+    tombstones = {
+        key: rec.get("deleted_at") or rec.get("timestamp", "")
+        for key, rec in resolved["by_key"].items()
+        if is_tombstone(rec)
+    }
+    return live, tombstones
+
+
+def _read_local_engrams(brain_path: Path) -> List[Dict[str, Any]]:
+    """Read all live engrams from local ledger, returning latest version per key."""
+    return _resolve_local_ledger(brain_path)[0]
+
+
+def _deleted_since(remote_engram: Dict[str, Any], tombstones: Dict[str, str]) -> bool:
+    """True if a local DELETE is newer than this remote engram."""
+    deleted_at = tombstones.get(remote_engram.get("key", ""))
+    if deleted_at is None:
+        return False
+    remote_ts = _parse_timestamp(remote_engram.get("timestamp", ""))
+    local_ts = _parse_timestamp(deleted_at)
+    if remote_ts is None or local_ts is None:
+        return True
+    return remote_ts <= local_ts
 
 
 def _engram_rank(engram: Dict[str, Any]) -> Tuple[int, float, int]:
@@ -140,6 +161,7 @@ def _apply_remote_engrams(
     from mcp_server_nucleus.runtime.memory_pipeline import MemoryPipeline
 
     pipeline = MemoryPipeline(brain_path)
+    _, tombstones = _resolve_local_ledger(brain_path)
     applied = 0
     skipped = 0
 
@@ -148,6 +170,10 @@ def _apply_remote_engrams(
         if not key:
             skipped += 1
             continue
+        if _deleted_since(remote_engram, tombstones):
+            # Deleted locally after the hosted copy was written — don't resurrect.
+            skipped += 1
+            continue
 
         try:
             # Use the ADUN pipeline for deterministic apply
@@ -167,22 +193,42 @@ def _apply_remote_engrams(
             logger.warning("Failed to apply remote engram %s: %s", key, e)
             skipped += 1
 
-    # Invalidate cache after writes
-    try:
-        from mcp_server_nucleus.runtime.engram_cache import get_engram_cache
-        get_engram_cache().invalidate()
-    except Exception:
-        pass
-
     return applied, skipped
 
 
+def _apply_remote_deletes(
+    remote_deletes: List[Dict[str, Any]], brain_path: Path, dry_run: bool = False
+) -> int:
+    """Tombstone local engrams the hosted side deleted after their last write.
+
+    Returns the number of keys deleted.
+    """
+    from mcp_server_nucleus.runtime.engram_ledger import append_records, make_tombstone
+
+    live = {e["key"]: e for e in _read_local_engrams(brain_path)}
+    tombstones = []
+    for d in remote_deletes:
+        key = d.get("key")
+        current = live.get(key)
+        if current is None:
+            continue
+        local_ts = _parse_timestamp(current.get("timestamp", ""))
+        deleted_at = _parse_timestamp(d.get("deleted_at", ""))
+        if local_ts is not None and deleted_at is not None and local_ts > deleted_at:
+            continue  # rewritten locally after the hosted delete
+        tombstones.append(make_tombstone(key))
+    if dry_run:
+        return len(tombstones)
+    return append_records(brain_path, tombstones)
+
+
 def _post_sync(
     url: str,
     token: Optional[str],
     since_timestamp: Optional[str],
     local_engrams: List[Dict[str, Any]],
     sync_state: Dict[str, Any],
+    deleted_keys: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """POST sync request to hosted endpoint. Returns parsed response."""
     import urllib.request
@@ -191,6 +237,10 @@ def _post_sync(
     payload = {
         "since_timestamp": since_timestamp,
         "local_engrams": local_engrams,
+        "deleted_keys": [
+            {"key": key, "deleted_at": deleted_at}
+            for key, deleted_at in sorted((deleted_keys or {}).items())
+        ],
         "local_sync_state": sync_state,
     }
 
@@ -226,7 +276,7 @@ def perform_sync_cycle(
     captured in the returned stats dict.
 
     Returns dict with keys:
-        ok (bool), pushed, received, applied, skipped, conflicts,
+        ok (bool), pushed, received, applied, skipped, deleted, conflicts,
         next_timestamp, error (str|None), transport_down (bool)
     """
     sync_url = _get_sync_url(url)
@@ -235,11 +285,11 @@ def perform_sync_cycle(
 
     sync_state = _load_sync_state(brain_path)
     since_ts = None if full else sync_state.get("last_sync_timestamp")
-    local_engrams = _read_local_engrams(brain_path)
+    local_engrams, local_deletes = _resolve_local_ledger(brain_path)
 
     stats: Dict[str, Any] = {
         "ok": False, "pushed": 0, "received": 0, "applied": 0,
-        "skipped": 0, "conflicts": 0, "next_timestamp": None,
+        "skipped": 0, "deleted": 0, "conflicts": 0, "next_timestamp": None,
         "error": None, "transport_down": False,
     }
 
@@ -255,7 +305,7 @@ def perform_sync_cycle(
     # POST to sync endpoint
     try:
         response = _post_sync(
-            sync_url, token, since_ts, local_engrams, sync_state
+            sync_url, token, since_ts, local_engrams, sync_state, local_deletes
         )
     except RuntimeError as e:
         stats["error"] = str(e)
@@ -269,6 +319,7 @@ def perform_sync_cycle(
     # Apply remote engrams to local
     remote_engrams = response.get("remote_engrams", [])
     applied, skipped = _apply_remote_engrams(remote_engrams, brain_path, dry_run)
+    deleted = _apply_remote_deletes(response.get("deleted_keys", []), brain_path, dry_run)
 
     # Update sync state
     next_ts = response.get("next_sync_timestamp")
@@ -281,6 +332,7 @@ def perform_sync_cycle(
         "last_sync_remote_received": len(remote_engrams),
         "last_sync_remote_applied": applied,
         "last_sync_remote_skipped": skipped,
+        "last_sync_remote_deleted": deleted,
         "last_sync_conflicts": response.get("conflict_count", 0),
     }
     _save_sync_state(brain_path, new_state)
@@ -291,6 +343,7 @@ def perform_sync_cycle(
         "received": len(remote_engrams),
         "applied": applied,
         "skipped": skipped,
+        "deleted": deleted,
         "conflicts": response.get("conflict_count", 0),
         "next_timestamp": next_ts,
     })
@@ -313,7 +366,7 @@ def perform_sync(
     since_ts = None if full else sync_state.get("last_sync_timestamp")
 
     # Read local engrams
-    local_engrams = _read_local_engrams(brain_path)
+    local_engrams, local_deletes = _resolve_local_ledger(brain_path)
 
     if verbose:
         print(f"Sync configuration:")
@@ -337,7 +390,7 @@ def perform_sync(
     # POST to sync endpoint
     try:
         response = _post_sync(
-            sync_url, token, since_ts, local_engrams, sync_state
+            sync_url, token, since_ts, local_engrams, sync_state, local_deletes
         )
     except RuntimeError as e:
         print(f"Sync failed: {e}", file=sys.stderr)
@@ -350,6 +403,7 @@ def perform_sync(
     # Apply remote engrams to local
     remote_engrams = response.get("remote_engrams", [])
     applied, skipped = _apply_remote_engrams(remote_engrams, brain_path, dry_run)
+    deleted = _apply_remote_deletes(response.get("deleted_keys", []), brain_path, dry_run)
 
     # Update sync state
     next_ts = response.get("next_sync_timestamp")
@@ -362,6 +416,7 @@ def perform_sync(
         "last_sync_remote_received": len(remote_engrams),
         "last_sync_remote_applied": applied,
         "last_sync_remote_skipped": skipped,
+        "last_sync_remote_deleted": deleted,
         "last_sync_conflicts": response.get("conflict_count", 0),
     }
     _save_sync_state(brain_path, new_state)
@@ -372,6 +427,7 @@ def perform_sync(
     print(f"  Received from hosted: {len(remote_engrams)} engrams")
     print(f"  Applied locally:     {applied} engrams")
     print(f"  Skipped:             {skipped} engrams")
+    print(f"  Deleted locally:     {deleted} engrams")
     print(f"  Conflicts:           {response.get('conflict_count', 0)}")
     if response.get("conflicts"):
         for c in response["conflicts"][:5]:
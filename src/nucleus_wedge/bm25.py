@@ -1,4 +1,12 @@
-"""In-memory BM25 over Store rows. Rebuild on every ``search`` call (Day-1; 2615 rows ≪ 50 ms).
+"""BM25 over Store rows.
+
+``search`` scores against the persistent inverted index in ``bm25_index``
+(postings mapped from ``engrams/bm25.idx``, tailed as rows are appended), so a
+query costs its terms' postings instead of a full rebuild — the Day-1
+rebuild-per-call ("2615 rows ≪ 50 ms") took seconds at 300k rows. Scores are
+identical to ``BM25Okapi`` over all rows. ``kind``/``since``-filtered queries
+(the corpus statistics depend on the filtered subset) and
+``NUCLEUS_WEDGE_BM25_INDEX=0`` still rebuild per call.
 
 #440 PR_C wire-in: NUCLEUS_WEDGE_RANKER env var selects post-BM25 re-ranker.
 Default = baseline (BM25-only, no re-rank). Set NUCLEUS_WEDGE_RANKER=time_bucket_boost
@@ -14,13 +22,13 @@ Allowed values:
 """
 from __future__ import annotations
 
-import json, math, os, re, time
-from datetime import datetime, timezone
+import math, os, re, time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
-from rank_bm25 import BM25Okapi  # type: ignore[import-untyped]
-
+from nucleus_wedge import bm25_index, metrics
 from nucleus_wedge.store import Store
 
 _TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
@@ -56,51 +64,136 @@ def _parse_ts(ts: str):
         return None
 
 
-def _rerank_time_decay(ranked: list[dict]) -> list[dict]:
-    now = datetime.now(timezone.utc)
-    for r in ranked:
-        ts = _parse_ts(r.get("timestamp", ""))
-        age_days = 365.0 if ts is None else max(0.0, (now - ts).total_seconds() / 86400.0)
-        r["score"] = r["score"] * math.exp(-age_days * _DECAY_RATE)
-    ranked.sort(key=lambda d: d["score"], reverse=True)
-    return ranked
+# Re-ranking is columnar: a candidate set becomes score / epoch-µs / kind-id
+# arrays and each ranker is one NumPy expression over them, instead of a
+# per-dict loop re-parsing ISO timestamps. Timestamps and kinds repeat across
+# queries, so each distinct string is parsed once per process.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+_KIND_IDS = {name: i for i, name in enumerate(_KIND_BOOST)}
 
 
-def _rerank_time_bucket(ranked: list[dict]) -> list[dict]:
+@lru_cache(maxsize=65536)
+def _ts_epoch_us(ts: str) -> float:
+    """Microseconds since the epoch for ``ts``; NaN when unparseable."""
+    t = _parse_ts(ts)
+    return math.nan if t is None else float((t - _EPOCH) // _US)
+
+
+@lru_cache(maxsize=1024)
+def _kind_id(kind: str) -> int:
+    kind = (kind or "unknown").lower()
+    if kind.startswith("["):
+        kind = kind.lstrip("[").split(":", 1)[0].strip()
+    return _KIND_IDS.get(kind, _KIND_IDS["unknown"])
+
+
+def _epoch_column(timestamps: Iterable):
+    import numpy as np
+
+    return np.array(
+        [_ts_epoch_us(t) if isinstance(t, str) else math.nan for t in timestamps],
+        dtype=np.float64,
+    )
+
+
+def _kind_column(kinds: Iterable):
+    import numpy as np
+
+    return np.array(
+        [_kind_id(k) if isinstance(k, str) else _KIND_IDS["unknown"] for k in kinds],
+        dtype=np.intp,
+    )
+
+
+def _age_days(timestamps: Iterable):
+    """Age in days per candidate (NaN where the timestamp is missing)."""
+    now_us = (datetime.now(timezone.utc) - _EPOCH) // _US
+    return (now_us - _epoch_column(timestamps)) / 1e6 / 86400.0
+
+
+def _time_decay_scores(scores, timestamps, kinds):
+    import numpy as np
+
+    age = _age_days(timestamps)
+    age = np.where(np.isnan(age), 365.0, np.maximum(0.0, age))
+    return scores * np.exp(-age * _DECAY_RATE)
+
+
+def _time_bucket_scores(scores, timestamps, kinds):
     """Tier-based recency boost. Uses ADDITIVE bonus (not multiplicative)
     because BM25 scores can be NEGATIVE on small/sparse corpora — multiplying
     a negative score by 3.0 inverts the intended ranking. Additive bonus is
     robust to score sign. Bonus magnitudes scaled so a tier-jump exceeds
     typical BM25 score gaps (~5-10) for visible promotion."""
-    now = datetime.now(timezone.utc)
-    for r in ranked:
-        ts = _parse_ts(r.get("timestamp", ""))
-        if ts is None:
-            bonus = 0.0
-        else:
-            age_days = (now - ts).total_seconds() / 86400.0
-            if age_days <= 7.0:
-                bonus = 10.0  # ~ same magnitude as 2x BM25 typical positive scores
-            elif age_days <= 30.0:
-                bonus = 3.0
-            else:
-                bonus = 0.0
-        r["score"] = r["score"] + bonus
-    ranked.sort(key=lambda d: d["score"], reverse=True)
+    import numpy as np
+
+    age = _age_days(timestamps)  # NaN compares False → no bonus
+    # 10.0 ~ same magnitude as 2x BM25 typical positive scores
+    return scores + np.where(age <= 7.0, 10.0, np.where(age <= 30.0, 3.0, 0.0))
+
+
+def _per_kind_scores(scores, timestamps, kinds):
+    import numpy as np
+
+    boosts = np.fromiter(_KIND_BOOST.values(), dtype=np.float64, count=len(_KIND_BOOST))
+    return scores * boosts[_kind_column(kinds)]
+
+
+def _top_indices(scores, k: int):
+    """Indices of the ``k`` highest ``scores``, best first, ties in input order.
+
+    Same result as ``sorted(range(n), key=scores.__getitem__, reverse=True)[:k]``
+    but O(n) selection (``np.partition``) plus a sort of the ``k`` survivors.
+    """
+    import numpy as np
+
+    scores = np.asarray(scores, dtype=np.float64)
+    n = len(scores)
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        tied = np.flatnonzero(scores == kth)[: k - len(above)]
+        idx = np.sort(np.concatenate((above, tied)))
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def _rerank_with(kernel, ranked: list[dict]) -> list[dict]:
+    """Apply a columnar ``kernel`` to ranker dicts in place (stable, best first)."""
+    import numpy as np
+
+    scores = np.fromiter((r["score"] for r in ranked), dtype=np.float64, count=len(ranked))
+    new = kernel(
+        scores,
+        [r.get("timestamp", "") for r in ranked],
+        [r.get("kind") for r in ranked],
+    )
+    for r, s in zip(ranked, new.tolist()):
+        r["score"] = s
+    ranked[:] = [ranked[i] for i in np.argsort(-new, kind="stable").tolist()]
     return ranked
 
 
+def _rerank_time_decay(ranked: list[dict]) -> list[dict]:
+    return _rerank_with(_time_decay_scores, ranked)
+
+
+def _rerank_time_bucket(ranked: list[dict]) -> list[dict]:
+    return _rerank_with(_time_bucket_scores, ranked)
+
+
 def _rerank_per_kind(ranked: list[dict]) -> list[dict]:
-    for r in ranked:
-        kind = (r.get("kind") or "unknown").lower()
-        if kind.startswith("["):
-            kind = kind.lstrip("[").split(":", 1)[0].strip()
-        boost = _KIND_BOOST.get(kind, _KIND_BOOST["unknown"])
-        r["score"] = r["score"] * boost
-    ranked.sort(key=lambda d: d["score"], reverse=True)
-    return ranked
+    return _rerank_with(_per_kind_scores, ranked)
 
 
+_KERNELS = {
+    "time_bucket_boost": _time_bucket_scores,
+    "bm25_time_decay": _time_decay_scores,
+    "per_kind": _per_kind_scores,
+}
+
 _RANKERS = {
     "baseline": lambda r: r,  # no-op; preserves pre-#440 behavior
     "time_bucket_boost": _rerank_time_bucket,
@@ -129,46 +222,87 @@ def search(
     Set NUCLEUS_WEDGE_RANKER=time_bucket_boost for empirical PR_B winner.
     """
     _t0 = time.perf_counter()
+    # Over-fetch when re-ranker is active so the re-rank step can promote
+    # relevant items the baseline buried below top-K. No-op for baseline.
+    reranker, ranker_name = _select_reranker()
+    pre_limit = max(1, int(limit)) * (5 if ranker_name != "baseline" else 1)
+
+    hits = None
+    if not kind and not since and bm25_index.index_enabled():
+        hits = _search_indexed(store, query, pre_limit)
+    if hits is None:
+        hits = _search_rebuild(store, query, pre_limit, kind, since)
+    ranked, q_tokens, rows_count = hits
+    if not ranked:
+        return []
+
+    ranked = reranker(ranked)
+
+    # Recorded in-process; the JSONL row is appended by the metrics flusher.
+    _ms = (time.perf_counter() - _t0) * 1000.0
+    metrics.observe("recall.search_ms", _ms)
+    metrics.log_event(
+        Path(os.environ.get("NUCLEUS_BRAIN_PATH", ".brain")) / "metrics" / "recall_timings.jsonl",
+        {"ts": time.time(), "query_token_count": len(q_tokens), "rows_count": rows_count, "ms": round(_ms, 3), "ranker": ranker_name},
+    )
+    return ranked[: max(1, int(limit))]
+
+
+def _search_indexed(store: Store, query: str, pre_limit: int):
+    """Top ``pre_limit`` from the persistent index; None if it is unusable."""
+    q_tokens = _tokenize(query)
+    if not q_tokens:
+        return [], q_tokens, 0
+    try:
+        index = bm25_index.get_index(store.history_file, _tokenize, Store.extract)
+        top = index.top_k(q_tokens, pre_limit)
+        records = index.rows([doc for doc, _ in top])
+    except Exception as e:  # noqa: BLE001 — recall must survive a broken index
+        bm25_index.logger.warning("bm25 index query failed, rebuilding in memory: %s", e)
+        return None
+    ranked = []
+    for row, (_, score) in zip(records, top):
+        r = Store.extract(row)
+        ranked.append({
+            "content": r["value"],
+            "kind": r["kind"],
+            "timestamp": r["timestamp"],
+            "key": r["key"],
+            "score": score,
+        })
+    return ranked, q_tokens, index.docs
+
+
+def _search_rebuild(store: Store, query: str, pre_limit: int, kind: str | None, since: str | None):
+    """Score every (filtered) row with a fresh ``BM25Okapi`` — the pre-index path."""
+    from rank_bm25 import BM25Okapi  # type: ignore[import-untyped]
+
     flat = [Store.extract(r) for r in store.rows()]
     if kind:
         flat = [r for r in flat if r["context"].startswith(kind)]
     if since:
         flat = [r for r in flat if r["timestamp"] >= since]
     if not flat:
-        return []
+        return [], [], 0
 
     corpus: Iterable[list[str]] = [_tokenize(r["value"]) for r in flat]
     bm25 = BM25Okapi(list(corpus))
     q_tokens = _tokenize(query)
     if not q_tokens:
-        return []
+        return [], q_tokens, len(flat)
     scores = bm25.get_scores(q_tokens)
 
-    # Over-fetch when re-ranker is active so the re-rank step can promote
-    # relevant items the baseline buried below top-K. No-op for baseline.
-    reranker, ranker_name = _select_reranker()
-    pre_limit = max(1, int(limit)) * (5 if ranker_name != "baseline" else 1)
-
-    ranked = sorted(
-        (
-            {
-                "content": r["value"],
-                "kind": r["kind"],
-                "timestamp": r["timestamp"],
-                "key": r["key"],
-                "score": float(s),
-            }
-            for r, s in zip(flat, scores)
-        ),
-        key=lambda d: d["score"],
-        reverse=True,
-    )[:pre_limit]
-
-    ranked = reranker(ranked)
-
-    _p = Path(os.environ.get("NUCLEUS_BRAIN_PATH", ".brain")) / "metrics" / "recall_timings.jsonl"; _p.parent.mkdir(parents=True, exist_ok=True)
-    with _p.open("a") as _f: _f.write(json.dumps({"ts": time.time(), "query_token_count": len(q_tokens), "rows_count": len(flat), "ms": round((time.perf_counter() - _t0) * 1000.0, 3), "ranker": ranker_name}) + "\n")
-    return ranked[: max(1, int(limit))]
+    ranked = []
+    for i in _top_indices(scores, pre_limit).tolist():
+        r = flat[i]
+        ranked.append({
+            "content": r["value"],
+            "kind": r["kind"],
+            "timestamp": r["timestamp"],
+            "key": r["key"],
+            "score": float(scores[i]),
+        })
+    return ranked, q_tokens, len(flat)
 
 
 def rank_candidates(
@@ -191,9 +325,10 @@ def rank_candidates(
     #440 ranker flag) is identical — no ranking regression versus the existing
     wedge path. The ``search(store, ...)`` entry point above is untouched.
 
-    Candidate dict keys are preserved: scoring uses an internal wrapper and the
-    returned list contains the caller's original dicts (no ``score`` key added),
-    so the output shape matches the pre-batch-4 ``_do_recall_query`` contract.
+    Candidate dict keys are preserved: scoring and re-ranking run on score /
+    timestamp / kind columns and the returned list contains the caller's
+    original dicts (no ``score`` key added), so the output shape matches the
+    pre-batch-4 ``_do_recall_query`` contract.
 
     Empty/whitespace ``query`` → no BM25 signal; candidates are returned in input
     order truncated to ``limit`` (the caller supplies recency order for that case).
@@ -208,25 +343,23 @@ def rank_candidates(
     corpus: Iterable[list[str]] = [
         _tokenize(str(c.get(text_key) or "")) for c in candidates
     ]
-    bm25 = BM25Okapi(list(corpus))
-    scores = bm25.get_scores(q_tokens)
+    import numpy as np
 
-    reranker, ranker_name = _select_reranker()
+    scores = np.asarray(bm25_index.okapi_scores(list(corpus), q_tokens), dtype=np.float64)
+
+    _, ranker_name = _select_reranker()
     pre_limit = cap * (5 if ranker_name != "baseline" else 1)
 
-    wrapped = sorted(
-        (
-            {
-                "_cand": c,
-                "score": float(s),
-                "timestamp": c.get(ts_key, ""),
-                "kind": c.get(kind_key, ""),
-            }
-            for c, s in zip(candidates, scores)
-        ),
-        key=lambda d: d["score"],
-        reverse=True,
-    )[:pre_limit]
-
-    wrapped = reranker(wrapped)
-    return [d["_cand"] for d in wrapped[:cap]]
+    # Select the pre-rerank window on the score array, then run the ranker
+    # over just those rows' columns; no per-candidate wrapper dicts.
+    top = _top_indices(scores, pre_limit)
+    kernel = _KERNELS.get(ranker_name)
+    if kernel is not None:
+        sel = top.tolist()
+        new = kernel(
+            scores[top],
+            [candidates[i].get(ts_key, "") for i in sel],
+            [candidates[i].get(kind_key, "") for i in sel],
+        )
+        top = top[np.argsort(-new, kind="stable")]
+    return [candidates[i] for i in top[:cap].tolist()]
@@ -0,0 +1,655 @@
+"""Persistent inverted index behind ``bm25.search`` — no per-query rebuild.
+
+``search`` used to build a ``BM25Okapi`` over every history row on each call:
+parse all of history.jsonl, re-tokenize every value, then score every doc.
+This index keeps, per term, a postings list of ``(doc, tf)`` plus ``df``, and
+per doc its token count and byte offset in history.jsonl. A query reads only
+the postings of its own terms and parses only the rows it returns.
+
+On disk it is one file, ``engrams/bm25.idx``, memory-mapped on load::
+
+    magic | u32 header length | JSON header
+    doc offset u64[N] | doc length u32[N]
+    postings offset u64[V] | df u32[V] | max tf u32[V] | min doc length u32[V]
+    postings u32[2P]   (doc, tf) pairs grouped by term, doc ascending
+    terms              utf-8, newline-separated, in term-id order
+
+Term ids follow first appearance in the corpus, which is the order
+``BM25Okapi`` builds its vocabulary in. The vocabulary-wide average idf (the
+epsilon floor for terms in more than half the docs) is therefore summed in the
+same order, and scores are bit-identical to the rebuild.
+
+Incremental: the header records how many bytes of history.jsonl the file
+covers, plus the inode and a hash of the first block so a replaced or
+rewritten history is detected. Rows appended after that are tailed into an
+in-memory segment. ``Store.append`` does this in-process; other writers are
+caught on the next query. Once the tail reaches a quarter of the file
+(minimum ``_MERGE_MIN_DOCS``) both are merged into a new ``bm25.idx``, written
+aside and swapped in with ``os.replace``. A truncated or replaced history
+triggers a full rebuild.
+
+Query: MaxScore-style early termination. Terms are visited in decreasing
+upper bound (idf times the tf factor at the term's max tf and min doc length).
+Once the k-th best partial score exceeds what the remaining terms can add, no
+new docs are admitted. The remaining terms are common and low-idf, so they are
+only looked up, by binary search, for the surviving candidates. Final scores
+are recomputed in query-token order so the float sums match ``get_scores``.
+Negative-idf queries, and queries with fewer than k positive hits, are scored
+exhaustively over their postings.
+
+``NUCLEUS_WEDGE_BM25_INDEX=0`` turns the index off, and ``search`` rebuilds
+per query as before.
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import math
+import mmap
+import os
+import sys
+import threading
+import uuid
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("nucleus_wedge.bm25_index")
+
+INDEX_NAME = "bm25.idx"
+
+_INDEX_FLAG = "NUCLEUS_WEDGE_BM25_INDEX"
+_INDEX_FALSY = frozenset({"0", "false", "no", "off"})
+
+# rank_bm25.BM25Okapi defaults — the baseline ranker.
+K1 = 1.5
+B = 0.75
+EPSILON = 0.25
+
+_MAGIC = b"NWBM25\x01\x00"
+_FORMAT_VERSION = 1
+_HEAD_BYTES = 4096
+_READ_CHUNK = 16 * 1024 * 1024
+_MERGE_MIN_DOCS = 2048
+_MERGE_FRACTION = 4  # merge once tail docs >= main docs / _MERGE_FRACTION
+_MAX_U32 = 0xFFFFFFFF
+# Slack on score bounds so float rounding never prunes a true top-k doc.
+_BOUND_SLACK = 1e-9
+
+Tokenizer = Callable[[str], List[str]]
+
+
+def index_enabled() -> bool:
+    """False iff ``NUCLEUS_WEDGE_BM25_INDEX`` is set falsy (default on)."""
+    return os.environ.get(_INDEX_FLAG, "").strip().lower() not in _INDEX_FALSY
+
+
+def _tf_factor(tf: int, dl: int, avgdl: float) -> float:
+    # Same expression (and evaluation order) as BM25Okapi.get_scores.
+    return tf * (K1 + 1) / (tf + K1 * (1 - B + B * dl / avgdl))
+
+
+def _idf(n_docs: int, df: int) -> float:
+    return math.log(n_docs - df + 0.5) - math.log(df + 0.5)
+
+
+def okapi_scores(corpus: Sequence[List[str]], q_tokens: List[str]) -> List[float]:
+    """``BM25Okapi(corpus).get_scores(q_tokens)`` without the dense per-term passes.
+
+    Only docs containing a query term are touched, and the average idf is only
+    computed when a query term needs the epsilon floor. Results are
+    bit-identical to rank_bm25 for any non-empty vocabulary.
+    """
+    n_docs = len(corpus)
+    scores = [0.0] * n_docs
+    if not n_docs or not q_tokens:
+        return scores
+    wanted = set(q_tokens)
+    df: Dict[str, int] = {}
+    tfs: Dict[str, List[Tuple[int, int]]] = {t: [] for t in wanted}
+    doc_lens: List[int] = []
+    total = 0
+    for i, doc in enumerate(corpus):
+        doc_lens.append(len(doc))
+        total += len(doc)
+        freqs: Dict[str, int] = {}
+        for token in doc:
+            freqs[token] = freqs.get(token, 0) + 1
+        for token, tf in freqs.items():
+            df[token] = df.get(token, 0) + 1
+            if token in wanted:
+                tfs[token].append((i, tf))
+    if not df:
+        return scores
+    avgdl = total / n_docs
+
+    eps: Optional[float] = None
+    idf: Dict[str, float] = {}
+    for token in wanted:
+        if token not in df:
+            continue
+        value = _idf(n_docs, df[token])
+        if value < 0:
+            if eps is None:
+                idf_sum = 0
+                for d in df.values():
+                    idf_sum += _idf(n_docs, d)
+                eps = EPSILON * (idf_sum / len(df))
+            value = eps
+        idf[token] = value
+
+    for token in q_tokens:
+        weight = idf.get(token)
+        if not weight:
+            continue
+        for i, tf in tfs[token]:
+            scores[i] += weight * _tf_factor(tf, doc_lens[i], avgdl)
+    return scores
+
+
+def _head_hash(path: Path, length: int) -> str:
+    with path.open("rb") as fh:
+        return hashlib.sha1(fh.read(min(length, _HEAD_BYTES))).hexdigest()
+
+
+class BM25Index:
+    """Inverted index over one ``history.jsonl``; see the module docstring."""
+
+    def __init__(self, history: Path, tokenize: Tokenizer, extract: Callable[[dict], dict]):
+        self.history = Path(history)
+        self.path = self.history.parent / INDEX_NAME
+        self._tokenize = tokenize
+        self._extract = extract
+        self.lock = threading.RLock()
+        self._reset()
+        try:
+            self._load()
+        except Exception as e:
+            logger.info("bm25 index %s not reusable (%s); rebuilding from history", self.path, e)
+            self._reset()
+
+    # ── State ──────────────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        self._unmap()
+        # Main segment (memory-mapped file).
+        self._main_docs = 0
+        self._main_terms = 0
+        self._doc_off: Sequence[int] = ()
+        self._doc_len: Sequence[int] = ()
+        self._t_off: Sequence[int] = ()
+        self._t_df: Sequence[int] = ()
+        self._t_maxtf: Sequence[int] = ()
+        self._t_mindl: Sequence[int] = ()
+        self._post: Sequence[int] = ()
+        # Vocabulary, shared by both segments.
+        self._terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        # Tail segment: docs appended since the file was written.
+        self._tail_off = array("Q")
+        self._tail_len = array("I")
+        self._tail_post: Dict[int, array] = {}
+        self._tail_maxtf: Dict[int, int] = {}
+        self._tail_mindl: Dict[int, int] = {}
+        self.docs = 0
+        self.tokens = 0
+        self._covered = 0
+        self._ino: Optional[int] = None
+        self._avg_idf: Optional[Tuple[int, float]] = None
+        self._norm_cache: Optional[Tuple[Tuple[int, int], List[float]]] = None
+
+    def _unmap(self) -> None:
+        for view in getattr(self, "_views", ()):
+            view.release()
+        self._views: List[memoryview] = []
+        mm = getattr(self, "_mm", None)
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # a view is still referenced; the mapping goes with it
+        self._mm: Optional[mmap.mmap] = None
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        st = os.stat(self.history)
+        with self.path.open("rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mm[:len(_MAGIC)] != _MAGIC:
+                raise ValueError("bad magic")
+            hlen = int.from_bytes(mm[8:12], "little")
+            header = json.loads(mm[12:12 + hlen])
+            if header.get("version") != _FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+                raise ValueError("incompatible format")
+            covered = header["covered"]
+            if header["ino"] != st.st_ino or covered > st.st_size:
+                raise ValueError("history replaced or truncated")
+            if _head_hash(self.history, covered) != header["head"]:
+                raise ValueError("history rewritten")
+        except Exception:
+            mm.close()
+            raise
+
+        self._mm = mm
+        base = memoryview(mm)
+        self._views = [base]
+
+        def section(name: str, fmt: str) -> memoryview:
+            start, length = header["sections"][name]
+            view = base[start:start + length].cast(fmt)
+            self._views.append(view)
+            return view
+
+        self._doc_off = section("doc_off", "Q")
+        self._doc_len = section("doc_len", "I")
+        self._t_off = section("t_off", "Q")
+        self._t_df = section("t_df", "I")
+        self._t_maxtf = section("t_maxtf", "I")
+        self._t_mindl = section("t_mindl", "I")
+        self._post = section("postings", "I")
+        start, length = header["sections"]["terms"]
+        self._terms = bytes(base[start:start + length]).decode("utf-8").split("\n") if length else []
+        self._term_ids = {t: i for i, t in enumerate(self._terms)}
+        self._main_docs = self.docs = header["docs"]
+        self._main_terms = len(self._terms)
+        self.tokens = header["tokens"]
+        self._covered = covered
+        self._ino = st.st_ino
+
+    # ── Ingest ─────────────────────────────────────────────────────
+
+    def catch_up(self, merge: bool = True) -> None:
+        """Index rows appended to history.jsonl since the last call."""
+        with self.lock:
+            try:
+                st = os.stat(self.history)
+            except FileNotFoundError:
+                if self.docs:
+                    self._reset()
+                return
+            if (self._ino is not None and st.st_ino != self._ino) or st.st_size < self._covered:
+                logger.info("history %s replaced or truncated; rebuilding bm25 index", self.history)
+                self._reset()
+            self._ino = st.st_ino
+            if st.st_size > self._covered:
+                self._ingest(st.st_size)
+            if merge and len(self._tail_len) >= max(_MERGE_MIN_DOCS, self._main_docs // _MERGE_FRACTION):
+                self._merge()
+
+    def _ingest(self, size: int) -> None:
+        # Only complete lines are consumed; a partial trailing write is picked
+        # up once its newline lands.
+        with self.history.open("rb") as fh:
+            fh.seek(self._covered)
+            pos = self._covered
+            pending = b""
+            while pos + len(pending) < size:
+                chunk = fh.read(min(_READ_CHUNK, size - pos - len(pending)))
+                if not chunk:
+                    break
+                data = pending + chunk
+                end = data.rfind(b"\n")
+                if end < 0:
+                    pending = data
+                    continue
+                for raw in data[:end].split(b"\n"):
+                    self._add_line(raw, pos)
+                    pos += len(raw) + 1
+                pending = data[end + 1:]
+            self._covered = pos
+
+    def _add_line(self, raw: bytes, offset: int) -> None:
+        # Mirrors Store.rows() + Store.extract(): blank and undecodable lines
+        # are not documents.
+        line = raw.strip()
+        if not line:
+            return
+        try:
+            row = json.loads(line)
+            tokens = self._tokenize(self._extract(row)["value"])
+        except (ValueError, TypeError, AttributeError):
+            return
+        doc = self.docs
+        freqs: Dict[int, int] = {}
+        term_ids = self._term_ids
+        for token in tokens:
+            tid = term_ids.get(token)
+            if tid is None:
+                tid = term_ids[token] = len(self._terms)
+                self._terms.append(token)
+            freqs[tid] = freqs.get(tid, 0) + 1
+        dl = len(tokens)
+        for tid, tf in freqs.items():
+            postings = self._tail_post.get(tid)
+            if postings is None:
+                postings = self._tail_post[tid] = array("I")
+                self._tail_maxtf[tid] = tf
+                self._tail_mindl[tid] = dl
+            else:
+                if tf > self._tail_maxtf[tid]:
+                    self._tail_maxtf[tid] = tf
+                if dl < self._tail_mindl[tid]:
+                    self._tail_mindl[tid] = dl
+            postings.append(doc)
+            postings.append(tf)
+        self._tail_off.append(offset)
+        self._tail_len.append(min(dl, _MAX_U32))
+        self.docs += 1
+        self.tokens += dl
+        self._avg_idf = None
+
+    # ── Persistence ────────────────────────────────────────────────
+
+    def _merge(self) -> None:
+        """Fold the tail into a fresh ``bm25.idx`` and map it."""
+        doc_off = array("Q", bytes(self._doc_off))
+        doc_off.extend(self._tail_off)
+        doc_len = array("I", bytes(self._doc_len))
+        doc_len.extend(self._tail_len)
+        t_off, t_df = array("Q"), array("I")
+        t_maxtf, t_mindl = array("I"), array("I")
+        postings = array("I")
+        for tid in range(len(self._terms)):
+            t_off.append(len(postings))
+            df, maxtf, mindl = 0, 0, _MAX_U32
+            if tid < self._main_terms:
+                start, df = self._t_off[tid], self._t_df[tid]
+                postings.frombytes(self._post[start:start + 2 * df].tobytes())
+                maxtf, mindl = self._t_maxtf[tid], self._t_mindl[tid]
+            tail = self._tail_post.get(tid)
+            if tail is not None:
+                postings.extend(tail)
+                df += len(tail) // 2
+                maxtf = max(maxtf, self._tail_maxtf[tid])
+                mindl = min(mindl, self._tail_mindl[tid])
+            t_df.append(df)
+            t_maxtf.append(maxtf)
+            t_mindl.append(mindl)
+        terms = "\n".join(self._terms).encode("utf-8")
+
+        sections = [
+            ("doc_off", doc_off.tobytes()), ("doc_len", doc_len.tobytes()),
+            ("t_off", t_off.tobytes()), ("t_df", t_df.tobytes()),
+            ("t_maxtf", t_maxtf.tobytes()), ("t_mindl", t_mindl.tobytes()),
+            ("postings", postings.tobytes()), ("terms", terms),
+        ]
+        header = {
+            "version": _FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "docs": self.docs,
+            "tokens": self.tokens,
+            "covered": self._covered,
+            "ino": self._ino,
+            "head": _head_hash(self.history, self._covered),
+        }
+        # Section offsets depend on the header length; reserve room for them.
+        layout: Dict[str, List[int]] = {}
+        offset = 0
+        for name, blob in sections:
+            layout[name] = [offset, len(blob)]
+            offset += (len(blob) + 7) & ~7
+        header["sections"] = layout
+        reserve = len(json.dumps(header)) + 32 * len(sections)
+        start = (12 + reserve + 7) & ~7
+        for name in layout:
+            layout[name][0] += start
+        header_bytes = json.dumps(header).encode("utf-8").ljust(start - 12)
+
+        tmp = self.path.with_name(f".{INDEX_NAME}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with tmp.open("wb") as fh:
+                fh.write(_MAGIC)
+                fh.write(len(header_bytes).to_bytes(4, "little"))
+                fh.write(header_bytes)
+                for _, blob in sections:
+                    fh.write(blob)
+                    fh.write(b"\0" * (-len(blob) % 8))
+            # The old mapping must be gone before the swap (Windows refuses to
+            # replace a mapped file).
+            self._unmap()
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("bm25 index write to %s failed (%s); keeping it in memory", self.path, e)
+            tmp.unlink(missing_ok=True)
+            self._adopt(doc_off, doc_len, t_off, t_df, t_maxtf, t_mindl, postings)
+            return
+        try:
+            self._reset()
+            self._load()
+        except Exception as e:
+            logger.warning("bm25 index %s unreadable after write (%s); rebuilding", self.path, e)
+            self._reset()
+            self.catch_up(merge=False)
+
+    def _adopt(self, doc_off, doc_len, t_off, t_df, t_maxtf, t_mindl, postings) -> None:
+        """Promote merged in-memory arrays to the main segment (read-only fs)."""
+        self._doc_off, self._doc_len = doc_off, doc_len
+        self._t_off, self._t_df = t_off, t_df
+        self._t_maxtf, self._t_mindl = t_maxtf, t_mindl
+        self._post = postings
+        self._main_docs = self.docs
+        self._main_terms = len(self._terms)
+        self._tail_off, self._tail_len = array("Q"), array("I")
+        self._tail_post, self._tail_maxtf, self._tail_mindl = {}, {}, {}
+
+    # ── Statistics ─────────────────────────────────────────────────
+
+    def _df(self, tid: int) -> int:
+        df = self._t_df[tid] if tid < self._main_terms else 0
+        tail = self._tail_post.get(tid)
+        return df + (len(tail) // 2 if tail is not None else 0)
+
+    def _average_idf(self) -> float:
+        n = self.docs
+        if self._avg_idf is None or self._avg_idf[0] != n:
+            idf_sum = 0
+            for tid in range(len(self._terms)):
+                idf_sum += _idf(n, self._df(tid))
+            self._avg_idf = (n, idf_sum / len(self._terms))
+        return self._avg_idf[1]
+
+    def _bound_inputs(self, tid: int) -> Tuple[int, int]:
+        maxtf, mindl = 0, _MAX_U32
+        if tid < self._main_terms:
+            maxtf, mindl = self._t_maxtf[tid], self._t_mindl[tid]
+        if tid in self._tail_maxtf:
+            maxtf = max(maxtf, self._tail_maxtf[tid])
+            mindl = min(mindl, self._tail_mindl[tid])
+        return maxtf, mindl
+
+    # ── Postings ───────────────────────────────────────────────────
+
+    def _postings(self, tid: int):
+        """Yield ``(doc, tf)`` for ``tid``, doc ascending."""
+        if tid < self._main_terms:
+            start = self._t_off[tid]
+            pairs = self._post[start:start + 2 * self._t_df[tid]]
+            yield from zip(pairs[0::2], pairs[1::2])
+        tail = self._tail_post.get(tid)
+        if tail is not None:
+            yield from zip(tail[0::2], tail[1::2])
+
+    def _lookup(self, tid: int, doc: int) -> int:
+        """tf of ``tid`` in ``doc`` (0 if absent), by binary search."""
+        if doc < self._main_docs:
+            if tid >= self._main_terms:
+                return 0
+            start = self._t_off[tid]
+            pairs = self._post[start:start + 2 * self._t_df[tid]]
+        else:
+            pairs = self._tail_post.get(tid)
+            if pairs is None:
+                return 0
+        docs = pairs[0::2]
+        i = bisect.bisect_left(docs, doc)
+        return pairs[2 * i + 1] if i < len(docs) and docs[i] == doc else 0
+
+    # ── Query ──────────────────────────────────────────────────────
+
+    def top_k(self, q_tokens: List[str], k: int) -> List[Tuple[int, float]]:
+        """The ``k`` best ``(doc, score)`` in ``get_scores`` + stable-sort order.
+
+        That is: score descending, ties by doc (file) order, with zero-score
+        docs filling up when fewer than ``k`` docs match.
+        """
+        with self.lock:
+            self.catch_up()
+            n = self.docs
+            if not n or k <= 0:
+                return []
+            idf: Dict[int, float] = {}
+            order: List[Optional[int]] = []
+            for token in q_tokens:
+                tid = self._term_ids.get(token)
+                order.append(tid)
+                if tid is None or tid in idf:
+                    continue
+                value = _idf(n, self._df(tid))
+                idf[tid] = value if value >= 0 else EPSILON * self._average_idf()
+            # Zero-weight terms add nothing ("idf or 0" in get_scores).
+            order = [tid for tid in order if tid is not None and idf[tid]]
+            if not order:
+                return self._with_zero_fill({}, k)
+            norms = self._norms()
+            if all(idf[tid] > 0 for tid in order):
+                hits = self._max_score(order, idf, norms, k)
+                if hits is not None:
+                    return hits
+            return self._with_zero_fill(self._exhaustive(order, idf, norms), k)
+
+    def _norms(self) -> List[float]:
+        """Per-doc ``K1 * (1 - B + B * dl / avgdl)``, cached until N or avgdl moves."""
+        key = (self.docs, self.tokens)
+        if self._norm_cache is None or self._norm_cache[0] != key:
+            avgdl = self.tokens / self.docs
+            norms = [K1 * (1 - B + B * dl / avgdl) for dl in self._doc_len[:self._main_docs]]
+            norms.extend(K1 * (1 - B + B * dl / avgdl) for dl in self._tail_len)
+            self._norm_cache = (key, norms)
+        return self._norm_cache[1]
+
+    def _exhaustive(self, order: List[int], idf: Dict[int, float], norms: List[float]) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        get = scores.get
+        k1p = K1 + 1
+        for tid in order:
+            weight = idf[tid]
+            for doc, tf in self._postings(tid):
+                scores[doc] = get(doc, 0.0) + weight * (tf * k1p / (tf + norms[doc]))
+        return scores
+
+    def _with_zero_fill(self, scores: Dict[int, float], k: int) -> List[Tuple[int, float]]:
+        rank = lambda item: (-item[1], item[0])  # noqa: E731
+        ranked = heapq.nsmallest(k, scores.items(), key=rank)
+        zeros = ((doc, 0.0) for doc in range(self.docs) if doc not in scores)
+        return list(itertools.islice(heapq.merge(ranked, zeros, key=rank), k))
+
+    def _max_score(
+        self, order: List[int], idf: Dict[int, float], norms: List[float], k: int
+    ) -> Optional[List[Tuple[int, float]]]:
+        """Top-k with early termination; None when fewer than k docs score > 0."""
+        k1p = K1 + 1
+        mult: Dict[int, int] = {}
+        for tid in order:
+            mult[tid] = mult.get(tid, 0) + 1
+        bound: Dict[int, float] = {}
+        for tid, m in mult.items():
+            maxtf, mindl = self._bound_inputs(tid)
+            norm = K1 * (1 - B + B * mindl / (self.tokens / self.docs))
+            bound[tid] = m * idf[tid] * (maxtf * k1p / (maxtf + norm)) * (1 + _BOUND_SLACK)
+        remaining = sum(bound.values())
+
+        # Partial scores, in bound order: lower bounds used only for pruning.
+        partial: Dict[int, float] = {}
+        get = partial.get
+        dropped: set = set()
+        theta = 0.0
+        admitting = True
+        for tid in sorted(mult, key=lambda t: -bound[t]):
+            remaining -= bound[tid]
+            weight = mult[tid] * idf[tid]
+            if admitting and len(partial) >= k and bound[tid] + remaining < theta:
+                admitting = False
+            if admitting:
+                for doc, tf in self._postings(tid):
+                    if dropped and doc in dropped:
+                        continue
+                    partial[doc] = get(doc, 0.0) + weight * (tf * k1p / (tf + norms[doc]))
+            else:
+                for doc in partial:
+                    tf = self._lookup(tid, doc)
+                    if tf:
+                        partial[doc] += weight * (tf * k1p / (tf + norms[doc]))
+            if len(partial) >= k:
+                theta = heapq.nlargest(k, partial.values())[-1]
+                floor = theta - _BOUND_SLACK * max(1.0, theta) - remaining
+                for doc in [d for d, s in partial.items() if s < floor]:
+                    del partial[doc]
+                    dropped.add(doc)
+
+        # Exact scores for the survivors, summed in query-token order like
+        # get_scores.
+        final: List[Tuple[int, float]] = []
+        for doc in partial:
+            score = 0.0
+            for tid in order:
+                tf = self._lookup(tid, doc)
+                if tf:
+                    score += idf[tid] * (tf * k1p / (tf + norms[doc]))
+            final.append((doc, score))
+        final.sort(key=lambda item: (-item[1], item[0]))
+        if len(final) < k or final[k - 1][1] <= 0:
+            return None
+        return final[:k]
+
+    # ── Rows ───────────────────────────────────────────────────────
+
+    def rows(self, docs: List[int]) -> List[dict]:
+        """The raw history records of ``docs``, read at their byte offsets."""
+        out = []
+        with self.lock, self.history.open("rb") as fh:
+            for doc in docs:
+                if doc < self._main_docs:
+                    offset = self._doc_off[doc]
+                else:
+                    offset = self._tail_off[doc - self._main_docs]
+                fh.seek(offset)
+                out.append(json.loads(fh.readline()))
+        return out
+
+
+_indexes: Dict[str, BM25Index] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(history: Path, tokenize: Tokenizer, extract: Callable[[dict], dict]) -> BM25Index:
+    """Shared index for ``history`` (loaded and mapped on first use)."""
+    key = str(Path(history).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = BM25Index(history, tokenize, extract)
+        return index
+
+
+def note_append(history: Path) -> None:
+    """Tail a just-appended row into an already-loaded index (``Store.append``).
+
+    A no-op until the first recall has loaded the index; never merges, so the
+    append path stays cheap.
+    """
+    index = _indexes.get(str(Path(history).resolve()))
+    if index is None:
+        return
+    try:
+        index.catch_up(merge=False)
+    except Exception as e:
+        logger.debug("bm25 index catch-up after append failed: %s", e)
+
+
+__all__ = ["BM25Index", "get_index", "index_enabled", "note_append", "okapi_scores", "INDEX_NAME"]
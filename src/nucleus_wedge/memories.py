@@ -10,9 +10,22 @@ Backfill 3-branch rule (idempotent — checks if column exists before adding):
     2. else context matches known legacy taxonomy (Strategy|Feature|...) →
        set kind='note', legacy_context=<word>
     3. else → set kind='unknown', legacy_context=<original>
+
+Incremental projection: ``sync_memories_index`` checkpoints what it has
+consumed in ``projection_state``. For history.jsonl that is the inode, size,
+byte offset and a hash of the first block. Each auto-memory file's
+(mtime, size) and projected row id go in ``auto_memory_files``. A sync applies
+only the appended history tail and the changed/removed markdown files; when
+neither source moved it compares the checkpoints read-only and takes no write
+lock. A
+replaced, truncated or rewritten history (or a flip of the A11 provenance flag,
+which changes what ``_project_row`` admits) falls back to a full re-projection
+of the history rows.
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import re
 import sqlite3
@@ -32,6 +45,20 @@ CREATE TABLE IF NOT EXISTS memories (
     optional_date TEXT,
     source TEXT
 );
+CREATE TABLE IF NOT EXISTS projection_state (
+    source TEXT PRIMARY KEY,
+    inode INTEGER,
+    size INTEGER,
+    byte_offset INTEGER,
+    head TEXT,
+    anchor INTEGER
+);
+CREATE TABLE IF NOT EXISTS auto_memory_files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    row_id INTEGER
+);
 """
 
 HISTORY_SOURCE_PREFIX = "history.jsonl"
@@ -45,6 +72,15 @@ _LEGACY_TAXONOMY = {"Strategy", "Feature", "Architecture", "Decision", "Brand"}
 # Regex for branch #1: bracket-tag form `kind [#tag1,tag2]`
 _BRACKET_TAG_RE = re.compile(r"^(?P<kind>\S+)\s*\[#(?P<tags>[^\]]*)\]\s*$")
 
+# Bytes of history.jsonl hashed into the checkpoint to catch in-place rewrites.
+_HEAD_BYTES = 4096
+
+_INSERT_MEMORY = (
+    "INSERT INTO memories "
+    "(text, tags, created_at, optional_date, source, kind, legacy_context) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
 logger = logging.getLogger("nucleus_wedge.memories")
 
 # Primary-store concurrency posture (mirrors runtime/db.py SQLiteBackend._get_conn):
@@ -88,12 +124,10 @@ def _connect(db: Path | str) -> sqlite3.Connection:
 def _checkpoint(conn: sqlite3.Connection) -> None:
     """Flush the WAL into the main ``memories.db`` file after a write.
 
-    ``recall_cmd._ensure_populated`` decides whether to rebuild the projection by
-    comparing the main ``memories.db`` file mtime against ``history.jsonl``. Under
-    WAL, an INSERT lands in the ``-wal`` sidecar and the main file's mtime is not
-    bumped until a checkpoint — so without this flush every recall would see the
-    db as stale and rebuild. Checkpoint failures (read-only FS, busy) degrade
-    silently: the worst case is the pre-existing rebuild, never a raise.
+    Under WAL an INSERT lands in the ``-wal`` sidecar; flushing after each
+    projection write keeps the main file complete on its own (copies, backups,
+    tools that open it without the sidecar) and the sidecar from growing.
+    Checkpoint failures (read-only FS, busy) degrade silently, never a raise.
     """
     try:
         conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
@@ -191,34 +225,242 @@ def _project_row(row: dict, brain_path: Path | None = None) -> tuple | None:
     return (text, tags_col, created_at, "", source, kind, legacy_context or "")
 
 
-def build_memories_index(brain_path: Path | None = None) -> Path:
-    """Rebuild history-projected rows. Auto-memory rows are preserved."""
-    db = ensure_schema(brain_path)
-    resolved_brain = Store.brain_path(brain_path)
-    store = Store(resolved_brain)
-    rows = [
-        r for r in (_project_row(row, resolved_brain) for row in store.rows())
-        if r is not None
-    ]
-    conn = _connect(db)
-    try:
+def _head_hash(path: Path, length: int) -> str:
+    with path.open("rb") as fh:
+        return hashlib.sha1(fh.read(min(length, _HEAD_BYTES))).hexdigest()
+
+
+def _delete_history_rows(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "DELETE FROM memories WHERE source = ? OR source LIKE ?",
+        (HISTORY_SOURCE_PREFIX, f"{HISTORY_SOURCE_PREFIX}:%"),
+    )
+
+
+def _history_state(conn: sqlite3.Connection) -> tuple | None:
+    return conn.execute(
+        "SELECT inode, byte_offset, head, anchor FROM projection_state WHERE source = ?",
+        (HISTORY_SOURCE_PREFIX,),
+    ).fetchone()
+
+
+def _history_current(conn: sqlite3.Connection, brain: Path) -> bool:
+    """True if the history checkpoint already covers history.jsonl (read-only)."""
+    history = Store(brain).history_file
+    st = history.stat()
+    state = _history_state(conn)
+    return (
+        state is not None
+        and state[0] == st.st_ino
+        and state[1] == st.st_size
+        and state[3] == (1 if _provenance_anchor_flag_on() else 0)
+        and _head_hash(history, state[1]) == state[2]
+    )
+
+
+def _sync_history(conn: sqlite3.Connection, brain: Path, full: bool = False) -> bool:
+    """Project history.jsonl rows past the checkpoint; True if anything changed.
+
+    Runs inside the caller's write transaction, so concurrent syncs never
+    project the same tail twice.
+    """
+    history = Store(brain).history_file
+    st = history.stat()
+    anchor = 1 if _provenance_anchor_flag_on() else 0
+    state = _history_state(conn)
+    if not full:
+        full = (
+            state is None
+            or state[0] != st.st_ino
+            or st.st_size < state[1]
+            or state[3] != anchor
+            or _head_hash(history, state[1]) != state[2]
+        )
+    if full:
+        _delete_history_rows(conn)
+        offset = 0
+    else:
+        offset = state[1]
+        if st.st_size == offset:
+            return False
+
+    with history.open("rb") as fh:
+        fh.seek(offset)
+        data = fh.read(st.st_size - offset)
+    consumed = data.rfind(b"\n") + 1
+    chunks = data[:consumed].split(b"\n")[:-1]
+    tail = data[consumed:]
+    if tail.strip():
+        # A final line without its newline is taken once it parses (writers
+        # that omit the trailing newline); a half-written append waits.
+        try:
+            json.loads(tail)
+        except ValueError:
+            pass
+        else:
+            chunks.append(tail)
+            consumed = len(data)
+
+    rows = []
+    for raw in chunks:
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(row, dict):
+            projected = _project_row(row, brain)
+            if projected is not None:
+                rows.append(projected)
+    conn.executemany(_INSERT_MEMORY, rows)
+    offset += consumed
+    conn.execute(
+        "INSERT OR REPLACE INTO projection_state "
+        "(source, inode, size, byte_offset, head, anchor) VALUES (?, ?, ?, ?, ?, ?)",
+        (HISTORY_SOURCE_PREFIX, st.st_ino, st.st_size, offset,
+         _head_hash(history, offset), anchor),
+    )
+    return True
+
+
+def _auto_memory_on_disk(root: Path) -> dict[str, tuple[int, int]]:
+    on_disk: dict[str, tuple[int, int]] = {}
+    if root.exists():
+        for md in sorted(root.glob("*.md")):
+            try:
+                st = md.stat()
+            except OSError:
+                continue
+            on_disk[str(md)] = (st.st_mtime_ns, st.st_size)
+    return on_disk
+
+
+def _auto_memory_current(conn: sqlite3.Connection, root: Path) -> bool:
+    """True if every auto-memory file matches its checkpoint (read-only)."""
+    if conn.execute(
+        "SELECT 1 FROM projection_state WHERE source = ?", (AUTO_MEMORY_SOURCE,)
+    ).fetchone() is None:
+        return False
+    known = {
+        path: (mtime, size)
+        for path, mtime, size in conn.execute("SELECT path, mtime_ns, size FROM auto_memory_files")
+    }
+    return known == _auto_memory_on_disk(root)
+
+
+def _sync_auto_memory(conn: sqlite3.Connection, root: Path, full: bool = False) -> bool:
+    """Re-project new/changed auto-memory files, drop removed ones."""
+    if full or conn.execute(
+        "SELECT 1 FROM projection_state WHERE source = ?", (AUTO_MEMORY_SOURCE,)
+    ).fetchone() is None:
+        # First sync (or a pre-checkpoint db): rows are not yet tied to files.
+        conn.execute("DELETE FROM memories WHERE source = ?", (AUTO_MEMORY_SOURCE,))
+        conn.execute("DELETE FROM auto_memory_files")
         conn.execute(
-            "DELETE FROM memories WHERE source = ? OR source LIKE ?",
-            (HISTORY_SOURCE_PREFIX, f"{HISTORY_SOURCE_PREFIX}:%"),
+            "INSERT OR REPLACE INTO projection_state (source) VALUES (?)", (AUTO_MEMORY_SOURCE,)
+        )
+        full = True
+
+    on_disk = _auto_memory_on_disk(root)
+    known = {
+        path: ((mtime, size), row_id)
+        for path, mtime, size, row_id in conn.execute(
+            "SELECT path, mtime_ns, size, row_id FROM auto_memory_files"
         )
-        conn.executemany(
-            "INSERT INTO memories "
-            "(text, tags, created_at, optional_date, source, kind, legacy_context) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            rows,
+    }
+    gone = [p for p in known if p not in on_disk]
+    changed = [p for p, sig in on_disk.items() if p not in known or known[p][0] != sig]
+    if not gone and not changed:
+        return full
+
+    stale_ids = [(known[p][1],) for p in gone + changed if p in known and known[p][1] is not None]
+    conn.executemany("DELETE FROM memories WHERE id = ?", stale_ids)
+    conn.executemany("DELETE FROM auto_memory_files WHERE path = ?", [(p,) for p in gone])
+    for path in changed:
+        projected = _project_memory_file(Path(path))
+        row_id = conn.execute(_INSERT_MEMORY, projected).lastrowid if projected is not None else None
+        mtime, size = on_disk[path]
+        conn.execute(
+            "INSERT OR REPLACE INTO auto_memory_files (path, mtime_ns, size, row_id) "
+            "VALUES (?, ?, ?, ?)",
+            (path, mtime, size, row_id),
         )
+    return True
+
+
+def _is_current(brain_path: Path | None, checks) -> bool:
+    """True if ``memories.db`` exists and every checkpoint ``check`` holds.
+
+    Read-only: no schema migration and no write lock, so a recall with
+    nothing new to project never contends with writers.
+    """
+    db = memories_db_path(brain_path)
+    if not db.exists():
+        return False
+    try:
+        conn = _connect(db)
+    except sqlite3.Error:
+        return False
+    try:
+        return all(check(conn) for check in checks)
+    except (sqlite3.Error, OSError):
+        # Missing tables or a missing history file: the sync path decides.
+        return False
+    finally:
+        conn.close()
+
+
+def _run_sync(brain_path: Path | None, steps) -> Path:
+    db = ensure_schema(brain_path)
+    conn = _connect(db)
+    try:
+        # IMMEDIATE: read the checkpoint and apply past it under one write lock.
+        conn.execute("BEGIN IMMEDIATE")
+        changed = False
+        for step in steps:
+            changed = step(conn) or changed
         conn.commit()
-        _checkpoint(conn)
+        if changed:
+            _checkpoint(conn)
+    except BaseException:
+        conn.rollback()
+        raise
     finally:
         conn.close()
     return db
 
 
+def sync_memories_index(
+    brain_path: Path | None = None,
+    memory_root: Path | None = None,
+) -> Path:
+    """Bring ``memories.db`` up to date — O(new rows + changed files).
+
+    Applies only the history.jsonl tail past the checkpoint and the auto-memory
+    files whose (mtime, size) moved; see the module docstring for when it
+    falls back to re-projecting all history rows.
+    """
+    resolved_brain = Store.brain_path(brain_path)
+    root = memory_root or default_auto_memory_root()
+    if _is_current(brain_path, (
+        lambda conn: _history_current(conn, resolved_brain),
+        lambda conn: _auto_memory_current(conn, root),
+    )):
+        return memories_db_path(brain_path)
+    return _run_sync(brain_path, (
+        lambda conn: _sync_history(conn, resolved_brain),
+        lambda conn: _sync_auto_memory(conn, root),
+    ))
+
+
+def build_memories_index(brain_path: Path | None = None) -> Path:
+    """Rebuild history-projected rows. Auto-memory rows are preserved."""
+    resolved_brain = Store.brain_path(brain_path)
+    return _run_sync(brain_path, (lambda conn: _sync_history(conn, resolved_brain, full=True),))
+
+
 def _parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
     if not content.startswith("---\n"):
         return {}, content
@@ -264,28 +506,8 @@ def build_auto_memory_index(
     memory_root: Path | None = None,
 ) -> Path:
     """Ingest auto-memory markdown files. History-projected rows are preserved."""
-    db = ensure_schema(brain_path)
     root = memory_root or default_auto_memory_root()
-    rows: list[tuple] = []
-    if root.exists():
-        for md in sorted(root.glob("*.md")):
-            projected = _project_memory_file(md)
-            if projected is not None:
-                rows.append(projected)
-    conn = _connect(db)
-    try:
-        conn.execute("DELETE FROM memories WHERE source = ?", (AUTO_MEMORY_SOURCE,))
-        conn.executemany(
-            "INSERT INTO memories "
-            "(text, tags, created_at, optional_date, source, kind, legacy_context) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            rows,
-        )
-        conn.commit()
-        _checkpoint(conn)
-    finally:
-        conn.close()
-    return db
+    return _run_sync(brain_path, (lambda conn: _sync_auto_memory(conn, root, full=True),))
 
 
 # ---- ADR-0033 v3 §C — lazy recall MCP tool surface helpers ----------------
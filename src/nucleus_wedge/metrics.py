@@ -0,0 +1,286 @@
+"""In-process metrics recorder — counters, latency histograms, batched JSONL.
+
+Instrumented hot paths (``bm25.search`` first) used to ``mkdir`` + open +
+append a JSONL line on every call. Here a call costs a few microseconds:
+
+  * ``observe(name, value)`` bumps one bucket of an HDR-style histogram
+    (32 log-linear sub-buckets per power of two, ~1.6% relative error) and
+    ``incr(name)`` a counter. Both write only to the calling thread's own
+    shard, so there is no lock on the hot path; readers sum the shards.
+  * ``log_event(path, record)`` queues a JSONL line. A daemon thread appends
+    queued lines every ``NUCLEUS_METRICS_FLUSH_S`` seconds (default 5), one
+    open per file per flush, and once more at interpreter exit. Files and
+    record shapes are unchanged (``metrics/recall_timings.jsonl`` keeps its
+    per-query rows); they just land in batches.
+
+``percentiles(name)`` / ``snapshot()`` read live distributions without
+touching disk. Values are unit-agnostic; callers put the unit in the name
+(``recall.search_ms``).
+
+Lives in ``nucleus_wedge`` (stdlib only) so the wedge stays importable
+stand-alone and ``mcp_server_nucleus`` can share the same recorder.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import math
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("nucleus_wedge.metrics")
+
+DEFAULT_FLUSH_S = 5.0
+MAX_PENDING_EVENTS = 100_000
+
+# Histogram layout: values in [2**_MIN_EXP, 2**_MAX_EXP) get _SUB buckets per
+# power of two; bucket 0 holds values <= 0 (and underflow), the last overflow.
+_SUB = 32
+_MIN_EXP = -20
+_MAX_EXP = 44
+_NBUCKETS = (_MAX_EXP - _MIN_EXP) * _SUB + 2
+
+
+def _flush_interval() -> float:
+    try:
+        return max(0.1, float(os.environ.get("NUCLEUS_METRICS_FLUSH_S", DEFAULT_FLUSH_S)))
+    except ValueError:
+        return DEFAULT_FLUSH_S
+
+
+def _bucket(value: float) -> int:
+    if value <= 0:
+        return 0
+    mantissa, exp = math.frexp(value)  # value = mantissa * 2**exp, mantissa in [0.5, 1)
+    if exp <= _MIN_EXP:
+        return 0
+    if exp > _MAX_EXP:
+        return _NBUCKETS - 1
+    return 1 + (exp - 1 - _MIN_EXP) * _SUB + int((mantissa - 0.5) * 2 * _SUB)
+
+
+def _bucket_value(index: int) -> float:
+    """Midpoint of a bucket (the value reported for percentiles)."""
+    if index <= 0:
+        return 0.0
+    if index >= _NBUCKETS - 1:
+        return math.ldexp(1.0, _MAX_EXP)
+    octave, sub = divmod(index - 1, _SUB)
+    low = math.ldexp(1.0 + sub / _SUB, octave + _MIN_EXP)
+    return low * (1.0 + 0.5 / (_SUB + sub))
+
+
+class _Shard:
+    """One thread's metrics; only that thread writes to it."""
+
+    __slots__ = ("hists", "stats", "counters")
+
+    def __init__(self):
+        self.hists: Dict[str, List[int]] = {}
+        # name -> [count, sum, max]
+        self.stats: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+
+
+class MetricsRecorder:
+    """Sharded counters/histograms plus a batched JSONL writer."""
+
+    def __init__(self, flush_interval_s: Optional[float] = None,
+                 max_pending: int = MAX_PENDING_EVENTS):
+        self._flush_interval = flush_interval_s
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._pending: deque = deque(maxlen=max_pending)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._atexit_registered = False
+        if hasattr(os, "register_at_fork"):
+            # A forked child inherits the parent's queue and shards, but not
+            # the flusher thread; the parent still owns all of them.
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    # ── Hot path ───────────────────────────────────────────────────
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe(self, name: str, value: float) -> None:
+        """Record one sample of ``name`` (e.g. a latency in ms)."""
+        shard = self._shard()
+        hist = shard.hists.get(name)
+        if hist is None:
+            # stats first: readers take ``hists`` membership to mean both exist.
+            shard.stats[name] = [0, 0.0, value]
+            hist = shard.hists[name] = [0] * _NBUCKETS
+        hist[_bucket(value)] += 1
+        stats = shard.stats[name]
+        stats[0] += 1
+        stats[1] += value
+        if value > stats[2]:
+            stats[2] = value
+
+    def incr(self, name: str, n: int = 1) -> None:
+        counters = self._shard().counters
+        counters[name] = counters.get(name, 0) + n
+
+    def log_event(self, path: Path, record: dict) -> None:
+        """Queue ``record`` as a JSONL line for ``path`` (written by the flusher)."""
+        self._pending.append((path, record))
+        if self._thread is None:
+            self._start_flusher()
+
+    # ── Flushing ───────────────────────────────────────────────────
+
+    def _start_flusher(self) -> None:
+        with self._flush_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="nucleus-metrics-flush", daemon=True
+            )
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def _after_fork(self) -> None:
+        # The parent flushes its own queued events; re-writing them here would
+        # duplicate JSONL rows, and its samples would skew the child's stats.
+        self._pending = deque(maxlen=self._pending.maxlen)
+        self._local = threading.local()
+        self._shards = []
+        self._flush_lock = threading.Lock()
+        self._shards_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._flush_interval or _flush_interval())
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # noqa: BLE001 — telemetry never takes the process down
+                logger.debug("metrics flush failed: %s", e)
+
+    def flush(self) -> int:
+        """Append every queued event to its file now; returns lines written."""
+        with self._flush_lock:
+            batches: Dict[Path, List[str]] = {}
+            while True:
+                try:
+                    path, record = self._pending.popleft()
+                except IndexError:
+                    break
+                batches.setdefault(Path(path), []).append(json.dumps(record) + "\n")
+            written = 0
+            for path, lines in batches.items():
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    with path.open("a") as fh:
+                        fh.write("".join(lines))
+                    written += len(lines)
+                except OSError as e:
+                    logger.debug("metrics flush to %s failed: %s", path, e)
+            return written
+
+    # ── Reading ────────────────────────────────────────────────────
+
+    def _merged(self, name: str) -> Tuple[List[int], List[float]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        counts = [0] * _NBUCKETS
+        total = [0, 0.0, 0.0]
+        for shard in shards:
+            hist = shard.hists.get(name)
+            if hist is None:
+                continue
+            for i, c in enumerate(hist):
+                if c:
+                    counts[i] += c
+            count, sum_, max_ = shard.stats[name]
+            total[2] = max_ if not total[0] else max(total[2], max_)
+            total[0] += count
+            total[1] += sum_
+        return counts, total
+
+    def percentiles(self, name: str, pcts: Iterable[float] = (50, 95, 99)) -> Dict[str, float]:
+        """Live ``{count, mean, max, p50, ...}`` for ``name`` (empty if unseen)."""
+        counts, (count, sum_, max_) = self._merged(name)
+        if not count:
+            return {}
+        out: Dict[str, float] = {"count": count, "mean": sum_ / count, "max": max_}
+        for pct in pcts:
+            rank = max(1, math.ceil(pct / 100.0 * count))
+            seen = 0
+            for i, c in enumerate(counts):
+                seen += c
+                if seen >= rank:
+                    out[f"p{pct:g}"] = min(_bucket_value(i), max_)
+                    break
+        return out
+
+    def counter(self, name: str) -> int:
+        with self._shards_lock:
+            shards = list(self._shards)
+        return sum(shard.counters.get(name, 0) for shard in shards)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Every counter and histogram summary recorded in this process."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        names = {n for s in shards for n in list(s.hists)}
+        counters = {n for s in shards for n in list(s.counters)}
+        return {
+            "counters": {n: self.counter(n) for n in sorted(counters)},
+            "histograms": {n: self.percentiles(n) for n in sorted(names)},
+            "pending_events": len(self._pending),
+        }
+
+
+_recorder = MetricsRecorder()
+
+
+def get_recorder() -> MetricsRecorder:
+    return _recorder
+
+
+def observe(name: str, value: float) -> None:
+    _recorder.observe(name, value)
+
+
+def incr(name: str, n: int = 1) -> None:
+    _recorder.incr(name, n)
+
+
+def log_event(path: Path, record: dict) -> None:
+    _recorder.log_event(path, record)
+
+
+def percentiles(name: str, pcts: Iterable[float] = (50, 95, 99)) -> Dict[str, float]:
+    return _recorder.percentiles(name, pcts)
+
+
+def snapshot() -> Dict[str, Dict]:
+    return _recorder.snapshot()
+
+
+def flush() -> int:
+    return _recorder.flush()
+
+
+__all__ = [
+    "MetricsRecorder", "get_recorder", "observe", "incr", "log_event",
+    "percentiles", "snapshot", "flush",
+]
@@ -4,7 +4,8 @@ Pairs with ``bench first_recall`` so cold-start recall can be stopwatched
 as a subprocess call (Phase 6 criterion #1, Fri acceptance).
 
 Auto-builds ``memories.db`` on first call (history projection + auto-memory
-ingest). Subsequent calls hit the populated index directly. Ranking is
+ingest). Subsequent calls project only what changed since the last one
+(see ``memories.sync_memories_index``). Ranking is
 case-insensitive substring match on text+tags, recency-ordered.
 
 ADR-0033 v3 Phase 0.5 extension: `do_recall` accepts structured `kind` /
@@ -21,12 +22,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from nucleus_wedge.memories import (
-    _connect,
-    build_auto_memory_index,
-    build_memories_index,
-    memories_db_path,
-)
+from nucleus_wedge.memories import _connect, sync_memories_index
 
 logger = logging.getLogger("nucleus_wedge.recall_cmd")
 
@@ -48,22 +44,16 @@ def _sor_flag_on() -> bool:
 
 
 def _ensure_populated(brain_path_arg: str | None) -> Path:
-    """Return the memories.db path, rebuilding the projection if stale.
-
-    The projection is rebuilt when ANY of:
-      - memories.db does not exist
-      - memories.db table is empty
-      - history.jsonl has been modified at-or-after memories.db
-        (PR #437 v1 used `>`; #447 v2 uses `>=` per cc-main Loop #6 finding
-        — same-second write+recall was silently swallowed when stat()
-        precision couldn't distinguish them within float-second quantum)
-      - history.jsonl line count > projected history-source row count
-        (#447 v2 row-count sanity check — defensive against rsync-preserved-
-        mtime imports, coarse fs mtime, edge cases where mtime doesn't
-        reflect content. Cost ~50ms on 8K-line file; acceptable as safety
-        net on per-call path that could otherwise silently return stale data)
-
-    The mtime check is fast path; row-count is safety net.
+    """Return the memories.db path, bringing the projection up to date first.
+
+    ``memories.sync_memories_index`` is checkpointed: it applies only the
+    history.jsonl lines appended since the last recall and the auto-memory
+    files whose (mtime, size) changed, so the first recall after a
+    ``remember`` costs O(new rows). A replaced, truncated or rewritten
+    history (inode / size / head-hash mismatch) re-projects all history rows.
+    This supersedes the #447 mtime + line-count staleness checks: the byte
+    checkpoint does not depend on fs mtime precision or preserved mtimes, and
+    no longer re-counts every history line per call.
 
     Move 2 batch 4 note: this function intentionally still returns the
     ``memories.db`` path even under ``NUCLEUS_MEMORY_SOR`` — it is NOT hard
@@ -75,49 +65,8 @@ def _ensure_populated(brain_path_arg: str | None) -> Path:
     gains the SoR while the legacy read-model — historically complete, pre-shim
     included — is never abandoned. Flag-ON is therefore never worse than flag-OFF.
     """
-    from nucleus_wedge.memories import history_jsonl_path
-
     brain = Path(brain_path_arg).expanduser() if brain_path_arg else None
-    db = memories_db_path(brain)
-    history = history_jsonl_path(brain)
-
-    # #447 v2: `>=` not `>` so same-second write+recall doesn't get swallowed.
-    # After build, db.mtime > history.mtime (build wrote later), so `>=` still
-    # returns False on no-write case. New write at T_remember updates
-    # history.mtime ≥ db.mtime → check fires.
-    stale_vs_history_mtime = (
-        db.exists()
-        and history.exists()
-        and history.stat().st_mtime >= db.stat().st_mtime
-    )
-
-    # #447 v2: row-count sanity check catches edges mtime misses.
-    # Match HISTORY_SOURCE_PREFIX = "history.jsonl" (memories.py L36); rows
-    # are written with source = "history.jsonl" or "history.jsonl:<agent>".
-    stale_vs_history_rowcount = False
-    if db.exists() and history.exists() and not stale_vs_history_mtime:
-        try:
-            with open(history, "rb") as fh:
-                history_lines = sum(1 for _ in fh)
-            with _connect(db) as conn:
-                projected_rows = conn.execute(
-                    "SELECT COUNT(*) FROM memories "
-                    "WHERE source = 'history.jsonl' OR source LIKE 'history.jsonl:%'"
-                ).fetchone()[0]
-            if history_lines > projected_rows:
-                stale_vs_history_rowcount = True
-        except (OSError, sqlite3.Error):
-            # Defensive: any I/O or DB error → fall through to rebuild.
-            stale_vs_history_rowcount = True
-
-    if db.exists() and not stale_vs_history_mtime and not stale_vs_history_rowcount:
-        with _connect(db) as conn:
-            count = conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
-        if count > 0:
-            return db
-    build_memories_index(brain)
-    build_auto_memory_index(brain)
-    return memories_db_path(brain)
+    return sync_memories_index(brain)
 
 
 def _do_recall_query(
@@ -259,6 +259,11 @@ class Store:
             record["snapshot"]["signature"] = self._sign_snapshot(record["snapshot"])
         with self._history.open("a", encoding="utf-8") as fh:
             fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # Keep an already-loaded recall index current (no-op before the first
+        # recall). Lazy import: bm25_index is only needed once search runs.
+        from nucleus_wedge.bm25_index import note_append
+
+        note_append(self._history)
         # Dual-write: after the authoritative history.jsonl append, ALSO mirror
         # into the unified SoR (flag-gated, fault-isolated). Never alters or
         # gates the return above — reads are untouched in this batch.